@@ -1,13 +1,58 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import sqlite3
 import datetime
 import json
-import matplotlib.pyplot as plt
-from matplotlib import dates
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import numpy as np
+import bisect
+import dataclasses
 from tkinter import font as tkFont
+from project_store import (ProjectStore, Project, Task, Resource, Risk, Stakeholder, DB_PATH, search_query,
+                           PROJECT_STATUSES, TASK_STATUSES, PRIORITIES, METHODOLOGIES, RESOURCE_TYPES,
+                           AVAILABILITY_VALUES, RISK_PROBABILITIES, RISK_IMPACTS, RISK_STATUSES,
+                           STAKEHOLDER_LEVELS)
+from dashboard import DashboardEngine
+from virtual_tree import VirtualTreeview, VirtualTree
+from task_runner import TaskRunner
+from scheduling import ScheduleGraph, CycleError, parse_dependency_input, format_dependencies
+from analytics import OPEN_RISK_STATUSES, stream_report
+from exporter import EXPORT_SOURCES, EXTENSIONS, columnar_format, export
+from importer import import_file
+
+# Cât de des se verifică jurnalul pentru modificări făcute din alte procese (CLI, API)
+CHANGE_POLL_MS = 2000
+# Peste acest număr de modificări (de ex. după un import) listele se reîncarcă complet
+MAX_PATCH_CHANGES = 500
+# Căutarea pornește după o pauză în tastare, nu la fiecare literă
+SEARCH_DELAY_MS = 150
+SEARCH_LIMIT = 30
+SEARCH_LABELS = {'project': "Proiect", 'task': "Task", 'risk': "Risc", 'stakeholder': "Stakeholder"}
+# Tabul în care se deschide fiecare tip de rezultat
+SEARCH_TABS = {'project': 'projects', 'task': 'wbs', 'risk': 'risks', 'stakeholder': 'stakeholders'}
+# Intervalele histogramei de încărcare a resurselor
+CAPACITY_BUCKETS = {"Săptămânal": 'week', "Zilnic": 'day'}
+PORTFOLIO_LABEL = "Tot portofoliul"
+# Opțiunile simulării Monte Carlo
+MONTE_CARLO_ITERATIONS = ("10000", "50000", "100000")
+MONTE_CARLO_DISTRIBUTIONS = {"PERT (beta)": 'pert', "Triunghiulară": 'triangular'}
+TORNADO_TARGETS = {"Termen": 'finish', "Cost": 'cost'}
+# Afișarea valorilor totalizate din WBS
+WBS_FORMATS = {'work': "{:g}".format, 'progress': "{:.0f}%".format, 'cost': "{:,.0f}".format}
+# Filtrul hărții riscurilor: statusurile incluse (None = toate)
+RISK_MAP_FILTERS = {"Deschise": OPEN_RISK_STATUSES, "Toate": None}
+# Indicatorii EVM afișați în dashboard, în ordinea afișării
+EVM_INDICATORS = (('pv', "PV:"), ('ev', "EV:"), ('ac', "AC:"), ('bac', "BAC:"),
+                  ('cpi', "CPI:"), ('spi', "SPI:"), ('eac', "EAC:"), ('etc', "ETC:"))
+
+
+def embed_figure(parent, figsize):
+    """Figură matplotlib încorporată în Tk; matplotlib este importat abia la primul grafic"""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+    fig = Figure(figsize=figsize)
+    ax = fig.add_subplot()
+    canvas = FigureCanvasTkAgg(fig, parent)
+    canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+    return fig, ax, canvas
 
 
 class ProjectManagementApp:
@@ -20,6 +65,12 @@ class ProjectManagementApp:
         # Inițializare bază de date
         self.init_database()
 
+        # Interogările și pregătirea graficelor rulează în fundal
+        self.runner = TaskRunner(self.root, on_busy_change=self.on_busy_change)
+        # Scrierile în curs, ca un al doilea clic pe Salvează să nu dubleze înregistrarea
+        self.pending_writes = set()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
         # Variabile pentru tracking
         self.current_project_id = None
         self.projects_data = []
@@ -27,96 +78,87 @@ class ProjectManagementApp:
         self.resources_data = []
         self.risks_data = []
 
+        # Widget-urile taburilor apar la prima selectare a tabului (vezi build_tab)
+        self.project_combos = []
+        self.projects_view = None
+        self.project_combo = None
+        self.tasks_view = None
+        self.resources_view = None
+        self.risks_view = None
+        self.stakeholders_view = None
+        self.gantt_chart = None
+
+        # Poziția în jurnalul de modificări până la care interfața este la zi
+        self.change_seq = self.store.last_change()
+        self._refresh_dashboard = False
+
         # Creare interfață
         self.create_main_interface()
         self.load_all_data()
+        self.root.after(CHANGE_POLL_MS, self.poll_changes)
 
     def init_database(self):
         """Inițializează baza de date SQLite"""
-        self.conn = sqlite3.connect('project_management.db')
-        self.cursor = self.conn.cursor()
-
-        # Tabel proiecte
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS projects (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                description TEXT,
-                start_date TEXT,
-                end_date TEXT,
-                budget REAL,
-                status TEXT,
-                priority TEXT,
-                project_manager TEXT,
-                methodology TEXT,
-                created_date TEXT
-            )
-        ''')
-
-        # Tabel taskuri/activități
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS tasks (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                project_id INTEGER,
-                name TEXT NOT NULL,
-                description TEXT,
-                start_date TEXT,
-                end_date TEXT,
-                duration INTEGER,
-                dependencies TEXT,
-                assigned_to TEXT,
-                status TEXT,
-                progress INTEGER,
-                priority TEXT,
-                FOREIGN KEY (project_id) REFERENCES projects (id)
-            )
-        ''')
-
-        # Tabel resurse
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS resources (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                project_id INTEGER,
-                name TEXT NOT NULL,
-                type TEXT,
-                cost_per_unit REAL,
-                quantity INTEGER,
-                total_cost REAL,
-                availability TEXT,
-                FOREIGN KEY (project_id) REFERENCES projects (id)
-            )
-        ''')
-
-        # Tabel riscuri
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS risks (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                project_id INTEGER,
-                description TEXT NOT NULL,
-                probability TEXT,
-                impact TEXT,
-                risk_level TEXT,
-                mitigation_strategy TEXT,
-                status TEXT,
-                FOREIGN KEY (project_id) REFERENCES projects (id)
-            )
-        ''')
-
-        # Tabel stakeholderi
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS stakeholders (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                project_id INTEGER,
-                name TEXT NOT NULL,
-                role TEXT,
-                influence TEXT,
-                interest TEXT,
-                communication_plan TEXT,
-                FOREIGN KEY (project_id) REFERENCES projects (id)
-            )
-        ''')
-
-        self.conn.commit()
+        self.store = ProjectStore(DB_PATH)
+        self.dashboard = DashboardEngine(self.store)
+        self._dashboard_chart_data = None
+        self.dashboard_canvas = None
+        self.dashboard_bars = None
+        self.evm_canvas = None
+
+    def fetch_page(self, entity_cls, project_id, sort_column, descending, after, limit):
+        """Citește o pagină pe o conexiune din pool (rulează în thread-ul de lucru)"""
+        with self.store.snapshot() as store:
+            return store.page(entity_cls, project_id, sort_column, descending, after, limit)
+
+    def fetch_wbs_page(self, project_id, sort_column, descending, after, limit):
+        """O pagină din nivelul de sus al WBS-ului (rulează în thread-ul de lucru)"""
+        with self.store.snapshot() as store:
+            return store.wbs_page(project_id, sort_column, descending, after, limit)
+
+    def fetch_wbs_children(self, parent_id, sort_column, descending):
+        """Subtaskurile unui nod din WBS, la prima expandare (rulează în thread-ul de lucru)"""
+        with self.store.snapshot() as store:
+            return store.wbs_children(parent_id, sort_column, descending)
+
+    def on_busy_change(self, busy):
+        """Pornește sau oprește indicatorul de progres"""
+        if busy:
+            self.status_var.set("Se încarcă...")
+            self.progress_bar.start(15)
+        else:
+            self.status_var.set("Gata")
+            self.progress_bar.stop()
+
+    def on_close(self):
+        """Oprește lucrul în fundal și închide baza de date"""
+        self.runner.shutdown()
+        self.store.close()
+        self.root.destroy()
+
+    def show_error(self, error):
+        """Afișează o eroare apărută într-o operație din fundal"""
+        messagebox.showerror("Eroare", f"A apărut o eroare: {str(error)}")
+
+    def submit_write(self, key, work, on_done, error_message="A apărut o eroare"):
+        """Rulează scrierea work() în fundal; on_done(rezultat) actualizează interfața în thread-ul Tk.
+        Validările store-ului (ValueError) sunt afișate ca atare, iar fereastra de editare rămâne deschisă."""
+        if key in self.pending_writes:
+            return
+        self.pending_writes.add(key)
+
+        def done(result):
+            self.pending_writes.discard(key)
+            on_done(result)
+
+        def failed(e):
+            self.pending_writes.discard(key)
+            if isinstance(e, ValueError):
+                messagebox.showerror("Eroare", str(e))
+            else:
+                messagebox.showerror("Eroare", f"{error_message}: {str(e)}")
+
+        self.runner.submit(key, work, on_done=done, on_error=failed)
 
     def create_main_interface(self):
         """Creează interfața principală cu toate modulele"""
@@ -125,27 +167,193 @@ class ProjectManagementApp:
         header_frame.pack(fill=tk.X, pady=(0, 10))
         header_frame.pack_propagate(False)
 
+        # Căutare globală în proiecte, taskuri, riscuri și stakeholderi
+        search_frame = tk.Frame(header_frame, bg='#2c3e50')
+        search_frame.pack(side=tk.RIGHT, padx=15)
+        tk.Label(search_frame, text="🔍", font=('Arial', 12), fg='white', bg='#2c3e50').pack(side=tk.LEFT)
+        self.search_var = tk.StringVar()
+        self.search_entry = tk.Entry(search_frame, textvariable=self.search_var, width=32, font=('Arial', 11))
+        self.search_entry.pack(side=tk.LEFT, padx=5)
+        self.search_entry.bind('<KeyRelease>', self.on_search_typed)
+        self.search_entry.bind('<Return>', lambda e: self.open_search_result(0))
+        self.search_entry.bind('<Down>', lambda e: self.focus_search_results())
+        self.search_entry.bind('<Escape>', lambda e: self.hide_search_results())
+        self.search_popup = None
+        self.search_results = []
+        self._search_after = None
+
         title_label = tk.Label(header_frame, text="SISTEM COMPLET DE MANAGEMENT PROIECTE",
                                font=('Arial', 18, 'bold'), fg='white', bg='#2c3e50')
         title_label.pack(pady=15)
 
+        # Bară de stare cu indicator de progres pentru lucrul în fundal
+        status_frame = tk.Frame(self.root)
+        status_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=(0, 5))
+
+        self.status_var = tk.StringVar(value="Gata")
+        tk.Label(status_frame, textvariable=self.status_var, anchor=tk.W).pack(side=tk.LEFT)
+        self.progress_bar = ttk.Progressbar(status_frame, mode='indeterminate', length=150)
+        self.progress_bar.pack(side=tk.RIGHT)
+
         # Notebook pentru taburi
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
-        # Taburi principale
-        self.create_dashboard_tab()
-        self.create_projects_tab()
-        self.create_wbs_tab()
-        self.create_gantt_tab()
-        self.create_resources_tab()
-        self.create_methodology_tab()
+        # Taburi principale: cadre goale, completate la prima selectare
+        tabs = [
+            ('dashboard', "🏠 Dashboard", self.create_dashboard_tab),
+            ('projects', "📁 Proiecte", self.create_projects_tab),
+            ('wbs', "📋 WBS & Taskuri", self.create_wbs_tab),
+            ('gantt', "📊 Diagrama Gantt", self.create_gantt_tab),
+            ('resources', "👥 Resurse", self.create_resources_tab),
+            ('risks', "⚠️ Riscuri", self.create_risks_tab),
+            ('stakeholders', "🤝 Stakeholderi", self.create_stakeholders_tab),
+            ('reports', "📈 Rapoarte", self.create_reports_tab),
+            ('methodology', "🔬 Metodologii", self.create_methodology_tab),
+        ]
+        self.tab_builders = {}
+        self.tab_frames = {}
+        for key, text, builder in tabs:
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=text)
+            self.tab_builders[str(frame)] = (builder, frame)
+            self.tab_frames[key] = frame
+        self.notebook.bind('<<NotebookTabChanged>>', self.on_tab_changed)
+        self.build_tab(self.notebook.tabs()[0])
+
+    def on_tab_changed(self, event=None):
+        """Construiește tabul selectat la prima lui afișare"""
+        self.build_tab(self.notebook.select())
+
+    def build_tab(self, tab_id):
+        """Creează widget-urile tabului, o singură dată"""
+        entry = self.tab_builders.pop(str(tab_id), None)
+        if entry:
+            builder, frame = entry
+            builder(frame)
+
+    def register_project_combo(self, combo):
+        """Combobox de proiect: primește lista curentă și este actualizat la fiecare reîncărcare"""
+        combo['values'] = self.project_labels()
+        self.project_combos.append(combo)
+
+    def project_labels(self):
+        return [f"{pid} - {name}" for pid, name in self.projects_data]
+
+    def show_tab(self, key):
+        """Afișează tabul dat, construindu-l dacă este nevoie"""
+        frame = self.tab_frames[key]
+        self.build_tab(str(frame))
+        self.notebook.select(frame)
+
+    def select_project(self, project_id):
+        """Selectează proiectul în toate combobox-urile și încarcă listele lui"""
+        label = next((f"{pid} - {name}" for pid, name in self.projects_data if pid == project_id), "")
+        for combo in self.project_combos:
+            combo.set(label)
+        if project_id == self.current_project_id:
+            return
+        self.current_project_id = project_id
+        self.load_tasks()
+        self.load_resources()
+        self.load_risks()
+        self.load_stakeholders()
 
-    def create_dashboard_tab(self):
-        """Dashboard cu overview general"""
-        dashboard_frame = ttk.Frame(self.notebook)
-        self.notebook.add(dashboard_frame, text="🏠 Dashboard")
+    # ------------------------------------------------------------------
+    # Căutare globală
+    # ------------------------------------------------------------------
+
+    def on_search_typed(self, event):
+        """Repornește temporizarea la fiecare tastă; căutarea rulează după o scurtă pauză"""
+        if event.keysym in ('Return', 'Escape', 'Up', 'Down'):
+            return
+        if self._search_after is not None:
+            self.root.after_cancel(self._search_after)
+        self._search_after = self.root.after(SEARCH_DELAY_MS, self.run_search)
+
+    def run_search(self):
+        """Caută în fundal; un rezultat sosit după o tastare nouă este ignorat de runner"""
+        self._search_after = None
+        text = self.search_var.get()
+        if not search_query(text):
+            self.runner.cancel('search')
+            self.hide_search_results()
+            return
 
+        def work():
+            with self.store.snapshot() as store:
+                return store.search(text, SEARCH_LIMIT)
+
+        self.runner.submit('search', work, on_done=self.show_search_results, on_error=self.show_error)
+
+    def show_search_results(self, results):
+        """Lista de rezultate, sub caseta de căutare"""
+        self.search_results = results
+        if self.search_popup is None:
+            self.search_popup = tk.Toplevel(self.root)
+            self.search_popup.overrideredirect(True)
+            self.search_listbox = tk.Listbox(self.search_popup, width=70, font=('Arial', 10), activestyle='dotbox')
+            self.search_listbox.pack(fill=tk.BOTH, expand=True)
+            self.search_listbox.bind('<Double-Button-1>', lambda e: self.open_selected_search_result())
+            self.search_listbox.bind('<Return>', lambda e: self.open_selected_search_result())
+            self.search_listbox.bind('<Escape>', lambda e: self.hide_search_results())
+
+        project_names = dict(self.projects_data)
+        self.search_listbox.delete(0, tk.END)
+        for result in results:
+            line = f"{SEARCH_LABELS[result.entity]}: {result.title}"
+            if result.entity != 'project':
+                line += f"  ·  {project_names.get(result.project_id, result.project_id)}"
+            if result.snippet:
+                line += f"  —  {result.snippet}"
+            self.search_listbox.insert(tk.END, line)
+        if not results:
+            self.search_listbox.insert(tk.END, "Niciun rezultat")
+        self.search_listbox.configure(height=min(max(len(results), 1), 12))
+
+        x = self.search_entry.winfo_rootx() + self.search_entry.winfo_width() - self.search_listbox.winfo_reqwidth()
+        y = self.search_entry.winfo_rooty() + self.search_entry.winfo_height() + 2
+        self.search_popup.geometry(f"+{max(x, 0)}+{y}")
+        self.search_popup.deiconify()
+        self.search_popup.lift()
+
+    def hide_search_results(self):
+        if self.search_popup is not None:
+            self.search_popup.withdraw()
+
+    def focus_search_results(self):
+        if self.search_popup is not None and self.search_results:
+            self.search_listbox.focus_set()
+            self.search_listbox.selection_clear(0, tk.END)
+            self.search_listbox.selection_set(0)
+            self.search_listbox.activate(0)
+
+    def open_selected_search_result(self):
+        selection = self.search_listbox.curselection()
+        if selection:
+            self.open_search_result(selection[0])
+
+    def open_search_result(self, index):
+        """Deschide tabul rezultatului, cu proiectul lui selectat, și selectează rândul"""
+        if index >= len(self.search_results):
+            return
+        result = self.search_results[index]
+        self.hide_search_results()
+        self.show_tab(SEARCH_TABS[result.entity])
+        if result.entity == 'project':
+            self.projects_view.reveal(result.entity_id)
+            return
+
+        self.select_project(result.project_id)
+        if result.entity == 'task':
+            # Subtaskurile apar după expandarea strămoșilor lor
+            self.tasks_view.reveal(result.entity_id, self.store.wbs_path(result.entity_id))
+            return
+        views = {'risk': self.risks_view, 'stakeholder': self.stakeholders_view}
+        views[result.entity].reveal(result.entity_id)
+
+    def create_dashboard_tab(self, dashboard_frame):
+        """Dashboard cu overview general"""
         # Statistici generale
         stats_frame = tk.LabelFrame(dashboard_frame, text="Statistici Generale", font=('Arial', 12, 'bold'))
         stats_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -178,14 +386,31 @@ class ProjectManagementApp:
         tk.Label(stats_inner, textvariable=self.total_budget_var, fg='purple').grid(row=1, column=3, sticky=tk.W,
                                                                                     padx=5)
 
-        # Grafic status proiecte
-        chart_frame = tk.LabelFrame(dashboard_frame, text="Distribuția Proiectelor pe Status",
-                                    font=('Arial', 12, 'bold'))
-        chart_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        # Grafic status proiecte și, alături, valoarea câștigată a portofoliului
+        charts_frame = tk.Frame(dashboard_frame)
+        charts_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        self.dashboard_fig, self.dashboard_ax = plt.subplots(figsize=(8, 4))
-        self.dashboard_canvas = FigureCanvasTkAgg(self.dashboard_fig, chart_frame)
-        self.dashboard_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        chart_frame = tk.LabelFrame(charts_frame, text="Distribuția Proiectelor pe Status",
+                                    font=('Arial', 12, 'bold'))
+        chart_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5)
+
+        # Figura este creată la primele date, după ce fereastra a apărut deja
+        self.dashboard_chart_frame = chart_frame
+
+        evm_frame = tk.LabelFrame(charts_frame, text="Valoare Câștigată (EVM)", font=('Arial', 12, 'bold'))
+        evm_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5)
+
+        evm_inner = tk.Frame(evm_frame)
+        evm_inner.pack(fill=tk.X, padx=10, pady=5)
+        self.evm_vars = {}
+        for i, (key, label) in enumerate(EVM_INDICATORS):
+            self.evm_vars[key] = tk.StringVar(value="-")
+            tk.Label(evm_inner, text=label, font=('Arial', 10, 'bold')).grid(row=i // 4, column=(i % 4) * 2,
+                                                                             sticky=tk.W, padx=5)
+            tk.Label(evm_inner, textvariable=self.evm_vars[key], fg='#2c3e50').grid(row=i // 4,
+                                                                                   column=(i % 4) * 2 + 1,
+                                                                                   sticky=tk.W, padx=5)
+        self.evm_chart_frame = evm_frame
 
         # Proiecte recente
         recent_frame = tk.LabelFrame(dashboard_frame, text="Proiecte Recente", font=('Arial', 12, 'bold'))
@@ -194,11 +419,8 @@ class ProjectManagementApp:
         self.recent_listbox = tk.Listbox(recent_frame, height=3)
         self.recent_listbox.pack(fill=tk.X, padx=10, pady=10)
 
-    def create_projects_tab(self):
+    def create_projects_tab(self, projects_frame):
         """Tab pentru managementul proiectelor"""
-        projects_frame = ttk.Frame(self.notebook)
-        self.notebook.add(projects_frame, text="📁 Proiecte")
-
         # Toolbar pentru proiecte
         toolbar_frame = tk.Frame(projects_frame)
         toolbar_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -211,6 +433,8 @@ class ProjectManagementApp:
                   bg='#e74c3c', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=5)
         tk.Button(toolbar_frame, text="🔄 Reîmprospătează", command=self.load_projects,
                   bg='#3498db', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=5)
+        tk.Button(toolbar_frame, text="📥 Import", command=self.import_data,
+                  bg='#34495e', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=5)
 
         # Lista proiecte
         list_frame = tk.LabelFrame(projects_frame, text="Lista Proiecte", font=('Arial', 12, 'bold'))
@@ -227,17 +451,22 @@ class ProjectManagementApp:
         # Scrollbars
         v_scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.projects_tree.yview)
         h_scrollbar = ttk.Scrollbar(list_frame, orient=tk.HORIZONTAL, command=self.projects_tree.xview)
-        self.projects_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.projects_tree.configure(xscrollcommand=h_scrollbar.set)
+        self.projects_view = VirtualTreeview(
+            self.projects_tree, v_scrollbar,
+            ('id', 'name', 'project_manager', 'start_date', 'end_date', 'budget', 'status', 'priority'),
+            lambda sort, desc, after, limit: self.fetch_page(Project, None, sort, desc, after, limit),
+            runner=self.runner)
 
         self.projects_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(10, 0), pady=10)
         v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
         h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X, padx=(10, 0))
 
-    def create_wbs_tab(self):
-        """Tab pentru Work Breakdown Structure"""
-        wbs_frame = ttk.Frame(self.notebook)
-        self.notebook.add(wbs_frame, text="📋 WBS & Taskuri")
+        # Tabul poate fi construit după încărcarea inițială
+        self.projects_view.reset()
 
+    def create_wbs_tab(self, wbs_frame):
+        """Tab pentru Work Breakdown Structure"""
         # Selector proiect
         selector_frame = tk.Frame(wbs_frame)
         selector_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -245,6 +474,7 @@ class ProjectManagementApp:
         tk.Label(selector_frame, text="Selectează Proiectul:", font=('Arial', 11, 'bold')).pack(side=tk.LEFT, padx=5)
         self.project_combo = ttk.Combobox(selector_frame, width=30, state='readonly')
         self.project_combo.pack(side=tk.LEFT, padx=5)
+        self.register_project_combo(self.project_combo)
         self.project_combo.bind('<<ComboboxSelected>>', self.on_project_selected)
 
         # Toolbar taskuri
@@ -253,6 +483,8 @@ class ProjectManagementApp:
 
         tk.Button(task_toolbar, text="➕ Adaugă Task", command=self.add_task,
                   bg='#27ae60', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=5)
+        tk.Button(task_toolbar, text="➕ Adaugă Subtask", command=self.add_subtask,
+                  bg='#16a085', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=5)
         tk.Button(task_toolbar, text="✏️ Editează Task", command=self.edit_task,
                   bg='#f39c12', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=5)
         tk.Button(task_toolbar, text="🗑️ Șterge Task", command=self.delete_task,
@@ -262,26 +494,29 @@ class ProjectManagementApp:
         tasks_frame = tk.LabelFrame(wbs_frame, text="Structura Activităților (WBS)", font=('Arial', 12, 'bold'))
         tasks_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
+        # Nume în coloana arborelui; durata, progresul și costul unui părinte sunt totalurile subtaskurilor
         task_columns = (
-            'ID', 'Nume Task', 'Responsabil', 'Data Început', 'Data Sfârșit', 'Durată', 'Progres', 'Status',
-            'Prioritate')
-        self.tasks_tree = ttk.Treeview(tasks_frame, columns=task_columns, show='headings', height=12)
+            'ID', 'Responsabil', 'Data Început', 'Data Sfârșit', 'Durată', 'Progres', 'Cost', 'Status', 'Prioritate')
+        self.tasks_tree = ttk.Treeview(tasks_frame, columns=task_columns, show='tree headings', height=12)
+        self.tasks_tree.column('#0', width=220, anchor=tk.W)
 
         for col in task_columns:
             self.tasks_tree.heading(col, text=col)
             self.tasks_tree.column(col, width=100, anchor=tk.CENTER)
 
         tasks_scrollbar = ttk.Scrollbar(tasks_frame, orient=tk.VERTICAL, command=self.tasks_tree.yview)
-        self.tasks_tree.configure(yscrollcommand=tasks_scrollbar.set)
+        self.tasks_view = VirtualTree(
+            self.tasks_tree, tasks_scrollbar, 'name', 'Nume Task',
+            ('id', 'assigned_to', 'start_date', 'end_date', 'work', 'progress', 'cost', 'status', 'priority'),
+            lambda sort, desc, after, limit: self.fetch_wbs_page(self.current_project_id, sort, desc, after, limit),
+            self.fetch_wbs_children, runner=self.runner, formats=WBS_FORMATS)
 
         self.tasks_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(10, 0), pady=10)
         tasks_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
+        self.load_tasks()
 
-    def create_gantt_tab(self):
+    def create_gantt_tab(self, gantt_frame):
         """Tab pentru diagrama Gantt"""
-        gantt_frame = ttk.Frame(self.notebook)
-        self.notebook.add(gantt_frame, text="📊 Diagrama Gantt")
-
         # Selector proiect pentru Gantt
         gantt_selector = tk.Frame(gantt_frame)
         gantt_selector.pack(fill=tk.X, padx=10, pady=5)
@@ -289,23 +524,28 @@ class ProjectManagementApp:
         tk.Label(gantt_selector, text="Proiect pentru Gantt:", font=('Arial', 11, 'bold')).pack(side=tk.LEFT, padx=5)
         self.gantt_project_combo = ttk.Combobox(gantt_selector, width=30, state='readonly')
         self.gantt_project_combo.pack(side=tk.LEFT, padx=5)
+        self.register_project_combo(self.gantt_project_combo)
 
         tk.Button(gantt_selector, text="🔄 Generează Gantt", command=self.generate_gantt,
                   bg='#9b59b6', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=10)
+        tk.Button(gantt_selector, text="🎲 Simulare Monte Carlo", command=self.show_monte_carlo,
+                  bg='#16a085', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=5)
+        tk.Button(gantt_selector, text="🗂 Timeline portofoliu", command=self.show_portfolio_timeline,
+                  bg='#34495e', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=5)
+        tk.Label(gantt_selector, text="Rotiță: derulare taskuri  |  Ctrl + rotiță: zoom timeline",
+                 fg='#7f8c8d').pack(side=tk.RIGHT, padx=5)
 
         # Canvas pentru diagrama Gantt
         gantt_chart_frame = tk.LabelFrame(gantt_frame, text="Diagrama Gantt", font=('Arial', 12, 'bold'))
         gantt_chart_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
-        self.gantt_fig, self.gantt_ax = plt.subplots(figsize=(12, 8))
-        self.gantt_canvas = FigureCanvasTkAgg(self.gantt_fig, gantt_chart_frame)
-        self.gantt_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        from gantt import GanttChart
 
-    def create_resources_tab(self):
-        """Tab pentru managementul resurselor"""
-        resources_frame = ttk.Frame(self.notebook)
-        self.notebook.add(resources_frame, text="👥 Resurse")
+        self.gantt_fig, self.gantt_ax, self.gantt_canvas = embed_figure(gantt_chart_frame, (12, 8))
+        self.gantt_chart = GanttChart(self.gantt_fig, self.gantt_ax, self.gantt_canvas)
 
+    def create_resources_tab(self, resources_frame):
+        """Tab pentru managementul resurselor"""
         # Selector proiect pentru resurse
         res_selector = tk.Frame(resources_frame)
         res_selector.pack(fill=tk.X, padx=10, pady=5)
@@ -313,6 +553,7 @@ class ProjectManagementApp:
         tk.Label(res_selector, text="Proiect:", font=('Arial', 11, 'bold')).pack(side=tk.LEFT, padx=5)
         self.resources_project_combo = ttk.Combobox(res_selector, width=30, state='readonly')
         self.resources_project_combo.pack(side=tk.LEFT, padx=5)
+        self.register_project_combo(self.resources_project_combo)
         self.resources_project_combo.bind('<<ComboboxSelected>>', self.load_resources)
 
         # Toolbar resurse
@@ -325,6 +566,8 @@ class ProjectManagementApp:
                   bg='#f39c12', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=5)
         tk.Button(res_toolbar, text="🗑️ Șterge", command=self.delete_resource,
                   bg='#e74c3c', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=5)
+        tk.Button(res_toolbar, text="📊 Încărcare resurse", command=self.show_capacity,
+                  bg='#9b59b6', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=5)
 
         # Lista resurse
         res_list_frame = tk.LabelFrame(resources_frame, text="Lista Resurse", font=('Arial', 12, 'bold'))
@@ -338,16 +581,19 @@ class ProjectManagementApp:
             self.resources_tree.column(col, width=120, anchor=tk.CENTER)
 
         res_scrollbar = ttk.Scrollbar(res_list_frame, orient=tk.VERTICAL, command=self.resources_tree.yview)
-        self.resources_tree.configure(yscrollcommand=res_scrollbar.set)
+        self.resources_view = VirtualTreeview(
+            self.resources_tree, res_scrollbar,
+            ('id', 'name', 'type', 'cost_per_unit', 'quantity', 'total_cost', 'availability'),
+            lambda sort, desc, after, limit: self.fetch_page(Resource, self.current_project_id,
+                                                             sort, desc, after, limit),
+            runner=self.runner)
 
         self.resources_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(10, 0), pady=10)
         res_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
+        self.load_resources()
 
-    def create_risks_tab(self):
+    def create_risks_tab(self, risks_frame):
         """Tab pentru managementul riscurilor"""
-        risks_frame = ttk.Frame(self.notebook)
-        self.notebook.add(risks_frame, text="⚠️ Riscuri")
-
         # Selector proiect pentru riscuri
         risk_selector = tk.Frame(risks_frame)
         risk_selector.pack(fill=tk.X, padx=10, pady=5)
@@ -355,6 +601,7 @@ class ProjectManagementApp:
         tk.Label(risk_selector, text="Proiect:", font=('Arial', 11, 'bold')).pack(side=tk.LEFT, padx=5)
         self.risks_project_combo = ttk.Combobox(risk_selector, width=30, state='readonly')
         self.risks_project_combo.pack(side=tk.LEFT, padx=5)
+        self.register_project_combo(self.risks_project_combo)
         self.risks_project_combo.bind('<<ComboboxSelected>>', self.load_risks)
 
         # Toolbar riscuri
@@ -367,12 +614,15 @@ class ProjectManagementApp:
                   bg='#f39c12', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=5)
         tk.Button(risk_toolbar, text="🗑️ Șterge", command=self.delete_risk,
                   bg='#e74c3c', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=5)
+        tk.Button(risk_toolbar, text="🔥 Hartă riscuri portofoliu", command=self.show_risk_map,
+                  bg='#9b59b6', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=5)
 
         # Lista riscuri
         risks_list_frame = tk.LabelFrame(risks_frame, text="Registrul Riscurilor", font=('Arial', 12, 'bold'))
         risks_list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
-        risk_columns = ('ID', 'Descriere', 'Probabilitate', 'Impact', 'Nivel Risc', 'Strategie Mitigare', 'Status')
+        risk_columns = ('ID', 'Descriere', 'Probabilitate', 'Impact', 'Scor', 'Nivel Risc', 'Strategie Mitigare',
+                        'Status')
         self.risks_tree = ttk.Treeview(risks_list_frame, columns=risk_columns, show='headings', height=10)
 
         for col in risk_columns:
@@ -380,16 +630,20 @@ class ProjectManagementApp:
             self.risks_tree.column(col, width=140, anchor=tk.CENTER)
 
         risk_scrollbar = ttk.Scrollbar(risks_list_frame, orient=tk.VERTICAL, command=self.risks_tree.yview)
-        self.risks_tree.configure(yscrollcommand=risk_scrollbar.set)
+        self.risks_view = VirtualTreeview(
+            self.risks_tree, risk_scrollbar,
+            ('id', 'description', 'probability', 'impact', 'risk_score', 'risk_level', 'mitigation_strategy',
+             'status'),
+            lambda sort, desc, after, limit: self.fetch_page(Risk, self.current_project_id,
+                                                             sort, desc, after, limit),
+            runner=self.runner)
 
         self.risks_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(10, 0), pady=10)
         risk_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
+        self.load_risks()
 
-    def create_stakeholders_tab(self):
+    def create_stakeholders_tab(self, stakeholders_frame):
         """Tab pentru managementul stakeholderilor"""
-        stakeholders_frame = ttk.Frame(self.notebook)
-        self.notebook.add(stakeholders_frame, text="🤝 Stakeholderi")
-
         # Selector proiect
         stake_selector = tk.Frame(stakeholders_frame)
         stake_selector.pack(fill=tk.X, padx=10, pady=5)
@@ -397,6 +651,7 @@ class ProjectManagementApp:
         tk.Label(stake_selector, text="Proiect:", font=('Arial', 11, 'bold')).pack(side=tk.LEFT, padx=5)
         self.stakeholders_project_combo = ttk.Combobox(stake_selector, width=30, state='readonly')
         self.stakeholders_project_combo.pack(side=tk.LEFT, padx=5)
+        self.register_project_combo(self.stakeholders_project_combo)
         self.stakeholders_project_combo.bind('<<ComboboxSelected>>', self.load_stakeholders)
 
         # Toolbar stakeholderi
@@ -420,16 +675,19 @@ class ProjectManagementApp:
             self.stakeholders_tree.column(col, width=150, anchor=tk.CENTER)
 
         stake_scrollbar = ttk.Scrollbar(stake_list_frame, orient=tk.VERTICAL, command=self.stakeholders_tree.yview)
-        self.stakeholders_tree.configure(yscrollcommand=stake_scrollbar.set)
+        self.stakeholders_view = VirtualTreeview(
+            self.stakeholders_tree, stake_scrollbar,
+            ('id', 'name', 'role', 'influence', 'interest', 'communication_plan'),
+            lambda sort, desc, after, limit: self.fetch_page(Stakeholder, self.current_project_id,
+                                                             sort, desc, after, limit),
+            runner=self.runner)
 
         self.stakeholders_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(10, 0), pady=10)
         stake_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
+        self.load_stakeholders()
 
-    def create_reports_tab(self):
+    def create_reports_tab(self, reports_frame):
         """Tab pentru rapoarte și analize"""
-        reports_frame = ttk.Frame(self.notebook)
-        self.notebook.add(reports_frame, text="📈 Rapoarte")
-
         # Opțiuni rapoarte
         options_frame = tk.LabelFrame(reports_frame, text="Opțiuni Rapoarte", font=('Arial', 12, 'bold'))
         options_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -449,6 +707,10 @@ class ProjectManagementApp:
                   bg='#27ae60', fg='white', font=('Arial', 10, 'bold'), width=20).grid(row=1, column=1, padx=5, pady=5)
         tk.Button(buttons_frame, text="📋 Export Date", command=self.export_data,
                   bg='#34495e', fg='white', font=('Arial', 10, 'bold'), width=20).grid(row=1, column=2, padx=5, pady=5)
+        tk.Button(buttons_frame, text="📈 Valoare Câștigată", command=self.generate_evm_report,
+                  bg='#2980b9', fg='white', font=('Arial', 10, 'bold'), width=20).grid(row=2, column=0, padx=5, pady=5)
+        tk.Button(buttons_frame, text="💾 Salvează Raport", command=self.save_report,
+                  bg='#16a085', fg='white', font=('Arial', 10, 'bold'), width=20).grid(row=2, column=1, padx=5, pady=5)
 
         # Zona afișare rapoarte
         display_frame = tk.LabelFrame(reports_frame, text="Rezultate Analize", font=('Arial', 12, 'bold'))
@@ -461,11 +723,8 @@ class ProjectManagementApp:
         self.report_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(10, 0), pady=10)
         report_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
 
-    def create_methodology_tab(self):
+    def create_methodology_tab(self, method_frame):
         """Tab pentru metodologii de management proiecte"""
-        method_frame = ttk.Frame(self.notebook)
-        self.notebook.add(method_frame, text="🔬 Metodologii")
-
         # Frame principal cu două coloane
         main_frame = tk.Frame(method_frame)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
@@ -618,9 +877,7 @@ class ProjectManagementApp:
         method_name = self.method_listbox.get(index).split()[1]  # Elimina emoji-ul
 
         try:
-            self.cursor.execute("UPDATE projects SET methodology=? WHERE id=?",
-                                (method_name, self.current_project_id))
-            self.conn.commit()
+            self.store.set_methodology(self.current_project_id, method_name)
             messagebox.showinfo("Succes", f"Metodologia '{method_name}' a fost aplicată proiectului!")
         except Exception as e:
             messagebox.showerror("Eroare", f"Eroare la aplicarea metodologiei: {str(e)}")
@@ -671,34 +928,33 @@ class ProjectManagementApp:
 
     def load_all_data(self):
         """Încarcă toate datele inițiale"""
-        self.update_dashboard()
+        self.load_projects()
+        self.update_dashboard(refresh=True)
 
     def load_projects(self):
         """Încarcă lista de proiecte în toate combobox-urile"""
-        self.cursor.execute("SELECT id, name FROM projects ORDER BY name")
-        projects = self.cursor.fetchall()
+        def work():
+            with self.store.snapshot() as store:
+                return store.project_choices(), store.recent_projects(3)
+
+        # Actualizează treeview-ul de proiecte (prima pagină, restul la derulare)
+        if self.projects_view is not None:
+            self.projects_view.reset()
+        self.runner.submit('projects', work, on_done=self._show_projects, on_error=self.show_error)
+
+    def _show_projects(self, result):
+        projects, recent = result
         self.projects_data = projects
 
-        # Actualizează toate combobox-urile
-        project_names = [f"{pid} - {name}" for pid, name in projects]
-        self.project_combo['values'] = project_names
-        self.gantt_project_combo['values'] = project_names
-        self.resources_project_combo['values'] = project_names
-        self.risks_project_combo['values'] = project_names
-        self.stakeholders_project_combo['values'] = project_names
-
-        # Actualizează treeview-ul de proiecte
-        self.projects_tree.delete(*self.projects_tree.get_children())
-        self.cursor.execute('''SELECT id, name, project_manager, start_date, end_date, 
-                                     budget, status, priority FROM projects''')
-        for row in self.cursor.fetchall():
-            self.projects_tree.insert('', tk.END, values=row)
+        # Actualizează combobox-urile taburilor deja construite
+        project_names = self.project_labels()
+        for combo in self.project_combos:
+            combo['values'] = project_names
 
         # Actualizează lista proiecte recente
         self.recent_listbox.delete(0, tk.END)
-        self.cursor.execute("SELECT name FROM projects ORDER BY created_date DESC LIMIT 3")
-        for row in self.cursor.fetchall():
-            self.recent_listbox.insert(tk.END, row[0])
+        for name in recent:
+            self.recent_listbox.insert(tk.END, name)
 
     def on_project_selected(self, event):
         """Handler pentru selectarea unui proiect"""
@@ -714,97 +970,220 @@ class ProjectManagementApp:
 
     def load_tasks(self):
         """Încarcă task-urile pentru proiectul selectat"""
-        if not self.current_project_id:
+        if not self.current_project_id or self.tasks_view is None:
             return
 
-        self.tasks_tree.delete(*self.tasks_tree.get_children())
-        self.cursor.execute('''SELECT id, name, assigned_to, start_date, end_date, 
-                                     duration, progress, status, priority FROM tasks 
-                                     WHERE project_id=?''', (self.current_project_id,))
-
-        for row in self.cursor.fetchall():
-            self.tasks_tree.insert('', tk.END, values=row)
+        self.tasks_view.reset()
 
     def load_resources(self, event=None):
         """Încarcă resursele pentru proiectul selectat"""
-        if not self.current_project_id:
+        if not self.current_project_id or self.resources_view is None:
             return
 
-        self.resources_tree.delete(*self.resources_tree.get_children())
-        self.cursor.execute('''SELECT id, name, type, cost_per_unit, quantity, 
-                                     total_cost, availability FROM resources 
-                                     WHERE project_id=?''', (self.current_project_id,))
-
-        for row in self.cursor.fetchall():
-            self.resources_tree.insert('', tk.END, values=row)
+        self.resources_view.reset()
 
     def load_risks(self, event=None):
         """Încarcă riscurile pentru proiectul selectat"""
-        if not self.current_project_id:
+        if not self.current_project_id or self.risks_view is None:
             return
 
-        self.risks_tree.delete(*self.risks_tree.get_children())
-        self.cursor.execute('''SELECT id, description, probability, impact, 
-                                     risk_level, mitigation_strategy, status FROM risks 
-                                     WHERE project_id=?''', (self.current_project_id,))
-
-        for row in self.cursor.fetchall():
-            self.risks_tree.insert('', tk.END, values=row)
+        self.risks_view.reset()
 
     def load_stakeholders(self, event=None):
         """Încarcă stakeholderii pentru proiectul selectat"""
-        if not self.current_project_id:
+        if not self.current_project_id or self.stakeholders_view is None:
             return
 
-        self.stakeholders_tree.delete(*self.stakeholders_tree.get_children())
-        self.cursor.execute('''SELECT id, name, role, influence, interest, 
-                                     communication_plan FROM stakeholders 
-                                     WHERE project_id=?''', (self.current_project_id,))
+        self.stakeholders_view.reset()
+
+    def sync_changes(self, refresh_dashboard=False):
+        """Aplică în interfață modificările din jurnal, rând cu rând, în locul reîncărcărilor complete"""
+        seq = self.change_seq
+        self._refresh_dashboard |= refresh_dashboard
+
+        def work():
+            with self.store.snapshot() as store:
+                changes = store.changes_since(seq, MAX_PATCH_CHANGES + 1)
+                if len(changes) > MAX_PATCH_CHANGES:
+                    return store.last_change(), None, None, None
+                if not changes:
+                    return seq, {}, None, {}
+                recent = store.recent_projects(3) if any(c.entity == 'project' for c in changes) else None
+                # Arborele WBS afișează taskurile cu totalurile subtaskurilor
+                nodes = {node.id: node for node in
+                         store.wbs_nodes({c.entity_id for c in changes if c.entity == 'task'})}
+                return changes[-1].seq, store.changed_entities(changes), recent, nodes
+
+        self.runner.submit('changes', work, on_done=self.apply_changes, on_error=self.show_error)
+
+    def poll_changes(self):
+        """Preia periodic modificările scrise de alte procese în aceeași bază de date"""
+        try:
+            if self.store.last_change() != self.change_seq:
+                self.sync_changes(refresh_dashboard=True)
+        finally:
+            self.root.after(CHANGE_POLL_MS, self.poll_changes)
+
+    def apply_changes(self, result):
+        """Actualizează listele, combobox-urile, dashboard-ul și diagrama Gantt cu entitățile modificate"""
+        seq, entities, recent, nodes = result
+        self.change_seq = max(self.change_seq, seq)
+        refresh_dashboard, self._refresh_dashboard = self._refresh_dashboard, False
+
+        if entities is None:
+            # Prea multe modificări: o reîncărcare completă costă mai puțin decât patch-urile
+            self.load_projects()
+            self.update_dashboard(refresh=True)
+            self.load_tasks()
+            self.load_resources()
+            self.load_risks()
+            self.load_stakeholders()
+            if self.gantt_chart is not None and self.gantt_chart.data is not None:
+                self.refresh_gantt(self.gantt_chart.data.project_id)
+            return
 
-        for row in self.cursor.fetchall():
-            self.stakeholders_tree.insert('', tk.END, values=row)
+        views = {'project': self.projects_view, 'task': self.tasks_view, 'resource': self.resources_view,
+                 'risk': self.risks_view, 'stakeholder': self.stakeholders_view}
+        gantt_data = self.gantt_chart.data if self.gantt_chart is not None else None
+        gantt_project = gantt_data.project_id if gantt_data is not None else None
+        gantt_tasks = []
+        gantt_rebuild = False
+        projects_changed = False
+
+        for (entity, entity_id), obj in entities.items():
+            if entity == 'project':
+                projects_changed = True
+                self.projects_data = [p for p in self.projects_data if p[0] != entity_id]
+                if obj is not None:
+                    bisect.insort(self.projects_data, (obj.id, obj.name), key=lambda p: p[1])
+                elif entity_id == self.current_project_id:
+                    self.clear_current_project()
+                shown = obj is not None
+            else:
+                shown = obj is not None and obj.project_id == self.current_project_id
+
+            view = views[entity]
+            if view is not None:
+                if shown:
+                    view.upsert(nodes.get(entity_id, obj) if entity == 'task' else obj)
+                else:
+                    view.remove(entity_id)
+
+            if entity == 'task' and gantt_data is not None:
+                # Taskurile modificate își actualizează barele; adăugările și ștergerile refac diagrama
+                in_chart = (gantt_project, entity_id) in self.gantt_chart.rows
+                belongs = obj is not None and obj.project_id == gantt_project
+                if in_chart and belongs:
+                    gantt_tasks.append(obj)
+                elif in_chart or belongs:
+                    gantt_rebuild = True
+
+        # Bugetul, progresul, datele și costul resurselor schimbă valoarea câștigată
+        if any(entity in ('project', 'task', 'resource') for entity, _ in entities):
+            self.update_evm()
+
+        if gantt_rebuild:
+            self.refresh_gantt(gantt_project)
+        elif gantt_tasks:
+            self.gantt_chart.update_tasks(gantt_tasks)
+
+        if projects_changed:
+            project_names = self.project_labels()
+            for combo in self.project_combos:
+                combo['values'] = project_names
+            if recent is not None:
+                self.recent_listbox.delete(0, tk.END)
+                for name in recent:
+                    self.recent_listbox.insert(tk.END, name)
+            if refresh_dashboard:
+                self.update_dashboard(refresh=True)
+
+    def clear_current_project(self):
+        """Golește listele proiectului selectat, de exemplu după ștergerea lui"""
+        self.current_project_id = None
+        if self.project_combo is not None:
+            self.project_combo.set('')
+        for view in (self.tasks_view, self.resources_view, self.risks_view, self.stakeholders_view):
+            if view is not None:
+                view.clear()
 
-    def update_dashboard(self):
+    def update_dashboard(self, refresh=False):
         """Actualizează statisticile din dashboard"""
-        # Total proiecte
-        self.cursor.execute("SELECT COUNT(*) FROM projects")
-        total = self.cursor.fetchone()[0]
-        self.total_projects_var.set(total)
-
-        # Proiecte active
-        self.cursor.execute("SELECT COUNT(*) FROM projects WHERE status='In progres'")
-        active = self.cursor.fetchone()[0]
-        self.active_projects_var.set(active)
-
-        # Proiecte finalizate
-        self.cursor.execute("SELECT COUNT(*) FROM projects WHERE status='Finalizat'")
-        completed = self.cursor.fetchone()[0]
-        self.completed_projects_var.set(completed)
-
-        # Buget total
-        self.cursor.execute("SELECT SUM(budget) FROM projects")
-        budget = self.cursor.fetchone()[0] or 0
-        self.total_budget_var.set(f"{budget:,.2f} RON")
-
-        # Grafic status proiecte
-        self.cursor.execute("SELECT status, COUNT(*) FROM projects GROUP BY status")
-        data = self.cursor.fetchall()
+        # KPI-urile vin din cache-ul motorului; refresh=True le recalculează în fundal
+        if refresh or not self.dashboard.loaded:
+            def work():
+                with self.store.snapshot() as store:
+                    return store.status_summary()
+
+            def done(summary):
+                self.dashboard.load(summary)
+                self.update_dashboard()
+                self.update_evm()
+
+            self.runner.submit('dashboard', work, on_done=done, on_error=self.show_error)
+            return
+
+        stats = self.dashboard.stats()
+        self.total_projects_var.set(stats.total)
+        self.active_projects_var.set(stats.active)
+        self.completed_projects_var.set(stats.completed)
+        self.total_budget_var.set(f"{stats.budget:,.2f} RON")
+
+        # Grafic status proiecte - redesenat doar dacă distribuția s-a schimbat
+        data = stats.by_status
+        if data == self._dashboard_chart_data:
+            return
+        previous = self._dashboard_chart_data or []
+        self._dashboard_chart_data = data
+        if self.dashboard_canvas is None:
+            self.dashboard_fig, self.dashboard_ax, self.dashboard_canvas = embed_figure(
+                self.dashboard_chart_frame, (8, 4))
+
+        statuses = [item[0] for item in data]
+        counts = [item[1] for item in data]
+        if data and statuses == [item[0] for item in previous]:
+            # Aceleași categorii: se modifică doar înălțimea barelor existente
+            for bar, count in zip(self.dashboard_bars, counts):
+                bar.set_height(count)
+            self.dashboard_ax.relim()
+            self.dashboard_ax.autoscale_view()
+            self.dashboard_canvas.draw_idle()
+            return
 
         self.dashboard_ax.clear()
+        self.dashboard_bars = None
         if data:
-            statuses = [item[0] for item in data]
-            counts = [item[1] for item in data]
-
             colors = ['#2ecc71' if s == 'In progres' else
                       '#3498db' if s == 'Planificare' else
                       '#e74c3c' if s == 'Blocat' else
                       '#95a5a6' for s in statuses]
 
-            self.dashboard_ax.bar(statuses, counts, color=colors)
+            self.dashboard_bars = self.dashboard_ax.bar(statuses, counts, color=colors)
             self.dashboard_ax.set_title('Distribuție Proiecte pe Status')
             self.dashboard_ax.set_ylabel('Număr Proiecte')
 
-        self.dashboard_canvas.draw()
+        self.dashboard_canvas.draw_idle()
+
+    def update_evm(self):
+        """Recalculează în fundal valoarea câștigată a portofoliului și curba S din dashboard"""
+        from evm import earned_value, draw_s_curve
+
+        def done(result):
+            portfolio = result.portfolio
+            for key, var in self.evm_vars.items():
+                value = float(getattr(portfolio, key))
+                if value != value:
+                    var.set("-")
+                elif key in ('cpi', 'spi'):
+                    var.set(f"{value:.2f}")
+                else:
+                    var.set(f"{value:,.0f} RON")
+            if self.evm_canvas is None:
+                self.evm_fig, self.evm_ax, self.evm_canvas = embed_figure(self.evm_chart_frame, (6, 4))
+            draw_s_curve(self.evm_ax, result)
+            self.evm_canvas.draw_idle()
+
+        self.runner.submit('evm', lambda: earned_value(self.store), on_done=done, on_error=self.show_error)
 
     def add_project(self):
         """Deschide fereastra pentru adăugare proiect nou"""
@@ -847,18 +1226,17 @@ class ProjectManagementApp:
         budget_entry.grid(row=5, column=1, sticky=tk.W, pady=5)
 
         tk.Label(main_frame, text="Status:", font=('Arial', 10, 'bold')).grid(row=6, column=0, sticky=tk.W, pady=5)
-        status_combo = ttk.Combobox(main_frame, values=["Planificare", "In progres", "Blocat", "Finalizat"], width=37)
+        status_combo = ttk.Combobox(main_frame, values=PROJECT_STATUSES, width=37)
         status_combo.grid(row=6, column=1, sticky=tk.W, pady=5)
         status_combo.current(0)
 
         tk.Label(main_frame, text="Prioritate:", font=('Arial', 10, 'bold')).grid(row=7, column=0, sticky=tk.W, pady=5)
-        priority_combo = ttk.Combobox(main_frame, values=["Înaltă", "Medie", "Scăzută"], width=37)
+        priority_combo = ttk.Combobox(main_frame, values=PRIORITIES, width=37)
         priority_combo.grid(row=7, column=1, sticky=tk.W, pady=5)
         priority_combo.current(1)
 
         tk.Label(main_frame, text="Metodologie:", font=('Arial', 10, 'bold')).grid(row=8, column=0, sticky=tk.W, pady=5)
-        method_combo = ttk.Combobox(main_frame, values=["Waterfall", "Agile", "Scrum", "Kanban", "PRINCE2", "PMBOK"],
-                                    width=37)
+        method_combo = ttk.Combobox(main_frame, values=METHODOLOGIES, width=37)
         method_combo.grid(row=8, column=1, sticky=tk.W, pady=5)
 
         # Butoane
@@ -890,24 +1268,51 @@ class ProjectManagementApp:
 
         try:
             budget_value = float(budget) if budget else 0.0
-            created_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            messagebox.showerror("Eroare", "Bugetul trebuie să fie un număr valid!")
+            return
+
+        project = Project(name=name, description=description, project_manager=manager,
+                          start_date=start_date, end_date=end_date, budget=budget_value,
+                          status=status, priority=priority, methodology=methodology)
 
-            self.cursor.execute('''INSERT INTO projects 
-                                        (name, description, project_manager, start_date, 
-                                        end_date, budget, status, priority, methodology, created_date) 
-                                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
-                                (name, description, manager, start_date, end_date,
-                                 budget_value, status, priority, methodology, created_date))
-            self.conn.commit()
+        def done(_):
+            self.dashboard.project_added(project)
 
             messagebox.showinfo("Succes", "Proiectul a fost adăugat cu succes!")
             window.destroy()
-            self.load_projects()
+            self.sync_changes()
             self.update_dashboard()
-        except ValueError:
-            messagebox.showerror("Eroare", "Bugetul trebuie să fie un număr valid!")
-        except Exception as e:
-            messagebox.showerror("Eroare", f"A apărut o eroare: {str(e)}")
+
+        self.submit_write(('add_project', str(window)), lambda: self.store.add_project(project), done)
+
+    def import_data(self):
+        """Importă în masă proiecte și taskuri dintr-un fișier CSV, JSON sau XML MS Project"""
+        path = filedialog.askopenfilename(filetypes=[("Fișiere import", "*.csv *.json *.jsonl *.ndjson *.xml"),
+                                                     ("Toate fișierele", "*.*")])
+        if not path:
+            return
+
+        def done(result):
+            self.sync_changes(refresh_dashboard=True)
+
+            message = (f"{result.projects:,} proiecte și {result.tasks:,} taskuri importate în "
+                       f"{result.seconds:.2f} s ({result.rows_per_second:,.0f} rânduri/s)")
+            if result.skipped:
+                message += f"\nTaskuri sumar omise: {result.skipped:,}"
+            if not (result.errors or result.warnings):
+                messagebox.showinfo("Succes", message)
+                return
+
+            message += (f"\n\nRânduri respinse: {len(result.errors):,}\nAvertismente: {len(result.warnings):,}"
+                        f"\n\nSalvați raportul de erori?")
+            if messagebox.askyesno("Import încheiat", message):
+                report_path = filedialog.asksaveasfilename(defaultextension=".csv", initialfile="erori_import.csv",
+                                                           filetypes=[("CSV", "*.csv"), ("Toate fișierele", "*.*")])
+                if report_path:
+                    result.write_report(report_path)
+
+        self.runner.submit('import', lambda: import_file(self.store, path), on_done=done, on_error=self.show_error)
 
     def edit_project(self):
         """Deschide fereastra pentru editare proiect"""
@@ -916,10 +1321,8 @@ class ProjectManagementApp:
             messagebox.showwarning("Avertisment", "Selectați un proiect pentru editare!")
             return
 
-        project_id = self.projects_tree.item(selected[0], 'values')[0]
-
-        self.cursor.execute("SELECT * FROM projects WHERE id=?", (project_id,))
-        project_data = self.cursor.fetchone()
+        project_id = int(self.projects_tree.item(selected[0], 'values')[0])
+        project_data = self.store.get_project(project_id)
 
         if not project_data:
             messagebox.showerror("Eroare", "Proiectul selectat nu a putut fi găsit!")
@@ -938,51 +1341,50 @@ class ProjectManagementApp:
                                                                                     pady=5)
         name_entry = tk.Entry(main_frame, width=40)
         name_entry.grid(row=0, column=1, sticky=tk.W, pady=5)
-        name_entry.insert(0, project_data[1])
+        name_entry.insert(0, project_data.name)
 
         tk.Label(main_frame, text="Descriere:", font=('Arial', 10, 'bold')).grid(row=1, column=0, sticky=tk.W, pady=5)
         desc_text = tk.Text(main_frame, width=40, height=5, wrap=tk.WORD)
         desc_text.grid(row=1, column=1, sticky=tk.W, pady=5)
-        desc_text.insert("1.0", project_data[2] or "")
+        desc_text.insert("1.0", project_data.description or "")
 
         tk.Label(main_frame, text="Manager Proiect:", font=('Arial', 10, 'bold')).grid(row=2, column=0, sticky=tk.W,
                                                                                        pady=5)
         manager_entry = tk.Entry(main_frame, width=40)
         manager_entry.grid(row=2, column=1, sticky=tk.W, pady=5)
-        manager_entry.insert(0, project_data[8] or "")
+        manager_entry.insert(0, project_data.project_manager or "")
 
         tk.Label(main_frame, text="Data Început:", font=('Arial', 10, 'bold')).grid(row=3, column=0, sticky=tk.W,
                                                                                     pady=5)
         start_entry = tk.Entry(main_frame, width=40)
         start_entry.grid(row=3, column=1, sticky=tk.W, pady=5)
-        start_entry.insert(0, project_data[3] or "")
+        start_entry.insert(0, project_data.start_date or "")
 
         tk.Label(main_frame, text="Data Sfârșit:", font=('Arial', 10, 'bold')).grid(row=4, column=0, sticky=tk.W,
                                                                                     pady=5)
         end_entry = tk.Entry(main_frame, width=40)
         end_entry.grid(row=4, column=1, sticky=tk.W, pady=5)
-        end_entry.insert(0, project_data[4] or "")
+        end_entry.insert(0, project_data.end_date or "")
 
         tk.Label(main_frame, text="Buget (RON):", font=('Arial', 10, 'bold')).grid(row=5, column=0, sticky=tk.W, pady=5)
         budget_entry = tk.Entry(main_frame, width=40)
         budget_entry.grid(row=5, column=1, sticky=tk.W, pady=5)
-        budget_entry.insert(0, project_data[5] or "0")
+        budget_entry.insert(0, project_data.budget or "0")
 
         tk.Label(main_frame, text="Status:", font=('Arial', 10, 'bold')).grid(row=6, column=0, sticky=tk.W, pady=5)
-        status_combo = ttk.Combobox(main_frame, values=["Planificare", "In progres", "Blocat", "Finalizat"], width=37)
+        status_combo = ttk.Combobox(main_frame, values=PROJECT_STATUSES, width=37)
         status_combo.grid(row=6, column=1, sticky=tk.W, pady=5)
-        status_combo.set(project_data[6] or "Planificare")
+        status_combo.set(project_data.status or "Planificare")
 
         tk.Label(main_frame, text="Prioritate:", font=('Arial', 10, 'bold')).grid(row=7, column=0, sticky=tk.W, pady=5)
-        priority_combo = ttk.Combobox(main_frame, values=["Înaltă", "Medie", "Scăzută"], width=37)
+        priority_combo = ttk.Combobox(main_frame, values=PRIORITIES, width=37)
         priority_combo.grid(row=7, column=1, sticky=tk.W, pady=5)
-        priority_combo.set(project_data[7] or "Medie")
+        priority_combo.set(project_data.priority or "Medie")
 
         tk.Label(main_frame, text="Metodologie:", font=('Arial', 10, 'bold')).grid(row=8, column=0, sticky=tk.W, pady=5)
-        method_combo = ttk.Combobox(main_frame, values=["Waterfall", "Agile", "Scrum", "Kanban", "PRINCE2", "PMBOK"],
-                                    width=37)
+        method_combo = ttk.Combobox(main_frame, values=METHODOLOGIES, width=37)
         method_combo.grid(row=8, column=1, sticky=tk.W, pady=5)
-        method_combo.set(project_data[9] or "")
+        method_combo.set(project_data.methodology or "")
 
         # Butoane
         button_frame = tk.Frame(main_frame)
@@ -1014,23 +1416,34 @@ class ProjectManagementApp:
 
         try:
             budget_value = float(budget) if budget else 0.0
+        except ValueError:
+            messagebox.showerror("Eroare", "Bugetul trebuie să fie un număr valid!")
+            return
 
-            self.cursor.execute('''UPDATE projects SET 
-                                        name=?, description=?, project_manager=?, start_date=?, 
-                                        end_date=?, budget=?, status=?, priority=?, methodology=? 
-                                        WHERE id=?''',
-                                (name, description, manager, start_date, end_date,
-                                 budget_value, status, priority, methodology, project_id))
-            self.conn.commit()
+        project = self.store.get_project(project_id)
+        if not project:
+            messagebox.showerror("Eroare", "Proiectul nu mai există!")
+            return
+        old_project = dataclasses.replace(project)
+        project.name = name
+        project.description = description
+        project.project_manager = manager
+        project.start_date = start_date
+        project.end_date = end_date
+        project.budget = budget_value
+        project.status = status
+        project.priority = priority
+        project.methodology = methodology
+
+        def done(_):
+            self.dashboard.project_updated(old_project, project)
 
             messagebox.showinfo("Succes", "Proiectul a fost actualizat cu succes!")
             window.destroy()
-            self.load_projects()
+            self.sync_changes()
             self.update_dashboard()
-        except ValueError:
-            messagebox.showerror("Eroare", "Bugetul trebuie să fie un număr valid!")
-        except Exception as e:
-            messagebox.showerror("Eroare", f"A apărut o eroare: {str(e)}")
+
+        self.submit_write(('update_project', project_id), lambda: self.store.update_project(project), done)
 
     def delete_project(self):
         """Șterge proiectul selectat"""
@@ -1039,7 +1452,7 @@ class ProjectManagementApp:
             messagebox.showwarning("Avertisment", "Selectați un proiect pentru ștergere!")
             return
 
-        project_id = self.projects_tree.item(selected[0], 'values')[0]
+        project_id = int(self.projects_tree.item(selected[0], 'values')[0])
         project_name = self.projects_tree.item(selected[0], 'values')[1]
 
         confirm = messagebox.askyesno("Confirmare",
@@ -1047,31 +1460,33 @@ class ProjectManagementApp:
         if not confirm:
             return
 
-        try:
-            # Ștergem toate datele asociate proiectului
-            self.cursor.execute("DELETE FROM tasks WHERE project_id=?", (project_id,))
-            self.cursor.execute("DELETE FROM resources WHERE project_id=?", (project_id,))
-            self.cursor.execute("DELETE FROM risks WHERE project_id=?", (project_id,))
-            self.cursor.execute("DELETE FROM stakeholders WHERE project_id=?", (project_id,))
-            self.cursor.execute("DELETE FROM projects WHERE id=?", (project_id,))
-            self.conn.commit()
+        # Citirea rămâne pe firul interfeței; în fundal ajunge doar scrierea
+        project = self.store.get_project(project_id)
+
+        def work():
+            # Ștergem toate datele asociate proiectului (în cascadă, poate dura pe proiecte mari)
+            self.store.delete_project(project_id)
+
+        def done(_):
+            if project:
+                self.dashboard.project_removed(project)
 
             messagebox.showinfo("Succes", "Proiectul a fost șters cu succes!")
-            self.load_projects()
+            # Jurnalul conține și ștergerile în cascadă; selecția curentă se golește dacă era proiectul șters
+            self.sync_changes()
             self.update_dashboard()
 
-            # Resetăm selecția curentă dacă era proiectul șters
-            if self.current_project_id == project_id:
-                self.current_project_id = None
-                self.project_combo.set('')
-                self.tasks_tree.delete(*self.tasks_tree.get_children())
-                self.resources_tree.delete(*self.resources_tree.get_children())
-                self.risks_tree.delete(*self.risks_tree.get_children())
-                self.stakeholders_tree.delete(*self.stakeholders_tree.get_children())
-        except Exception as e:
-            messagebox.showerror("Eroare", f"A apărut o eroare la ștergere: {str(e)}")
+        self.submit_write(('delete_project', project_id), work, done, "A apărut o eroare la ștergere")
 
-    def add_task(self):
+    def add_subtask(self):
+        """Adaugă un subtask sub task-ul selectat"""
+        selected = self.tasks_tree.selection()
+        if not selected:
+            messagebox.showwarning("Avertisment", "Selectați task-ul părinte!")
+            return
+        self.add_task(parent_id=int(self.tasks_tree.item(selected[0], 'values')[0]))
+
+    def add_task(self, parent_id=None):
         """Adaugă un task nou la proiectul curent"""
         if not self.current_project_id:
             messagebox.showwarning("Avertisment", "Selectați mai întâi un proiect!")
@@ -1079,7 +1494,7 @@ class ProjectManagementApp:
 
         add_window = tk.Toplevel(self.root)
         add_window.title("Adăugare Task Nou")
-        add_window.geometry("500x500")
+        add_window.geometry("500x660")
 
         # Frame principal
         main_frame = tk.Frame(add_window, padx=10, pady=10)
@@ -1114,23 +1529,50 @@ class ProjectManagementApp:
         duration_entry = tk.Entry(main_frame, width=40)
         duration_entry.grid(row=5, column=1, sticky=tk.W, pady=5)
 
-        tk.Label(main_frame, text="Progres (%):", font=('Arial', 10, 'bold')).grid(row=6, column=0, sticky=tk.W, pady=5)
+        tk.Label(main_frame, text="Estimare opt./pes.:", font=('Arial', 10, 'bold')).grid(row=6, column=0,
+                                                                                          sticky=tk.W, pady=5)
+        estimate_frame = tk.Frame(main_frame)
+        estimate_frame.grid(row=6, column=1, sticky=tk.W, pady=5)
+        optimistic_entry = tk.Entry(estimate_frame, width=18)
+        optimistic_entry.pack(side=tk.LEFT)
+        tk.Label(estimate_frame, text="–").pack(side=tk.LEFT, padx=5)
+        pessimistic_entry = tk.Entry(estimate_frame, width=18)
+        pessimistic_entry.pack(side=tk.LEFT)
+
+        tk.Label(main_frame, text="Progres (%):", font=('Arial', 10, 'bold')).grid(row=7, column=0, sticky=tk.W, pady=5)
         progress_scale = tk.Scale(main_frame, from_=0, to=100, orient=tk.HORIZONTAL)
-        progress_scale.grid(row=6, column=1, sticky=tk.W, pady=5)
+        progress_scale.grid(row=7, column=1, sticky=tk.W, pady=5)
 
-        tk.Label(main_frame, text="Status:", font=('Arial', 10, 'bold')).grid(row=7, column=0, sticky=tk.W, pady=5)
-        status_combo = ttk.Combobox(main_frame, values=["Neînceput", "În desfășurare", "Blocat", "Finalizat"], width=37)
-        status_combo.grid(row=7, column=1, sticky=tk.W, pady=5)
+        tk.Label(main_frame, text="Status:", font=('Arial', 10, 'bold')).grid(row=8, column=0, sticky=tk.W, pady=5)
+        status_combo = ttk.Combobox(main_frame, values=TASK_STATUSES, width=37)
+        status_combo.grid(row=8, column=1, sticky=tk.W, pady=5)
         status_combo.current(0)
 
-        tk.Label(main_frame, text="Prioritate:", font=('Arial', 10, 'bold')).grid(row=8, column=0, sticky=tk.W, pady=5)
-        priority_combo = ttk.Combobox(main_frame, values=["Înaltă", "Medie", "Scăzută"], width=37)
-        priority_combo.grid(row=8, column=1, sticky=tk.W, pady=5)
+        tk.Label(main_frame, text="Prioritate:", font=('Arial', 10, 'bold')).grid(row=9, column=0, sticky=tk.W, pady=5)
+        priority_combo = ttk.Combobox(main_frame, values=PRIORITIES, width=37)
+        priority_combo.grid(row=9, column=1, sticky=tk.W, pady=5)
         priority_combo.current(1)
 
+        tk.Label(main_frame, text="Dependențe (ID-uri):", font=('Arial', 10, 'bold')).grid(row=10, column=0,
+                                                                                           sticky=tk.W, pady=5)
+        dependencies_entry = tk.Entry(main_frame, width=40)
+        dependencies_entry.grid(row=10, column=1, sticky=tk.W, pady=5)
+
+        tk.Label(main_frame, text="Task părinte (ID):", font=('Arial', 10, 'bold')).grid(row=11, column=0,
+                                                                                         sticky=tk.W, pady=5)
+        parent_entry = tk.Entry(main_frame, width=40)
+        parent_entry.grid(row=11, column=1, sticky=tk.W, pady=5)
+        if parent_id is not None:
+            parent_entry.insert(0, str(parent_id))
+
+        tk.Label(main_frame, text="Cost planificat (RON):", font=('Arial', 10, 'bold')).grid(row=12, column=0,
+                                                                                             sticky=tk.W, pady=5)
+        cost_entry = tk.Entry(main_frame, width=40)
+        cost_entry.grid(row=12, column=1, sticky=tk.W, pady=5)
+
         # Butoane
         button_frame = tk.Frame(main_frame)
-        button_frame.grid(row=9, column=0, columnspan=2, pady=15)
+        button_frame.grid(row=13, column=0, columnspan=2, pady=15)
 
         tk.Button(button_frame, text="Salvează", command=lambda: self.save_task(
             self.current_project_id,
@@ -1140,9 +1582,14 @@ class ProjectManagementApp:
             start_entry.get(),
             end_entry.get(),
             duration_entry.get(),
+            optimistic_entry.get(),
+            pessimistic_entry.get(),
             progress_scale.get(),
             status_combo.get(),
             priority_combo.get(),
+            dependencies_entry.get(),
+            parent_entry.get(),
+            cost_entry.get(),
             add_window
         ), bg='#27ae60', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=10)
 
@@ -1150,7 +1597,8 @@ class ProjectManagementApp:
                   bg='#e74c3c', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=10)
 
     def save_task(self, project_id, name, description, assigned_to, start_date, end_date,
-                  duration, progress, status, priority, window):
+                  duration, optimistic, pessimistic, progress, status, priority, dependencies, parent, cost,
+                  window):
         """Salvează task-ul în baza de date"""
         if not name:
             messagebox.showerror("Eroare", "Numele task-ului este obligatoriu!")
@@ -1158,25 +1606,49 @@ class ProjectManagementApp:
 
         try:
             duration_value = int(duration) if duration else 0
-            dependencies = "[]"  # Empty JSON array for now
-
-            self.cursor.execute('''INSERT INTO tasks 
-                                        (project_id, name, description, assigned_to, 
-                                        start_date, end_date, duration, progress, 
-                                        status, priority, dependencies) 
-                                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
-                                (project_id, name, description, assigned_to,
-                                 start_date, end_date, duration_value, progress,
-                                 status, priority, dependencies))
-            self.conn.commit()
+        except ValueError:
+            messagebox.showerror("Eroare", "Durata trebuie să fie un număr întreg!")
+            return
+
+        try:
+            optimistic_value = int(optimistic) if optimistic else 0
+            pessimistic_value = int(pessimistic) if pessimistic else 0
+        except ValueError:
+            messagebox.showerror("Eroare", "Estimările optimistă și pesimistă trebuie să fie numere întregi!")
+            return
+
+        try:
+            parent_value = int(parent) if parent.strip() else None
+        except ValueError:
+            messagebox.showerror("Eroare", "Task-ul părinte trebuie să fie ID-ul unui task!")
+            return
+
+        try:
+            cost_value = float(cost) if cost.strip() else 0.0
+        except ValueError:
+            messagebox.showerror("Eroare", "Costul trebuie să fie un număr!")
+            return
 
+        try:
+            dependencies = parse_dependency_input(dependencies)
+        except ValueError as e:
+            messagebox.showerror("Eroare", str(e))
+            return
+
+        task = Task(project_id=project_id, name=name, description=description,
+                    assigned_to=assigned_to, start_date=start_date, end_date=end_date,
+                    duration=duration_value, optimistic_duration=optimistic_value,
+                    pessimistic_duration=pessimistic_value, progress=progress, status=status,
+                    priority=priority, dependencies=dependencies, parent_id=parent_value,
+                    cost=cost_value)
+
+        def done(_):
             messagebox.showinfo("Succes", "Task-ul a fost adăugat cu succes!")
             window.destroy()
-            self.load_tasks()
-        except ValueError:
-            messagebox.showerror("Eroare", "Durata trebuie să fie un număr întreg!")
-        except Exception as e:
-            messagebox.showerror("Eroare", f"A apărut o eroare: {str(e)}")
+            # Jurnalul aduce și taskurile sumare recalculate de triggerele WBS
+            self.sync_changes()
+
+        self.submit_write(('add_task', str(window)), lambda: self.store.add_task(task), done)
 
     def edit_task(self):
         """Editează un task existent"""
@@ -1185,10 +1657,8 @@ class ProjectManagementApp:
             messagebox.showwarning("Avertisment", "Selectați un task pentru editare!")
             return
 
-        task_id = self.tasks_tree.item(selected[0], 'values')[0]
-
-        self.cursor.execute("SELECT * FROM tasks WHERE id=?", (task_id,))
-        task_data = self.cursor.fetchone()
+        task_id = int(self.tasks_tree.item(selected[0], 'values')[0])
+        task_data = self.store.get_task(task_id)
 
         if not task_data:
             messagebox.showerror("Eroare", "Task-ul selectat nu a putut fi găsit!")
@@ -1196,7 +1666,7 @@ class ProjectManagementApp:
 
         edit_window = tk.Toplevel(self.root)
         edit_window.title("Editare Task")
-        edit_window.geometry("500x500")
+        edit_window.geometry("500x660")
 
         # Frame principal
         main_frame = tk.Frame(edit_window, padx=10, pady=10)
@@ -1206,54 +1676,85 @@ class ProjectManagementApp:
         tk.Label(main_frame, text="Nume Task:", font=('Arial', 10, 'bold')).grid(row=0, column=0, sticky=tk.W, pady=5)
         name_entry = tk.Entry(main_frame, width=40)
         name_entry.grid(row=0, column=1, sticky=tk.W, pady=5)
-        name_entry.insert(0, task_data[2])
+        name_entry.insert(0, task_data.name)
 
         tk.Label(main_frame, text="Descriere:", font=('Arial', 10, 'bold')).grid(row=1, column=0, sticky=tk.W, pady=5)
         desc_text = tk.Text(main_frame, width=40, height=3, wrap=tk.WORD)
         desc_text.grid(row=1, column=1, sticky=tk.W, pady=5)
-        desc_text.insert("1.0", task_data[3] or "")
+        desc_text.insert("1.0", task_data.description or "")
 
         tk.Label(main_frame, text="Responsabil:", font=('Arial', 10, 'bold')).grid(row=2, column=0, sticky=tk.W, pady=5)
         assigned_entry = tk.Entry(main_frame, width=40)
         assigned_entry.grid(row=2, column=1, sticky=tk.W, pady=5)
-        assigned_entry.insert(0, task_data[8] or "")
+        assigned_entry.insert(0, task_data.assigned_to or "")
 
         tk.Label(main_frame, text="Data Început:", font=('Arial', 10, 'bold')).grid(row=3, column=0, sticky=tk.W,
                                                                                     pady=5)
         start_entry = tk.Entry(main_frame, width=40)
         start_entry.grid(row=3, column=1, sticky=tk.W, pady=5)
-        start_entry.insert(0, task_data[4] or "")
+        start_entry.insert(0, task_data.start_date or "")
 
         tk.Label(main_frame, text="Data Sfârșit:", font=('Arial', 10, 'bold')).grid(row=4, column=0, sticky=tk.W,
                                                                                     pady=5)
         end_entry = tk.Entry(main_frame, width=40)
         end_entry.grid(row=4, column=1, sticky=tk.W, pady=5)
-        end_entry.insert(0, task_data[5] or "")
+        end_entry.insert(0, task_data.end_date or "")
 
         tk.Label(main_frame, text="Durată (zile):", font=('Arial', 10, 'bold')).grid(row=5, column=0, sticky=tk.W,
                                                                                      pady=5)
         duration_entry = tk.Entry(main_frame, width=40)
         duration_entry.grid(row=5, column=1, sticky=tk.W, pady=5)
-        duration_entry.insert(0, task_data[6] or "0")
-
-        tk.Label(main_frame, text="Progres (%):", font=('Arial', 10, 'bold')).grid(row=6, column=0, sticky=tk.W, pady=5)
+        duration_entry.insert(0, task_data.duration or "0")
+
+        tk.Label(main_frame, text="Estimare opt./pes.:", font=('Arial', 10, 'bold')).grid(row=6, column=0,
+                                                                                          sticky=tk.W, pady=5)
+        estimate_frame = tk.Frame(main_frame)
+        estimate_frame.grid(row=6, column=1, sticky=tk.W, pady=5)
+        optimistic_entry = tk.Entry(estimate_frame, width=18)
+        optimistic_entry.pack(side=tk.LEFT)
+        tk.Label(estimate_frame, text="–").pack(side=tk.LEFT, padx=5)
+        pessimistic_entry = tk.Entry(estimate_frame, width=18)
+        pessimistic_entry.pack(side=tk.LEFT)
+        optimistic_entry.insert(0, task_data.optimistic_duration or "")
+        pessimistic_entry.insert(0, task_data.pessimistic_duration or "")
+
+        tk.Label(main_frame, text="Progres (%):", font=('Arial', 10, 'bold')).grid(row=7, column=0, sticky=tk.W, pady=5)
         progress_scale = tk.Scale(main_frame, from_=0, to=100, orient=tk.HORIZONTAL)
-        progress_scale.grid(row=6, column=1, sticky=tk.W, pady=5)
-        progress_scale.set(task_data[11] or 0)
-
-        tk.Label(main_frame, text="Status:", font=('Arial', 10, 'bold')).grid(row=7, column=0, sticky=tk.W, pady=5)
-        status_combo = ttk.Combobox(main_frame, values=["Neînceput", "În desfășurare", "Blocat", "Finalizat"], width=37)
-        status_combo.grid(row=7, column=1, sticky=tk.W, pady=5)
-        status_combo.set(task_data[12] or "Neînceput")
-
-        tk.Label(main_frame, text="Prioritate:", font=('Arial', 10, 'bold')).grid(row=8, column=0, sticky=tk.W, pady=5)
-        priority_combo = ttk.Combobox(main_frame, values=["Înaltă", "Medie", "Scăzută"], width=37)
-        priority_combo.grid(row=8, column=1, sticky=tk.W, pady=5)
-        priority_combo.set(task_data[13] or "Medie")
+        progress_scale.grid(row=7, column=1, sticky=tk.W, pady=5)
+        progress_scale.set(task_data.progress or 0)
+
+        tk.Label(main_frame, text="Status:", font=('Arial', 10, 'bold')).grid(row=8, column=0, sticky=tk.W, pady=5)
+        status_combo = ttk.Combobox(main_frame, values=TASK_STATUSES, width=37)
+        status_combo.grid(row=8, column=1, sticky=tk.W, pady=5)
+        status_combo.set(task_data.status or "Neînceput")
+
+        tk.Label(main_frame, text="Prioritate:", font=('Arial', 10, 'bold')).grid(row=9, column=0, sticky=tk.W, pady=5)
+        priority_combo = ttk.Combobox(main_frame, values=PRIORITIES, width=37)
+        priority_combo.grid(row=9, column=1, sticky=tk.W, pady=5)
+        priority_combo.set(task_data.priority or "Medie")
+
+        tk.Label(main_frame, text="Dependențe (ID-uri):", font=('Arial', 10, 'bold')).grid(row=10, column=0,
+                                                                                           sticky=tk.W, pady=5)
+        dependencies_entry = tk.Entry(main_frame, width=40)
+        dependencies_entry.grid(row=10, column=1, sticky=tk.W, pady=5)
+        dependencies_entry.insert(0, format_dependencies(task_data.dependencies))
+
+        tk.Label(main_frame, text="Task părinte (ID):", font=('Arial', 10, 'bold')).grid(row=11, column=0,
+                                                                                         sticky=tk.W, pady=5)
+        parent_entry = tk.Entry(main_frame, width=40)
+        parent_entry.grid(row=11, column=1, sticky=tk.W, pady=5)
+        if task_data.parent_id is not None:
+            parent_entry.insert(0, str(task_data.parent_id))
+
+        tk.Label(main_frame, text="Cost planificat (RON):", font=('Arial', 10, 'bold')).grid(row=12, column=0,
+                                                                                             sticky=tk.W, pady=5)
+        cost_entry = tk.Entry(main_frame, width=40)
+        cost_entry.grid(row=12, column=1, sticky=tk.W, pady=5)
+        cost_entry.insert(0, f"{task_data.cost or 0:g}")
 
         # Butoane
         button_frame = tk.Frame(main_frame)
-        button_frame.grid(row=9, column=0, columnspan=2, pady=15)
+        button_frame.grid(row=13, column=0, columnspan=2, pady=15)
 
         tk.Button(button_frame, text="Salvează", command=lambda: self.update_task(
             task_id,
@@ -1263,9 +1764,14 @@ class ProjectManagementApp:
             start_entry.get(),
             end_entry.get(),
             duration_entry.get(),
+            optimistic_entry.get(),
+            pessimistic_entry.get(),
             progress_scale.get(),
             status_combo.get(),
             priority_combo.get(),
+            dependencies_entry.get(),
+            parent_entry.get(),
+            cost_entry.get(),
             edit_window
         ), bg='#27ae60', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=10)
 
@@ -1273,7 +1779,8 @@ class ProjectManagementApp:
                   bg='#e74c3c', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=10)
 
     def update_task(self, task_id, name, description, assigned_to, start_date, end_date,
-                    duration, progress, status, priority, window):
+                    duration, optimistic, pessimistic, progress, status, priority, dependencies, parent, cost,
+                    window):
         """Actualizează task-ul în baza de date"""
         if not name:
             messagebox.showerror("Eroare", "Numele task-ului este obligatoriu!")
@@ -1281,24 +1788,65 @@ class ProjectManagementApp:
 
         try:
             duration_value = int(duration) if duration else 0
-
-            self.cursor.execute('''UPDATE tasks SET 
-                                        name=?, description=?, assigned_to=?, 
-                                        start_date=?, end_date=?, duration=?, 
-                                        progress=?, status=?, priority=? 
-                                        WHERE id=?''',
-                                (name, description, assigned_to,
-                                 start_date, end_date, duration_value,
-                                 progress, status, priority, task_id))
-            self.conn.commit()
-
-            messagebox.showinfo("Succes", "Task-ul a fost actualizat cu succes!")
-            window.destroy()
-            self.load_tasks()
         except ValueError:
             messagebox.showerror("Eroare", "Durata trebuie să fie un număr întreg!")
-        except Exception as e:
-            messagebox.showerror("Eroare", f"A apărut o eroare: {str(e)}")
+            return
+
+        try:
+            optimistic_value = int(optimistic) if optimistic else 0
+            pessimistic_value = int(pessimistic) if pessimistic else 0
+        except ValueError:
+            messagebox.showerror("Eroare", "Estimările optimistă și pesimistă trebuie să fie numere întregi!")
+            return
+
+        try:
+            parent_value = int(parent) if parent.strip() else None
+        except ValueError:
+            messagebox.showerror("Eroare", "Task-ul părinte trebuie să fie ID-ul unui task!")
+            return
+
+        try:
+            cost_value = float(cost) if cost.strip() else 0.0
+        except ValueError:
+            messagebox.showerror("Eroare", "Costul trebuie să fie un număr!")
+            return
+
+        try:
+            dependencies = parse_dependency_input(dependencies)
+        except ValueError as e:
+            messagebox.showerror("Eroare", str(e))
+            return
+
+        task = self.store.get_task(task_id)
+        if not task:
+            messagebox.showerror("Eroare", "Task-ul nu mai există!")
+            return
+        task.name = name
+        task.description = description
+        task.assigned_to = assigned_to
+        task.start_date = start_date
+        task.end_date = end_date
+        task.duration = duration_value
+        task.optimistic_duration = optimistic_value
+        task.pessimistic_duration = pessimistic_value
+        task.progress = progress
+        task.status = status
+        task.priority = priority
+        task.dependencies = dependencies
+        task.parent_id = parent_value
+        task.cost = cost_value
+
+        def done(moved):
+            message = "Task-ul a fost actualizat cu succes!"
+            if moved:
+                message += f"\nTaskuri reprogramate după dependențe: {len(moved)}"
+            messagebox.showinfo("Succes", message)
+            window.destroy()
+            # Taskurile mutate ajung în liste și în Gantt prin jurnalul de modificări
+            self.sync_changes()
+
+        # Propagarea parcurge succesorii și rescrie taskurile mutate: rulează în fundal
+        self.submit_write(('update_task', task_id), lambda: self.store.update_task(task), done)
 
     def delete_task(self):
         """Șterge task-ul selectat"""
@@ -1307,22 +1855,21 @@ class ProjectManagementApp:
             messagebox.showwarning("Avertisment", "Selectați un task pentru ștergere!")
             return
 
-        task_id = self.tasks_tree.item(selected[0], 'values')[0]
-        task_name = self.tasks_tree.item(selected[0], 'values')[1]
+        task_id = int(self.tasks_tree.item(selected[0], 'values')[0])
+        task_name = self.tasks_tree.item(selected[0], 'text')
 
         confirm = messagebox.askyesno("Confirmare",
-                                      f"Sunteți sigur că doriți să ștergeți task-ul '{task_name}'?")
+                                      f"Sunteți sigur că doriți să ștergeți task-ul '{task_name}'?\n"
+                                      "Subtaskurile lui vor fi șterse și ele.")
         if not confirm:
             return
 
-        try:
-            self.cursor.execute("DELETE FROM tasks WHERE id=?", (task_id,))
-            self.conn.commit()
-
+        def done(_):
             messagebox.showinfo("Succes", "Task-ul a fost șters cu succes!")
-            self.load_tasks()
-        except Exception as e:
-            messagebox.showerror("Eroare", f"A apărut o eroare la ștergere: {str(e)}")
+            self.sync_changes()
+
+        self.submit_write(('delete_task', task_id), lambda: self.store.delete_task(task_id), done,
+                          "A apărut o eroare la ștergere")
 
     def generate_gantt(self):
         """Generează diagrama Gantt pentru proiectul selectat"""
@@ -1332,78 +1879,164 @@ class ProjectManagementApp:
             return
 
         project_id = int(selection.split(' - ')[0])
+        self.runner.submit('gantt', lambda: self.prepare_gantt(project_id),
+                           on_done=self.draw_gantt, on_error=self.show_error)
 
-        self.cursor.execute("SELECT name FROM projects WHERE id=?", (project_id,))
-        project_name = self.cursor.fetchone()[0]
-
-        self.cursor.execute('''SELECT name, start_date, end_date, progress, status 
-                                    FROM tasks WHERE project_id=? ORDER BY start_date''', (project_id,))
-        tasks = self.cursor.fetchall()
+    def show_monte_carlo(self):
+        """Simularea Monte Carlo a termenului și costului pentru proiectul selectat în Gantt"""
+        selection = self.gantt_project_combo.get()
+        if not selection:
+            messagebox.showwarning("Avertisment", "Selectați un proiect pentru simulare!")
+            return
+        project_id = int(selection.split(' - ')[0])
 
-        if not tasks:
+        window = tk.Toplevel(self.root)
+        window.title(f"Simulare Monte Carlo - {selection}")
+        window.geometry("1200x650")
+
+        controls = tk.Frame(window)
+        controls.pack(fill=tk.X, padx=10, pady=5)
+        tk.Label(controls, text="Iterații:", font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=5)
+        iterations_combo = ttk.Combobox(controls, values=MONTE_CARLO_ITERATIONS, width=10, state='readonly')
+        iterations_combo.set(MONTE_CARLO_ITERATIONS[0])
+        iterations_combo.pack(side=tk.LEFT, padx=5)
+        tk.Label(controls, text="Distribuție:", font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=5)
+        distribution_combo = ttk.Combobox(controls, values=list(MONTE_CARLO_DISTRIBUTIONS), width=15,
+                                          state='readonly')
+        distribution_combo.set(next(iter(MONTE_CARLO_DISTRIBUTIONS)))
+        distribution_combo.pack(side=tk.LEFT, padx=5)
+        tk.Label(controls, text="Tornado:", font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=5)
+        tornado_combo = ttk.Combobox(controls, values=list(TORNADO_TARGETS), width=10, state='readonly')
+        tornado_combo.set(next(iter(TORNADO_TARGETS)))
+        tornado_combo.pack(side=tk.LEFT, padx=5)
+        summary = tk.Label(window, text="Se simulează...", fg='#7f8c8d', anchor=tk.W, justify=tk.LEFT,
+                           font=('Courier', 10))
+        summary.pack(fill=tk.X, padx=15)
+
+        chart_frame = tk.LabelFrame(window, text="Rezultatele simulării", font=('Arial', 12, 'bold'))
+        chart_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        fig, ax, canvas = embed_figure(chart_frame, (12, 4))
+        ax.remove()
+        finish_ax, cost_ax, tornado_ax = fig.subplots(1, 3)
+
+        from montecarlo import simulate_project, draw_histogram, draw_tornado
+        results = []
+
+        def draw_tornado_chart(event=None):
+            if results:
+                draw_tornado(tornado_ax, results[-1], TORNADO_TARGETS[tornado_combo.get()])
+                fig.tight_layout()
+                canvas.draw_idle()
+
+        def show(result):
+            if not window.winfo_exists():
+                return
+            results.append(result)
+            lines = [f"{'':<6}{'Finalizare':<14}{'Cost (RON)':>16}"]
+            for level, (finish, cost) in result.percentiles().items():
+                lines.append(f"P{level:<5}{finish.isoformat():<14}{cost:>16,.0f}")
+            lines.append(f"CPM (durate probabile): {result.finish_date(result.deterministic_finish).isoformat()}"
+                         f"   buget: {result.budget:,.0f} RON")
+            on_time = result.on_time_probability()
+            if on_time is not None:
+                lines.append(f"Probabilitate de finalizare până la {result.planned_end.isoformat()}: "
+                             f"{on_time:.0%}")
+            summary.config(text="\n".join(lines), fg='#2c3e50')
+            draw_histogram(finish_ax, result)
+            draw_histogram(cost_ax, result, 'cost')
+            draw_tornado_chart()
+
+        def compute(event=None):
+            iterations = int(iterations_combo.get())
+            distribution = MONTE_CARLO_DISTRIBUTIONS[distribution_combo.get()]
+            summary.config(text="Se simulează...", fg='#7f8c8d')
+            self.runner.submit('montecarlo',
+                               lambda: simulate_project(self.store, project_id, iterations, distribution),
+                               on_done=show, on_error=self.show_error)
+
+        iterations_combo.bind('<<ComboboxSelected>>', compute)
+        distribution_combo.bind('<<ComboboxSelected>>', compute)
+        tornado_combo.bind('<<ComboboxSelected>>', draw_tornado_chart)
+        compute()
+
+    def refresh_gantt(self, project_id):
+        """Reface diagrama afișată după adăugarea sau ștergerea unor taskuri, fără mesaje"""
+        self.runner.submit('gantt', lambda: self.prepare_gantt(project_id, allow_empty=True),
+                           on_done=self.gantt_chart.set_data, on_error=self.show_error)
+
+    def prepare_gantt(self, project_id, allow_empty=False):
+        """Citește taskurile și calculează datele diagramei (rulează în thread-ul de lucru)"""
+        with self.store.snapshot() as store:
+            project = store.get_project(project_id)
+            tasks = store.gantt_tasks(project_id)
+
+        if not tasks and not allow_empty:
+            return None
+
+        from gantt import build_gantt_data
+
+        # Drumul critic; un ciclu rămas din date mai vechi doar dezactivează evidențierea
+        try:
+            schedule = ScheduleGraph(tasks)
+        except CycleError:
+            schedule = None
+        return build_gantt_data(project_id, project.name if project else "", tasks, schedule)
+
+    def draw_gantt(self, data):
+        """Desenează diagrama Gantt din datele pregătite (în thread-ul Tk)"""
+        if data is None:
             messagebox.showinfo("Informație", "Nu există task-uri pentru acest proiect!")
             return
 
-        # Procesare date pentru Gantt
-        task_names = []
-        start_dates = []
-        end_dates = []
-        colors = []
-
-        for task in tasks:
-            task_names.append(task[0])
-
-            try:
-                start_date = datetime.datetime.strptime(task[1], "%Y-%m-%d").date()
-                end_date = datetime.datetime.strptime(task[2], "%Y-%m-%d").date()
-            except:
-                start_date = datetime.date.today()
-                end_date = datetime.date.today() + datetime.timedelta(days=1)
-
-            start_dates.append(start_date)
-            end_dates.append(end_date)
-
-            # Setează culoarea în funcție de status
-            if task[4] == "Finalizat":
-                colors.append('#2ecc71')  # Verde
-            elif task[4] == "În desfășurare":
-                colors.append('#3498db')  # Albastru
-            elif task[4] == "Blocat":
-                colors.append('#e74c3c')  # Roșu
-            else:
-                colors.append('#f39c12')  # Portocaliu
+        self.gantt_chart.set_data(data)
+
+    def show_portfolio_timeline(self):
+        """Toate proiectele pe aceeași axă a timpului; taskurile apar la zoom, dublu-click deschide proiectul"""
+        window = tk.Toplevel(self.root)
+        window.title("Timeline portofoliu")
+        window.geometry("1300x800")
+
+        from timeline import PortfolioTimeline, portfolio_timeline, load_details, DETAIL_DAYS
+
+        controls = tk.Frame(window)
+        controls.pack(fill=tk.X, padx=10, pady=5)
+        tk.Button(controls, text="🔄 Reîncarcă", command=lambda: load(),
+                  bg='#3498db', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=5)
+        hint = (f"Rotiță: derulare proiecte  |  Ctrl + rotiță: zoom (taskuri sub {DETAIL_DAYS} zile)  |  "
+                "Shift + rotiță: deplasare  |  Dublu-click: Gantt-ul proiectului")
+        tk.Label(controls, text=hint, fg='#7f8c8d').pack(side=tk.RIGHT, padx=5)
 
-        # Convertim datele pentru matplotlib
-        start_dates_num = [dates.date2num(d) for d in start_dates]
-        durations = [dates.date2num(end) - dates.date2num(start)
-                     for start, end in zip(start_dates, end_dates)]
+        chart_frame = tk.LabelFrame(window, text="Proiecte", font=('Arial', 12, 'bold'))
+        chart_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        fig, ax, canvas = embed_figure(chart_frame, (13, 8))
+
+        def request_details(request, project_ids, first_day, last_day):
+            # O cerere nouă (derulare, zoom) o anulează pe cea în curs
+            def show_details(details):
+                if window.winfo_exists():
+                    chart.set_details(request, details)
 
-        # Creare diagramă Gantt
-        self.gantt_ax.clear()
+            self.runner.submit('timeline-details', lambda: load_details(self.store, project_ids, first_day, last_day),
+                               on_done=show_details, on_error=self.show_error)
 
-        y_pos = range(len(task_names))
-        self.gantt_ax.barh(y_pos, durations, left=start_dates_num, height=0.5,
-                           align='center', color=colors)
+        chart = PortfolioTimeline(fig, ax, canvas, request_details, on_open=self.open_project_gantt)
 
-        # Adăugăm procentul de completare pe fiecare bară
-        for i, (task, progress) in enumerate(zip(tasks, [t[3] for t in tasks])):
-            if progress > 0:
-                x_pos = start_dates_num[i] + durations[i] * (progress / 100) / 2
-                self.gantt_ax.text(x_pos, i, f"{progress}%",
-                                   ha='center', va='center', color='white', fontweight='bold')
+        def show(data):
+            if window.winfo_exists():
+                chart.set_data(data)
 
-        # Formatare axă
-        self.gantt_ax.set_yticks(y_pos)
-        self.gantt_ax.set_yticklabels(task_names)
-        self.gantt_ax.set_title(f"Diagrama Gantt - {project_name}")
-        self.gantt_ax.set_xlabel("Timeline")
-        self.gantt_ax.grid(True)
+        def load():
+            self.runner.submit('timeline', lambda: portfolio_timeline(self.store), on_done=show,
+                               on_error=self.show_error)
 
-        # Formatare date pe axa X
-        self.gantt_ax.xaxis_date()
-        self.gantt_fig.autofmt_xdate()
+        load()
 
-        self.gantt_canvas.draw()
+    def open_project_gantt(self, project_id):
+        """Detalierea unui proiect din timeline-ul portofoliului: diagrama Gantt a proiectului"""
+        self.show_tab('gantt')
+        self.select_project(project_id)
+        self.generate_gantt()
+        self.root.lift()
 
     def add_resource(self):
         """Adaugă o resursă nouă la proiectul curent"""
@@ -1426,8 +2059,7 @@ class ProjectManagementApp:
         name_entry.grid(row=0, column=1, sticky=tk.W, pady=5)
 
         tk.Label(main_frame, text="Tip Resursă:", font=('Arial', 10, 'bold')).grid(row=1, column=0, sticky=tk.W, pady=5)
-        type_combo = ttk.Combobox(main_frame, values=["Uman", "Material", "Financiar", "Tehnic", "Informațional"],
-                                  width=37)
+        type_combo = ttk.Combobox(main_frame, values=RESOURCE_TYPES, width=37)
         type_combo.grid(row=1, column=1, sticky=tk.W, pady=5)
         type_combo.current(0)
 
@@ -1444,7 +2076,7 @@ class ProjectManagementApp:
 
         tk.Label(main_frame, text="Disponibilitate:", font=('Arial', 10, 'bold')).grid(row=4, column=0, sticky=tk.W,
                                                                                        pady=5)
-        avail_combo = ttk.Combobox(main_frame, values=["Disponibil", "Parțial", "Indisponibil"], width=37)
+        avail_combo = ttk.Combobox(main_frame, values=AVAILABILITY_VALUES, width=37)
         avail_combo.grid(row=4, column=1, sticky=tk.W, pady=5)
         avail_combo.current(0)
 
@@ -1474,23 +2106,20 @@ class ProjectManagementApp:
         try:
             cost_value = float(cost) if cost else 0.0
             quantity_value = int(quantity) if quantity else 1
-            total_cost = cost_value * quantity_value
+        except ValueError:
+            messagebox.showerror("Eroare", "Costul și cantitatea trebuie să fie numere valide!")
+            return
 
-            self.cursor.execute('''INSERT INTO resources 
-                                        (project_id, name, type, cost_per_unit, 
-                                        quantity, total_cost, availability) 
-                                        VALUES (?, ?, ?, ?, ?, ?, ?)''',
-                                (project_id, name, type_res, cost_value,
-                                 quantity_value, total_cost, availability))
-            self.conn.commit()
+        # Costul total este calculat de store din cost/unitate x cantitate
+        resource = Resource(project_id=project_id, name=name, type=type_res, cost_per_unit=cost_value,
+                            quantity=quantity_value, availability=availability)
 
+        def done(_):
             messagebox.showinfo("Succes", "Resursa a fost adăugată cu succes!")
             window.destroy()
-            self.load_resources()
-        except ValueError:
-            messagebox.showerror("Eroare", "Costul și cantitatea trebuie să fie numere valide!")
-        except Exception as e:
-            messagebox.showerror("Eroare", f"A apărut o eroare: {str(e)}")
+            self.sync_changes()
+
+        self.submit_write(('add_resource', str(window)), lambda: self.store.add_resource(resource), done)
 
     def edit_resource(self):
         """Editează o resursă existentă"""
@@ -1499,10 +2128,8 @@ class ProjectManagementApp:
             messagebox.showwarning("Avertisment", "Selectați o resursă pentru editare!")
             return
 
-        resource_id = self.resources_tree.item(selected[0], 'values')[0]
-
-        self.cursor.execute("SELECT * FROM resources WHERE id=?", (resource_id,))
-        resource_data = self.cursor.fetchone()
+        resource_id = int(self.resources_tree.item(selected[0], 'values')[0])
+        resource_data = self.store.get_resource(resource_id)
 
         if not resource_data:
             messagebox.showerror("Eroare", "Resursa selectată nu a putut fi găsită!")
@@ -1521,30 +2148,29 @@ class ProjectManagementApp:
                                                                                     pady=5)
         name_entry = tk.Entry(main_frame, width=40)
         name_entry.grid(row=0, column=1, sticky=tk.W, pady=5)
-        name_entry.insert(0, resource_data[2])
+        name_entry.insert(0, resource_data.name)
 
         tk.Label(main_frame, text="Tip Resursă:", font=('Arial', 10, 'bold')).grid(row=1, column=0, sticky=tk.W, pady=5)
-        type_combo = ttk.Combobox(main_frame, values=["Uman", "Material", "Financiar", "Tehnic", "Informațional"],
-                                  width=37)
+        type_combo = ttk.Combobox(main_frame, values=RESOURCE_TYPES, width=37)
         type_combo.grid(row=1, column=1, sticky=tk.W, pady=5)
-        type_combo.set(resource_data[3] or "Uman")
+        type_combo.set(resource_data.type or "Uman")
 
         tk.Label(main_frame, text="Cost per Unitate (RON):", font=('Arial', 10, 'bold')).grid(row=2, column=0,
                                                                                               sticky=tk.W, pady=5)
         cost_entry = tk.Entry(main_frame, width=40)
         cost_entry.grid(row=2, column=1, sticky=tk.W, pady=5)
-        cost_entry.insert(0, resource_data[4] or "0.00")
+        cost_entry.insert(0, resource_data.cost_per_unit or "0.00")
 
         tk.Label(main_frame, text="Cantitate:", font=('Arial', 10, 'bold')).grid(row=3, column=0, sticky=tk.W, pady=5)
         quantity_entry = tk.Entry(main_frame, width=40)
         quantity_entry.grid(row=3, column=1, sticky=tk.W, pady=5)
-        quantity_entry.insert(0, resource_data[5] or "1")
+        quantity_entry.insert(0, resource_data.quantity or "1")
 
         tk.Label(main_frame, text="Disponibilitate:", font=('Arial', 10, 'bold')).grid(row=4, column=0, sticky=tk.W,
                                                                                        pady=5)
-        avail_combo = ttk.Combobox(main_frame, values=["Disponibil", "Parțial", "Indisponibil"], width=37)
+        avail_combo = ttk.Combobox(main_frame, values=AVAILABILITY_VALUES, width=37)
         avail_combo.grid(row=4, column=1, sticky=tk.W, pady=5)
-        avail_combo.set(resource_data[7] or "Disponibil")
+        avail_combo.set(resource_data.availability or "Disponibil")
 
         # Butoane
         button_frame = tk.Frame(main_frame)
@@ -1572,23 +2198,26 @@ class ProjectManagementApp:
         try:
             cost_value = float(cost) if cost else 0.0
             quantity_value = int(quantity) if quantity else 1
-            total_cost = cost_value * quantity_value
+        except ValueError:
+            messagebox.showerror("Eroare", "Costul și cantitatea trebuie să fie numere valide!")
+            return
 
-            self.cursor.execute('''UPDATE resources SET 
-                                        name=?, type=?, cost_per_unit=?, 
-                                        quantity=?, total_cost=?, availability=? 
-                                        WHERE id=?''',
-                                (name, type_res, cost_value,
-                                 quantity_value, total_cost, availability, resource_id))
-            self.conn.commit()
+        resource = self.store.get_resource(resource_id)
+        if not resource:
+            messagebox.showerror("Eroare", "Resursa nu mai există!")
+            return
+        resource.name = name
+        resource.type = type_res
+        resource.cost_per_unit = cost_value
+        resource.quantity = quantity_value
+        resource.availability = availability
 
+        def done(_):
             messagebox.showinfo("Succes", "Resursa a fost actualizată cu succes!")
             window.destroy()
-            self.load_resources()
-        except ValueError:
-            messagebox.showerror("Eroare", "Costul și cantitatea trebuie să fie numere valide!")
-        except Exception as e:
-            messagebox.showerror("Eroare", f"A apărut o eroare: {str(e)}")
+            self.sync_changes()
+
+        self.submit_write(('update_resource', resource_id), lambda: self.store.update_resource(resource), done)
 
     def delete_resource(self):
         """Șterge resursa selectată"""
@@ -1597,7 +2226,7 @@ class ProjectManagementApp:
             messagebox.showwarning("Avertisment", "Selectați o resursă pentru ștergere!")
             return
 
-        resource_id = self.resources_tree.item(selected[0], 'values')[0]
+        resource_id = int(self.resources_tree.item(selected[0], 'values')[0])
         resource_name = self.resources_tree.item(selected[0], 'values')[1]
 
         confirm = messagebox.askyesno("Confirmare",
@@ -1605,14 +2234,175 @@ class ProjectManagementApp:
         if not confirm:
             return
 
-        try:
-            self.cursor.execute("DELETE FROM resources WHERE id=?", (resource_id,))
-            self.conn.commit()
-
+        def done(_):
             messagebox.showinfo("Succes", "Resursa a fost ștearsă cu succes!")
-            self.load_resources()
-        except Exception as e:
-            messagebox.showerror("Eroare", f"A apărut o eroare la ștergere: {str(e)}")
+            self.sync_changes()
+
+        self.submit_write(('delete_resource', resource_id), lambda: self.store.delete_resource(resource_id), done,
+                          "A apărut o eroare la ștergere")
+
+    def show_capacity(self):
+        """Încărcarea resurselor din tot portofoliul: supraalocările și histograma"""
+        window = tk.Toplevel(self.root)
+        window.title("Încărcarea resurselor")
+        window.geometry("1000x700")
+
+        controls = tk.Frame(window)
+        controls.pack(fill=tk.X, padx=10, pady=5)
+        tk.Label(controls, text="Interval:", font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=5)
+        bucket_combo = ttk.Combobox(controls, values=list(CAPACITY_BUCKETS), width=12, state='readonly')
+        bucket_combo.set(next(iter(CAPACITY_BUCKETS)))
+        bucket_combo.pack(side=tk.LEFT, padx=5)
+        tk.Label(controls, text="Resursă:", font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=5)
+        resource_combo = ttk.Combobox(controls, values=[PORTFOLIO_LABEL], width=30, state='readonly')
+        resource_combo.set(PORTFOLIO_LABEL)
+        resource_combo.pack(side=tk.LEFT, padx=5)
+        summary = tk.Label(window, text="Se calculează...", fg='#7f8c8d', anchor=tk.W, justify=tk.LEFT)
+        summary.pack(fill=tk.X, padx=15)
+
+        over_frame = tk.LabelFrame(window, text="Resurse supraalocate", font=('Arial', 12, 'bold'))
+        over_frame.pack(fill=tk.X, padx=10, pady=5)
+        over_columns = ('Resursă', 'Capacitate/zi', 'Vârf/zi', 'Intervale supraalocate', 'Prima supraalocare')
+        over_tree = ttk.Treeview(over_frame, columns=over_columns, show='headings', height=6)
+        for col in over_columns:
+            over_tree.heading(col, text=col)
+            over_tree.column(col, width=150, anchor=tk.CENTER)
+        over_scrollbar = ttk.Scrollbar(over_frame, orient=tk.VERTICAL, command=over_tree.yview)
+        over_tree.configure(yscrollcommand=over_scrollbar.set)
+        over_tree.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(10, 0), pady=10)
+        over_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
+
+        chart_frame = tk.LabelFrame(window, text="Histograma încărcării", font=('Arial', 12, 'bold'))
+        chart_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        fig, ax, canvas = embed_figure(chart_frame, (10, 4))
+
+        from capacity import capacity_plan, draw_histogram
+        plans = []
+
+        def draw(event=None):
+            if plans:
+                name = resource_combo.get()
+                draw_histogram(ax, plans[-1], None if name == PORTFOLIO_LABEL else name)
+                canvas.draw_idle()
+
+        def show(plan):
+            if not window.winfo_exists():
+                return
+            plans.append(plan)
+            over = plan.over_allocated()
+            over_tree.delete(*over_tree.get_children())
+            for item in over:
+                over_tree.insert('', tk.END, values=(item.name, f"{item.capacity:g}", f"{item.peak:.2f}",
+                                                     item.buckets, item.first.isoformat()))
+            resource_combo['values'] = [PORTFOLIO_LABEL] + sorted(plan.names, key=str.casefold)
+            if resource_combo.get() not in plan.names:
+                resource_combo.set(PORTFOLIO_LABEL)
+            text = f"{len(over)} din {len(plan.names)} resurse supraalocate"
+            if plan.unmatched:
+                names = sorted(plan.unmatched, key=plan.unmatched.get, reverse=True)
+                more = f" și încă {len(names) - 10}" if len(names) > 10 else ""
+                text += f"\nResponsabili fără resursă în niciun proiect: {', '.join(names[:10])}{more}"
+            summary.config(text=text)
+            draw()
+
+        def compute(event=None):
+            bucket = CAPACITY_BUCKETS[bucket_combo.get()]
+            self.runner.submit('capacity', lambda: capacity_plan(self.store, bucket=bucket),
+                               on_done=show, on_error=self.show_error)
+
+        def on_over_selected(event):
+            selected = over_tree.selection()
+            if selected:
+                resource_combo.set(over_tree.item(selected[0], 'values')[0])
+                draw()
+
+        bucket_combo.bind('<<ComboboxSelected>>', compute)
+        resource_combo.bind('<<ComboboxSelected>>', draw)
+        over_tree.bind('<<TreeviewSelect>>', on_over_selected)
+        compute()
+
+    def show_risk_map(self):
+        """Matricea probabilitate x impact din tot portofoliul, expunerea pe proiecte și riscurile ridicate"""
+        window = tk.Toplevel(self.root)
+        window.title("Harta riscurilor portofoliului")
+        window.geometry("1100x700")
+
+        controls = tk.Frame(window)
+        controls.pack(fill=tk.X, padx=10, pady=5)
+        tk.Label(controls, text="Riscuri:", font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=5)
+        filter_combo = ttk.Combobox(controls, values=list(RISK_MAP_FILTERS), width=12, state='readonly')
+        filter_combo.set(next(iter(RISK_MAP_FILTERS)))
+        filter_combo.pack(side=tk.LEFT, padx=5)
+        summary = tk.Label(controls, text="Se calculează...", fg='#7f8c8d')
+        summary.pack(side=tk.LEFT, padx=15)
+
+        top_frame = tk.Frame(window)
+        top_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        chart_frame = tk.LabelFrame(top_frame, text="Probabilitate × impact", font=('Arial', 12, 'bold'))
+        chart_frame.pack(side=tk.LEFT, fill=tk.BOTH, padx=(0, 5))
+        fig, ax, canvas = embed_figure(chart_frame, (5, 4))
+
+        exposure_frame = tk.LabelFrame(top_frame, text="Expunere pe proiect", font=('Arial', 12, 'bold'))
+        exposure_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0))
+        exposure_columns = ('ID', 'Proiect', 'Riscuri', 'Ridicate', 'Scor total', 'Cost potențial')
+        exposure_tree = ttk.Treeview(exposure_frame, columns=exposure_columns, show='headings')
+        for col in exposure_columns:
+            exposure_tree.heading(col, text=col)
+            exposure_tree.column(col, width=90, anchor=tk.CENTER)
+        exposure_tree.column('Proiect', width=200, anchor=tk.W)
+        exposure_scrollbar = ttk.Scrollbar(exposure_frame, orient=tk.VERTICAL, command=exposure_tree.yview)
+        exposure_tree.configure(yscrollcommand=exposure_scrollbar.set)
+        exposure_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(10, 0), pady=10)
+        exposure_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
+
+        high_frame = tk.LabelFrame(window, text="Riscuri ridicate", font=('Arial', 12, 'bold'))
+        high_frame.pack(fill=tk.X, padx=10, pady=5)
+        high_columns = ('ID', 'Proiect', 'Descriere', 'Probabilitate', 'Impact', 'Scor', 'Status')
+        high_tree = ttk.Treeview(high_frame, columns=high_columns, show='headings', height=8)
+        for col in high_columns:
+            high_tree.heading(col, text=col)
+            high_tree.column(col, width=110, anchor=tk.CENTER)
+        high_tree.column('Descriere', width=250, anchor=tk.W)
+        high_scrollbar = ttk.Scrollbar(high_frame, orient=tk.VERTICAL, command=high_tree.yview)
+        high_tree.configure(yscrollcommand=high_scrollbar.set)
+        high_tree.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(10, 0), pady=10)
+        high_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
+
+        from riskmap import risk_map, draw_heat_map
+
+        def work(statuses):
+            result = risk_map(self.store, statuses)
+            with self.store.snapshot() as store:
+                return result, store.high_risks(open_statuses=statuses)
+
+        def show(outcome):
+            if not window.winfo_exists():
+                return
+            result, high = outcome
+            names = {item.project_id: item.name for item in result.exposure}
+            exposure_tree.delete(*exposure_tree.get_children())
+            for item in result.exposure:
+                exposure_tree.insert('', tk.END, values=(item.project_id, item.name, item.risks, item.high,
+                                                         f"{item.score:g}", f"{item.cost:,.0f}"))
+            high_tree.delete(*high_tree.get_children())
+            for risk in high:
+                high_tree.insert('', tk.END, values=(risk.id, names.get(risk.project_id, risk.project_id),
+                                                     risk.description, risk.probability, risk.impact,
+                                                     risk.risk_score, risk.status))
+            text = f"{result.total} riscuri în {len(result.exposure)} proiecte, {len(high)} ridicate"
+            if result.other:
+                text += f" ({result.other} cu probabilitate sau impact necunoscut)"
+            summary.config(text=text, fg='#2c3e50')
+            draw_heat_map(ax, result)
+            fig.tight_layout()
+            canvas.draw_idle()
+
+        def compute(event=None):
+            statuses = RISK_MAP_FILTERS[filter_combo.get()]
+            self.runner.submit('riskmap', lambda: work(statuses), on_done=show, on_error=self.show_error)
+
+        filter_combo.bind('<<ComboboxSelected>>', compute)
+        compute()
 
     def add_risk(self):
         """Adaugă un risc nou la proiectul curent"""
@@ -1622,7 +2412,7 @@ class ProjectManagementApp:
 
         add_window = tk.Toplevel(self.root)
         add_window.title("Adăugare Risc Nou")
-        add_window.geometry("500x500")
+        add_window.geometry("500x540")
 
         # Frame principal
         main_frame = tk.Frame(add_window, padx=10, pady=10)
@@ -1636,34 +2426,46 @@ class ProjectManagementApp:
 
         tk.Label(main_frame, text="Probabilitate:", font=('Arial', 10, 'bold')).grid(row=1, column=0, sticky=tk.W,
                                                                                      pady=5)
-        prob_combo = ttk.Combobox(main_frame, values=["Mică", "Medie", "Mare"], width=37)
+        prob_combo = ttk.Combobox(main_frame, values=RISK_PROBABILITIES, width=37)
         prob_combo.grid(row=1, column=1, sticky=tk.W, pady=5)
         prob_combo.current(1)
 
         tk.Label(main_frame, text="Impact:", font=('Arial', 10, 'bold')).grid(row=2, column=0, sticky=tk.W, pady=5)
-        impact_combo = ttk.Combobox(main_frame, values=["Mic", "Mediu", "Mare"], width=37)
+        impact_combo = ttk.Combobox(main_frame, values=RISK_IMPACTS, width=37)
         impact_combo.grid(row=2, column=1, sticky=tk.W, pady=5)
         impact_combo.current(1)
 
-        tk.Label(main_frame, text="Strategie Mitigare:", font=('Arial', 10, 'bold')).grid(row=3, column=0, sticky=tk.W,
+        tk.Label(main_frame, text="Efect (zile / RON):", font=('Arial', 10, 'bold')).grid(row=3, column=0,
+                                                                                          sticky=tk.W, pady=5)
+        effect_frame = tk.Frame(main_frame)
+        effect_frame.grid(row=3, column=1, sticky=tk.W, pady=5)
+        delay_entry = tk.Entry(effect_frame, width=18)
+        delay_entry.pack(side=tk.LEFT)
+        tk.Label(effect_frame, text="/").pack(side=tk.LEFT, padx=5)
+        cost_entry = tk.Entry(effect_frame, width=18)
+        cost_entry.pack(side=tk.LEFT)
+
+        tk.Label(main_frame, text="Strategie Mitigare:", font=('Arial', 10, 'bold')).grid(row=4, column=0, sticky=tk.W,
                                                                                           pady=5)
         strategy_text = tk.Text(main_frame, width=40, height=5, wrap=tk.WORD)
-        strategy_text.grid(row=3, column=1, sticky=tk.W, pady=5)
+        strategy_text.grid(row=4, column=1, sticky=tk.W, pady=5)
 
-        tk.Label(main_frame, text="Status:", font=('Arial', 10, 'bold')).grid(row=4, column=0, sticky=tk.W, pady=5)
-        status_combo = ttk.Combobox(main_frame, values=["Identificat", "Monitorizat", "Mitigat", "Realizat"], width=37)
-        status_combo.grid(row=4, column=1, sticky=tk.W, pady=5)
+        tk.Label(main_frame, text="Status:", font=('Arial', 10, 'bold')).grid(row=5, column=0, sticky=tk.W, pady=5)
+        status_combo = ttk.Combobox(main_frame, values=RISK_STATUSES, width=37)
+        status_combo.grid(row=5, column=1, sticky=tk.W, pady=5)
         status_combo.current(0)
 
         # Butoane
         button_frame = tk.Frame(main_frame)
-        button_frame.grid(row=5, column=0, columnspan=2, pady=15)
+        button_frame.grid(row=6, column=0, columnspan=2, pady=15)
 
         tk.Button(button_frame, text="Salvează", command=lambda: self.save_risk(
             self.current_project_id,
             desc_text.get("1.0", tk.END).strip(),
             prob_combo.get(),
             impact_combo.get(),
+            delay_entry.get(),
+            cost_entry.get(),
             strategy_text.get("1.0", tk.END).strip(),
             status_combo.get(),
             add_window
@@ -1672,40 +2474,29 @@ class ProjectManagementApp:
         tk.Button(button_frame, text="Anulează", command=add_window.destroy,
                   bg='#e74c3c', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=10)
 
-    def save_risk(self, project_id, description, probability, impact, strategy, status, window):
+    def save_risk(self, project_id, description, probability, impact, delay, cost, strategy, status, window):
         """Salvează riscul în baza de date"""
         if not description:
             messagebox.showerror("Eroare", "Descrierea riscului este obligatorie!")
             return
 
         try:
-            # Calculăm nivelul riscului
-            prob_values = {"Mică": 1, "Medie": 2, "Mare": 3}
-            impact_values = {"Mic": 1, "Mediu": 2, "Mare": 3}
-
-            risk_level_value = prob_values.get(probability, 1) * impact_values.get(impact, 1)
-            risk_level = ""
-
-            if risk_level_value <= 2:
-                risk_level = "Scăzut"
-            elif risk_level_value <= 4:
-                risk_level = "Moderat"
-            else:
-                risk_level = "Ridicat"
+            delay_value = int(delay) if delay else 0
+            cost_value = float(cost) if cost else 0.0
+        except ValueError:
+            messagebox.showerror("Eroare", "Întârzierea trebuie să fie un număr întreg de zile, iar costul un număr!")
+            return
 
-            self.cursor.execute('''INSERT INTO risks 
-                                        (project_id, description, probability, impact, 
-                                        risk_level, mitigation_strategy, status) 
-                                        VALUES (?, ?, ?, ?, ?, ?, ?)''',
-                                (project_id, description, probability, impact,
-                                 risk_level, strategy, status))
-            self.conn.commit()
+        # Nivelul riscului este calculat de store din probabilitate x impact
+        risk = Risk(project_id=project_id, description=description, probability=probability, impact=impact,
+                    delay_days=delay_value, cost_impact=cost_value, mitigation_strategy=strategy, status=status)
 
+        def done(_):
             messagebox.showinfo("Succes", "Riscul a fost adăugat cu succes!")
             window.destroy()
-            self.load_risks()
-        except Exception as e:
-            messagebox.showerror("Eroare", f"A apărut o eroare: {str(e)}")
+            self.sync_changes()
+
+        self.submit_write(('add_risk', str(window)), lambda: self.store.add_risk(risk), done)
 
     def edit_risk(self):
         """Editează un risc existent"""
@@ -1714,10 +2505,8 @@ class ProjectManagementApp:
             messagebox.showwarning("Avertisment", "Selectați un risc pentru editare!")
             return
 
-        risk_id = self.risks_tree.item(selected[0], 'values')[0]
-
-        self.cursor.execute("SELECT * FROM risks WHERE id=?", (risk_id,))
-        risk_data = self.cursor.fetchone()
+        risk_id = int(self.risks_tree.item(selected[0], 'values')[0])
+        risk_data = self.store.get_risk(risk_id)
 
         if not risk_data:
             messagebox.showerror("Eroare", "Riscul selectat nu a putut fi găsit!")
@@ -1725,7 +2514,7 @@ class ProjectManagementApp:
 
         edit_window = tk.Toplevel(self.root)
         edit_window.title("Editare Risc")
-        edit_window.geometry("500x500")
+        edit_window.geometry("500x540")
 
         # Frame principal
         main_frame = tk.Frame(edit_window, padx=10, pady=10)
@@ -1736,31 +2525,302 @@ class ProjectManagementApp:
                                                                                       pady=5)
         desc_text = tk.Text(main_frame, width=40, height=3, wrap=tk.WORD)
         desc_text.grid(row=0, column=1, sticky=tk.W, pady=5)
-        desc_text.insert("1.0", risk_data[2] or "")
+        desc_text.insert("1.0", risk_data.description or "")
 
         tk.Label(main_frame, text="Probabilitate:", font=('Arial', 10, 'bold')).grid(row=1, column=0, sticky=tk.W,
                                                                                      pady=5)
-        prob_combo = ttk.Combobox(main_frame, values=["Mică", "Medie", "Mare"], width=37)
+        prob_combo = ttk.Combobox(main_frame, values=RISK_PROBABILITIES, width=37)
         prob_combo.grid(row=1, column=1, sticky=tk.W, pady=5)
-        prob_combo.set(risk_data[3] or "Medie")
+        prob_combo.set(risk_data.probability or "Medie")
 
         tk.Label(main_frame, text="Impact:", font=('Arial', 10, 'bold')).grid(row=2, column=0, sticky=tk.W, pady=5)
-        impact_combo = ttk.Combobox(main_frame, values=["Mic", "Mediu", "Mare"], width=37)
+        impact_combo = ttk.Combobox(main_frame, values=RISK_IMPACTS, width=37)
         impact_combo.grid(row=2, column=1, sticky=tk.W, pady=5)
-        impact_combo.set(risk_data[4] or "Mediu")
-        tk.Label(main_frame, text="Strategie Mitigare:", font=('Arial', 10, 'bold')).grid(row=3, column=0, sticky=tk.W,
+        impact_combo.set(risk_data.impact or "Mediu")
+        tk.Label(main_frame, text="Efect (zile / RON):", font=('Arial', 10, 'bold')).grid(row=3, column=0,
+                                                                                          sticky=tk.W, pady=5)
+        effect_frame = tk.Frame(main_frame)
+        effect_frame.grid(row=3, column=1, sticky=tk.W, pady=5)
+        delay_entry = tk.Entry(effect_frame, width=18)
+        delay_entry.pack(side=tk.LEFT)
+        tk.Label(effect_frame, text="/").pack(side=tk.LEFT, padx=5)
+        cost_entry = tk.Entry(effect_frame, width=18)
+        cost_entry.pack(side=tk.LEFT)
+        delay_entry.insert(0, risk_data.delay_days or "")
+        cost_entry.insert(0, risk_data.cost_impact or "")
+        tk.Label(main_frame, text="Strategie Mitigare:", font=('Arial', 10, 'bold')).grid(row=4, column=0, sticky=tk.W,
                                                                                           pady=5)
         strategy_text = tk.Text(main_frame, width=40, height=5, wrap=tk.WORD)
-        strategy_text.grid(row=3, column=1, sticky=tk.W, pady=5)
-        strategy_text.insert("1.0", risk_data[6] or "")
-        tk.Label(main_frame, text="Status:", font=('Arial', 10, 'bold')).grid(row=4, column=0, sticky=tk.W, pady=5)
-        status_combo = ttk.Combobox(main_frame, values=["Identificat", "Monitorizat", "Mitigat", "Realizat"], width=37)
-        status_combo.grid(row=4, column=1, sticky=tk.W, pady=5)
-        status_combo.set(risk_data[7] or "Identificat")
+        strategy_text.grid(row=4, column=1, sticky=tk.W, pady=5)
+        strategy_text.insert("1.0", risk_data.mitigation_strategy or "")
+        tk.Label(main_frame, text="Status:", font=('Arial', 10, 'bold')).grid(row=5, column=0, sticky=tk.W, pady=5)
+        status_combo = ttk.Combobox(main_frame, values=RISK_STATUSES, width=37)
+        status_combo.grid(row=5, column=1, sticky=tk.W, pady=5)
+        status_combo.set(risk_data.status or "Identificat")
+        # Butoane
+        button_frame = tk.Frame(main_frame)
+        button_frame.grid(row=6, column=0, columnspan=2, pady=15)
+
+        tk.Button(button_frame, text="Salvează", command=lambda: self.update_risk(
+            risk_id,
+            desc_text.get("1.0", tk.END).strip(),
+            prob_combo.get(),
+            impact_combo.get(),
+            delay_entry.get(),
+            cost_entry.get(),
+            strategy_text.get("1.0", tk.END).strip(),
+            status_combo.get(),
+            edit_window
+        ), bg='#27ae60', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=10)
+
+        tk.Button(button_frame, text="Anulează", command=edit_window.destroy,
+                  bg='#e74c3c', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=10)
+
+    def update_risk(self, risk_id, description, probability, impact, delay, cost, strategy, status, window):
+        """Actualizează riscul în baza de date"""
+        if not description:
+            messagebox.showerror("Eroare", "Descrierea riscului este obligatorie!")
+            return
+
+        try:
+            delay_value = int(delay) if delay else 0
+            cost_value = float(cost) if cost else 0.0
+        except ValueError:
+            messagebox.showerror("Eroare", "Întârzierea trebuie să fie un număr întreg de zile, iar costul un număr!")
+            return
+
+        risk = self.store.get_risk(risk_id)
+        if not risk:
+            messagebox.showerror("Eroare", "Riscul nu mai există!")
+            return
+        risk.description = description
+        risk.probability = probability
+        risk.impact = impact
+        risk.delay_days = delay_value
+        risk.cost_impact = cost_value
+        risk.mitigation_strategy = strategy
+        risk.status = status
+
+        def done(_):
+            messagebox.showinfo("Succes", "Riscul a fost actualizat cu succes!")
+            window.destroy()
+            self.sync_changes()
+
+        self.submit_write(('update_risk', risk_id), lambda: self.store.update_risk(risk), done)
+
+    def delete_risk(self):
+        """Șterge riscul selectat"""
+        selected = self.risks_tree.selection()
+        if not selected:
+            messagebox.showwarning("Avertisment", "Selectați un risc pentru ștergere!")
+            return
+
+        risk_id = int(self.risks_tree.item(selected[0], 'values')[0])
+
+        confirm = messagebox.askyesno("Confirmare", "Sunteți sigur că doriți să ștergeți riscul selectat?")
+        if not confirm:
+            return
+
+        def done(_):
+            messagebox.showinfo("Succes", "Riscul a fost șters cu succes!")
+            self.sync_changes()
+
+        self.submit_write(('delete_risk', risk_id), lambda: self.store.delete_risk(risk_id), done,
+                          "A apărut o eroare la ștergere")
+
+    def add_stakeholder(self):
+        """Adaugă un stakeholder nou la proiectul curent"""
+        if not self.current_project_id:
+            messagebox.showwarning("Avertisment", "Selectați mai întâi un proiect!")
+            return
+
+        add_window = tk.Toplevel(self.root)
+        add_window.title("Adăugare Stakeholder Nou")
+        add_window.geometry("500x450")
+
+        # Frame principal
+        main_frame = tk.Frame(add_window, padx=10, pady=10)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # Câmpuri formular
+        tk.Label(main_frame, text="Nume:", font=('Arial', 10, 'bold')).grid(row=0, column=0, sticky=tk.W, pady=5)
+        name_entry = tk.Entry(main_frame, width=40)
+        name_entry.grid(row=0, column=1, sticky=tk.W, pady=5)
+
+        tk.Label(main_frame, text="Rol:", font=('Arial', 10, 'bold')).grid(row=1, column=0, sticky=tk.W, pady=5)
+        role_entry = tk.Entry(main_frame, width=40)
+        role_entry.grid(row=1, column=1, sticky=tk.W, pady=5)
+
+        tk.Label(main_frame, text="Influență:", font=('Arial', 10, 'bold')).grid(row=2, column=0, sticky=tk.W, pady=5)
+        influence_combo = ttk.Combobox(main_frame, values=STAKEHOLDER_LEVELS, width=37)
+        influence_combo.grid(row=2, column=1, sticky=tk.W, pady=5)
+        influence_combo.current(1)
+
+        tk.Label(main_frame, text="Interes:", font=('Arial', 10, 'bold')).grid(row=3, column=0, sticky=tk.W, pady=5)
+        interest_combo = ttk.Combobox(main_frame, values=STAKEHOLDER_LEVELS, width=37)
+        interest_combo.grid(row=3, column=1, sticky=tk.W, pady=5)
+        interest_combo.current(1)
+
+        tk.Label(main_frame, text="Plan Comunicare:", font=('Arial', 10, 'bold')).grid(row=4, column=0, sticky=tk.W,
+                                                                                       pady=5)
+        plan_text = tk.Text(main_frame, width=40, height=5, wrap=tk.WORD)
+        plan_text.grid(row=4, column=1, sticky=tk.W, pady=5)
+
         # Butoane
         button_frame = tk.Frame(main_frame)
         button_frame.grid(row=5, column=0, columnspan=2, pady=15)
 
+        tk.Button(button_frame, text="Salvează", command=lambda: self.save_stakeholder(
+            self.current_project_id,
+            name_entry.get(),
+            role_entry.get(),
+            influence_combo.get(),
+            interest_combo.get(),
+            plan_text.get("1.0", tk.END).strip(),
+            add_window
+        ), bg='#27ae60', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=10)
+
+        tk.Button(button_frame, text="Anulează", command=add_window.destroy,
+                  bg='#e74c3c', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=10)
+
+    def save_stakeholder(self, project_id, name, role, influence, interest, plan, window):
+        """Salvează stakeholderul în baza de date"""
+        if not name:
+            messagebox.showerror("Eroare", "Numele stakeholderului este obligatoriu!")
+            return
+
+        stakeholder = Stakeholder(project_id=project_id, name=name, role=role, influence=influence,
+                                  interest=interest, communication_plan=plan)
+
+        def done(_):
+            messagebox.showinfo("Succes", "Stakeholderul a fost adăugat cu succes!")
+            window.destroy()
+            self.sync_changes()
+
+        self.submit_write(('add_stakeholder', str(window)), lambda: self.store.add_stakeholder(stakeholder), done)
+
+    def show_stakeholder_matrix(self):
+        """Afișează matricea influență x interes pentru stakeholderii proiectului"""
+        if not self.current_project_id:
+            messagebox.showwarning("Avertisment", "Selectați mai întâi un proiect!")
+            return
+
+        quadrants = {
+            (True, True): "Gestionare atentă",
+            (True, False): "Menținere satisfăcuți",
+            (False, True): "Menținere informați",
+            (False, False): "Monitorizare",
+        }
+        grouped = {label: [] for label in quadrants.values()}
+        for s in self.store.list_stakeholders(self.current_project_id):
+            key = (s.influence == "Mare", s.interest == "Mare")
+            grouped[quadrants[key]].append(f"{s.name} ({s.role})" if s.role else s.name)
+
+        matrix_window = tk.Toplevel(self.root)
+        matrix_window.title("Matrice Stakeholderi")
+        matrix_window.geometry("600x400")
+
+        text = tk.Text(matrix_window, wrap=tk.WORD, font=('Arial', 10))
+        text.pack(fill=tk.BOTH, expand=True)
+        for label, names in grouped.items():
+            text.insert(tk.END, f"{label}:\n")
+            for name in names or ["-"]:
+                text.insert(tk.END, f"    • {name}\n")
+            text.insert(tk.END, "\n")
+        text.config(state=tk.DISABLED)
+
+    def show_report(self, name):
+        """Generează raportul în fundal și îl afișează pe măsură ce sosesc secțiunile"""
+        self.report_text.delete("1.0", tk.END)
+        self.runner.stream('report', lambda: stream_report(self.store, name),
+                           on_item=lambda chunk: self.report_text.insert(tk.END, chunk),
+                           on_error=self.show_error)
+
+    def generate_progress_report(self):
+        self.show_report('progress')
+
+    def generate_budget_analysis(self):
+        self.show_report('budget')
+
+    def generate_timeline_analysis(self):
+        self.show_report('timeline')
+
+    def generate_risk_report(self):
+        self.show_report('risks')
+
+    def generate_resource_analysis(self):
+        self.show_report('resources')
+
+    def generate_evm_report(self):
+        self.show_report('evm')
+
+    def export_data(self):
+        """Exportă în flux un tabel sau vederea de portofoliu în CSV, JSON Lines sau format columnar"""
+        export_window = tk.Toplevel(self.root)
+        export_window.title("Export Date")
+        export_window.geometry("420x180")
+
+        main_frame = tk.Frame(export_window, padx=10, pady=10)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        tk.Label(main_frame, text="Date:", font=('Arial', 10, 'bold')).grid(row=0, column=0, sticky=tk.W, pady=5)
+        source_combo = ttk.Combobox(main_frame, values=list(EXPORT_SOURCES), width=30, state='readonly')
+        source_combo.grid(row=0, column=1, sticky=tk.W, pady=5)
+        source_combo.set('portfolio')
+
+        formats = ['csv', 'jsonl', columnar_format()]
+        tk.Label(main_frame, text="Format:", font=('Arial', 10, 'bold')).grid(row=1, column=0, sticky=tk.W, pady=5)
+        format_combo = ttk.Combobox(main_frame, values=formats, width=30, state='readonly')
+        format_combo.grid(row=1, column=1, sticky=tk.W, pady=5)
+        format_combo.current(0)
+
+        button_frame = tk.Frame(main_frame)
+        button_frame.grid(row=2, column=0, columnspan=2, pady=15)
+
+        tk.Button(button_frame, text="Exportă", command=lambda: self.run_export(
+            source_combo.get(),
+            format_combo.get(),
+            export_window
+        ), bg='#27ae60', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=10)
+
+        tk.Button(button_frame, text="Anulează", command=export_window.destroy,
+                  bg='#e74c3c', fg='white', font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=10)
+
+    def run_export(self, source, fmt, window):
+        """Alege fișierul destinație și rulează exportul în fundal"""
+        extension = EXTENSIONS[fmt]
+        path = filedialog.asksaveasfilename(defaultextension=extension, initialfile=f"{source}{extension}",
+                                            filetypes=[(fmt.upper(), f"*{extension}"), ("Toate fișierele", "*.*")])
+        if not path:
+            return
+        window.destroy()
+
+        def done(result):
+            messagebox.showinfo("Succes", f"{result.rows:,} rânduri exportate în {result.path}\n"
+                                          f"Durată: {result.seconds:.2f} s ({result.rows_per_second:,.0f} rânduri/s)")
+
+        self.runner.submit('export', lambda: export(self.store, source, path, fmt),
+                           on_done=done, on_error=self.show_error)
+
+    def save_report(self):
+        """Salvează raportul afișat într-un fișier text"""
+        content = self.report_text.get("1.0", tk.END).strip()
+        if not content:
+            messagebox.showwarning("Avertisment", "Generați mai întâi un raport!")
+            return
+
+        path = filedialog.asksaveasfilename(defaultextension=".txt",
+                                            filetypes=[("Fișiere text", "*.txt"), ("Toate fișierele", "*.*")])
+        if not path:
+            return
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content + "\n")
+            messagebox.showinfo("Succes", f"Raportul a fost salvat în {path}")
+        except Exception as e:
+            messagebox.showerror("Eroare", f"A apărut o eroare la salvare: {str(e)}")
+
+
 if __name__ == "__main__":
     root = tk.Tk()
     app = ProjectManagementApp(root)
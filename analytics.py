@@ -0,0 +1,340 @@
+"""Rapoartele din tab-ul Rapoarte: progres, buget, timeline, riscuri, resurse și EVM.
+
+Agregarea se face în SQLite (GROUP BY, funcții fereastră), câte o interogare
+pentru tot portofoliul; Python doar formatează rezultatele (excepție face
+raportul EVM, calculat cu NumPy în modulul evm). Fiecare raport este
+un generator de bucăți de text, astfel încât interfața le poate afișa pe
+măsură ce sosesc, iar rândurile tabelelor mari sunt citite în loturi.
+"""
+import datetime
+import itertools
+
+from project_store import (RISK_PROBABILITIES, RISK_IMPACTS, day_number, high_risk_score, load_risk_levels,
+                           is_leaf)
+
+# Câte rânduri dintr-un tabel sunt formatate într-o singură bucată de text
+BATCH_SIZE = 200
+# Riscurile cu aceste statusuri sunt considerate încă deschise
+OPEN_RISK_STATUSES = ("Identificat", "Monitorizat")
+
+# Ponderea unui task în progresul proiectului este durata lui (minim o zi)
+_TASK_WEIGHT = "MAX(IFNULL(duration, 0), 1)"
+# Doar pachetele de lucru: taskurile sumare din WBS ar număra a doua oară munca subtaskurilor
+_WORK_PACKAGES = f"tasks t WHERE {is_leaf('t.id')}"
+
+
+def _cell(value, width):
+    if value is None:
+        text = "-"
+    elif isinstance(value, float):
+        text = f"{value:,.1f}"
+    else:
+        text = str(value)
+    if len(text) > width:
+        text = text[:width - 1] + "…"
+    return text.rjust(width) if value is None or isinstance(value, (int, float)) else text.ljust(width)
+
+
+def _format_row(values, widths):
+    return "  ".join(_cell(value, width) for value, width in zip(values, widths)).rstrip()
+
+
+def section(title):
+    return f"\n{title}\n{'=' * len(title)}\n"
+
+
+def table(cursor, columns):
+    """Tabel text din rezultatul unei interogări (sau o listă de rânduri); columns = [(antet, lățime), ...]"""
+    widths = [width for _, width in columns]
+    header = "  ".join(title.ljust(width) for title, width in columns).rstrip()
+    yield f"{header}\n{'-' * len(header)}\n"
+    # Cursorul (sau lista de rânduri) este parcurs în loturi de BATCH_SIZE
+    remaining = iter(cursor)
+    empty = True
+    while True:
+        rows = list(itertools.islice(remaining, BATCH_SIZE))
+        if not rows:
+            break
+        empty = False
+        yield "".join(_format_row(row, widths) + "\n" for row in rows)
+    if empty:
+        yield "(nu există date)\n"
+
+
+def key_values(pairs):
+    width = max((len(label) for label, _ in pairs), default=0)
+    lines = []
+    for label, value in pairs:
+        if isinstance(value, float):
+            value = f"{value:,.2f}"
+        lines.append(f"{label.ljust(width)} : {'-' if value is None else value}")
+    return "\n".join(lines) + "\n"
+
+
+# ----------------------------------------------------------------------
+# Rapoarte
+# ----------------------------------------------------------------------
+
+def progress_report(conn, today):
+    """Progresul pe portofoliu și pe proiecte, ponderat cu durata taskurilor"""
+    summary = conn.execute(f"""
+        SELECT COUNT(*), SUM(status = 'Finalizat'), SUM(status = 'Blocat'), AVG(progress),
+               TOTAL(progress * {_TASK_WEIGHT}) / MAX(TOTAL({_TASK_WEIGHT}), 1)
+        FROM {_WORK_PACKAGES}
+    """).fetchone()
+    projects = conn.execute("SELECT COUNT(*), SUM(status = 'Finalizat') FROM projects").fetchone()
+    yield section("Sumar portofoliu")
+    yield key_values([
+        ("Proiecte", projects[0]),
+        ("Proiecte finalizate", projects[1] or 0),
+        ("Taskuri", summary[0]),
+        ("Taskuri finalizate", summary[1] or 0),
+        ("Taskuri blocate", summary[2] or 0),
+        ("Progres mediu taskuri (%)", summary[3]),
+        ("Progres ponderat cu durata (%)", summary[4]),
+    ])
+
+    yield section("Proiecte pe status")
+    yield from table(conn.execute("""
+        SELECT IFNULL(status, '-'), COUNT(*), 100.0 * COUNT(*) / SUM(COUNT(*)) OVER ()
+        FROM projects GROUP BY status ORDER BY COUNT(*) DESC
+    """), [("Status", 20), ("Proiecte", 9), ("Pondere %", 10)])
+
+    yield section("Progres pe proiect")
+    yield from table(conn.execute(f"""
+        WITH t AS (
+            SELECT project_id, COUNT(*) AS tasks, SUM(status = 'Finalizat') AS done,
+                   SUM(status = 'Blocat') AS blocked,
+                   TOTAL(progress * {_TASK_WEIGHT}) / TOTAL({_TASK_WEIGHT}) AS progress
+            FROM {_WORK_PACKAGES} GROUP BY project_id
+        )
+        SELECT RANK() OVER (ORDER BY IFNULL(t.progress, -1) DESC), p.id, p.name, p.status,
+               IFNULL(t.tasks, 0), IFNULL(t.done, 0), IFNULL(t.blocked, 0), t.progress
+        FROM projects p LEFT JOIN t ON t.project_id = p.id
+        ORDER BY 1, p.id
+    """), [("Loc", 4), ("ID", 5), ("Proiect", 28), ("Status", 14), ("Taskuri", 8),
+           ("Finaliz.", 8), ("Blocate", 8), ("Progres %", 10)])
+
+
+def budget_report(conn, today):
+    """Bugetul proiectelor comparat cu costul resurselor alocate"""
+    cost_cte = """
+        WITH cost AS (SELECT project_id, TOTAL(total_cost) AS cost FROM resources GROUP BY project_id)
+    """
+    summary = conn.execute(cost_cte + """
+        SELECT TOTAL(p.budget), TOTAL(c.cost), SUM(IFNULL(c.cost, 0) > IFNULL(p.budget, 0))
+        FROM projects p LEFT JOIN cost c ON c.project_id = p.id
+    """).fetchone()
+    budget, cost, over = summary
+    yield section("Sumar buget portofoliu")
+    yield key_values([
+        ("Buget total (RON)", budget),
+        ("Cost resurse (RON)", cost),
+        ("Rămas (RON)", budget - cost),
+        ("Grad de utilizare (%)", 100.0 * cost / budget if budget else None),
+        ("Proiecte peste buget", over or 0),
+    ])
+
+    yield section("Buget pe status")
+    yield from table(conn.execute(cost_cte + """
+        SELECT IFNULL(p.status, '-'), COUNT(*), TOTAL(p.budget), TOTAL(c.cost),
+               100.0 * TOTAL(p.budget) / NULLIF(SUM(TOTAL(p.budget)) OVER (), 0)
+        FROM projects p LEFT JOIN cost c ON c.project_id = p.id
+        GROUP BY p.status ORDER BY 3 DESC
+    """), [("Status", 20), ("Proiecte", 9), ("Buget", 14), ("Cost", 14), ("Pondere %", 10)])
+
+    yield section("Buget pe proiect (după gradul de utilizare)")
+    yield from table(conn.execute(cost_cte + """
+        SELECT p.id, p.name, IFNULL(p.budget, 0.0), IFNULL(c.cost, 0.0),
+               IFNULL(p.budget, 0.0) - IFNULL(c.cost, 0.0),
+               CASE WHEN p.budget > 0 THEN 100.0 * IFNULL(c.cost, 0.0) / p.budget END AS used,
+               100.0 * IFNULL(p.budget, 0.0) / NULLIF(SUM(IFNULL(p.budget, 0.0)) OVER (), 0)
+        FROM projects p LEFT JOIN cost c ON c.project_id = p.id
+        ORDER BY used DESC NULLS LAST, p.id
+    """), [("ID", 5), ("Proiect", 28), ("Buget", 14), ("Cost", 14), ("Rămas", 14),
+           ("Utilizat %", 10), ("Din portof. %", 13)])
+
+
+def timeline_report(conn, today):
+    """Termene: timp scurs față de progres, depășiri și taskuri întârziate"""
+    # Comparațiile folosesc coloanele numerice start_day / end_day și indexurile lor
+    params = {'today': day_number(today)}
+    summary = conn.execute("""
+        SELECT (SELECT COUNT(*) FROM projects
+                WHERE end_day < :today AND IFNULL(status, '') != 'Finalizat'),
+               (SELECT COUNT(*) FROM projects
+                WHERE end_day >= :today AND end_day <= :today + 30),
+               (SELECT COUNT(*) FROM tasks
+                WHERE end_day < :today AND IFNULL(status, '') != 'Finalizat')
+    """, params).fetchone()
+    yield section(f"Sumar termene la {today}")
+    yield key_values([
+        ("Proiecte cu termen depășit", summary[0]),
+        ("Proiecte care se termină în 30 de zile", summary[1]),
+        ("Taskuri întârziate", summary[2]),
+    ])
+
+    yield section("Timeline pe proiect (după depășirea estimată)")
+    yield from table(conn.execute(f"""
+        WITH t AS (
+            SELECT project_id, MAX(end_day) AS last_end,
+                   SUM(end_day < :today AND IFNULL(status, '') != 'Finalizat') AS overdue,
+                   TOTAL(progress * {_TASK_WEIGHT}) / TOTAL({_TASK_WEIGHT}) AS progress
+            FROM {_WORK_PACKAGES} GROUP BY project_id
+        ), span AS (
+            SELECT p.*, p.end_day - p.start_day AS days FROM projects p
+        )
+        SELECT p.id, p.name, p.start_date, p.end_date, p.days,
+               CASE WHEN p.days > 0 THEN
+                    MIN(MAX(100.0 * (:today - p.start_day) / p.days, 0.0), 100.0) END,
+               t.progress, date(t.last_end * 86400, 'unixepoch'),
+               t.last_end - p.end_day AS slip,
+               IFNULL(t.overdue, 0)
+        FROM span p LEFT JOIN t ON t.project_id = p.id
+        ORDER BY slip DESC NULLS LAST, p.end_day
+    """, params), [("ID", 5), ("Proiect", 24), ("Început", 10), ("Sfârșit", 10), ("Zile", 5),
+                   ("Timp scurs %", 12), ("Progres %", 10), ("Ultimul task", 12), ("Depășire", 8),
+                   ("Întârziate", 10)])
+
+
+def risk_report(conn, today):
+    """Matricea probabilitate × impact și expunerea la risc a proiectelor"""
+    counts = {(probability, impact): count for probability, impact, count in conn.execute(
+        "SELECT probability, impact, COUNT(*) FROM risks GROUP BY probability, impact")}
+    yield section("Matrice riscuri (probabilitate × impact)")
+    width = max(len(label) for label in RISK_PROBABILITIES + RISK_IMPACTS) + 2
+    lines = ["Probabilitate \\ Impact".ljust(24) + "".join(i.rjust(width) for i in RISK_IMPACTS)]
+    for probability in reversed(RISK_PROBABILITIES):
+        lines.append(probability.ljust(24) + "".join(str(counts.get((probability, impact), 0)).rjust(width)
+                                                     for impact in RISK_IMPACTS))
+    other = sum(count for key, count in counts.items()
+                if key[0] not in RISK_PROBABILITIES or key[1] not in RISK_IMPACTS)
+    if other:
+        lines.append(f"(alte valori: {other})")
+    yield "\n".join(lines) + "\n"
+
+    yield section("Riscuri pe nivel și status")
+    yield from table(conn.execute("""
+        SELECT IFNULL(NULLIF(risk_level, ''), '-'), IFNULL(status, '-'), COUNT(*),
+               100.0 * COUNT(*) / SUM(COUNT(*)) OVER ()
+        FROM risks GROUP BY risk_level, status ORDER BY risk_level, status
+    """), [("Nivel", 10), ("Status", 14), ("Riscuri", 8), ("Pondere %", 10)])
+
+    open_statuses = ", ".join(f"'{status}'" for status in OPEN_RISK_STATUSES)
+    yield section("Expunere pe proiect")
+    yield from table(conn.execute(f"""
+        SELECT RANK() OVER (ORDER BY SUM(r.risk_level = 'Ridicat' AND r.status IN ({open_statuses})) DESC,
+                                     COUNT(*) DESC),
+               p.id, p.name, COUNT(*), SUM(r.risk_level = 'Ridicat'), SUM(r.risk_level = 'Moderat'),
+               SUM(r.status IN ({open_statuses})),
+               SUM(r.risk_level = 'Ridicat' AND r.status IN ({open_statuses}))
+        FROM risks r JOIN projects p ON p.id = r.project_id
+        GROUP BY p.id ORDER BY 1, p.id
+    """), [("Loc", 4), ("ID", 5), ("Proiect", 28), ("Total", 6), ("Ridicate", 9), ("Moderate", 9),
+           ("Deschise", 9), ("Ridicate deschise", 17)])
+
+    # Scorul indexat, nu textul risk_level: riscurile sunt găsite printr-o parcurgere de interval în index
+    yield section("Riscuri ridicate încă deschise")
+    high_risks = conn.execute(f"""
+        SELECT p.name, r.description, r.probability, r.impact, r.risk_score, r.status, r.mitigation_strategy
+        FROM risks r JOIN projects p ON p.id = r.project_id
+        WHERE r.risk_score >= ? AND r.status IN ({open_statuses})
+        ORDER BY r.risk_score DESC, p.name, r.id
+    """, (high_risk_score(load_risk_levels(conn)),))
+    yield from table(high_risks, [("Proiect", 20), ("Risc", 30), ("Prob.", 6), ("Impact", 6), ("Scor", 5),
+                                  ("Status", 12), ("Mitigare", 30)])
+
+
+def resource_report(conn, today):
+    """Costurile resurselor pe tip și proiect și încărcarea responsabililor de taskuri"""
+    yield section("Resurse pe tip")
+    yield from table(conn.execute("""
+        SELECT IFNULL(type, '-'), COUNT(*), TOTAL(quantity), TOTAL(total_cost), AVG(cost_per_unit),
+               100.0 * TOTAL(total_cost) / NULLIF(SUM(TOTAL(total_cost)) OVER (), 0)
+        FROM resources GROUP BY type ORDER BY 4 DESC
+    """), [("Tip", 16), ("Resurse", 8), ("Cantitate", 10), ("Cost total", 14), ("Cost mediu/unit", 15),
+           ("Din cost %", 10)])
+
+    yield section("Disponibilitate")
+    yield from table(conn.execute("""
+        SELECT IFNULL(availability, '-'), COUNT(*), 100.0 * COUNT(*) / SUM(COUNT(*)) OVER ()
+        FROM resources GROUP BY availability ORDER BY 2 DESC
+    """), [("Disponibilitate", 16), ("Resurse", 8), ("Pondere %", 10)])
+
+    yield section("Cost resurse pe proiect și cea mai scumpă resursă")
+    yield from table(conn.execute("""
+        SELECT p.id, p.name, r.resources, r.project_cost, r.name, r.total_cost,
+               100.0 * r.total_cost / NULLIF(r.project_cost, 0)
+        FROM (
+            SELECT project_id, name, total_cost,
+                   ROW_NUMBER() OVER (PARTITION BY project_id ORDER BY total_cost DESC) AS rn,
+                   COUNT(*) OVER (PARTITION BY project_id) AS resources,
+                   TOTAL(total_cost) OVER (PARTITION BY project_id) AS project_cost
+            FROM resources
+        ) r JOIN projects p ON p.id = r.project_id
+        WHERE r.rn = 1
+        ORDER BY r.project_cost DESC, p.id
+    """), [("ID", 5), ("Proiect", 24), ("Resurse", 8), ("Cost proiect", 14), ("Cea mai scumpă", 20),
+           ("Cost", 12), ("Din proiect %", 13)])
+
+    yield section("Încărcare responsabili taskuri")
+    yield from table(conn.execute(f"""
+        SELECT assigned_to, COUNT(*), SUM(IFNULL(status, '') != 'Finalizat'),
+               TOTAL(CASE WHEN IFNULL(status, '') != 'Finalizat' THEN {_TASK_WEIGHT} END),
+               COUNT(DISTINCT project_id)
+        FROM {_WORK_PACKAGES} AND IFNULL(assigned_to, '') != ''
+        GROUP BY assigned_to ORDER BY 4 DESC, 1
+    """), [("Responsabil", 24), ("Taskuri", 8), ("Active", 8), ("Zile active", 12), ("Proiecte", 9)])
+
+
+def evm_report(conn, today):
+    """Valoarea câștigată (EVM) la data raportului, pe portofoliu și pe proiecte"""
+    # NumPy este încărcat doar pentru acest raport
+    from evm import compute, read_rows
+    result = compute(*read_rows(conn), day_number(today))
+
+    def index(value):
+        return None if value != value else f"{value:6.2f}"
+
+    portfolio = result.portfolio
+    yield section(f"Sumar portofoliu la {today}")
+    yield key_values([
+        ("Buget la finalizare, BAC (RON)", float(portfolio.bac)),
+        ("Valoare planificată, PV (RON)", float(portfolio.pv)),
+        ("Valoare câștigată, EV (RON)", float(portfolio.ev)),
+        ("Cost efectiv estimat, AC (RON)", float(portfolio.ac)),
+        ("Indice de cost, CPI", index(float(portfolio.cpi))),
+        ("Indice de program, SPI", index(float(portfolio.spi))),
+        ("Estimare la finalizare, EAC (RON)", float(portfolio.eac)),
+        ("Estimare până la finalizare, ETC (RON)", float(portfolio.etc)),
+    ])
+    yield "AC presupune costul resurselor cheltuit uniform pe durata planificată a taskurilor\n"
+
+    yield section("EVM pe proiect (cel mai mic CPI întâi)")
+    projects = result.projects
+    cpi, spi, eac = projects.cpi, projects.spi, projects.eac
+    order = sorted(range(len(result.project_ids)), key=lambda i: (cpi[i] != cpi[i], cpi[i], result.project_ids[i]))
+    yield from table([(int(result.project_ids[i]), result.project_names[i], float(projects.bac[i]),
+                       float(projects.pv[i]), float(projects.ev[i]), float(projects.ac[i]),
+                       index(float(cpi[i])), index(float(spi[i])), float(eac[i])) for i in order],
+                     [("ID", 5), ("Proiect", 28), ("BAC", 14), ("PV", 14), ("EV", 14), ("AC", 14),
+                      ("CPI", 6), ("SPI", 6), ("EAC", 14)])
+
+
+REPORTS = {
+    'progress': ("Raport Progres General", progress_report),
+    'budget': ("Analiză Bugetară", budget_report),
+    'timeline': ("Analiză Timeline", timeline_report),
+    'risks': ("Raport Riscuri", risk_report),
+    'resources': ("Analiză Resurse", resource_report),
+    'evm': ("Valoare Câștigată (EVM)", evm_report),
+}
+
+
+def stream_report(store, name, today=None):
+    """Generează raportul pe o conexiune de citire din pool, bucată cu bucată"""
+    title, report = REPORTS[name]
+    today = today or datetime.date.today().isoformat()
+    yield f"{title.upper()}\nGenerat la {datetime.datetime.now():%Y-%m-%d %H:%M}\n"
+    with store.reader() as conn:
+        yield from report(conn, today)
@@ -0,0 +1,487 @@
+"""API HTTP/JSON locală peste baza de proiecte, pentru alte unelte.
+
+Serverul folosește doar biblioteca standard: asyncio pentru conexiuni (HTTP/1.1
+cu keep-alive) și thread-uri pentru SQLite. Citirile rulează pe conexiunile din
+pool-ul motorului de stocare; în modul WAL ele nu se blochează între ele și nici
+nu blochează scrierile, care trec pe rând prin conexiunea de scriere.
+
+    python api_server.py --port 8765
+    curl localhost:8765/projects?limit=50
+    curl localhost:8765/projects/3/tasks?sort=start_date
+    curl -X PATCH -d '{"progress": 60}' localhost:8765/tasks/17
+
+Rute, pentru fiecare entitate (projects, tasks, resources, risks, stakeholders):
+    GET    /<entități>                listă paginată (?project_id= pentru entitățile unui proiect)
+    GET    /projects/<id>/<entități>  entitățile proiectului, paginat
+    POST   /<entități>                adaugă; project_id în corp sau în ruta proiectului
+    GET    /<entități>/<id>
+    PATCH  /<entități>/<id>           modifică doar câmpurile date
+    DELETE /<entități>/<id>
+    GET    /changes?since=<seq>       jurnalul de modificări, după numărul de secvență
+    GET    /search?q=<text>           căutare full-text (&entity=task, &limit=)
+
+Paginarea este keyset: limit, sort, desc și after, cursorul "next" din pagina
+precedentă. Răspunsurile GET au ETag; If-None-Match cu aceeași valoare întoarce
+304 fără corp, iar If-Match la PATCH / DELETE refuză modificarea (412) dacă
+înregistrarea s-a schimbat între timp. Consumatorii externi urmăresc /changes
+în loc să citească tabele întregi: pornesc de la "last" din răspunsul precedent
+și primesc 410 dacă modificările cerute au fost deja eliminate din jurnal.
+"""
+import sys
+import json
+import base64
+import asyncio
+import hashlib
+import sqlite3
+import argparse
+import datetime
+from http import HTTPStatus
+from urllib.parse import urlsplit, parse_qs
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import MISSING, fields
+
+from cli import ENTITIES, CHOICES, COMPUTED
+from project_store import ProjectStore, Task
+from scheduling import parse_dependencies, parse_dependency_input
+from storage import DB_PATH, StorageConfig
+
+HOST = '127.0.0.1'
+PORT = 8765
+PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+MAX_BODY = 1024 * 1024
+# Limita pentru o linie din cerere (linia de start sau un header)
+MAX_LINE = 16 * 1024
+
+PLURALS = {plural: entity for entity, (_, plural) in ENTITIES.items()}
+
+
+class HttpError(Exception):
+    def __init__(self, status, message=None):
+        super().__init__(message or HTTPStatus(status).phrase)
+        self.status = status
+
+
+# ----------------------------------------------------------------------
+# Conversii JSON <-> entități
+# ----------------------------------------------------------------------
+
+def to_json(obj):
+    """Entitatea ca dicționar JSON; dependențele taskurilor ca listă de id-uri"""
+    # vars() în loc de columns(): listele de sute de rânduri trec pe aici pentru fiecare cerere
+    data = {'id': obj.id, **vars(obj)}
+    if isinstance(obj, Task):
+        data['dependencies'] = parse_dependencies(obj.dependencies)
+    return data
+
+
+def _convert(entity, field, value):
+    name = field.name
+    if name == 'dependencies':
+        if isinstance(value, list):
+            if not all(isinstance(i, int) and not isinstance(i, bool) and i > 0 for i in value):
+                raise ValueError("dependencies trebuie să conțină ID-uri de task")
+            return json.dumps(list(dict.fromkeys(value)))
+        if isinstance(value, str):
+            return parse_dependency_input(value)
+        raise ValueError("dependencies trebuie să fie o listă de ID-uri")
+
+    if value is None and field.default is None:
+        # Câmp opțional golit, de exemplu un task mutat la nivelul de sus al WBS-ului
+        return None
+    if field.type is float and isinstance(value, int) and not isinstance(value, bool):
+        value = float(value)
+    if not isinstance(value, field.type) or isinstance(value, bool):
+        raise ValueError(f"{name} trebuie să fie de tip {field.type.__name__}")
+
+    choices = CHOICES[entity].get(name)
+    if choices and value not in choices:
+        raise ValueError(f"{name} trebuie să fie una dintre: {', '.join(choices)}")
+    if name.endswith('_date') and value:
+        try:
+            value = datetime.date.fromisoformat(value).isoformat()
+        except ValueError:
+            raise ValueError(f"{name}: '{value}' nu este o dată validă (AAAA-LL-ZZ)")
+    if name == 'progress' and not 0 <= value <= 100:
+        raise ValueError("progress trebuie să fie între 0 și 100")
+    return value
+
+
+def parse_fields(entity, data, required):
+    """Valorile din corpul cererii, validate ca în formularele aplicației"""
+    if not isinstance(data, dict):
+        raise ValueError("Corpul cererii trebuie să fie un obiect JSON")
+    editable = {f.name: f for f in fields(ENTITIES[entity][0]) if f.name != 'id' and f.name not in COMPUTED}
+    unknown = sorted(set(data) - set(editable))
+    if unknown:
+        raise ValueError(f"Câmpuri necunoscute sau calculate: {', '.join(unknown)}")
+    values = {name: _convert(entity, editable[name], value) for name, value in data.items()}
+    if required:
+        missing = [name for name, f in editable.items()
+                   if f.default is MISSING and f.default_factory is MISSING and name not in values]
+        if missing:
+            raise ValueError(f"Câmpuri obligatorii lipsă: {', '.join(missing)}")
+    return values
+
+
+def encode_cursor(value, entity_id):
+    return base64.urlsafe_b64encode(json.dumps([value, entity_id]).encode()).decode().rstrip('=')
+
+
+def _sql_integer(value):
+    # bool este subclasă a lui int, dar nu apare niciodată într-un cursor emis de server
+    return isinstance(value, int) and not isinstance(value, bool) and -2 ** 63 <= value < 2 ** 63
+
+
+def decode_cursor(cursor):
+    """Cheia (valoare sortare, id) din cursor; orice altă formă este refuzată înainte de SQL"""
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except (ValueError, TypeError):
+        raise ValueError("Cursor de paginare invalid")
+    # Valoarea de sortare ajunge ca parametru SQL: doar scalari pe care SQLite îi poate lega
+    if not (isinstance(key, list) and len(key) == 2 and _sql_integer(key[1]) and
+            (key[0] is None or isinstance(key[0], (str, float)) or _sql_integer(key[0]))):
+        raise ValueError("Cursor de paginare invalid")
+    return tuple(key)
+
+
+def etag(body):
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def _matches(header, tag):
+    if header is None:
+        return False
+    candidates = [t.strip().removeprefix('W/') for t in header.split(',')]
+    return '*' in candidates or tag in candidates
+
+
+def _encode(payload):
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+# ----------------------------------------------------------------------
+# Operațiile API, executate în thread-uri
+# ----------------------------------------------------------------------
+
+class Api:
+    """Rutele API peste un ProjectStore; fiecare apel întoarce (status, corp, headere)"""
+
+    def __init__(self, store):
+        self.store = store
+
+    def handle(self, method, target, headers, body):
+        url = urlsplit(target)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        parts = [part for part in url.path.split('/') if part]
+        try:
+            return self._route(method, parts, query, headers, body)
+        except HttpError as e:
+            return self.error(e.status, str(e))
+        except ValueError as e:
+            return self.error(HTTPStatus.BAD_REQUEST, str(e))
+        except sqlite3.IntegrityError as e:
+            return self.error(HTTPStatus.CONFLICT, str(e))
+        except sqlite3.OperationalError as e:
+            return self.error(HTTPStatus.SERVICE_UNAVAILABLE, str(e))
+
+    def error(self, status, message):
+        return status, _encode({'error': message}), {}
+
+    def _route(self, method, parts, query, headers, body):
+        if parts == ['changes']:
+            if method != 'GET':
+                raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED)
+            return self.changes(query, headers)
+        if parts == ['search']:
+            if method != 'GET':
+                raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED)
+            return self.search(query, headers)
+        if not parts or parts[0] not in PLURALS or len(parts) > 3:
+            raise HttpError(HTTPStatus.NOT_FOUND)
+        entity = PLURALS[parts[0]]
+        entity_id = self._id(parts[1]) if len(parts) > 1 else None
+
+        if len(parts) == 3:
+            # /projects/<id>/<entități>
+            if entity != 'project' or parts[2] not in PLURALS or parts[2] == 'projects':
+                raise HttpError(HTTPStatus.NOT_FOUND)
+            child = PLURALS[parts[2]]
+            if method == 'GET':
+                return self.list(child, query, headers, project_id=entity_id)
+            if method == 'POST':
+                return self.create(child, body, project_id=entity_id)
+            raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED)
+
+        if entity_id is None:
+            if method == 'GET':
+                project_id = self._id(query['project_id']) if 'project_id' in query else None
+                if entity == 'project' and project_id is not None:
+                    raise ValueError("project_id nu se aplică proiectelor")
+                return self.list(entity, query, headers, project_id)
+            if method == 'POST':
+                return self.create(entity, body)
+            raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED)
+
+        if method == 'GET':
+            return self.show(entity, entity_id, headers)
+        if method == 'PATCH':
+            return self.update(entity, entity_id, headers, body)
+        if method == 'DELETE':
+            return self.delete(entity, entity_id, headers)
+        raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED)
+
+    def _id(self, text):
+        if not text.isdigit():
+            raise HttpError(HTTPStatus.NOT_FOUND)
+        return int(text)
+
+    def _cached(self, payload, headers):
+        """Răspuns GET cu ETag; 304 dacă clientul are deja aceeași versiune"""
+        body = _encode(payload)
+        tag = etag(body)
+        if _matches(headers.get('if-none-match'), tag):
+            return HTTPStatus.NOT_MODIFIED, b'', {'ETag': tag}
+        return HTTPStatus.OK, body, {'ETag': tag, 'Cache-Control': 'no-cache'}
+
+    def _get(self, store, entity, entity_id):
+        obj = getattr(store, f"get_{entity}")(entity_id)
+        if obj is None:
+            raise HttpError(HTTPStatus.NOT_FOUND, f"{entity} {entity_id} nu există")
+        return obj
+
+    def _check_version(self, obj, headers):
+        expected = headers.get('if-match')
+        if expected is not None and not _matches(expected, etag(_encode(to_json(obj)))):
+            raise HttpError(HTTPStatus.PRECONDITION_FAILED, "Înregistrarea a fost modificată între timp")
+
+    def list(self, entity, query, headers, project_id=None):
+        entity_cls = ENTITIES[entity][0]
+        limit = int(query.get('limit', PAGE_SIZE))
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit trebuie să fie între 1 și {MAX_PAGE_SIZE}")
+        sort = query.get('sort', 'id')
+        descending = query.get('desc', '0').lower() in ('1', 'true', 'yes')
+        after = decode_cursor(query['after']) if 'after' in query else None
+
+        with self.store.snapshot() as view:
+            if project_id is not None:
+                self._get(view, 'project', project_id)
+            # Un rând în plus arată dacă mai există o pagină
+            items = view.page(entity_cls, project_id, sort, descending, after, limit + 1)
+
+        cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            last = items[-1]
+            cursor = encode_cursor(getattr(last, sort), last.id)
+        return self._cached({'items': [to_json(obj) for obj in items], 'next': cursor}, headers)
+
+    def changes(self, query, headers):
+        since = int(query.get('since', 0))
+        limit = int(query.get('limit', MAX_PAGE_SIZE))
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit trebuie să fie între 1 și {MAX_PAGE_SIZE}")
+        with self.store.snapshot() as view:
+            if since < view.first_change() - 1:
+                raise HttpError(HTTPStatus.GONE, f"Modificările de după {since} nu mai sunt în jurnal; "
+                                                 f"reîncărcați datele")
+            changes = view.changes_since(since, limit)
+        last = changes[-1].seq if changes else since
+        return self._cached({'changes': [vars(change) for change in changes], 'last': last}, headers)
+
+    def search(self, query, headers):
+        limit = int(query.get('limit', 20))
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit trebuie să fie între 1 și {MAX_PAGE_SIZE}")
+        entity = query.get('entity')
+        if entity is not None and entity not in ENTITIES:
+            raise ValueError(f"Entitate necunoscută: {entity}")
+        with self.store.snapshot() as view:
+            results = view.search(query.get('q', ''), limit, entity)
+        return self._cached({'results': [vars(result) for result in results]}, headers)
+
+    def show(self, entity, entity_id, headers):
+        with self.store.snapshot() as view:
+            obj = self._get(view, entity, entity_id)
+        return self._cached(to_json(obj), headers)
+
+    def create(self, entity, body, project_id=None):
+        data = self._body(body)
+        if project_id is not None:
+            data['project_id'] = project_id
+        obj = ENTITIES[entity][0](**parse_fields(entity, data, required=True))
+        store = self.store
+        with store.engine.write():
+            if entity != 'project':
+                self._get(store, 'project', obj.project_id)
+            getattr(store, f"add_{entity}")(obj)
+        return HTTPStatus.CREATED, _encode(to_json(obj)), {'Location': f"/{ENTITIES[entity][1]}/{obj.id}"}
+
+    def update(self, entity, entity_id, headers, body):
+        changes = parse_fields(entity, self._body(body), required=False)
+        if not changes:
+            raise ValueError("Nu a fost dat niciun câmp de modificat")
+        store = self.store
+        with store.engine.write():
+            obj = self._get(store, entity, entity_id)
+            self._check_version(obj, headers)
+            if 'project_id' in changes:
+                self._get(store, 'project', changes['project_id'])
+            for name, value in changes.items():
+                setattr(obj, name, value)
+            moved = getattr(store, f"update_{entity}")(obj)
+            payload = to_json(self._get(store, entity, entity_id))
+        if entity == 'task':
+            payload['rescheduled'] = [task.id for task in moved if task.id != entity_id]
+        return HTTPStatus.OK, _encode(payload), {}
+
+    def delete(self, entity, entity_id, headers):
+        store = self.store
+        with store.engine.write():
+            self._check_version(self._get(store, entity, entity_id), headers)
+            getattr(store, f"delete_{entity}")(entity_id)
+        return HTTPStatus.NO_CONTENT, b'', {}
+
+    def _body(self, body):
+        try:
+            return json.loads(body or b'{}')
+        except ValueError as e:
+            raise ValueError(f"JSON invalid: {e}")
+
+
+# ----------------------------------------------------------------------
+# Serverul HTTP
+# ----------------------------------------------------------------------
+
+def http_response(status, body=b'', headers=None, keep_alive=True):
+    status = HTTPStatus(status)
+    lines = [f"HTTP/1.1 {status.value} {status.phrase}"]
+    if status != HTTPStatus.NOT_MODIFIED and status != HTTPStatus.NO_CONTENT:
+        lines.append("Content-Type: application/json; charset=utf-8")
+        lines.append(f"Content-Length: {len(body)}")
+    lines.extend(f"{name}: {value}" for name, value in (headers or {}).items())
+    lines.append("Connection: keep-alive" if keep_alive else "Connection: close")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode('latin-1') + body
+
+
+async def read_request(reader):
+    """Citește o cerere HTTP/1.1: (metodă, țintă, versiune, headere, corp) sau None la EOF"""
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, target, version = line.decode('latin-1').split()
+    except ValueError:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Linie de cerere invalidă")
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get('content-length') or 0)
+    except ValueError:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Content-Length invalid")
+    if length > MAX_BODY:
+        raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+    body = await reader.readexactly(length) if length else b''
+    return method.upper(), target, version, headers, body
+
+
+class ApiServer:
+    """Serverul asyncio: citirile rulează în paralel, scrierile pe un singur thread"""
+
+    def __init__(self, store, readers=None):
+        self.api = Api(store)
+        # Câte un thread pentru fiecare conexiune de citire din pool, ca niciunul să nu aștepte o conexiune
+        self.read_executor = ThreadPoolExecutor(max_workers=readers or store.engine.config.read_pool_size,
+                                                thread_name_prefix='pm-api-read')
+        # Scrierile sunt oricum serializate de motorul de stocare
+        self.write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pm-api-write')
+        self.server = None
+
+    async def start(self, host=HOST, port=PORT):
+        """Pornește ascultarea; întoarce portul (util pentru port=0)"""
+        self.server = await asyncio.start_server(self.handle_connection, host, port, limit=MAX_LINE)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self, host=HOST, port=PORT):
+        port = await self.start(host, port)
+        print(f"API disponibil la http://{host}:{port}/projects", flush=True)
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def handle_connection(self, reader, writer):
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except HttpError as e:
+                    _, body, _ = self.api.error(e.status, str(e))
+                    writer.write(http_response(e.status, body, keep_alive=False))
+                    break
+                except ValueError:
+                    # Linie mai lungă decât MAX_LINE
+                    writer.write(http_response(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, keep_alive=False))
+                    break
+                if request is None:
+                    break
+
+                method, target, version, headers, body = request
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+                executor = self.read_executor if method in ('GET', 'HEAD') else self.write_executor
+                status, payload, extra = await loop.run_in_executor(
+                    executor, self.api.handle, 'GET' if method == 'HEAD' else method, target, headers, body)
+                response = http_response(status, payload, extra, keep_alive)
+                if method == 'HEAD':
+                    response = response[:len(response) - len(payload)]
+                writer.write(response)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def close(self):
+        if self.server is not None:
+            self.server.close()
+        self.read_executor.shutdown(wait=True)
+        self.write_executor.shutdown(wait=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="API HTTP/JSON locală peste baza de proiecte")
+    parser.add_argument('--db', default=DB_PATH, help="baza de date (implicit: %(default)s)")
+    parser.add_argument('--host', default=HOST, help="adresa (implicit: %(default)s)")
+    parser.add_argument('--port', type=int, default=PORT, help="portul (implicit: %(default)s)")
+    parser.add_argument('--readers', type=int, default=StorageConfig.read_pool_size,
+                        help="conexiuni de citire în pool (implicit: %(default)s)")
+    args = parser.parse_args(argv)
+
+    store = ProjectStore(config=StorageConfig(path=args.db, read_pool_size=args.readers))
+    server = ApiServer(store)
+    try:
+        asyncio.run(server.serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        print(f"Eroare: {e}", file=sys.stderr)
+        return 1
+    finally:
+        server.close()
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""Benchmark pentru API-ul HTTP: sute de clienți concurenți care citesc.
+
+Serverul rulează într-un thread al aceluiași proces, pe o bază de date
+generată; fiecare client ține o conexiune keep-alive și cere pagini de
+taskuri. A doua rundă trimite If-None-Match și primește 304.
+
+    python benchmarks/bench_api.py [--clients 200] [--requests 50] [--projects 200]
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+import tempfile
+import threading
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_store import ProjectStore, Project, Task  # noqa: E402
+from api_server import ApiServer  # noqa: E402
+from storage import StorageConfig  # noqa: E402
+
+
+def build_database(path, projects, tasks_per_project):
+    store = ProjectStore(path)
+    store.add_projects(Project(name=f"Proiect {i}") for i in range(projects))
+    store.add_tasks(Task(project_id=p, name=f"Task {p}-{i}", start_date="2025-01-01", end_date="2025-01-10",
+                         duration=9) for p in range(1, projects + 1) for i in range(tasks_per_project))
+    store.close()
+
+
+def start_server(path, readers):
+    """Pornește serverul într-un thread separat; întoarce (server, store, port)"""
+    store = ProjectStore(config=StorageConfig(path=path, read_pool_size=readers))
+    server = ApiServer(store)
+    loop = asyncio.new_event_loop()
+    port = loop.run_until_complete(server.start('127.0.0.1', 0))
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return server, store, port
+
+
+async def get(reader, writer, path, etag=None):
+    """O cerere GET pe o conexiune keep-alive; întoarce (status, etag)"""
+    extra = f"If-None-Match: {etag}\r\n" if etag else ""
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n{extra}\r\n".encode())
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line == b'\r\n':
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.lower()] = value.strip()
+    await reader.readexactly(int(headers.get('content-length', 0)))
+    return status, headers.get('etag')
+
+
+async def client(port, index, count, projects, etags, latencies, conditional):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    try:
+        for i in range(count):
+            path = f"/projects/{(index + i) % projects + 1}/tasks?limit=50"
+            t0 = time.perf_counter()
+            status, tag = await get(reader, writer, path, etags.get(path) if conditional else None)
+            latencies.append(time.perf_counter() - t0)
+            if status not in (200, 304):
+                raise RuntimeError(f"{path}: {status}")
+            etags[path] = tag
+    finally:
+        writer.close()
+
+
+async def run_clients(port, clients, count, projects, etags, conditional):
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, i, count, projects, etags, latencies, conditional)
+                           for i in range(clients)))
+    return time.perf_counter() - start, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--clients', type=int, default=200)
+    parser.add_argument('--requests', type=int, default=50, help="cereri per client")
+    parser.add_argument('--projects', type=int, default=200)
+    parser.add_argument('--tasks', type=int, default=50, help="taskuri per proiect")
+    parser.add_argument('--readers', type=int, default=StorageConfig.read_pool_size)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "api.db")
+        build_database(path, args.projects, args.tasks)
+        server, store, port = start_server(path, args.readers)
+        etags = {}
+        try:
+            print(f"clienți: {args.clients}  cereri/client: {args.requests}  conexiuni de citire: {args.readers}")
+            for label, conditional in (("GET", False), ("GET + If-None-Match", True)):
+                seconds, latencies = asyncio.run(run_clients(port, args.clients, args.requests, args.projects,
+                                                             etags, conditional))
+                latencies.sort()
+                print(f"{label:<22}{len(latencies) / seconds:>10,.0f} cereri/s   "
+                      f"p50 {statistics.median(latencies) * 1000:6.1f} ms   "
+                      f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:6.1f} ms")
+        finally:
+            server.close()
+            store.close()
+
+
+if __name__ == "__main__":
+    main()
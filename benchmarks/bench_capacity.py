@@ -0,0 +1,74 @@
+"""Benchmark pentru încărcarea resurselor: matricea de alocare pentru tot portofoliul.
+
+Generează un portofoliu cu sute de persoane, zeci de mii de taskuri alocate
+(unele cu două persoane) pe doi ani și măsoară tot calculul (citirea din
+baza de date, matricea și lista supraalocărilor), zilnic și săptămânal.
+
+    python benchmarks/bench_capacity.py [--people 500] [--tasks 50000] [--years 2] [--repeat 5]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import datetime
+import tempfile
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_store import ProjectStore, Project, Task, Resource, AVAILABILITY_VALUES  # noqa: E402
+from capacity import capacity_plan  # noqa: E402
+
+PROJECTS = 100
+
+
+def build_database(path, people, tasks, years, seed=1):
+    rnd = random.Random(seed)
+    start = datetime.date(2025, 1, 1)
+    horizon = int(365 * years)
+    store = ProjectStore(path)
+    store.add_projects(Project(name=f"Proiect {i}") for i in range(PROJECTS))
+    # Fiecare persoană apare ca resursă în unul sau două proiecte
+    store._insert_many([Resource(project_id=rnd.randint(1, PROJECTS), name=f"Persoana {p}",
+                                 availability=rnd.choice(AVAILABILITY_VALUES[:2]))
+                        for p in range(people) for _ in range(rnd.randint(1, 2))])
+
+    def task(i):
+        names = ", ".join(f"Persoana {rnd.randrange(people)}" for _ in range(rnd.choice((1, 1, 1, 2))))
+        first = start + datetime.timedelta(days=rnd.randrange(horizon - 30))
+        length = rnd.randint(1, 30)
+        return Task(project_id=rnd.randint(1, PROJECTS), name=f"Task {i}", assigned_to=names,
+                    start_date=first.isoformat(), end_date=(first + datetime.timedelta(days=length)).isoformat(),
+                    duration=rnd.randint(1, length))
+    store.add_tasks(task(i) for i in range(tasks))
+    store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--people', type=int, default=500)
+    parser.add_argument('--tasks', type=int, default=50_000)
+    parser.add_argument('--years', type=float, default=2)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "capacity.db")
+        build_database(path, args.people, args.tasks, args.years)
+        store = ProjectStore(path)
+        print(f"persoane: {args.people:,}  taskuri: {args.tasks:,}  ani: {args.years:g}  (mediana din {args.repeat})")
+        for bucket in ('week', 'day'):
+            runs = []
+            for _ in range(args.repeat):
+                t0 = time.perf_counter()
+                plan = capacity_plan(store, bucket=bucket)
+                over = plan.over_allocated()
+                runs.append(time.perf_counter() - t0)
+            print(f"{bucket:<6} matrice {plan.load.shape[0]:,} x {plan.load.shape[1]:,}   "
+                  f"supraalocate {len(over):,}   {statistics.median(runs) * 1000:8.1f} ms")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark pentru valoarea câștigată (EVM) calculată pentru tot portofoliul.
+
+Generează un portofoliu cu o mie de proiecte (buget, resurse, taskuri datate
+cu progres) și măsoară tot calculul la o dată de stare: citirea în bloc,
+indicatorii pe taskuri, proiecte și portofoliu, plus curba S a portofoliului.
+
+    python benchmarks/bench_evm.py [--projects 1000] [--tasks 50] [--repeat 5]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import datetime
+import tempfile
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_store import ProjectStore, Project, Task, Resource  # noqa: E402
+from evm import earned_value  # noqa: E402
+
+STATUS_DATE = "2025-09-30"
+
+
+def build_database(path, projects, tasks, seed=1):
+    rnd = random.Random(seed)
+    start = datetime.date(2025, 1, 1)
+    store = ProjectStore(path)
+    store.add_projects(Project(name=f"Proiect {i}", budget=rnd.randint(10, 500) * 1000.0,
+                               start_date=start.isoformat(), end_date="2026-06-30")
+                       for i in range(projects))
+
+    def resource(project_id, i):
+        cost, quantity = rnd.randint(50, 500), rnd.randint(50, 600)
+        return Resource(project_id=project_id, name=f"Resursa {project_id}.{i}", cost_per_unit=cost,
+                        quantity=quantity, total_cost=float(cost * quantity))
+    store._insert_many([resource(p, r) for p in range(1, projects + 1) for r in range(3)])
+
+    def task(project_id, i):
+        first = start + datetime.timedelta(days=rnd.randrange(500))
+        length = rnd.randint(1, 60)
+        return Task(project_id=project_id, name=f"Task {i}", start_date=first.isoformat(),
+                    end_date=(first + datetime.timedelta(days=length)).isoformat(),
+                    duration=rnd.randint(1, length), progress=rnd.choice((0, 0, 25, 50, 75, 100)))
+    store.add_tasks(task(p, i) for p in range(1, projects + 1) for i in range(rnd.randint(1, 2 * tasks)))
+    store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--projects', type=int, default=1000)
+    parser.add_argument('--tasks', type=int, default=50, help="taskuri per proiect, în medie")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "evm.db")
+        build_database(path, args.projects, args.tasks)
+        store = ProjectStore(path)
+        runs = []
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            result = earned_value(store, STATUS_DATE)
+            days, pv, ac = result.s_curve()
+            runs.append(time.perf_counter() - t0)
+        portfolio = result.portfolio
+        print(f"proiecte: {len(result.project_ids):,}  taskuri: {len(result.task_ids):,}  "
+              f"zile curbă S: {len(days):,}  (mediana din {args.repeat})")
+        print(f"CPI {float(portfolio.cpi):.2f}  SPI {float(portfolio.spi):.2f}  "
+              f"EAC {float(portfolio.eac):,.0f}   {statistics.median(runs) * 1000:8.1f} ms")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Benchmark pentru diagrama Gantt: randarea veche (barh + text per task) vs. gantt.py.
+
+Măsoară separat pregătirea datelor și desenarea primului cadru, pe backend-ul
+Agg, pentru proiecte cu 100, 1.000 și 10.000 de taskuri.
+
+    python benchmarks/bench_gantt.py [--sizes 100 1000 10000] [--repeat 3]
+"""
+import os
+import sys
+import time
+import random
+import datetime
+import argparse
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt  # noqa: E402
+from matplotlib import dates  # noqa: E402
+from matplotlib.backends.backend_agg import FigureCanvasAgg  # noqa: E402
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_store import Task, TASK_STATUSES, EPOCH  # noqa: E402
+from gantt import GanttChart, build_gantt_data, STATUS_COLORS, DEFAULT_COLOR  # noqa: E402
+
+
+def make_tasks(count, seed=1):
+    rng = random.Random(seed)
+    base = datetime.date(2025, 1, 1)
+    tasks = []
+    for i in range(count):
+        start = base + datetime.timedelta(days=rng.randrange(365))
+        end = start + datetime.timedelta(days=rng.randrange(1, 30))
+        # start_day / end_day, ca la citirea din baza de date
+        tasks.append(Task(project_id=1, name=f"Task {i}", start_date=start.isoformat(),
+                          end_date=end.isoformat(), status=rng.choice(TASK_STATUSES),
+                          progress=rng.randrange(0, 101, 10), id=i + 1,
+                          start_day=(start - EPOCH).days, end_day=(end - EPOCH).days))
+    return tasks
+
+
+def legacy_prepare(tasks):
+    """Bucla inițială: strptime și date2num pentru fiecare task"""
+    start_dates, durations, colors = [], [], []
+    for task in tasks:
+        try:
+            start_date = datetime.datetime.strptime(task.start_date, "%Y-%m-%d").date()
+            end_date = datetime.datetime.strptime(task.end_date, "%Y-%m-%d").date()
+        except (TypeError, ValueError):
+            start_date = datetime.date.today()
+            end_date = start_date + datetime.timedelta(days=1)
+        start_dates.append(dates.date2num(start_date))
+        durations.append(dates.date2num(end_date) - dates.date2num(start_date))
+        colors.append(STATUS_COLORS.get(task.status, DEFAULT_COLOR))
+    return [t.name for t in tasks], start_dates, durations, colors, [t.progress for t in tasks]
+
+
+def legacy_draw(fig, ax, prepared):
+    """Desenarea inițială: un barh cu toate taskurile și un text per bară"""
+    names, start_dates, durations, colors, progress = prepared
+    ax.clear()
+    y_pos = range(len(names))
+    ax.barh(y_pos, durations, left=start_dates, height=0.5, align='center', color=colors)
+    for i, p in enumerate(progress):
+        if p > 0:
+            ax.text(start_dates[i] + durations[i] * (p / 100) / 2, i, f"{p}%",
+                    ha='center', va='center', color='white', fontweight='bold')
+    ax.set_yticks(y_pos)
+    ax.set_yticklabels(names)
+    ax.xaxis_date()
+    fig.autofmt_xdate()
+    fig.canvas.draw()
+
+
+def timed(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def run(size, repeat):
+    tasks = make_tasks(size)
+
+    fig, ax = plt.subplots(figsize=(12, 8))
+    FigureCanvasAgg(fig)
+    prepared = legacy_prepare(tasks)
+    old_prep = timed(lambda: legacy_prepare(tasks), repeat)
+    old_draw = timed(lambda: legacy_draw(fig, ax, prepared), repeat)
+    plt.close(fig)
+
+    fig, ax = plt.subplots(figsize=(12, 8))
+    canvas = FigureCanvasAgg(fig)
+    chart = GanttChart(fig, ax, canvas)
+    data = build_gantt_data(1, "Benchmark", tasks)
+    new_prep = timed(lambda: build_gantt_data(1, "Benchmark", tasks), repeat)
+
+    # Pe Agg, draw_idle() desenează imediat, deci cadrul este inclus în timp
+    new_draw = timed(lambda: chart.set_data(data), repeat)
+    # Derulare alternativ în jos și în sus, ca fereastra să se miște la fiecare măsurătoare
+    steps = iter([chart.visible_rows, -chart.visible_rows] * repeat)
+    new_scroll = timed(lambda: chart.scroll(next(steps)), repeat) if size > chart.visible_rows else 0.0
+    plt.close(fig)
+
+    print(f"{size:>8,} {old_prep:>11.1f} {old_draw:>11.1f} {new_prep:>11.1f} {new_draw:>11.1f} "
+          f"{new_scroll:>11.1f} {(old_prep + old_draw) / (new_prep + new_draw):>8.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'taskuri':>8} {'vechi prep':>11} {'vechi desen':>11} {'nou prep':>11} {'nou desen':>11} "
+          f"{'derulare':>11} {'câștig':>9}")
+    print(f"{'':>8} {'(ms)':>11} {'(ms)':>11} {'(ms)':>11} {'(ms)':>11} {'(ms)':>11}")
+    for size in args.sizes:
+        run(size, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
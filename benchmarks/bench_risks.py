@@ -0,0 +1,78 @@
+"""Benchmark pentru harta riscurilor din tot portofoliul.
+
+Generează un registru mare de riscuri și măsoară matricea probabilitate x
+impact cu expunerea pe proiecte (o singură agregare), lista riscurilor
+ridicate deschise (parcurgere în indexul pe risk_score) și reclasificarea
+tuturor riscurilor cu alte praguri (o singură instrucțiune UPDATE).
+
+    python benchmarks/bench_risks.py [--projects 2000] [--risks 50] [--repeat 5]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_store import (ProjectStore, Project, Risk, RISK_PROBABILITIES, RISK_IMPACTS,  # noqa: E402
+                           RISK_STATUSES, RISK_LEVELS, compute_risk_level)
+from analytics import OPEN_RISK_STATUSES  # noqa: E402
+from riskmap import risk_map  # noqa: E402
+
+
+def build_database(path, projects, risks, seed=1):
+    rnd = random.Random(seed)
+    store = ProjectStore(path)
+    store.add_projects(Project(name=f"Proiect {i}") for i in range(projects))
+
+    def risk(project_id, i):
+        probability, impact = rnd.choice(RISK_PROBABILITIES), rnd.choice(RISK_IMPACTS)
+        return Risk(project_id=project_id, description=f"Risc {project_id}.{i}", probability=probability,
+                    impact=impact, risk_level=compute_risk_level(probability, impact),
+                    status=rnd.choice(RISK_STATUSES), cost_impact=float(rnd.randint(0, 50) * 100))
+    store._insert_many(risk(p, i) for p in range(1, projects + 1) for i in range(rnd.randint(1, 2 * risks)))
+    store.close()
+
+
+def timed(repeat, func):
+    runs = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = func()
+        runs.append(time.perf_counter() - t0)
+    return result, statistics.median(runs) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--projects', type=int, default=2000)
+    parser.add_argument('--risks', type=int, default=50, help="riscuri per proiect, în medie")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "risks.db")
+        build_database(path, args.projects, args.risks)
+        store = ProjectStore(path)
+        total = store.conn.execute("SELECT COUNT(*) FROM risks").fetchone()[0]
+        print(f"proiecte: {args.projects:,}  riscuri: {total:,}  (mediana din {args.repeat})")
+
+        result, ms = timed(args.repeat, lambda: risk_map(store, OPEN_RISK_STATUSES))
+        print(f"{'matrice + expunere (deschise)':<32}{result.total:>10,} riscuri {ms:10.1f} ms")
+        high, ms = timed(args.repeat, lambda: store.high_risks(open_statuses=OPEN_RISK_STATUSES))
+        print(f"{'riscuri ridicate deschise':<32}{len(high):>10,} riscuri {ms:10.1f} ms")
+
+        (low, _), (moderate, _), high_level = RISK_LEVELS
+        rules = [[(low, 2), (moderate, 4), high_level], [(low, 1), (moderate, 3), high_level]]
+        t0 = time.perf_counter()
+        changed = [store.rescore_risks(rules[i % 2]) for i in range(1, args.repeat + 1)]
+        ms = (time.perf_counter() - t0) / args.repeat * 1000
+        print(f"{'reclasificare (media)':<32}{max(changed):>10,} riscuri {ms:10.1f} ms")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark pentru reprogramarea automată a taskurilor dependente.
+
+Creează un program cu N taskuri legate prin dependențe finish-to-start și
+măsoară cât durează ProjectStore.update_task() când mută data unui task:
+validarea, propagarea în aval și scrierea într-o singură tranzacție.
+
+    python benchmarks/bench_schedule.py [--tasks 5000] [--updates 50]
+"""
+import os
+import sys
+import json
+import time
+import random
+import datetime
+import argparse
+import tempfile
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_store import ProjectStore, Project, Task  # noqa: E402
+from storage import StorageConfig  # noqa: E402
+
+
+def build_program(store, count, seed=1):
+    """Program consistent: fiecare task depinde de 1-2 taskuri anterioare și începe după ele"""
+    rng = random.Random(seed)
+    project_id = store.add_project(Project(name="Program"))
+    base = datetime.date(2025, 1, 1)
+    first_id = store.conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM tasks").fetchone()[0]
+    tasks = []
+    ends = []
+    for i in range(count):
+        deps = sorted({rng.randrange(max(0, i - 20), i) for _ in range(rng.randrange(1, 3))}) if i else []
+        start = max((ends[d] for d in deps), default=base) + datetime.timedelta(days=rng.randrange(3))
+        length = rng.randrange(1, 10)
+        ends.append(start + datetime.timedelta(days=length))
+        tasks.append(Task(project_id=project_id, name=f"Task {i}", start_date=start.isoformat(),
+                          end_date=ends[-1].isoformat(), duration=length,
+                          dependencies=json.dumps([first_id + d for d in deps])))
+    store.add_tasks(tasks)
+    return project_id
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tasks', type=int, default=5000)
+    parser.add_argument('--updates', type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ProjectStore(config=StorageConfig(path=os.path.join(tmp, "schedule.db")))
+        project_id = build_program(store, args.tasks)
+        ids = [t.id for t in store.list_tasks(project_id)]
+
+        rng = random.Random(2)
+        timings = []
+        moved_counts = []
+        for _ in range(args.updates):
+            task = store.get_task(rng.choice(ids))
+            end = datetime.date.fromisoformat(task.end_date) + datetime.timedelta(days=rng.randrange(1, 15))
+            task.end_date = end.isoformat()
+            t0 = time.perf_counter()
+            moved = store.update_task(task)
+            timings.append(time.perf_counter() - t0)
+            moved_counts.append(len(moved))
+
+        # Cazul cel mai defavorabil: primul task se mută cu un an, iar aproape tot programul îl urmează
+        task = store.get_task(ids[0])
+        task.end_date = (datetime.date.fromisoformat(task.end_date) + datetime.timedelta(days=365)).isoformat()
+        t0 = time.perf_counter()
+        worst_moved = len(store.update_task(task))
+        worst = time.perf_counter() - t0
+        store.close()
+
+    timings.sort()
+    print(f"taskuri: {args.tasks:,}  actualizări: {args.updates}")
+    print(f"taskuri mutate per actualizare: median {statistics.median(moved_counts):,.0f}, max {max(moved_counts):,}")
+    print(f"durată update_task: p50 {statistics.median(timings) * 1000:.1f} ms, "
+          f"p95 {timings[int(len(timings) * 0.95)] * 1000:.1f} ms, max {timings[-1] * 1000:.1f} ms")
+    print(f"primul task mutat cu un an: {worst_moved:,} taskuri mutate în {worst * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
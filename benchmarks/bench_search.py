@@ -0,0 +1,90 @@
+"""Benchmark pentru căutarea globală FTS5, pe o bază de date cu un milion de rânduri de text.
+
+Simulează tastarea: fiecare termen este căutat literă cu literă ("m", "mi",
+"mig", ...), ca în caseta de căutare, și raportează latența pe apăsare de tastă.
+
+    python benchmarks/bench_search.py [--rows 1000000] [--limit 20] [--repeat 5]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_store import ProjectStore, Project, Task, Risk, Stakeholder  # noqa: E402
+
+WORDS = ("migrare analiză cerințe proiectare implementare testare integrare livrare documentație instruire "
+         "buget contract furnizor server rețea bază date aplicație interfață raport audit securitate "
+         "risc întârziere depășire calitate client echipă manager sponsor comunicare ședință plan "
+         "achiziție licență infrastructură mentenanță suport migrare arhitectură cloud mobil portal").split()
+SYLLABLES = "ba be bi bo bu ca ce ci co cu da de di do du fa fe fi ga ge la le li lo lu ma me mi mo mu " \
+            "na ne ni no nu pa pe pi po pu ra re ri ro ru sa se si so su ta te ti to tu va ve vi vo vu".split()
+TERMS = ["m", "mi", "mig", "migr", "migra", "migrare", "migrare s", "migrare se", "migrare securitate",
+         "desf", "raport a", "raport audit", "zzzz", "buget client", "in", "int"]
+
+
+def text(rnd, vocabulary, words):
+    return " ".join(rnd.choice(vocabulary) for _ in range(words))
+
+
+def build_database(path, rows, seed=1):
+    """Proiecte, taskuri, riscuri și stakeholderi în proporții realiste, cu text generat"""
+    rnd = random.Random(seed)
+    # Vocabular mare, ca în date reale: cuvinte comune plus ~20.000 de cuvinte generate
+    vocabulary = WORDS * 20 + ["".join(rnd.choice(SYLLABLES) for _ in range(rnd.randint(2, 4)))
+                               for _ in range(20000)]
+    projects = max(1, rows // 20)
+    store = ProjectStore(path)
+    store.add_projects(Project(name=text(rnd, vocabulary, 3), description=text(rnd, vocabulary, 15))
+                       for _ in range(projects))
+    store.add_tasks(Task(project_id=rnd.randint(1, projects), name=text(rnd, vocabulary, 4),
+                         description=text(rnd, vocabulary, 12)) for _ in range(rows * 3 // 4))
+    store._insert_many([Risk(project_id=rnd.randint(1, projects), description=text(rnd, vocabulary, 6),
+                             mitigation_strategy=text(rnd, vocabulary, 10)) for _ in range(rows // 8)])
+    store._insert_many([Stakeholder(project_id=rnd.randint(1, projects), name=text(rnd, vocabulary, 2),
+                                    role=text(rnd, vocabulary, 2), communication_plan=text(rnd, vocabulary, 8))
+                        for _ in range(rows - projects - rows * 3 // 4 - rows // 8)])
+    with store.engine.write() as conn:
+        conn.execute("INSERT INTO search_index (search_index) VALUES ('optimize')")
+    store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--limit', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=5, help="repetări per termen (se raportează mediana)")
+    parser.add_argument('--db', help="refolosește o bază de date generată anterior")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = args.db or os.path.join(workdir, "search.db")
+        if not os.path.exists(path):
+            start = time.perf_counter()
+            build_database(path, args.rows)
+            print(f"{args.rows:,} rânduri generate și indexate în {time.perf_counter() - start:.1f} s")
+
+        store = ProjectStore(path)
+        latencies = []
+        print(f"{'termen':<22}{'rezultate':>10}{'ms':>9}")
+        for term in TERMS:
+            runs = []
+            for _ in range(args.repeat):
+                t0 = time.perf_counter()
+                results = store.search(term, args.limit)
+                runs.append(time.perf_counter() - t0)
+            elapsed = statistics.median(runs)
+            latencies.append(elapsed)
+            print(f"{term:<22}{len(results):>10}{elapsed * 1000:>9.1f}")
+        store.close()
+
+    latencies.sort()
+    print(f"mediana {statistics.median(latencies) * 1000:.1f} ms   maxim {latencies[-1] * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Benchmark pentru timpul de pornire al aplicației grafice.
+
+Fiecare măsurătoare rulează într-un proces Python nou, pe o copie a unei baze
+de date generate, și raportează:
+  - importul modulului aplicației;
+  - prima afișare a ferestrei (time-to-first-paint);
+  - momentul în care graficul din dashboard este desenat.
+
+Modul "eager" reproduce pornirea de dinainte: matplotlib, FigureCanvasTkAgg
+și NumPy importate la început, toate taburile și figurile construite înainte
+de afișarea ferestrei. Necesită un display (sau Xvfb).
+
+    python benchmarks/bench_startup.py [--runs 5] [--projects 500]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+APP_PATH = os.path.join(ROOT, "PROJECTS MANAGEMENT.py")
+TIMEOUT_S = 30
+
+
+def child(mode):
+    """Pornește aplicația în procesul curent și afișează timpii ca JSON"""
+    import importlib
+    import importlib.util
+    start = time.perf_counter()
+    if mode == 'eager':
+        for name in ('numpy', 'matplotlib.pyplot', 'matplotlib.backends.backend_tkagg'):
+            importlib.import_module(name)
+
+    import tkinter as tk
+    spec = importlib.util.spec_from_file_location("project_management_app", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    imported = time.perf_counter()
+
+    root = tk.Tk()
+    app = module.ProjectManagementApp(root)
+    if mode == 'eager':
+        app.dashboard_fig, app.dashboard_ax, app.dashboard_canvas = module.embed_figure(
+            app.dashboard_chart_frame, (8, 4))
+        for tab in list(app.tab_builders):
+            app.build_tab(tab)
+
+    deadline = time.perf_counter() + TIMEOUT_S
+    while not root.winfo_viewable() and time.perf_counter() < deadline:
+        root.update()
+    root.update_idletasks()
+    painted = time.perf_counter()
+
+    # Graficul este desenat după ce sosesc datele din thread-ul de lucru
+    while app.dashboard_bars is None and time.perf_counter() < deadline:
+        root.update()
+        time.sleep(0.001)
+    app.dashboard_canvas.draw()
+    root.update_idletasks()
+    charted = time.perf_counter()
+
+    app.on_close()
+    print(json.dumps({'import': imported - start, 'paint': painted - start, 'chart': charted - start}))
+
+
+def build_database(path, count):
+    from project_store import ProjectStore, Project, PROJECT_STATUSES
+    store = ProjectStore(path)
+    store.add_projects(Project(name=f"Proiect {i}", budget=1000.0 * i,
+                               status=PROJECT_STATUSES[i % len(PROJECT_STATUSES)]) for i in range(count))
+    store.close()
+
+
+def measure(mode, workdir):
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', mode], cwd=workdir,
+                            capture_output=True, text=True, timeout=TIMEOUT_S * 2)
+    if output.returncode != 0:
+        raise RuntimeError(output.stderr.strip().splitlines()[-1] if output.stderr else "eroare necunoscută")
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--projects', type=int, default=500)
+    parser.add_argument('--child', choices=['lazy', 'eager'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child)
+        return
+
+    with tempfile.TemporaryDirectory() as workdir:
+        build_database(os.path.join(workdir, "project_management.db"), args.projects)
+        results = {}
+        try:
+            for mode in ('eager', 'lazy'):
+                # Prima rulare încălzește cache-ul de fișiere și bytecode-ul
+                measure(mode, workdir)
+                results[mode] = [measure(mode, workdir) for _ in range(args.runs)]
+        except RuntimeError as e:
+            sys.exit(f"Aplicația nu a putut porni (este disponibil un display?): {e}")
+
+    print(f"proiecte: {args.projects:,}  rulări: {args.runs} (mediana, ms de la pornirea procesului)")
+    print(f"{'mod':<8}{'import':>10}{'prima afișare':>16}{'grafic dashboard':>19}")
+    for mode, runs in results.items():
+        med = {key: statistics.median(r[key] for r in runs) * 1000 for key in runs[0]}
+        print(f"{mode:<8}{med['import']:>10.0f}{med['paint']:>16.0f}{med['chart']:>19.0f}")
+
+
+if __name__ == "__main__":
+    main()
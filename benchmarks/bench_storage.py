@@ -0,0 +1,104 @@
+"""Benchmark pentru motorul de stocare: setările SQLite implicite vs. WAL.
+
+Măsoară inserările pe secundă (un commit per task, ca în formularele
+aplicației) și latența citirilor concurente în timp ce un thread scrie.
+
+    python benchmarks/bench_storage.py [--inserts 2000] [--seconds 3]
+"""
+import os
+import sys
+import time
+import sqlite3
+import argparse
+import tempfile
+import threading
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_store import ProjectStore, Project, Task  # noqa: E402
+from storage import StorageConfig  # noqa: E402
+
+
+def bench_inserts(store, project_id, count):
+    """Inserări individuale, fiecare cu propriul commit"""
+    start = time.perf_counter()
+    for i in range(count):
+        store.add_task(Task(project_id=project_id, name=f"Task {i}", start_date="2025-01-01",
+                            end_date="2025-01-10", duration=9))
+    return count / (time.perf_counter() - start)
+
+
+def bench_concurrent_reads(store, project_id, seconds, readers=4):
+    """Latența citirilor din pool în timp ce conexiunea de scriere inserează continuu"""
+    stop = threading.Event()
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+
+    def writer():
+        i = 0
+        while not stop.is_set():
+            try:
+                store.add_task(Task(project_id=project_id, name=f"Concurent {i}"))
+            except sqlite3.OperationalError as e:
+                errors.append(str(e))
+            i += 1
+
+    def reader():
+        local = []
+        while not stop.is_set():
+            t0 = time.perf_counter()
+            try:
+                with store.reader() as conn:
+                    conn.execute("SELECT COUNT(*), AVG(progress) FROM tasks WHERE project_id=?",
+                                 (project_id,)).fetchone()
+            except sqlite3.OperationalError as e:
+                errors.append(str(e))
+                continue
+            local.append(time.perf_counter() - t0)
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(readers)]
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+
+    latencies.sort()
+    return {
+        'reads': len(latencies),
+        'p50_ms': statistics.median(latencies) * 1000 if latencies else float('nan'),
+        'p95_ms': latencies[int(len(latencies) * 0.95)] * 1000 if latencies else float('nan'),
+        'max_ms': latencies[-1] * 1000 if latencies else float('nan'),
+        'errors': len(errors),
+    }
+
+
+def run(name, config, inserts, seconds):
+    store = ProjectStore(config=config)
+    project_id = store.add_project(Project(name="Benchmark"))
+    rate = bench_inserts(store, project_id, inserts)
+    reads = bench_concurrent_reads(store, project_id, seconds)
+    store.close()
+    print(f"{name:<8} {rate:>12,.0f} {reads['reads']:>10,} {reads['p50_ms']:>9.3f} "
+          f"{reads['p95_ms']:>9.3f} {reads['max_ms']:>9.2f} {reads['errors']:>7}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--inserts', type=int, default=2000)
+    parser.add_argument('--seconds', type=float, default=3.0)
+    args = parser.parse_args()
+
+    print(f"{'config':<8} {'inserts/s':>12} {'citiri':>10} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9} {'erori':>7}")
+    with tempfile.TemporaryDirectory() as tmp:
+        run("implicit", StorageConfig.legacy(os.path.join(tmp, "legacy.db")), args.inserts, args.seconds)
+        run("WAL", StorageConfig(path=os.path.join(tmp, "wal.db")), args.inserts, args.seconds)
+
+
+if __name__ == "__main__":
+    main()
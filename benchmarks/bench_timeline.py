@@ -0,0 +1,85 @@
+"""Benchmark pentru timeline-ul portofoliului.
+
+Generează un portofoliu mare (proiecte cu taskuri eșalonate pe câțiva ani) și
+măsoară agregarea intervalelor pe proiect (un rând pe proiect, calculat în
+SQL), construcția tablourilor pentru diagramă și încărcarea detaliilor la
+zoom: taskurile proiectelor de pe ecran care se suprapun cu fereastra de timp.
+
+    python benchmarks/bench_timeline.py [--projects 2000] [--tasks 100] [--repeat 5]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import datetime
+import tempfile
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_store import ProjectStore, Project, Task, TASK_STATUSES  # noqa: E402
+from timeline import (portfolio_timeline, load_details, VISIBLE_ROWS, DETAIL_DAYS,  # noqa: E402
+                      MAX_DETAIL_TASKS)
+
+
+def build_database(path, projects, tasks, seed=1):
+    rnd = random.Random(seed)
+    store = ProjectStore(path)
+    store.add_projects(Project(name=f"Proiect {i}") for i in range(projects))
+    origin = datetime.date(2024, 1, 1)
+
+    def project_tasks(project_id):
+        start = origin + datetime.timedelta(days=rnd.randint(0, 3 * 365))
+        for i in range(rnd.randint(1, 2 * tasks)):
+            begin = start + datetime.timedelta(days=rnd.randint(0, 365))
+            duration = rnd.randint(1, 30)
+            yield Task(project_id=project_id, name=f"Task {project_id}.{i}", start_date=begin.isoformat(),
+                       end_date=(begin + datetime.timedelta(days=duration)).isoformat(), duration=duration,
+                       progress=rnd.randint(0, 100), status=rnd.choice(TASK_STATUSES))
+    store.add_tasks(task for p in range(1, projects + 1) for task in project_tasks(p))
+    store.close()
+
+
+def timed(repeat, func):
+    runs = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = func()
+        runs.append(time.perf_counter() - t0)
+    return result, statistics.median(runs) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--projects', type=int, default=2000)
+    parser.add_argument('--tasks', type=int, default=100, help="taskuri per proiect, în medie")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "timeline.db")
+        build_database(path, args.projects, args.tasks)
+        store = ProjectStore(path)
+        total = store.conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+        print(f"proiecte: {args.projects:,}  taskuri: {total:,}  (mediana din {args.repeat})")
+
+        spans, ms = timed(args.repeat, store.project_spans)
+        print(f"{'intervale pe proiect (SQL)':<36}{len(spans):>8,} rânduri {ms:10.1f} ms")
+        data, ms = timed(args.repeat, lambda: portfolio_timeline(store))
+        print(f"{'date timeline (SQL + tablouri)':<36}{len(data):>8,} proiecte {ms:9.1f} ms")
+
+        # Detalii pentru ecranul din mijlocul portofoliului, la o fereastră de DETAIL_DAYS zile
+        middle = len(data) // 2
+        ids = data.ids[middle:middle + VISIBLE_ROWS].tolist()
+        first_day = spans[middle][3]
+        for days in (DETAIL_DAYS // 4, DETAIL_DAYS):
+            detail, ms = timed(args.repeat, lambda: load_details(store, ids, first_day, first_day + days))
+            shown = "prea multe" if detail.truncated else f"{len(detail):,}"
+            print(f"{f'detalii {len(ids)} proiecte x {days} zile':<36}{shown:>8} taskuri {ms:9.1f} ms"
+                  f"  (limită {MAX_DETAIL_TASKS:,})")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark pentru WBS-ul ierarhic cu totaluri actualizate incremental.
+
+Construiește un arbore de taskuri (câteva rădăcini, fiecare nod cu --fanout
+subtaskuri) și măsoară: încărcarea în masă față de aceleași taskuri fără
+părinți (costul triggerelor care întrețin închiderea și totalurile),
+actualizarea unei frunze (propagarea până la rădăcină), mutarea unui
+subarbore, o pagină din nivelul de sus și copiii unui nod.
+
+    python benchmarks/bench_wbs.py [--tasks 20000] [--roots 20] [--fanout 5] [--repeat 50]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_store import ProjectStore, Project, Task  # noqa: E402
+
+
+def build_tasks(store, count, roots, fanout, hierarchy=True, seed=1):
+    """Taskuri în ordinea nivelurilor, ca părintele să existe înaintea subtaskurilor"""
+    rng = random.Random(seed)
+    project_id = store.add_project(Project(name="WBS", start_date="2025-01-01"))
+    first_id = store.conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM tasks").fetchone()[0]
+    tasks = [Task(project_id=project_id, name=f"Task {i}", duration=rng.randint(1, 20),
+                  progress=rng.randint(0, 100), cost=float(rng.randint(1, 50) * 100),
+                  parent_id=first_id + (i - roots) // fanout if hierarchy and i >= roots else None)
+             for i in range(count)]
+    t0 = time.perf_counter()
+    store.add_tasks(tasks)
+    return project_id, first_id, time.perf_counter() - t0
+
+
+def timed(repeat, func):
+    runs = []
+    for i in range(repeat):
+        t0 = time.perf_counter()
+        result = func(i)
+        runs.append(time.perf_counter() - t0)
+    return result, statistics.median(runs) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tasks', type=int, default=20_000)
+    parser.add_argument('--roots', type=int, default=20)
+    parser.add_argument('--fanout', type=int, default=5)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        flat = ProjectStore(os.path.join(workdir, "flat.db"))
+        _, _, flat_seconds = build_tasks(flat, args.tasks, args.roots, args.fanout, hierarchy=False)
+        flat.close()
+
+        store = ProjectStore(os.path.join(workdir, "wbs.db"))
+        project_id, first_id, tree_seconds = build_tasks(store, args.tasks, args.roots, args.fanout)
+        depth = store.conn.execute("SELECT MAX(depth) FROM task_tree").fetchone()[0]
+        print(f"taskuri: {args.tasks:,}  adâncime: {depth}  (mediana din {args.repeat})")
+        print(f"{'încărcare fără părinți':<36}{flat_seconds * 1000:10.1f} ms")
+        print(f"{'încărcare cu WBS':<36}{tree_seconds * 1000:10.1f} ms")
+
+        leaves = [row[0] for row in store.conn.execute(
+            "SELECT id FROM tasks t WHERE NOT EXISTS (SELECT 1 FROM tasks c WHERE c.parent_id = t.id)")]
+        rng = random.Random(2)
+
+        def update_leaf(i):
+            task = store.get_task(rng.choice(leaves))
+            task.progress = i % 101
+            task.cost += 100
+            return store.update_task(task)
+
+        _, ms = timed(args.repeat, update_leaf)
+        print(f"{'actualizare frunză + totaluri':<36}{ms:10.1f} ms")
+
+        # Mută alternativ un subarbore de sub o rădăcină sub alta
+        subtree = store.get_task(first_id + args.roots)
+        parents = [first_id + 1, first_id + 2]
+
+        def move(i):
+            subtree.parent_id = parents[i % 2]
+            return store.update_task(subtree)
+
+        _, ms = timed(args.repeat, move)
+        size = store.conn.execute("SELECT COUNT(*) FROM task_tree WHERE ancestor=?", (subtree.id,)).fetchone()[0]
+        print(f"{f'mutare subarbore ({size} noduri)':<36}{ms:10.1f} ms")
+
+        for sort in ('id', 'progress', 'cost'):
+            page, ms = timed(args.repeat, lambda i: store.wbs_page(project_id, sort, True, None, 100))
+            print(f"{f'pagină nivel de sus ({sort})':<36}{ms:10.1f} ms  {len(page)} noduri")
+        children, ms = timed(args.repeat, lambda i: store.wbs_children(first_id + i % args.roots, 'progress', False))
+        print(f"{'copiii unei rădăcini':<36}{ms:10.1f} ms  {len(children)} noduri")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
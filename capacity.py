@@ -0,0 +1,197 @@
+"""Încărcarea resurselor: alocarea pe zile sau săptămâni, în tot portofoliul.
+
+Taskurile sunt legate de resurse prin numele din assigned_to (mai multe nume
+separate prin virgulă sau punct și virgulă), fără diferență între litere mari
+și mici. Aceeași persoană poate apărea ca resursă în mai multe proiecte: are
+o singură capacitate, cea mai mare cantitate declarată, înmulțită cu
+disponibilitatea. Un task încarcă fiecare resursă a sa, pe intervalul
+[start_day, end_day), cu duration / zilele intervalului pe zi (1 dacă durata
+lipsește).
+
+Matricea resurse x zile este construită vectorizat: fiecare alocare adaugă
++încărcare în ziua de început și -încărcare în ziua de sfârșit (np.bincount),
+iar o sumă cumulativă pe rânduri dă încărcarea zilnică. Costul este
+O(alocări + resurse x zile), fără bucle Python pe taskuri.
+"""
+import re
+import datetime
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from project_store import EPOCH, day_number, normalize_date, is_leaf
+
+# Fracțiunea din capacitate pentru fiecare valoare a disponibilității din formular
+AVAILABILITY_FACTORS = {"Disponibil": 1.0, "Parțial": 0.5, "Indisponibil": 0.0}
+# Lungimea unui interval, în zile
+BUCKETS = {'day': 1, 'week': 7}
+# Încărcările care depășesc capacitatea cu mai puțin de atât nu sunt supraalocări
+EPSILON = 1e-9
+
+LOAD_COLOR = '#3498db'
+OVER_COLOR = '#e74c3c'
+CAPACITY_COLOR = '#2c3e50'
+
+_SEPARATORS = re.compile(r"[,;]")
+
+
+@dataclass
+class OverAllocation:
+    name: str
+    capacity: float
+    peak: float             # cea mai mare încărcare medie pe zi dintr-un interval
+    buckets: int            # câte intervale depășesc capacitatea
+    first: datetime.date    # începutul primului interval supraalocat
+
+
+@dataclass
+class CapacityPlan:
+    names: list
+    capacity: np.ndarray    # capacitatea pe zi, per resursă
+    start: datetime.date    # începutul primului interval (luni, pentru intervale săptămânale)
+    bucket: str             # 'day' sau 'week'
+    load: np.ndarray        # încărcarea medie pe zi, resurse x intervale
+    unmatched: dict = field(default_factory=dict)   # nume din assigned_to fără resursă -> taskuri
+
+    @property
+    def over(self):
+        """Masca resurse x intervale a supraalocărilor"""
+        return self.load > self.capacity[:, None] + EPSILON
+
+    def bucket_start(self, index):
+        return self.start + datetime.timedelta(days=index * BUCKETS[self.bucket])
+
+    def over_allocated(self):
+        """Resursele supraalocate, cele cu cea mai mare depășire întâi"""
+        over = self.over
+        rows = np.flatnonzero(over.any(axis=1))
+        excess = self.load[rows].max(axis=1) - self.capacity[rows]
+        return [OverAllocation(name=self.names[i], capacity=float(self.capacity[i]),
+                               peak=float(self.load[i].max()), buckets=int(over[i].sum()),
+                               first=self.bucket_start(int(np.argmax(over[i]))))
+                for i in rows[np.argsort(-excess, kind='stable')]]
+
+
+def _split_names(text):
+    return [name.strip() for name in _SEPARATORS.split(text) if name.strip()]
+
+
+def build_plan(resources, assignments, first_day, last_day, bucket='week'):
+    """Matricea de încărcare din (nume, cantitate, disponibilitate) și (assigned_to, start_day, end_day, durată)
+
+    first_day și last_day sunt zile de la EPOCH; ultima zi este inclusă.
+    """
+    step = BUCKETS[bucket]
+    names, capacity, index = [], [], {}
+    for name, quantity, availability in resources:
+        key = name.strip().casefold()
+        value = (quantity or 0) * AVAILABILITY_FACTORS.get(availability, 1.0)
+        if key in index:
+            capacity[index[key]] = max(capacity[index[key]], value)
+        else:
+            index[key] = len(names)
+            names.append(name.strip())
+            capacity.append(value)
+
+    # Săptămânile încep lunea; 1970-01-01 (ziua 0) a fost joi
+    origin = first_day - (first_day + 3) % 7 if step == 7 else first_day
+    count = max(-(-(last_day + 1 - origin) // step), 1)
+    days = count * step
+    plan = CapacityPlan(names=names, capacity=np.array(capacity, dtype=float),
+                        start=EPOCH + datetime.timedelta(days=origin), bucket=bucket,
+                        load=np.zeros((len(names), count)))
+    if not assignments:
+        return plan
+
+    assigned, start, end, duration = zip(*assignments)
+    start = np.array(start, dtype=np.int64)
+    span = np.maximum(np.array(end, dtype=np.int64) - start, 1)
+    duration = np.array(duration, dtype=float)
+    intensity = np.where(duration > 0, duration / span, 1.0)
+
+    # Textele distincte din assigned_to sunt puține: numele sunt căutate o singură dată per text
+    texts, inverse = np.unique(np.array(assigned, dtype=object), return_inverse=True)
+    matched = []
+    task_counts = np.bincount(inverse, minlength=len(texts))
+    for text, tasks in zip(texts, task_counts):
+        found = []
+        for name in _split_names(text):
+            position = index.get(name.casefold())
+            if position is None:
+                plan.unmatched[name] = plan.unmatched.get(name, 0) + int(tasks)
+            else:
+                found.append(position)
+        matched.append(list(dict.fromkeys(found)))
+
+    # O alocare pentru fiecare pereche (task, resursă)
+    per_text = np.array([len(found) for found in matched], dtype=np.int64)
+    flat = np.array([position for found in matched for position in found], dtype=np.int64)
+    offsets = np.cumsum(per_text) - per_text
+    counts = per_text[inverse]
+    rows = np.repeat(np.arange(len(start)), counts)
+    within = np.arange(len(rows)) - np.repeat(np.cumsum(counts) - counts, counts)
+    resource = flat[offsets[inverse[rows]] + within] if len(rows) else rows
+
+    first = np.clip(start[rows] - origin, 0, days)
+    last = np.clip(start[rows] + span[rows] - origin, 0, days)
+    width = days + 1
+    delta = (np.bincount(resource * width + first, weights=intensity[rows], minlength=len(names) * width) -
+             np.bincount(resource * width + last, weights=intensity[rows], minlength=len(names) * width))
+    daily = np.cumsum(delta.reshape(len(names), width)[:, :days], axis=1)
+    plan.load = daily.reshape(len(names), count, step).mean(axis=2)
+    return plan
+
+
+def capacity_plan(store, start=None, end=None, bucket='week'):
+    """Planul de încărcare pentru tot portofoliul, între start și end (AAAA-LL-ZZ, implicit toate taskurile)"""
+    with store.reader() as conn:
+        first_day, last_day = conn.execute(
+            "SELECT MIN(start_day), MAX(end_day) FROM tasks WHERE IFNULL(assigned_to, '') != ''").fetchone()
+        if start:
+            first_day = day_number(normalize_date(start))
+        if end:
+            last_day = day_number(normalize_date(end))
+        if first_day is None or last_day is None:
+            first_day = last_day = (datetime.date.today() - EPOCH).days
+
+        resources = conn.execute("SELECT name, quantity, availability FROM resources "
+                                 "WHERE IFNULL(name, '') != '' ORDER BY id").fetchall()
+        # Indexul pe (end_day, start_day) limitează citirea la taskurile din interval; taskurile sumare
+        # din WBS nu încarcă resursele peste subtaskurile lor
+        assignments = conn.execute(f"""
+            SELECT assigned_to, start_day, end_day, IFNULL(duration, 0) FROM tasks t
+            WHERE end_day >= ? AND start_day <= ? AND IFNULL(assigned_to, '') != '' AND {is_leaf('t.id')}
+        """, (first_day, last_day)).fetchall()
+    return build_plan(resources, assignments, first_day, last_day, bucket)
+
+
+def draw_histogram(ax, plan, resource=None):
+    """Histograma încărcării pentru o resursă sau, fără resursă, pentru tot portofoliul.
+
+    Partea din capacitate este albastră, depășirea roșie; linia punctată este capacitatea.
+    """
+    from matplotlib import dates
+    from matplotlib.lines import Line2D
+    from matplotlib.patches import Patch
+
+    rows = slice(None) if resource is None else [plan.names.index(resource)]
+    load = plan.load[rows]
+    capacity = plan.capacity[rows]
+    within = np.minimum(load, capacity[:, None]).sum(axis=0)
+    excess = np.clip(load - capacity[:, None], 0, None).sum(axis=0)
+
+    step = BUCKETS[plan.bucket]
+    edges = dates.date2num(plan.start) + np.arange(load.shape[1] + 1) * step
+    ax.clear()
+    # stairs desenează toate intervalele ca un singur artist
+    ax.stairs(within, edges, fill=True, color=LOAD_COLOR)
+    ax.stairs(within + excess, edges, baseline=within, fill=True, color=OVER_COLOR)
+    ax.axhline(capacity.sum(), color=CAPACITY_COLOR, linestyle='--', linewidth=1)
+    ax.xaxis_date()
+    ax.set_xlim(edges[0], edges[-1])
+    ax.set_ylabel("Încărcare medie pe zi")
+    ax.set_title(resource or f"Portofoliu ({len(plan.names)} resurse)")
+    ax.legend(handles=[Patch(color=LOAD_COLOR, label="Alocat"), Patch(color=OVER_COLOR, label="Supraalocat"),
+                       Line2D([], [], color=CAPACITY_COLOR, linestyle='--', linewidth=1, label="Capacitate")],
+              loc='upper right')
+    ax.figure.autofmt_xdate()
@@ -0,0 +1,463 @@
+"""Linia de comandă pentru lucrul fără interfață grafică: job-uri nocturne, servere fără display.
+
+Modulul nu importă tkinter, matplotlib sau NumPy, așa că pornește mult mai
+repede decât aplicația grafică; pyarrow este încărcat doar la exportul Parquet,
+iar NumPy doar pentru încărcarea resurselor, valoarea câștigată și simularea
+Monte Carlo.
+
+    python cli.py project add --name "Migrare ERP" --budget 50000 --status "In progres"
+    python cli.py project timeline --json
+    python cli.py task list 3 --json
+    python cli.py task update 17 --progress 60 --status "În desfășurare"
+    python cli.py task active --from 2025-03-03 --to 2025-03-09
+    python cli.py task overdue --project 3
+    python cli.py resource load --bucket day --from 2025-01-01 --to 2025-06-30
+    python cli.py risk rescore --moderate 3
+    python cli.py risk high --min-score 6 --json
+    python cli.py report budget -o buget.txt
+    python cli.py evm --date 2025-06-30 --project 3
+    python cli.py simulate 3 --iterations 50000 --distribution triangular
+    python cli.py changes --since 1200 --json
+    python cli.py search "migrare erp" --entity task
+    python cli.py export portfolio -o portofoliu.csv
+    python cli.py import plan.xml --errors erori.csv
+"""
+import os
+import sys
+import json
+import argparse
+import datetime
+from dataclasses import MISSING, fields
+
+import exporter
+import importer
+from analytics import REPORTS, OPEN_RISK_STATUSES, stream_report
+from project_store import (ProjectStore, Project, Task, Resource, Risk, Stakeholder,
+                           PROJECT_STATUSES, TASK_STATUSES, PRIORITIES, METHODOLOGIES, RESOURCE_TYPES,
+                           AVAILABILITY_VALUES, RISK_PROBABILITIES, RISK_IMPACTS, RISK_STATUSES,
+                           RISK_LEVELS, STAKEHOLDER_LEVELS, EPOCH)
+from scheduling import parse_dependency_input, format_dependencies
+from storage import DB_PATH
+
+# Entitățile gestionate prin comenzile add / list / show / update / delete
+ENTITIES = {
+    'project': (Project, 'projects'),
+    'task': (Task, 'tasks'),
+    'resource': (Resource, 'resources'),
+    'risk': (Risk, 'risks'),
+    'stakeholder': (Stakeholder, 'stakeholders'),
+}
+
+# Aceleași valori ca în formularele aplicației
+CHOICES = {
+    'project': {'status': PROJECT_STATUSES, 'priority': PRIORITIES, 'methodology': METHODOLOGIES},
+    'task': {'status': TASK_STATUSES, 'priority': PRIORITIES},
+    'resource': {'type': RESOURCE_TYPES, 'availability': AVAILABILITY_VALUES},
+    'risk': {'probability': RISK_PROBABILITIES, 'impact': RISK_IMPACTS, 'status': RISK_STATUSES},
+    'stakeholder': {'influence': STAKEHOLDER_LEVELS, 'interest': STAKEHOLDER_LEVELS},
+}
+
+# Coloane calculate de store sau de SQLite, care nu pot fi date din linia de comandă
+COMPUTED = {'created_date', 'total_cost', 'risk_level', 'risk_score', 'start_day', 'end_day'}
+
+
+def iso_date(value):
+    try:
+        return datetime.date.fromisoformat(value).isoformat()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{value}' nu este o dată validă (AAAA-LL-ZZ)")
+
+
+def percent(value):
+    number = int(value)
+    if not 0 <= number <= 100:
+        raise argparse.ArgumentTypeError(f"{value} trebuie să fie între 0 și 100")
+    return number
+
+
+def dependencies(value):
+    try:
+        return parse_dependency_input(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def _field_type(name, annotation):
+    if name.endswith('_date'):
+        return iso_date
+    if name == 'progress':
+        return percent
+    if name == 'dependencies':
+        return dependencies
+    return annotation
+
+
+def add_field_arguments(parser, entity, required):
+    """Câte o opțiune --câmp pentru fiecare coloană editabilă a entității"""
+    entity_cls = ENTITIES[entity][0]
+    choices = CHOICES[entity]
+    for f in fields(entity_cls):
+        if f.name == 'id' or f.name in COMPUTED:
+            continue
+        mandatory = required and f.default is MISSING and f.default_factory is MISSING
+        help_text = "ID-urile taskurilor predecesoare, separate prin virgulă" if f.name == 'dependencies' else None
+        parser.add_argument(f"--{f.name.replace('_', '-')}", dest=f.name, required=mandatory,
+                            type=_field_type(f.name, f.type), choices=choices.get(f.name),
+                            default=argparse.SUPPRESS, help=help_text)
+
+
+def _row(entity, obj):
+    values = {'id': obj.id}
+    values.update((name, getattr(obj, name)) for name in obj.columns())
+    if entity == 'task':
+        values['dependencies'] = format_dependencies(obj.dependencies)
+    return values
+
+
+def print_rows(rows, as_json):
+    if as_json:
+        json.dump(rows, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        return
+    if not rows:
+        return
+    columns = list(rows[0])
+    print("\t".join(columns))
+    for row in rows:
+        print("\t".join("" if row[c] is None else str(row[c]) for c in columns))
+
+
+def _changes(args, entity):
+    entity_cls = ENTITIES[entity][0]
+    return {name: getattr(args, name) for name in entity_cls.columns() if hasattr(args, name)}
+
+
+def cmd_add(store, args):
+    entity_cls, _ = ENTITIES[args.entity]
+    obj = entity_cls(**_changes(args, args.entity))
+    getattr(store, f"add_{args.entity}")(obj)
+    print(obj.id)
+    return 0
+
+
+def cmd_list(store, args):
+    plural = ENTITIES[args.entity][1]
+    if args.entity == 'project':
+        objects = store.list_projects()
+    else:
+        if store.get_project(args.project_id) is None:
+            raise ValueError(f"Proiectul {args.project_id} nu există")
+        objects = getattr(store, f"list_{plural}")(args.project_id)
+    print_rows([_row(args.entity, obj) for obj in objects], args.json)
+    return 0
+
+
+def _get(store, args):
+    obj = getattr(store, f"get_{args.entity}")(args.id)
+    if obj is None:
+        raise ValueError(f"{args.entity} {args.id} nu există")
+    return obj
+
+
+def cmd_show(store, args):
+    row = _row(args.entity, _get(store, args))
+    if args.json:
+        print_rows(row, True)
+    else:
+        width = max(len(name) for name in row)
+        for name, value in row.items():
+            print(f"{name:<{width}}  {'' if value is None else value}")
+    return 0
+
+
+def cmd_update(store, args):
+    obj = _get(store, args)
+    changes = _changes(args, args.entity)
+    if not changes:
+        raise ValueError("Nu a fost dat niciun câmp de modificat")
+    for name, value in changes.items():
+        setattr(obj, name, value)
+    moved = getattr(store, f"update_{args.entity}")(obj)
+    if args.entity == 'task' and moved:
+        print(f"Taskuri reprogramate după dependențe: {len(moved)}")
+    return 0
+
+
+def cmd_delete(store, args):
+    _get(store, args)
+    getattr(store, f"delete_{args.entity}")(args.id)
+    return 0
+
+
+def _iso_day(day):
+    return None if day is None else (EPOCH + datetime.timedelta(days=day)).isoformat()
+
+
+def cmd_timeline(store, args):
+    rows = [{'id': project_id, 'name': name, 'status': status, 'start': _iso_day(first_day),
+             'end': _iso_day(last_day), 'tasks': tasks, 'progress': round(progress, 1)}
+            for project_id, name, status, first_day, last_day, tasks, progress in store.project_spans()]
+    print_rows(rows, args.json)
+    return 0
+
+
+def cmd_active(store, args):
+    # Implicit săptămâna curentă, de luni până duminică
+    monday = datetime.date.today() - datetime.timedelta(days=datetime.date.today().weekday())
+    start = args.start or monday.isoformat()
+    end = args.end or (monday + datetime.timedelta(days=6)).isoformat()
+    print_rows([_row('task', task) for task in store.active_tasks(start, end, args.project)], args.json)
+    return 0
+
+
+def cmd_overdue(store, args):
+    print_rows([_row('task', task) for task in store.overdue_tasks(args.today, args.project)], args.json)
+    return 0
+
+
+def cmd_load(store, args):
+    # NumPy este încărcat doar pentru această comandă
+    from capacity import capacity_plan
+    plan = capacity_plan(store, args.start, args.end, args.bucket)
+    rows = [{'resource': item.name, 'capacity': item.capacity, 'peak': round(item.peak, 2),
+             'buckets': item.buckets, 'first': item.first.isoformat()} for item in plan.over_allocated()]
+    if args.json:
+        print_rows({'over_allocated': rows, 'unmatched': plan.unmatched}, True)
+        return 0
+    print_rows(rows, False)
+    for name, tasks in sorted(plan.unmatched.items()):
+        print(f"Responsabil fără resursă: {name} ({tasks} taskuri)", file=sys.stderr)
+    return 0
+
+
+def cmd_evm(store, args):
+    # NumPy este încărcat doar pentru această comandă
+    from evm import earned_value
+    result = earned_value(store, args.date)
+    if args.project is not None:
+        # Pentru un proiect: totalul lui, apoi taskurile
+        ids, tasks = result.project_tasks(args.project)
+        rows = [{'task': item.pop('id'), **item} for item in tasks.records(ids.tolist())]
+        total = result.project(args.project)
+    else:
+        rows = [{'project': item.pop('id'), 'name': name, **item}
+                for item, name in zip(result.projects.records(result.project_ids.tolist()), result.project_names)]
+        total = result.portfolio
+    summary = {name: value for name, value in total.records([None])[0].items() if name != 'id'}
+    if args.json:
+        print_rows({'status_date': result.status_date.isoformat(), 'total': summary, 'rows': rows}, True)
+        return 0
+    print_rows(rows, False)
+    print(f"Total la {result.status_date}: " + "  ".join(f"{name.upper()}={'-' if value is None else value}"
+                                                         for name, value in summary.items()), file=sys.stderr)
+    return 0
+
+
+def cmd_simulate(store, args):
+    # NumPy este încărcat doar pentru această comandă
+    from montecarlo import simulate_project
+    result = simulate_project(store, args.project_id, args.iterations, args.distribution, args.seed, args.workers)
+    rows = [{'percentile': f"P{level}", 'finish': finish.isoformat(), 'cost': round(cost, 2)}
+            for level, (finish, cost) in result.percentiles().items()]
+    tornado = [{'input': label, 'correlation': round(value, 3)} for label, value in result.tornado()]
+    if args.json:
+        print_rows({'iterations': result.iterations, 'distribution': result.distribution,
+                    'deterministic_finish': result.finish_date(result.deterministic_finish).isoformat(),
+                    'on_time_probability': result.on_time_probability(), 'percentiles': rows,
+                    'tornado': tornado}, True)
+        return 0
+    print_rows(rows, False)
+    print()
+    print_rows(tornado, False)
+    return 0
+
+
+def cmd_rescore(store, args):
+    # Pragurile date sunt salvate; fără ele se reaplică pragurile salvate (sau cele implicite, cu --reset)
+    levels = list(RISK_LEVELS) if args.reset else None
+    if args.low is not None or args.moderate is not None:
+        (low, low_max), (moderate, moderate_max), high = levels or store.risk_levels()
+        low_max = low_max if args.low is None else args.low
+        moderate_max = moderate_max if args.moderate is None else args.moderate
+        if not 0 < low_max <= moderate_max:
+            raise ValueError("Pragurile trebuie să fie crescătoare: 0 < --low <= --moderate")
+        levels = [(low, low_max), (moderate, moderate_max), high]
+    print(f"Riscuri cu nivel modificat: {store.rescore_risks(levels)}")
+    return 0
+
+
+def cmd_high_risks(store, args):
+    risks = store.high_risks(args.min_score, None if args.all else OPEN_RISK_STATUSES, args.project)
+    print_rows([dict(_row('risk', risk), risk_score=risk.risk_score) for risk in risks], args.json)
+    return 0
+
+
+def cmd_changes(store, args):
+    if args.prune_before is not None:
+        print(f"Modificări eliminate din jurnal: {store.prune_changes(args.prune_before)}")
+        return 0
+    print_rows([vars(change) for change in store.changes_since(args.since, args.limit)], args.json)
+    return 0
+
+
+def cmd_search(store, args):
+    print_rows([vars(result) for result in store.search(args.text, args.limit, args.entity)], args.json)
+    return 0
+
+
+def cmd_report(store, args):
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        for chunk in stream_report(store, args.name, args.date):
+            out.write(chunk)
+    finally:
+        if args.output:
+            out.close()
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Managementul proiectelor din linia de comandă")
+    parser.add_argument('--db', default=DB_PATH, help="baza de date (implicit: %(default)s)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    for entity, (_, plural) in ENTITIES.items():
+        entity_parser = commands.add_parser(entity, help=f"operații pe {plural}")
+        actions = entity_parser.add_subparsers(dest='action', required=True)
+
+        add = actions.add_parser('add', help="adaugă; afișează id-ul nou")
+        add_field_arguments(add, entity, required=True)
+        add.set_defaults(handler=cmd_add)
+
+        listing = actions.add_parser('list', help="listează (TSV sau JSON)")
+        if entity != 'project':
+            listing.add_argument('project_id', type=int)
+        listing.add_argument('--json', action='store_true')
+        listing.set_defaults(handler=cmd_list)
+
+        show = actions.add_parser('show', help="afișează o înregistrare")
+        show.add_argument('id', type=int)
+        show.add_argument('--json', action='store_true')
+        show.set_defaults(handler=cmd_show)
+
+        update = actions.add_parser('update', help="modifică doar câmpurile date")
+        update.add_argument('id', type=int)
+        add_field_arguments(update, entity, required=False)
+        update.set_defaults(handler=cmd_update)
+
+        delete = actions.add_parser('delete', help="șterge")
+        delete.add_argument('id', type=int)
+        delete.set_defaults(handler=cmd_delete)
+
+        if entity == 'project':
+            timeline = actions.add_parser('timeline', help="intervalul și progresul fiecărui proiect, "
+                                                           "din datele taskurilor")
+            timeline.add_argument('--json', action='store_true')
+            timeline.set_defaults(handler=cmd_timeline)
+
+        if entity == 'task':
+            active = actions.add_parser('active', help="taskurile active într-un interval "
+                                                       "(implicit: săptămâna curentă)")
+            active.add_argument('--from', dest='start', type=iso_date)
+            active.add_argument('--to', dest='end', type=iso_date)
+            active.add_argument('--project', type=int)
+            active.add_argument('--json', action='store_true')
+            active.set_defaults(handler=cmd_active)
+
+            overdue = actions.add_parser('overdue', help="taskurile nefinalizate cu termenul depășit")
+            overdue.add_argument('--today', type=iso_date, help="data de referință (implicit: azi)")
+            overdue.add_argument('--project', type=int)
+            overdue.add_argument('--json', action='store_true')
+            overdue.set_defaults(handler=cmd_overdue)
+
+        if entity == 'resource':
+            load = actions.add_parser('load', help="resursele supraalocate, din tot portofoliul")
+            load.add_argument('--from', dest='start', type=iso_date)
+            load.add_argument('--to', dest='end', type=iso_date)
+            load.add_argument('--bucket', choices=['day', 'week'], default='week')
+            load.add_argument('--json', action='store_true')
+            load.set_defaults(handler=cmd_load)
+
+        if entity == 'risk':
+            rescore = actions.add_parser('rescore', help="recalculează nivelul tuturor riscurilor")
+            rescore.add_argument('--low', type=int, metavar='SCOR', help="scorul maxim al unui risc scăzut")
+            rescore.add_argument('--moderate', type=int, metavar='SCOR', help="scorul maxim al unui risc moderat")
+            rescore.add_argument('--reset', action='store_true', help="revine la pragurile implicite")
+            rescore.set_defaults(handler=cmd_rescore)
+
+            high = actions.add_parser('high', help="riscurile deschise cu scor mare, din tot portofoliul")
+            high.add_argument('--min-score', type=int, help="scorul minim, 1-9 (implicit: nivelul ridicat)")
+            high.add_argument('--all', action='store_true', help="include riscurile mitigate sau realizate")
+            high.add_argument('--project', type=int)
+            high.add_argument('--json', action='store_true')
+            high.set_defaults(handler=cmd_high_risks)
+
+        entity_parser.set_defaults(entity=entity)
+
+    report = commands.add_parser('report', help="generează un raport text")
+    report.add_argument('name', choices=list(REPORTS))
+    report.add_argument('-o', '--output', help="fișierul raportului (implicit: ieșirea standard)")
+    report.add_argument('--date', type=iso_date, help="data de referință a raportului (implicit: azi)")
+    report.set_defaults(handler=cmd_report)
+
+    evm = commands.add_parser('evm', help="valoarea câștigată (PV, EV, AC, CPI, SPI, EAC, ETC) pe proiecte "
+                                          "sau pe taskurile unui proiect")
+    evm.add_argument('--date', type=iso_date, help="data de stare (implicit: azi)")
+    evm.add_argument('--project', type=int, help="afișează taskurile acestui proiect")
+    evm.add_argument('--json', action='store_true')
+    evm.set_defaults(handler=cmd_evm)
+
+    simulate = commands.add_parser('simulate', help="simulare Monte Carlo a termenului și costului unui proiect")
+    simulate.add_argument('project_id', type=int)
+    simulate.add_argument('--iterations', type=int, default=10_000)
+    simulate.add_argument('--distribution', choices=['pert', 'triangular'], default='pert')
+    simulate.add_argument('--seed', type=int, help="sămânța generatorului, pentru rezultate reproductibile")
+    simulate.add_argument('--workers', type=int, help="numărul de procese (implicit: numărul de nuclee)")
+    simulate.add_argument('--json', action='store_true')
+    simulate.set_defaults(handler=cmd_simulate)
+
+    search = commands.add_parser('search', help="căutare full-text în proiecte, taskuri, riscuri, stakeholderi")
+    search.add_argument('text')
+    search.add_argument('--entity', choices=[e for e in ENTITIES if e != 'resource'])
+    search.add_argument('--limit', type=int, default=20)
+    search.add_argument('--json', action='store_true')
+    search.set_defaults(handler=cmd_search)
+
+    changes = commands.add_parser('changes', help="jurnalul de modificări, după numărul de secvență")
+    changes.add_argument('--since', type=int, default=0, help="afișează modificările de după această secvență")
+    changes.add_argument('--limit', type=int)
+    changes.add_argument('--json', action='store_true')
+    changes.add_argument('--prune-before', type=int, metavar='SEQ',
+                         help="elimină din jurnal modificările mai vechi decât SEQ")
+    changes.set_defaults(handler=cmd_changes)
+
+    export = commands.add_parser('export', help="export în flux (CSV, JSON Lines, columnar)")
+    exporter.add_arguments(export)
+    export.set_defaults(handler=exporter.run)
+
+    import_ = commands.add_parser('import', help="import în masă (CSV, JSON, XML MS Project)")
+    importer.add_arguments(import_)
+    import_.set_defaults(handler=importer.run)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    store = ProjectStore(args.db)
+    try:
+        return args.handler(store, args)
+    except BrokenPipeError:
+        # Ieșirea a fost închisă de cititor (de ex. | head); Python nu mai încearcă să o golească la final
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except (OSError, ValueError) as e:
+        print(f"Eroare: {e}", file=sys.stderr)
+        return 1
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""Motorul de statistici pentru dashboard.
+
+KPI-urile sunt calculate o singură dată, într-o singură agregare pe tabelul
+projects, apoi ținute la zi prin delte la fiecare adăugare, modificare sau
+ștergere de proiect, fără a mai interoga baza de date.
+"""
+from dataclasses import dataclass, field
+
+ACTIVE_STATUS = "In progres"
+COMPLETED_STATUS = "Finalizat"
+
+
+@dataclass
+class DashboardStats:
+    total: int = 0
+    active: int = 0
+    completed: int = 0
+    budget: float = 0.0
+    by_status: list = field(default_factory=list)
+
+
+class DashboardEngine:
+    """Cache de KPI-uri pe status, actualizat incremental"""
+
+    def __init__(self, store):
+        self.store = store
+        self.counts = {}
+        self.budgets = {}
+        self.loaded = False
+
+    def refresh(self):
+        """Recalculează toate KPI-urile dintr-o singură interogare agregată"""
+        self.load(self.store.status_summary())
+
+    def load(self, summary):
+        """Înlocuiește cache-ul cu rezultatul lui status_summary()"""
+        self.counts.clear()
+        self.budgets.clear()
+        for status, count, budget in summary:
+            self.counts[status] = count
+            self.budgets[status] = budget
+        self.loaded = True
+
+    def stats(self):
+        """Statisticile curente, din cache"""
+        if not self.loaded:
+            self.refresh()
+        return DashboardStats(
+            total=sum(self.counts.values()),
+            active=self.counts.get(ACTIVE_STATUS, 0),
+            completed=self.counts.get(COMPLETED_STATUS, 0),
+            budget=sum(self.budgets.values()),
+            by_status=sorted(((status, count) for status, count in self.counts.items() if count),
+                             key=lambda item: (item[0] is None, item[0] or "")),
+        )
+
+    def _apply(self, status, budget, sign):
+        self.counts[status] = self.counts.get(status, 0) + sign
+        self.budgets[status] = self.budgets.get(status, 0.0) + sign * (budget or 0.0)
+        if self.counts[status] <= 0:
+            del self.counts[status]
+            del self.budgets[status]
+
+    def project_added(self, project):
+        if self.loaded:
+            self._apply(project.status, project.budget, +1)
+
+    def project_removed(self, project):
+        if self.loaded:
+            self._apply(project.status, project.budget, -1)
+
+    def project_updated(self, old, new):
+        self.project_removed(old)
+        self.project_added(new)
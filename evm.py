@@ -0,0 +1,256 @@
+"""Managementul valorii câștigate (EVM) pe taskuri, proiecte și tot portofoliul.
+
+Bugetul proiectului (BAC) este împărțit între taskuri după durată (minim o
+zi), ca ponderea din rapoartele de progres. La data de stare:
+
+    PV = BAC x fracțiunea din intervalul [start_day, end_day) deja scursă
+    EV = BAC x progres / 100
+    AC = costul resurselor proiectului, consumat uniform pe același plan
+
+Nu există înregistrări ale costurilor efective: resources.total_cost este
+costul planificat al resurselor, așa că AC presupune că a fost cheltuit în
+ritmul planului. Taskurile fără date folosesc datele proiectului; un proiect
+fără taskuri este tratat ca un singur task (progres 100 dacă este finalizat).
+
+Toate valorile sunt calculate vectorizat din două citiri în bloc (proiecte și
+taskuri), fără bucle Python pe rânduri: agregarea pe proiecte este un
+np.bincount, iar curbele S o sumă cumulativă dublă peste un tablou de
+diferențe (pantele de cost pe zi).
+"""
+import datetime
+from dataclasses import dataclass
+
+import numpy as np
+
+from project_store import EPOCH, day_number, normalize_date, is_leaf
+
+PV_COLOR = '#3498db'
+EV_COLOR = '#27ae60'
+AC_COLOR = '#e74c3c'
+BAC_COLOR = '#2c3e50'
+
+FINISHED_STATUS = "Finalizat"
+
+
+def _ratio(numerator, denominator):
+    """numerator / denominator, NaN unde numitorul este zero"""
+    numerator = np.asarray(numerator, dtype=float)
+    denominator = np.asarray(denominator, dtype=float)
+    out = np.full(np.broadcast(numerator, denominator).shape, np.nan)
+    return np.divide(numerator, denominator, out=out, where=denominator != 0)
+
+
+@dataclass
+class Metrics:
+    """Indicatorii EVM pentru un tablou de taskuri sau proiecte (sau un singur total)"""
+    bac: np.ndarray
+    pv: np.ndarray
+    ev: np.ndarray
+    ac: np.ndarray
+
+    @property
+    def cv(self):
+        return self.ev - self.ac
+
+    @property
+    def sv(self):
+        return self.ev - self.pv
+
+    @property
+    def cpi(self):
+        return _ratio(self.ev, self.ac)
+
+    @property
+    def spi(self):
+        return _ratio(self.ev, self.pv)
+
+    @property
+    def eac(self):
+        """BAC / CPI; fără CPI, AC + munca rămasă la buget (BAC dacă nu există niciun cost)"""
+        cpi = self.cpi
+        usable = np.isfinite(cpi) & (cpi > 0)
+        fallback = np.where(self.ac == 0, self.bac, self.ac + self.bac - self.ev)
+        return np.where(usable, _ratio(self.bac, np.where(usable, cpi, 1.0)), fallback)
+
+    @property
+    def etc(self):
+        return self.eac - self.ac
+
+    def records(self, ids):
+        """Câte un dicționar pe rând, cu NaN înlocuit de None"""
+        columns = {name: np.atleast_1d(getattr(self, name)).astype(float)
+                   for name in ('bac', 'pv', 'ev', 'ac', 'cv', 'sv', 'cpi', 'spi', 'eac', 'etc')}
+        return [{'id': item_id, **{name: (None if np.isnan(values[i]) else round(float(values[i]), 2))
+                                   for name, values in columns.items()}}
+                for i, item_id in enumerate(ids)]
+
+
+@dataclass
+class EarnedValue:
+    status_date: datetime.date
+    task_ids: np.ndarray
+    tasks: Metrics
+    project_ids: np.ndarray
+    project_names: list
+    projects: Metrics
+    portfolio: Metrics
+    # Elementele de plan (taskurile, apoi proiectele fără taskuri), pentru curbele S
+    _project: np.ndarray = None
+    _start: np.ndarray = None
+    _span: np.ndarray = None
+    _bac: np.ndarray = None
+    _cost: np.ndarray = None
+
+    def _position(self, project_id):
+        i = int(np.searchsorted(self.project_ids, project_id))
+        if i == len(self.project_ids) or self.project_ids[i] != project_id:
+            raise ValueError(f"Proiectul {project_id} nu există")
+        return i
+
+    def project(self, project_id):
+        """Indicatorii unui singur proiect, ca Metrics cu valori scalare"""
+        i = self._position(project_id)
+        return Metrics(*(getattr(self.projects, name)[i] for name in ('bac', 'pv', 'ev', 'ac')))
+
+    def project_tasks(self, project_id):
+        """Id-urile și indicatorii taskurilor unui proiect"""
+        mask = self._project[:len(self.task_ids)] == self._position(project_id)
+        return self.task_ids[mask], Metrics(*(getattr(self.tasks, name)[mask]
+                                              for name in ('bac', 'pv', 'ev', 'ac')))
+
+    def s_curve(self, project_id=None):
+        """Zilele planului și PV, AC cumulate la sfârșitul fiecărei zile (portofoliu sau un proiect)
+
+        Întoarce (zile de la EPOCH, pv, ac); tablouri goale dacă nu există nimic planificat.
+        """
+        dated = ~np.isnan(self._start)
+        if project_id is not None:
+            dated &= self._project == self._position(project_id)
+        if not dated.any():
+            return np.array([], dtype=np.int64), np.array([]), np.array([])
+        start = self._start[dated].astype(np.int64)
+        span = self._span[dated].astype(np.int64)
+        first = int(start.min())
+        days = int((start + span).max()) - first
+
+        # Pantele (cost pe zi) intră la început și ies la sfârșit; cumsum dă costul zilnic, încă un cumsum totalul
+        begin, finish = start - first, start + span - first
+        curves = []
+        for amount in (self._bac[dated], self._cost[dated]):
+            slope = amount / span
+            delta = (np.bincount(begin, weights=slope, minlength=days + 1) -
+                     np.bincount(finish, weights=slope, minlength=days + 1))
+            curves.append(np.cumsum(np.cumsum(delta[:days])))
+        return np.arange(first, first + days), curves[0], curves[1]
+
+
+def compute(projects, tasks, status_day):
+    """EVM din rândurile (id, nume, buget, cost, start_day, end_day, status) și
+    (id, project_id, start_day, end_day, pondere, progres), la ziua status_day de la EPOCH"""
+    project_ids = np.array([row[0] for row in projects], dtype=np.int64)
+    names = [row[1] for row in projects]
+    budget, cost, p_start, p_end = (np.array([row[i] for row in projects], dtype=float).reshape(-1)
+                                    for i in (2, 3, 4, 5))
+    finished = np.array([row[6] == FINISHED_STATUS for row in projects], dtype=bool)
+    data = np.array(tasks, dtype=float).reshape(-1, 6)
+
+    # Taskurile proiectelor care nu mai există sunt ignorate
+    task_project = np.searchsorted(project_ids, data[:, 1]).clip(max=max(len(project_ids) - 1, 0))
+    known = (project_ids[task_project] == data[:, 1]) if len(project_ids) else np.zeros(len(data), dtype=bool)
+    data, task_project = data[known], task_project[known]
+    weight = data[:, 4]
+    total_weight = np.bincount(task_project, weights=weight, minlength=len(project_ids))
+    # Proiectele fără taskuri devin un singur element de plan, cu întreg bugetul
+    empty = np.flatnonzero(total_weight == 0)
+
+    owner = np.concatenate([task_project, empty])
+    share = np.concatenate([weight / total_weight[task_project], np.ones(len(empty))])
+    start = np.concatenate([data[:, 2], np.full(len(empty), np.nan)])
+    end = np.concatenate([data[:, 3], np.full(len(empty), np.nan)])
+    progress = np.concatenate([data[:, 5], np.where(finished[empty], 100.0, 0.0)])
+
+    # Datele lipsă sunt luate din proiect; un singur capăt cunoscut înseamnă o zi
+    undated = np.isnan(start) & np.isnan(end)
+    start = np.where(undated, p_start[owner], start)
+    end = np.where(undated, p_end[owner], end)
+    start = np.where(np.isnan(start), end, start)
+    end = np.where(np.isnan(end), start, end)
+    span = np.maximum(end - start, 1)
+
+    bac = budget[owner] * share
+    planned_cost = cost[owner] * share
+    # Fără date, nimic nu este planificat până la o anumită zi
+    elapsed = np.nan_to_num(np.clip((status_day - start) / span, 0, 1))
+    items = Metrics(bac=bac, pv=bac * elapsed, ev=bac * np.clip(progress, 0, 100) / 100,
+                    ac=planned_cost * elapsed)
+
+    count = len(project_ids)
+    by_project = Metrics(*(np.bincount(owner, weights=getattr(items, name), minlength=count)
+                           for name in ('bac', 'pv', 'ev', 'ac')))
+    # Un proiect cu taskuri de pondere zero nu există (ponderea minimă este 1), deci BAC = buget
+    by_project.bac = budget.copy()
+    portfolio = Metrics(*(getattr(by_project, name).sum() for name in ('bac', 'pv', 'ev', 'ac')))
+
+    tasks_count = len(data)
+    return EarnedValue(
+        status_date=EPOCH + datetime.timedelta(days=int(status_day)),
+        task_ids=data[:, 0].astype(np.int64),
+        tasks=Metrics(*(getattr(items, name)[:tasks_count] for name in ('bac', 'pv', 'ev', 'ac'))),
+        project_ids=project_ids, project_names=names, projects=by_project, portfolio=portfolio,
+        _project=owner, _start=start, _span=span, _bac=bac, _cost=planned_cost)
+
+
+def read_rows(conn):
+    """Cele două citiri în bloc: proiectele (ordonate după id) și taskurile"""
+    projects = conn.execute("""
+        SELECT p.id, p.name, IFNULL(p.budget, 0), IFNULL(c.cost, 0), p.start_day, p.end_day, p.status
+        FROM projects p
+        LEFT JOIN (SELECT project_id, TOTAL(total_cost) AS cost FROM resources GROUP BY project_id) c
+               ON c.project_id = p.id
+        ORDER BY p.id
+    """).fetchall()
+    # Bugetul se împarte doar pe pachetele de lucru; taskurile sumare din WBS nu au muncă proprie
+    tasks = conn.execute(f"""
+        SELECT id, project_id, start_day, end_day, MAX(IFNULL(duration, 0), 1), IFNULL(progress, 0)
+        FROM tasks t WHERE {is_leaf('t.id')}
+    """).fetchall()
+    return projects, tasks
+
+
+def earned_value(store, status_date=None):
+    """EVM pentru tot portofoliul la data de stare (AAAA-LL-ZZ, implicit azi)"""
+    status_day = day_number(normalize_date(status_date)) if status_date else (datetime.date.today() - EPOCH).days
+    if status_day is None:
+        raise ValueError("Data de stare este obligatorie")
+    with store.reader() as conn:
+        projects, tasks = read_rows(conn)
+    return compute(projects, tasks, status_day)
+
+
+def draw_s_curve(ax, result, project_id=None):
+    """Curbele S: PV și AC cumulate, EV la data de stare, BAC și EAC ca linii orizontale"""
+    from matplotlib import dates
+
+    metrics = result.portfolio if project_id is None else result.project(project_id)
+    days, pv, ac = result.s_curve(project_id)
+    status = dates.date2num(result.status_date)
+    offset = dates.date2num(EPOCH)
+    ax.clear()
+    if len(days):
+        x = offset + days + 1
+        ax.plot(x, pv, color=PV_COLOR, label="PV (planificat)")
+        # Costul efectiv este cunoscut doar până la data de stare
+        past = x <= status
+        ax.plot(x[past], ac[past], color=AC_COLOR, label="AC (cost)")
+        ax.set_xlim(x[0] - 1, max(x[-1], status))
+    ax.plot([status], [float(metrics.ev)], 'o', color=EV_COLOR, label="EV (realizat)")
+    ax.axvline(status, color='#7f8c8d', linestyle=':', linewidth=1)
+    ax.axhline(float(metrics.bac), color=BAC_COLOR, linestyle='--', linewidth=1, label="BAC")
+    eac = float(metrics.eac)
+    if np.isfinite(eac) and eac != float(metrics.bac):
+        ax.axhline(eac, color=AC_COLOR, linestyle='--', linewidth=1, label="EAC")
+    ax.xaxis_date()
+    ax.set_ylabel("RON")
+    ax.set_title("Curba S (valoare câștigată)")
+    ax.legend(loc='upper left', fontsize=8)
+    ax.figure.autofmt_xdate()
@@ -0,0 +1,258 @@
+"""Export în flux al datelor în CSV, JSON Lines și format columnar.
+
+Rândurile sunt citite cu fetchmany, în loturi, pe o conexiune de citire din
+pool și trec printr-un lanț de generatoare până la fișier, astfel încât
+memoria folosită nu depinde de numărul de rânduri. Formatul columnar este
+Parquet dacă pyarrow este instalat; altfel se folosește formatul intern
+.pmcol.gz: un fișier gzip cu câte o linie JSON pentru fiecare grup de rânduri,
+în care valorile sunt păstrate pe coloane.
+
+    python exporter.py tasks -o tasks.csv
+    python exporter.py portfolio -o portofoliu.parquet --batch-size 10000
+"""
+import os
+import csv
+import sys
+import gzip
+import json
+import time
+import argparse
+import importlib.util
+from dataclasses import dataclass
+
+from project_store import ProjectStore, CHILD_TABLES
+from storage import DB_PATH
+
+BATCH_SIZE = 5000
+PMCOL_FORMAT = "pm-columnar"
+PMCOL_VERSION = 1
+
+# Sursele exportabile: tabelele și o vedere proiect / task / resurse
+EXPORT_SOURCES = {table: f"SELECT * FROM {table} ORDER BY id" for table in ['projects'] + CHILD_TABLES}
+EXPORT_SOURCES['portfolio'] = """
+    SELECT p.id AS project_id, p.name AS project_name, p.status AS project_status,
+           p.budget AS project_budget, t.id AS task_id, t.name AS task_name, t.start_date, t.end_date,
+           t.duration, t.status AS task_status, t.progress, t.assigned_to,
+           IFNULL(r.resources, 0) AS project_resources, IFNULL(r.resource_cost, 0.0) AS project_resource_cost
+    FROM tasks t
+    JOIN projects p ON p.id = t.project_id
+    LEFT JOIN (SELECT project_id, COUNT(*) AS resources, TOTAL(total_cost) AS resource_cost
+               FROM resources GROUP BY project_id) r ON r.project_id = p.id
+    ORDER BY t.project_id, t.id
+"""
+# Tipurile declarate ale coloanelor vederii; pentru tabele sunt citite din schemă (PRAGMA table_xinfo)
+SOURCE_TYPES = {
+    'portfolio': {
+        'project_id': 'INTEGER', 'project_name': 'TEXT', 'project_status': 'TEXT', 'project_budget': 'REAL',
+        'task_id': 'INTEGER', 'task_name': 'TEXT', 'start_date': 'TEXT', 'end_date': 'TEXT',
+        'duration': 'INTEGER', 'task_status': 'TEXT', 'progress': 'INTEGER', 'assigned_to': 'TEXT',
+        'project_resources': 'INTEGER', 'project_resource_cost': 'REAL',
+    },
+}
+
+# Extensia de fișier pentru fiecare format
+EXTENSIONS = {'csv': '.csv', 'jsonl': '.jsonl', 'parquet': '.parquet', 'pmcol': '.pmcol.gz'}
+
+
+@dataclass
+class ExportResult:
+    source: str
+    path: str
+    format: str
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds > 0 else float('inf')
+
+
+def has_pyarrow():
+    """pyarrow este opțional și este importat doar la exportul Parquet"""
+    return importlib.util.find_spec('pyarrow') is not None
+
+
+def columnar_format():
+    """Formatul columnar disponibil: Parquet cu pyarrow, altfel formatul intern"""
+    return 'parquet' if has_pyarrow() else 'pmcol'
+
+
+def format_for_path(path):
+    """Deduce formatul din extensia fișierului"""
+    for fmt, extension in EXTENSIONS.items():
+        if path.lower().endswith(extension):
+            return fmt
+    raise ValueError(f"Extensie necunoscută pentru {path}; folosiți una dintre: {', '.join(EXTENSIONS.values())}")
+
+
+def iter_batches(conn, source, batch_size=BATCH_SIZE):
+    """Întoarce (coloane, generator de loturi de rânduri) pentru o sursă de export"""
+    if source not in EXPORT_SOURCES:
+        raise ValueError(f"Sursă necunoscută: {source}")
+    cursor = conn.execute(EXPORT_SOURCES[source])
+    columns = [description[0] for description in cursor.description]
+
+    def batches():
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            yield [tuple(row) for row in rows]
+
+    return columns, batches()
+
+
+def column_types(conn, source):
+    """{coloană: tipul SQL declarat} pentru o sursă de export"""
+    if source in SOURCE_TYPES:
+        return SOURCE_TYPES[source]
+    # Coloanele generate (hidden 2 sau 3) apar în SELECT *; hidden 1 sunt doar ale tabelelor virtuale
+    return {row[1]: row[2] for row in conn.execute(f"PRAGMA table_xinfo({source})") if row[6] != 1}
+
+
+def arrow_type(pyarrow, declared):
+    """Tipul Arrow pentru afinitatea tipului SQL declarat (regulile de afinitate din SQLite)"""
+    declared = (declared or "").upper()
+    if "INT" in declared:
+        return pyarrow.int64()
+    if any(name in declared for name in ("REAL", "FLOA", "DOUB", "NUMERIC", "DECIMAL")):
+        return pyarrow.float64()
+    return pyarrow.string()
+
+
+def write_csv(path, columns, batches):
+    count = 0
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for rows in batches:
+            writer.writerows(rows)
+            count += len(rows)
+    return count
+
+
+def write_jsonl(path, columns, batches):
+    count = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        for rows in batches:
+            f.write("".join(json.dumps(dict(zip(columns, row)), ensure_ascii=False) + "\n" for row in rows))
+            count += len(rows)
+    return count
+
+
+def write_pmcol(path, columns, batches):
+    """Formatul columnar intern: antet JSON, apoi câte un grup de rânduri pe linie, pe coloane"""
+    count = 0
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        f.write(json.dumps({'format': PMCOL_FORMAT, 'version': PMCOL_VERSION, 'columns': columns}) + "\n")
+        for rows in batches:
+            f.write(json.dumps({'rows': len(rows), 'data': [list(values) for values in zip(*rows)]},
+                               ensure_ascii=False) + "\n")
+            count += len(rows)
+    return count
+
+
+def read_pmcol(path):
+    """Citește un fișier .pmcol.gz: întoarce (coloane, generator de loturi de rânduri)"""
+    f = gzip.open(path, 'rt', encoding='utf-8')
+    header = json.loads(f.readline())
+    if header.get('format') != PMCOL_FORMAT:
+        f.close()
+        raise ValueError(f"{path} nu este un fișier {PMCOL_FORMAT}")
+
+    def batches():
+        with f:
+            for line in f:
+                group = json.loads(line)
+                yield list(zip(*group['data'])) if group['data'] else [()] * group['rows']
+
+    return header['columns'], batches()
+
+
+def write_parquet(path, columns, batches, types=None):
+    """Parquet prin pyarrow: fiecare lot devine un row group.
+
+    Schema vine din tipurile SQL declarate (types: {coloană: tip}), nu din date, ca un lot cu o
+    coloană doar NULL sau cu alt tip de valori să nu schimbe schema; fără tip, coloana este text.
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet as parquet
+    except ImportError:
+        raise ValueError("Exportul Parquet necesită pyarrow; folosiți formatul .pmcol.gz")
+    types = types or {}
+    schema = pyarrow.schema([(name, arrow_type(pyarrow, types.get(name))) for name in columns])
+    count = 0
+    with parquet.ParquetWriter(path, schema) as writer:
+        for rows in batches:
+            arrays = []
+            for values, field in zip(zip(*rows), schema):
+                try:
+                    arrays.append(pyarrow.array(values, type=field.type))
+                except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError) as e:
+                    # SQLite acceptă orice valoare în orice coloană; Parquet nu
+                    raise ValueError(f"Coloana {field.name} are valori care nu sunt de tipul {field.type}: {e}")
+            writer.write_table(pyarrow.table(arrays, schema=schema))
+            count += len(rows)
+    return count
+
+
+WRITERS = {'csv': write_csv, 'jsonl': write_jsonl, 'parquet': write_parquet, 'pmcol': write_pmcol}
+
+
+def export(store, source, path, fmt=None, batch_size=BATCH_SIZE):
+    """Exportă o sursă într-un fișier; formatul se deduce din extensie dacă nu este dat"""
+    fmt = fmt or format_for_path(path)
+    if fmt == 'columnar':
+        fmt = columnar_format()
+    writer = WRITERS[fmt]
+
+    start = time.perf_counter()
+    with store.reader() as conn:
+        columns, batches = iter_batches(conn, source, batch_size)
+        if fmt == 'parquet':
+            rows = writer(path, columns, batches, column_types(conn, source))
+        else:
+            rows = writer(path, columns, batches)
+    return ExportResult(source, path, fmt, rows, time.perf_counter() - start)
+
+
+def add_arguments(parser):
+    """Argumentele exportului, comune scriptului și comenzii export din cli.py"""
+    parser.add_argument('source', choices=sorted(EXPORT_SOURCES), help="tabelul sau vederea exportată")
+    parser.add_argument('-o', '--output', required=True,
+                        help="fișierul destinație; formatul se deduce din extensie "
+                             "(.csv, .jsonl, .parquet, .pmcol.gz)")
+    parser.add_argument('-f', '--format', choices=sorted(WRITERS) + ['columnar'],
+                        help="formatul, dacă nu se deduce din extensie")
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+
+
+def run(store, args):
+    """Rulează exportul descris de argumente și afișează debitul"""
+    result = export(store, args.source, args.output, args.format, args.batch_size)
+    print(f"{result.rows:,} rânduri din {result.source} exportate în {result.path} ({result.format}) "
+          f"în {result.seconds:.2f} s - {result.rows_per_second:,.0f} rânduri/s")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export în flux al datelor din baza de proiecte")
+    add_arguments(parser)
+    parser.add_argument('--db', default=DB_PATH, help="baza de date (implicit: %(default)s)")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.db):
+        parser.error(f"baza de date {args.db} nu există")
+
+    store = ProjectStore(args.db)
+    try:
+        return run(store, args)
+    except ValueError as e:
+        parser.error(str(e))
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,308 @@
+"""Motor de randare pentru diagrama Gantt.
+
+Datele taskurilor sunt convertite o singură dată în tablouri NumPy, direct din
+coloanele numerice start_day / end_day, fără parsarea șirurilor; barele
+sunt desenate ca o singură PolyCollection, iar pe ecran ajung doar rândurile
+din fereastra vizibilă. Etichetele de progres sunt afișate doar pentru barele
+suficient de late la nivelul curent de zoom. Artiștii sunt refolosiți între
+redesenări, iar modificarea unui task se aplică pe loc, prin blitting.
+Taskurile de pe drumul critic sunt conturate.
+"""
+import datetime
+from dataclasses import dataclass
+
+import numpy as np
+from matplotlib import dates
+from matplotlib.collections import PolyCollection
+from matplotlib.patches import Patch
+
+from project_store import EPOCH
+
+STATUS_COLORS = {
+    "Finalizat": '#2ecc71',       # Verde
+    "În desfășurare": '#3498db',  # Albastru
+    "Blocat": '#e74c3c',          # Roșu
+}
+DEFAULT_COLOR = '#f39c12'         # Portocaliu
+CRITICAL_EDGE_COLOR = '#8e0000'   # Conturul taskurilor de pe drumul critic
+
+BAR_HEIGHT = 0.5
+# Câte rânduri sunt desenate simultan; restul sunt accesibile prin derulare
+VISIBLE_ROWS = 40
+# Lățimea minimă a unei bare, în pixeli, pentru a primi eticheta de progres
+MIN_LABEL_WIDTH_PX = 34
+SCROLL_STEP = 3
+ZOOM_FACTOR = 1.25
+
+
+@dataclass
+class GanttData:
+    project_id: int
+    project_name: str
+    ids: np.ndarray
+    names: np.ndarray
+    start: np.ndarray       # zile matplotlib (date2num)
+    duration: np.ndarray    # zile
+    progress: np.ndarray    # 0..100
+    colors: np.ndarray
+    critical: np.ndarray
+    schedule: object = None  # ScheduleGraph, dacă dependențele sunt valide
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def end(self):
+        return self.start + self.duration
+
+
+def day_spans(start_days, end_days):
+    """Începutul (în zile matplotlib) și durata, din zilele de la EPOCH (None dacă data lipsește)"""
+    start = np.array([np.nan if day is None else day for day in start_days], dtype=float)
+    end = np.array([np.nan if day is None else day for day in end_days], dtype=float)
+
+    # Intervalele fără date (datele invalide sunt respinse la scriere) sunt afișate în ziua curentă
+    missing = np.isnan(start) | np.isnan(end)
+    today = (datetime.date.today() - EPOCH).days
+    start[missing] = today
+    end[missing] = today + 1
+
+    # Zilele de la EPOCH coincid cu date2num pentru epoca implicită din matplotlib
+    offset = dates.date2num(EPOCH)
+    return start + offset, end - start
+
+
+def task_spans(tasks):
+    """Începutul (în zile matplotlib) și durata fiecărui task, din coloanele numerice start_day / end_day"""
+    return day_spans([t.start_day for t in tasks], [t.end_day for t in tasks])
+
+
+def critical_mask(ids, schedule):
+    if schedule is None:
+        return np.zeros(len(ids), dtype=bool)
+    return np.array([schedule.is_critical(int(task_id)) for task_id in ids], dtype=bool)
+
+
+def build_gantt_data(project_id, project_name, tasks, schedule=None):
+    """Pregătește tablourile pentru randare dintr-o listă de Task-uri"""
+    start, duration = task_spans(tasks)
+    ids = np.array([t.id for t in tasks], dtype=np.int64)
+    return GanttData(
+        project_id=project_id,
+        project_name=project_name,
+        ids=ids,
+        names=np.array([t.name for t in tasks], dtype=object),
+        start=start,
+        duration=duration,
+        progress=np.array([t.progress or 0 for t in tasks], dtype=float),
+        colors=np.array([STATUS_COLORS.get(t.status, DEFAULT_COLOR) for t in tasks], dtype=object),
+        critical=critical_mask(ids, schedule),
+        schedule=schedule,
+    )
+
+
+def bar_vertices(left, width, rows, height=BAR_HEIGHT):
+    """Vârfurile dreptunghiurilor pentru o PolyCollection, calculate vectorizat"""
+    half = height / 2
+    verts = np.empty((len(left), 4, 2))
+    verts[:, 0, 0] = verts[:, 1, 0] = left
+    verts[:, 2, 0] = verts[:, 3, 0] = left + width
+    verts[:, 0, 1] = verts[:, 3, 1] = rows - half
+    verts[:, 1, 1] = verts[:, 2, 1] = rows + half
+    return verts
+
+
+class GanttChart:
+    """Diagramă Gantt cu derulare pe rânduri și zoom pe axa timpului.
+
+    Barele, suprapunerea de progres și etichetele sunt create o singură dată și
+    marcate ca animate: o redesenare completă salvează fundalul (axe, grilă,
+    etichete de pe axe), iar modificarea unui singur task actualizează artiștii
+    pe loc și îi redesenează peste fundal prin blitting.
+    """
+
+    def __init__(self, fig, ax, canvas, visible_rows=VISIBLE_ROWS):
+        self.fig = fig
+        self.ax = ax
+        self.canvas = canvas
+        self.visible_rows = visible_rows
+        self.data = None
+        self.rows = {}          # (project_id, task_id) -> rândul din diagramă
+        self.first_row = 0
+        self.xlim = None
+        self._background = None
+
+        self.bars = PolyCollection([], edgecolors='none', animated=True)
+        self.done_bars = PolyCollection([], facecolors='black', alpha=0.25, edgecolors='none', animated=True)
+        ax.add_collection(self.bars)
+        ax.add_collection(self.done_bars)
+        self.labels = [ax.text(0, 0, '', ha='center', va='center', color='white', fontweight='bold', fontsize=8,
+                               clip_on=True, animated=True, visible=False)
+                       for _ in range(visible_rows)]
+        ax.set_xlabel("Timeline")
+        ax.grid(True)
+        ax.xaxis_date()
+        ax.legend(handles=[Patch(facecolor='none', edgecolor=CRITICAL_EDGE_COLOR, linewidth=2,
+                                 label="Drum critic")], loc='upper right')
+
+        canvas.mpl_connect('scroll_event', self.on_scroll)
+        canvas.mpl_connect('draw_event', self._on_draw)
+
+    def set_data(self, data):
+        """Înlocuiește datele și afișează începutul proiectului"""
+        self.data = data
+        self.rows = {(data.project_id, int(task_id)): row for row, task_id in enumerate(data.ids)}
+        self.first_row = 0
+        self.xlim = None
+        if len(data):
+            self.xlim = (float(data.start.min()) - 1, float(data.end.max()) + 1)
+        self.render()
+
+    def visible_slice(self):
+        n = len(self.data)
+        first = max(0, min(self.first_row, n - self.visible_rows))
+        return first, min(n, first + self.visible_rows)
+
+    def render(self):
+        """Reașază axele pentru fereastra vizibilă și cere o redesenare completă"""
+        data = self.data
+        if data is None or not len(data):
+            self.bars.set_verts([])
+            self.done_bars.set_verts([])
+            for label in self.labels:
+                label.set_visible(False)
+            self.canvas.draw_idle()
+            return
+
+        lo, hi = self.visible_slice()
+        ax = self.ax
+        ax.set_xlim(*self.xlim)
+        ax.set_ylim(hi - 0.5, lo - 0.5)
+        ax.set_yticks(np.arange(lo, hi))
+        ax.set_yticklabels(data.names[lo:hi])
+        ax.set_title(f"Diagrama Gantt - {data.project_name}  "
+                     f"(taskuri {lo + 1}-{hi} din {len(data)})")
+        self.fig.autofmt_xdate()
+        self._update_artists()
+        self.canvas.draw_idle()
+
+    def _update_artists(self):
+        """Recalculează barele și etichetele rândurilor vizibile"""
+        data = self.data
+        lo, hi = self.visible_slice()
+        rows = np.arange(lo, hi, dtype=float)
+        left = data.start[lo:hi]
+        width = data.duration[lo:hi]
+        progress = data.progress[lo:hi]
+
+        self.bars.set_verts(bar_vertices(left, width, rows))
+        self.bars.set_facecolor(list(data.colors[lo:hi]))
+        critical = data.critical[lo:hi]
+        self.bars.set_edgecolor([CRITICAL_EDGE_COLOR if c else 'none' for c in critical])
+        self.bars.set_linewidth(np.where(critical, 2.0, 0.0))
+        # Partea realizată a fiecărei bare, ca suprapunere mai închisă
+        self.done_bars.set_verts(bar_vertices(left, width * progress / 100, rows, BAR_HEIGHT / 3))
+
+        # Etichete de progres doar pentru barele vizibile și suficient de late la zoom-ul curent
+        x0, x1 = self.xlim
+        px_per_day = self.ax.get_window_extent().width / max(x1 - x0, 1e-9)
+        show = (progress > 0) & (left + width > x0) & (left < x1) & (width * px_per_day >= MIN_LABEL_WIDTH_PX)
+        for i, label in enumerate(self.labels):
+            if i < len(rows) and show[i]:
+                label.set_position((left[i] + width[i] / 2, rows[i]))
+                label.set_text(f"{progress[i]:.0f}%")
+                label.set_visible(True)
+            else:
+                label.set_visible(False)
+
+    def _draw_animated(self):
+        self.ax.draw_artist(self.bars)
+        self.ax.draw_artist(self.done_bars)
+        for label in self.labels:
+            if label.get_visible():
+                self.ax.draw_artist(label)
+
+    def _on_draw(self, event):
+        """După fiecare redesenare completă: salvează fundalul și adaugă artiștii animați"""
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+
+    def _blit(self):
+        if self._background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.fig.bbox)
+
+    def update_tasks(self, tasks):
+        """Actualizează pe loc barele taskurilor modificate; întoarce câte dintre ele sunt în diagramă"""
+        data = self.data
+        found = [(self.rows[(t.project_id, t.id)], t) for t in tasks if (t.project_id, t.id) in self.rows]
+        if not found:
+            return 0
+
+        rows = np.array([row for row, _ in found])
+        data.start[rows], data.duration[rows] = task_spans([task for _, task in found])
+        renamed = set()
+        for row, task in found:
+            if data.names[row] != task.name:
+                renamed.add(row)
+            data.progress[row] = task.progress or 0
+            data.colors[row] = STATUS_COLORS.get(task.status, DEFAULT_COLOR)
+            data.names[row] = task.name
+            if data.schedule is not None:
+                # CPM incremental: se recalculează doar taskurile afectate de modificare
+                data.schedule.update_task(task)
+        if data.schedule is not None:
+            data.critical = critical_mask(data.ids, data.schedule)
+
+        lo, hi = self.visible_slice()
+        visible = rows[(rows >= lo) & (rows < hi)]
+        if not len(visible) and data.schedule is None:
+            return len(found)
+
+        # Numele de pe axa Y sau intervalul de timp se schimbă: redesenare completă
+        relayout = any(lo <= row < hi for row in renamed)
+        if len(visible):
+            x0, x1 = self.xlim
+            xlim = (min(x0, float(data.start[visible].min()) - 1), max(x1, float(data.end[visible].max()) + 1))
+            if xlim != self.xlim:
+                self.xlim = xlim
+                relayout = True
+        if relayout:
+            self.render()
+        else:
+            self._update_artists()
+            self._blit()
+        return len(found)
+
+    def update_task(self, task):
+        """Actualizează pe loc bara unui task modificat; întoarce False dacă task-ul nu e în diagramă"""
+        return self.update_tasks([task]) > 0
+
+    def scroll(self, rows):
+        """Derulează fereastra de taskuri cu numărul dat de rânduri"""
+        if self.data is None:
+            return
+        first = max(0, min(self.first_row + rows, len(self.data) - self.visible_rows))
+        if first != self.first_row:
+            self.first_row = first
+            self.render()
+
+    def zoom(self, factor, center=None):
+        """Zoom pe axa timpului în jurul punctului dat (factor > 1 = apropiere)"""
+        if self.xlim is None:
+            return
+        x0, x1 = self.xlim
+        center = (x0 + x1) / 2 if center is None else center
+        self.xlim = (center - (center - x0) / factor, center + (x1 - center) / factor)
+        self.render()
+
+    def on_scroll(self, event):
+        """Rotița: derulare rânduri; Ctrl + rotița: zoom pe timeline"""
+        direction = 1 if event.button == 'up' else -1
+        if event.key == 'control':
+            self.zoom(ZOOM_FACTOR ** direction, event.xdata)
+        else:
+            self.scroll(-direction * SCROLL_STEP)
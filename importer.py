@@ -0,0 +1,696 @@
+"""Import în masă al proiectelor și taskurilor din CSV, JSON și XML MS Project.
+
+Fișierele sunt parcurse în flux, înregistrare cu înregistrare: CSV cu
+csv.DictReader, JSON Lines linie cu linie, JSON ca listă decodată element cu
+element, iar XML-ul MS Project cu iterparse, eliberând elementele procesate.
+Rândurile valide sunt inserate în loturi (executemany într-un tabel
+temporar, apoi INSERT ... SELECT), într-o singură tranzacție; rândurile
+respinse ajung în raportul de erori, fără a opri importul.
+
+Id-urile din fișier (coloana id, UID-ul din MS Project) sunt chei externe:
+taskurile primesc id-uri noi, iar referințele din dependencies sunt traduse
+în noile id-uri. Proiectele trebuie să apară în fișier înaintea taskurilor
+lor. Toate legăturile MS Project sunt importate ca finish-to-start; la final,
+taskurile care încep înaintea sfârșitului unei dependențe sunt mutate după
+ea, ca la editarea din aplicație, iar fiecare mutare apare ca avertisment.
+
+    python importer.py taskuri.csv --project 3
+    python importer.py plan.xml --errors erori.csv
+"""
+import os
+import re
+import csv
+import sys
+import json
+import time
+import argparse
+import datetime
+import xml.etree.ElementTree as ElementTree
+from dataclasses import dataclass, field
+
+from project_store import (ProjectStore, Project, Task, PROJECT_STATUSES, TASK_STATUSES, PRIORITIES,
+                           METHODOLOGIES, bulk_insert, check_estimates, normalize_date)
+from scheduling import ScheduleGraph, CycleError
+from storage import DB_PATH
+
+BATCH_SIZE = 5000
+JSON_CHUNK_SIZE = 1 << 16
+
+# Formatul dedus din extensia fișierului
+FORMATS = {'.csv': 'csv', '.json': 'json', '.jsonl': 'jsonl', '.ndjson': 'jsonl', '.xml': 'msproject'}
+RECORD_KINDS = {'project': 'project', 'proiect': 'project', 'task': 'task'}
+
+# O zi de lucru MS Project are 8 ore
+MSP_HOURS_PER_DAY = 8
+_MSP_DURATION = re.compile(r'^-?P(?:(\d+(?:\.\d+)?)D)?(?:T(?:(\d+(?:\.\d+)?)H)?(?:(\d+(?:\.\d+)?)M)?'
+                           r'(?:(\d+(?:\.\d+)?)S)?)?$')
+_JSON_SEPARATOR = re.compile(r'[\s,]*')
+_JSON_END = frozenset(' \t\r\n,]')
+_DEPENDENCY_SEPARATOR = re.compile(r'[\s,;]+')
+
+
+@dataclass
+class ImportIssue:
+    row: int
+    kind: str
+    key: str
+    message: str
+
+
+@dataclass
+class ImportResult:
+    path: str
+    format: str
+    projects: int = 0
+    tasks: int = 0
+    skipped: int = 0
+    seconds: float = 0.0
+    # Rândurile respinse și referințele ignorate din rândurile importate
+    errors: list = field(default_factory=list)
+    warnings: list = field(default_factory=list)
+
+    @property
+    def rows(self):
+        return self.projects + self.tasks
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds > 0 else float('inf')
+
+    def write_report(self, path):
+        """Scrie erorile și avertismentele într-un fișier CSV"""
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['rând', 'tip', 'cheie', 'severitate', 'mesaj'])
+            for severity, issues in (('respins', self.errors), ('avertisment', self.warnings)):
+                writer.writerows((i.row, i.kind, i.key, severity, i.message) for i in issues)
+
+
+def format_for_path(path):
+    """Deduce formatul din extensia fișierului"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(f"Extensie necunoscută pentru {path}; folosiți una dintre: {', '.join(FORMATS)}")
+    return FORMATS[extension]
+
+
+# ----------------------------------------------------------------------
+# Validare
+# ----------------------------------------------------------------------
+
+def _text(value):
+    return "" if value is None else str(value).strip()
+
+
+def _key(value):
+    """Cheia externă a unei înregistrări, ca text ("7", nu "7.0")"""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return _text(value)
+
+
+def _date(record, name):
+    # Aceleași formate ca în formulare; datele cu oră (2025-01-06T08:00:00) păstrează doar ziua
+    try:
+        return normalize_date(_text(record.get(name)))
+    except ValueError as e:
+        raise ValueError(f"{name}: {e}")
+
+
+def _number(record, name, cast, default, maximum=None):
+    value = record.get(name)
+    if value is None or _text(value) == "":
+        return default
+    try:
+        number = float(str(value).replace(',', '.')) if isinstance(value, str) else float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name}: '{value}' nu este un număr valid")
+    if number != number or number in (float('inf'), float('-inf')):
+        raise ValueError(f"{name}: '{value}' nu este un număr valid")
+    if cast is int and not number.is_integer():
+        raise ValueError(f"{name}: '{value}' trebuie să fie un număr întreg")
+    if number < 0 or (maximum is not None and number > maximum):
+        limit = f"între 0 și {maximum}" if maximum is not None else "pozitiv"
+        raise ValueError(f"{name}: {value} trebuie să fie {limit}")
+    return cast(number)
+
+
+def _choice(record, name, allowed, default):
+    value = _text(record.get(name))
+    if not value:
+        return default
+    if value not in allowed:
+        raise ValueError(f"{name}: '{value}' nu este una dintre valorile {', '.join(allowed)}")
+    return value
+
+
+def _check_dates(start_date, end_date):
+    if start_date and end_date and end_date < start_date:
+        raise ValueError(f"data de sfârșit {end_date} este înaintea datei de început {start_date}")
+
+
+def validate_project(record):
+    """Proiectul construit dintr-o înregistrare; ValueError dacă înregistrarea este invalidă"""
+    name = _text(record.get('name'))
+    if not name:
+        raise ValueError("Numele proiectului este obligatoriu!")
+    project = Project(name=name, description=_text(record.get('description')),
+                      start_date=_date(record, 'start_date'), end_date=_date(record, 'end_date'),
+                      budget=_number(record, 'budget', float, 0.0),
+                      status=_choice(record, 'status', PROJECT_STATUSES, "Planificare"),
+                      priority=_choice(record, 'priority', PRIORITIES, "Medie"),
+                      project_manager=_text(record.get('project_manager')),
+                      methodology=_choice(record, 'methodology', METHODOLOGIES, ""),
+                      created_date=_text(record.get('created_date')))
+    _check_dates(project.start_date, project.end_date)
+    return project
+
+
+def validate_task(record, project_id):
+    """Taskul construit dintr-o înregistrare, fără dependențe (acestea sunt rezolvate la import)"""
+    name = _text(record.get('name'))
+    if not name:
+        raise ValueError("Numele task-ului este obligatoriu!")
+    task = Task(project_id=project_id, name=name, description=_text(record.get('description')),
+                start_date=_date(record, 'start_date'), end_date=_date(record, 'end_date'),
+                duration=_number(record, 'duration', int, 0),
+                optimistic_duration=_number(record, 'optimistic_duration', int, 0),
+                pessimistic_duration=_number(record, 'pessimistic_duration', int, 0),
+                assigned_to=_text(record.get('assigned_to')),
+                status=_choice(record, 'status', TASK_STATUSES, "Neînceput"),
+                progress=_number(record, 'progress', int, 0, maximum=100),
+                priority=_choice(record, 'priority', PRIORITIES, "Medie"),
+                cost=_number(record, 'cost', float, 0.0))
+    _check_dates(task.start_date, task.end_date)
+    check_estimates(task)
+    return task
+
+
+def dependency_keys(value):
+    """Cheile predecesorilor: listă JSON, listă Python sau text separat prin virgule"""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        value = value.strip()
+        if value.startswith('['):
+            try:
+                value = json.loads(value)
+            except ValueError:
+                raise ValueError(f"dependencies: '{value}' nu este o listă validă")
+        else:
+            return [part for part in _DEPENDENCY_SEPARATOR.split(value) if part]
+    if not isinstance(value, list):
+        value = [value]
+    return [_key(v) for v in value if _key(v)]
+
+
+# ----------------------------------------------------------------------
+# Cititoare: fiecare produce (rând, tip, înregistrare)
+# ----------------------------------------------------------------------
+
+def _record_kind(record, kind):
+    """Tipul înregistrării: coloana type, tipul implicit sau, în lipsa lor, prezența unui proiect"""
+    value = _text(record.pop('type', None)).lower() or kind
+    if not value:
+        has_project = any(_text(record.get(name)) for name in ('project_id', 'project', 'project_name'))
+        return 'task' if has_project else 'project'
+    if value not in RECORD_KINDS:
+        raise ValueError(f"type: '{value}' nu este 'project' sau 'task'")
+    return RECORD_KINDS[value]
+
+
+def _with_kind(row, record, kind):
+    """Înregistrarea cu tipul ei; un proiect JSON poate conține lista taskurilor sale"""
+    if not isinstance(record, dict):
+        yield row, 'task', ValueError("înregistrarea nu este un obiect")
+        return
+    try:
+        record_kind = _record_kind(record, kind)
+    except ValueError as e:
+        yield row, kind or 'task', e
+        return
+    tasks = record.pop('tasks', None) if record_kind == 'project' else None
+    if tasks:
+        # Taskurile imbricate se leagă de proiect prin cheia lui, chiar dacă fișierul nu o dă
+        key = _key(record.get('id', record.get('key'))) or f"#{row}"
+        record['key'] = key
+    yield row, record_kind, record
+    if tasks:
+        for task in tasks:
+            if isinstance(task, dict):
+                task = dict(task, type='task', project=key)
+            yield from _with_kind(row, task, 'task')
+
+
+def iter_csv(f, kind=None):
+    reader = csv.DictReader(f)
+    for record in reader:
+        # Celulele din coloanele fără antet nu au cheie text
+        record.pop(None, None)
+        yield from _with_kind(reader.line_num, record, kind)
+
+
+def iter_jsonl(f, kind=None):
+    for row, line in enumerate(f, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield row, kind or 'task', ValueError(f"JSON invalid: {e}")
+            continue
+        yield from _with_kind(row, record, kind)
+
+
+def iter_json_array(f, chunk_size=JSON_CHUNK_SIZE):
+    """Elementele unei liste JSON de pe primul nivel, decodate pe rând dintr-un buffer limitat"""
+    decoder = json.JSONDecoder()
+    buffer = f.read(chunk_size).lstrip()
+    while not buffer:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        buffer = chunk.lstrip()
+    if not buffer.startswith('['):
+        raise ValueError("Fișierul JSON trebuie să conțină o listă de înregistrări")
+    pos, eof = 1, False
+    while True:
+        pos = _JSON_SEPARATOR.match(buffer, pos).end()
+        if pos < len(buffer) and buffer[pos] == ']':
+            return
+        try:
+            if pos == len(buffer):
+                raise ValueError("Sfârșit neașteptat al fișierului JSON")
+            item, end = decoder.raw_decode(buffer, pos)
+            # Un număr tăiat de capătul bufferului (1.5|e10) pare complet; elementul se încheie la separator
+            complete = eof or (end < len(buffer) and buffer[end] in _JSON_END)
+        except ValueError as e:
+            if eof:
+                raise ValueError(f"JSON invalid: {e}")
+            complete = False
+        if not complete:
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer, pos = buffer[pos:] + chunk, 0
+            continue
+        yield item
+        pos = end
+
+
+def iter_json(f, kind=None):
+    for row, record in enumerate(iter_json_array(f), start=1):
+        yield from _with_kind(row, record, kind)
+
+
+def _msp_int(value, default):
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return default
+
+
+def _msp_duration(value):
+    """Durata MS Project (PT16H0M0S) în zile de lucru"""
+    match = _MSP_DURATION.match(_text(value))
+    if not match:
+        return ""
+    days, hours, minutes, seconds = (float(part or 0) for part in match.groups())
+    return round(days + (hours + minutes / 60 + seconds / 3600) / MSP_HOURS_PER_DAY)
+
+
+def _msp_status(percent):
+    if percent >= 100:
+        return "Finalizat"
+    return "În desfășurare" if percent > 0 else "Neînceput"
+
+
+def _msp_priority(value):
+    """Prioritatea MS Project (0-1000, implicit 500) în prioritățile aplicației"""
+    priority = _msp_int(value, 500)
+    if priority >= 700:
+        return "Înaltă"
+    return "Scăzută" if priority <= 300 else "Medie"
+
+
+def _msp_project(project):
+    """Numele proiectului: titlul sau, în lipsa lui, numele fișierului MS Project"""
+    name = project.get('title') or os.path.splitext(project.get('file_name', ""))[0] or "Proiect importat"
+    return dict(project, name=name)
+
+
+def iter_msproject(f, create_project=True):
+    """Proiectul, taskurile și asignările dintr-un fișier XML MS Project (schema Project 2003+).
+
+    Taskurile sumar și taskul 0 (sumarul proiectului) sunt omise; persoanele
+    asignate sunt trimise la final, ca înregistrări 'assignment'.
+    """
+    stack = []
+    namespace = ""
+    project = {'key': 'msproject'}
+    project_sent = not create_project
+    resources = {}
+    assignments = {}
+    skipped = set()
+
+    def child(elem, name):
+        found = elem.find(f'{namespace}{name}')
+        return found.text if found is not None and found.text is not None else ""
+
+    try:
+        for event, elem in ElementTree.iterparse(f, events=('start', 'end')):
+            if event == 'start':
+                if not stack:
+                    namespace = elem.tag[:elem.tag.index('}') + 1] if elem.tag.startswith('{') else ""
+                stack.append(elem)
+                if elem.tag == f'{namespace}Tasks' and len(stack) == 2 and not project_sent:
+                    # Câmpurile proiectului preced lista de taskuri
+                    project_sent = True
+                    yield 0, 'project', _msp_project(project)
+                continue
+
+            stack.pop()
+            tag = elem.tag[len(namespace):]
+            depth = len(stack)
+            if depth == 1:
+                # Câmpurile proiectului: Name, Title, StartDate, FinishDate, Manager
+                names = {'Name': 'file_name', 'Title': 'title', 'StartDate': 'start_date',
+                         'FinishDate': 'end_date', 'Manager': 'project_manager'}
+                if tag in names and elem.text:
+                    project[names[tag]] = elem.text.strip()
+                stack[0].clear()
+            elif depth == 2 and tag == 'Task':
+                uid = child(elem, 'UID')
+                if uid == '0' or child(elem, 'Summary') == '1' or child(elem, 'IsNull') == '1':
+                    skipped.add(uid)
+                    yield _msp_int(child(elem, 'ID'), 0), 'skip', None
+                else:
+                    percent = _msp_int(child(elem, 'PercentComplete'), 0)
+                    record = {'key': uid, 'name': child(elem, 'Name'), 'description': child(elem, 'Notes'),
+                              'start_date': child(elem, 'Start'), 'end_date': child(elem, 'Finish'),
+                              'duration': _msp_duration(child(elem, 'Duration')), 'progress': percent,
+                              'status': _msp_status(percent), 'priority': _msp_priority(child(elem, 'Priority')),
+                              'dependencies': [child(link, 'PredecessorUID')
+                                               for link in elem.iter(f'{namespace}PredecessorLink')]}
+                    if create_project:
+                        record['project'] = project['key']
+                    yield _msp_int(child(elem, 'ID'), 0), 'task', record
+                stack[-1].clear()
+            elif depth == 2 and tag == 'Resource':
+                if child(elem, 'Name'):
+                    resources[child(elem, 'UID')] = child(elem, 'Name')
+                stack[-1].clear()
+            elif depth == 2 and tag == 'Assignment':
+                name = resources.get(child(elem, 'ResourceUID'))
+                if name and child(elem, 'TaskUID') not in skipped:
+                    assignments.setdefault(child(elem, 'TaskUID'), []).append(name)
+                stack[-1].clear()
+    except ElementTree.ParseError as e:
+        raise ValueError(f"XML invalid: {e}")
+
+    if not project_sent:
+        yield 0, 'project', _msp_project(project)
+    for task_key, names in assignments.items():
+        yield 0, 'assignment', {'key': task_key, 'assigned_to': ", ".join(names)}
+
+
+# ----------------------------------------------------------------------
+# Import
+# ----------------------------------------------------------------------
+
+class _Importer:
+    """Starea unui import: cheile deja văzute, loturile în așteptare și dependențele nerezolvate"""
+
+    def __init__(self, conn, result, default_project_id, batch_size):
+        self.conn = conn
+        self.result = result
+        self.default_project_id = default_project_id
+        self.batch_size = batch_size
+        self.project_keys = {}
+        self.project_names = {}
+        self.task_keys = {}
+        self.projects = []
+        self.tasks = []
+        self.assignments = []
+        # (rând, id task, id proiect, chei nerezolvate) pentru referințele spre taskuri de mai jos
+        self.pending = []
+        # {id proiect: {id task: (rând, cheie)}} pentru taskurile cu dependențe, reprogramate la final
+        self.dependent = {}
+        self.existing_projects = None
+
+        self.next_project_id = self._next_id('projects')
+        self.next_task_id = self._next_id('tasks')
+        self.first_task_id = self.next_task_id
+
+    def _next_id(self, table):
+        """Primul id liber; id-urile alocate dinainte permit rezolvarea dependențelor fără interogări"""
+        row = self.conn.execute(f"""SELECT MAX(IFNULL((SELECT seq FROM sqlite_sequence WHERE name='{table}'), 0),
+                                               IFNULL((SELECT MAX(id) FROM {table}), 0))""").fetchone()
+        return row[0] + 1
+
+    def reject(self, row, kind, key, message):
+        self.result.errors.append(ImportIssue(row, kind, key, message))
+
+    def add(self, row, kind, record):
+        if kind == 'skip':
+            self.result.skipped += 1
+            return
+        if isinstance(record, Exception):
+            self.reject(row, kind, "", str(record))
+            return
+        key = _key(record.get('id', record.get('key')))
+        try:
+            if kind == 'project':
+                self.add_project(key, record)
+            elif kind == 'task':
+                self.add_task(row, key, record)
+            else:
+                self.assign(key, record)
+        except ValueError as e:
+            self.reject(row, kind, key, str(e))
+
+    def add_project(self, key, record):
+        if key and key in self.project_keys:
+            raise ValueError(f"Cheia de proiect '{key}' apare de mai multe ori")
+        project = validate_project(record)
+        if not project.created_date:
+            project.created_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        project.id = self.next_project_id
+        self.next_project_id += 1
+        if key:
+            self.project_keys[key] = project.id
+        self.project_names.setdefault(project.name, project.id)
+        self.projects.append((project.id,) + project.values())
+        self.result.projects += 1
+        if len(self.projects) >= self.batch_size:
+            self.flush()
+
+    def resolve_project(self, record):
+        """Proiectul taskului: cheie din fișier, id existent, nume sau proiectul implicit"""
+        reference = _key(record.get('project_id', record.get('project')))
+        name = _text(record.get('project_name'))
+        if reference:
+            if reference in self.project_keys:
+                return self.project_keys[reference]
+            if reference.isdigit() and int(reference) in self._existing_projects():
+                return int(reference)
+            raise ValueError(f"Proiectul '{reference}' nu există")
+        if name:
+            if name in self.project_names:
+                return self.project_names[name]
+            row = self.conn.execute("SELECT id FROM projects WHERE name=? ORDER BY id LIMIT 1", (name,)).fetchone()
+            if row is None:
+                raise ValueError(f"Proiectul '{name}' nu există")
+            self.project_names[name] = row[0]
+            return row[0]
+        if self.default_project_id is None:
+            raise ValueError("Taskul nu indică proiectul (project_id sau project_name)")
+        return self.default_project_id
+
+    def _existing_projects(self):
+        if self.existing_projects is None:
+            self.existing_projects = {row[0] for row in self.conn.execute("SELECT id FROM projects")}
+        return self.existing_projects
+
+    def add_task(self, row, key, record):
+        if key and key in self.task_keys:
+            raise ValueError(f"Cheia de task '{key}' apare de mai multe ori")
+        project_id = self.resolve_project(record)
+        task = validate_task(record, project_id)
+        keys = dependency_keys(record.get('dependencies'))
+
+        task.id = self.next_task_id
+        self.next_task_id += 1
+        resolved, unresolved = self.resolve_dependencies(row, key, task, keys)
+        task.dependencies = json.dumps(resolved)
+        if unresolved:
+            self.pending.append((row, key, task.id, project_id, resolved, unresolved))
+        if keys:
+            self.dependent.setdefault(project_id, {})[task.id] = (row, key)
+        if key:
+            self.task_keys[key] = (task.id, project_id)
+        self.tasks.append((task.id,) + task.values())
+        self.result.tasks += 1
+        if len(self.tasks) >= self.batch_size:
+            self.flush()
+
+    def resolve_dependencies(self, row, key, task, keys):
+        """Traduce cheile predecesorilor deja importați; restul rămân pentru finalul importului"""
+        resolved, unresolved = [], []
+        for dependency in dict.fromkeys(keys):
+            if dependency == key:
+                self.result.warnings.append(ImportIssue(row, 'task', key, "Taskul depinde de el însuși"))
+            elif dependency in self.task_keys:
+                dependency_id, project_id = self.task_keys[dependency]
+                if project_id != task.project_id:
+                    self.result.warnings.append(ImportIssue(
+                        row, 'task', key, f"Dependența '{dependency}' aparține altui proiect și a fost ignorată"))
+                else:
+                    resolved.append(dependency_id)
+            else:
+                unresolved.append(dependency)
+        return resolved, unresolved
+
+    def assign(self, key, record):
+        if key not in self.task_keys:
+            raise ValueError(f"Taskul '{key}' nu a fost importat")
+        self.assignments.append((record['assigned_to'], self.task_keys[key][0]))
+
+    def flush(self):
+        # Proiectele înaintea taskurilor, pentru cheia externă tasks.project_id
+        if self.projects:
+            bulk_insert(self.conn, 'projects', ['id'] + Project.columns(), self.projects)
+            self.projects = []
+        if self.tasks:
+            bulk_insert(self.conn, 'tasks', ['id'] + Task.columns(), self.tasks)
+            self.tasks = []
+
+    def finish(self):
+        """Scrie loturile rămase, dependențele spre taskuri apărute mai târziu în fișier, apoi reprogramează"""
+        self.flush()
+        updates = []
+        existing = self._existing_tasks({k for *_, unresolved in self.pending for k in unresolved
+                                         if k not in self.task_keys})
+        for row, key, task_id, project_id, resolved, unresolved in self.pending:
+            for dependency in unresolved:
+                dependency_id, dependency_project = (self.task_keys.get(dependency) or
+                                                     existing.get(dependency, (None, None)))
+                if dependency_id is None:
+                    message = f"Dependența '{dependency}' nu a fost găsită și a fost ignorată"
+                elif dependency_project != project_id:
+                    message = f"Dependența '{dependency}' aparține altui proiect și a fost ignorată"
+                else:
+                    resolved.append(dependency_id)
+                    continue
+                self.result.warnings.append(ImportIssue(row, 'task', key, message))
+            updates.append((json.dumps(resolved), task_id))
+        self.conn.executemany("UPDATE tasks SET dependencies=? WHERE id=?", updates)
+        self.conn.executemany("UPDATE tasks SET assigned_to=? WHERE id=?", self.assignments)
+        self.reschedule()
+
+    def reschedule(self):
+        """Mută taskurile importate după sfârșitul dependențelor lor, ca update_task din ProjectStore"""
+        for project_id, imported in self.dependent.items():
+            tasks = [Task.from_row(row) for row in self.conn.execute("SELECT * FROM tasks WHERE project_id=?",
+                                                                        (project_id,))]
+            try:
+                graph = ScheduleGraph(tasks, compute=False)
+            except CycleError as e:
+                row, key = next((imported[i] for i in e.cycle if i in imported), (0, ""))
+                self.result.warnings.append(ImportIssue(row, 'task', key, f"{e}; taskurile proiectului "
+                                                                          f"nu au fost reprogramate"))
+                continue
+            moved = graph.propagate_many(imported)
+            for task_id in moved:
+                row, key = imported[task_id]
+                start_date, end_date = graph.dates(task_id)
+                self.result.warnings.append(ImportIssue(
+                    row, 'task', key, f"Mutat după dependențe: {start_date} - {end_date}"))
+            self.conn.executemany("UPDATE tasks SET start_date=?, end_date=? WHERE id=?",
+                                  [graph.dates(task_id) + (task_id,) for task_id in moved])
+
+    def _existing_tasks(self, keys):
+        """Taskurile existente dinaintea importului, pentru cheile care nu sunt în fișier"""
+        ids = [int(k) for k in keys if k.isdigit()]
+        found = {}
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            rows = self.conn.execute(f"SELECT id, project_id FROM tasks WHERE id < ? AND id IN "
+                                     f"({', '.join('?' for _ in chunk)})", [self.first_task_id] + chunk)
+            found.update((str(task_id), (task_id, project_id)) for task_id, project_id in rows)
+        return found
+
+
+def import_file(store, path, fmt=None, project_id=None, kind=None, batch_size=BATCH_SIZE):
+    """Importă un fișier într-o singură tranzacție și întoarce un ImportResult.
+
+    project_id este proiectul existent al taskurilor care nu indică unul; kind
+    ('project' sau 'task') este tipul înregistrărilor fără coloana type.
+    """
+    fmt = fmt or format_for_path(path)
+    if project_id is not None and store.get_project(project_id) is None:
+        raise ValueError(f"Proiectul {project_id} nu există")
+    if project_id is not None and kind is None:
+        kind = 'task'
+
+    result = ImportResult(path, fmt)
+    start = time.perf_counter()
+    if fmt == 'msproject':
+        f = open(path, 'rb')
+        records = iter_msproject(f, create_project=project_id is None)
+    else:
+        f = open(path, newline='' if fmt == 'csv' else None, encoding='utf-8-sig')
+        records = {'csv': iter_csv, 'json': iter_json, 'jsonl': iter_jsonl}[fmt](f, kind)
+
+    with f, store.engine.write() as conn:
+        importer = _Importer(conn, result, project_id, batch_size)
+        for row, record_kind, record in records:
+            importer.add(row, record_kind, record)
+        importer.finish()
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def add_arguments(parser):
+    """Argumentele importului, comune scriptului și comenzii import din cli.py"""
+    parser.add_argument('path', help="fișierul importat (.csv, .json, .jsonl, .xml MS Project)")
+    parser.add_argument('-f', '--format', choices=sorted(set(FORMATS.values())),
+                        help="formatul, dacă nu se deduce din extensie")
+    parser.add_argument('--project', type=int, help="proiectul existent al taskurilor care nu indică unul")
+    parser.add_argument('--kind', choices=['project', 'task'], help="tipul înregistrărilor fără coloana type")
+    parser.add_argument('--errors', help="fișier CSV pentru raportul de erori")
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+
+
+def run(store, args):
+    """Rulează importul descris de argumente și afișează rezumatul; 1 dacă au fost rânduri respinse"""
+    result = import_file(store, args.path, args.format, args.project, args.kind, args.batch_size)
+    print(f"{result.projects:,} proiecte și {result.tasks:,} taskuri importate din {result.path} "
+          f"în {result.seconds:.2f} s - {result.rows_per_second:,.0f} rânduri/s")
+    if result.skipped:
+        print(f"{result.skipped:,} taskuri sumar omise")
+    print(f"{len(result.errors):,} rânduri respinse, {len(result.warnings):,} avertismente")
+    for issue in result.errors[:10]:
+        print(f"  rândul {issue.row} ({issue.kind} {issue.key}): {issue.message}")
+    if args.errors:
+        result.write_report(args.errors)
+        print(f"Raportul de erori a fost salvat în {args.errors}")
+    return 1 if result.errors else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import în masă al proiectelor și taskurilor")
+    add_arguments(parser)
+    parser.add_argument('--db', default=DB_PATH, help="baza de date (implicit: %(default)s)")
+    args = parser.parse_args(argv)
+
+    store = ProjectStore(args.db)
+    try:
+        return run(store, args)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
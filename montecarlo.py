@@ -0,0 +1,346 @@
+"""Simularea Monte Carlo a termenului și costului unui proiect.
+
+Fiecare task are o estimare în trei puncte: optimistă, cea mai probabilă
+(durata folosită de CPM) și pesimistă; fără estimări, durata rămâne fixă.
+Duratele sunt eșantionate din distribuția PERT (beta) sau triunghiulară, iar
+pentru fiecare iterație termenul rezultă din parcurgerea înainte a grafului
+de dependențe, vectorizată pe iterații: taskurile sunt vizitate o singură
+dată, în ordine topologică, fiecare cu un maxim peste predecesori pe toate
+iterațiile deodată. Un task nu începe înaintea datei lui planificate.
+
+Riscurile deschise cu efect cuantificat (întârziere în zile, cost în RON) se
+produc independent, cu probabilitatea din RISK_PROBABILITY_VALUES, și se adaugă
+la termenul și costul proiectului. Costul unui task este partea lui din buget
+(după durată, ca în EVM), proporțională cu durata eșantionată. Sunt simulate
+doar pachetele de lucru (frunzele WBS); taskurile sumare își transmit
+dependențele frunzelor lor.
+
+Iterațiile sunt împărțite în loturi cu semințe derivate dintr-o singură
+SeedSequence, deci rezultatul depinde doar de sămânță, nu și de numărul de
+procese. Loturile rulează în paralel într-un ProcessPoolExecutor (context
+spawn: sigur și din aplicația grafică, care are mai multe thread-uri). Pentru
+analiza de senzitivitate (tornado), fiecare lot întoarce doar sumele necesare
+corelațiilor, nu matricele de eșantioane.
+"""
+import os
+import json
+import math
+import datetime
+import itertools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+from analytics import OPEN_RISK_STATUSES
+from project_store import EPOCH
+from scheduling import ScheduleGraph, parse_dependencies
+
+DISTRIBUTIONS = ('pert', 'triangular')
+PERCENTILES = (50, 80, 95)
+# Probabilitatea de producere pentru fiecare valoare din formularul riscurilor
+RISK_PROBABILITY_VALUES = {"Mică": 0.1, "Medie": 0.3, "Mare": 0.6}
+# Eșantioane (taskuri x iterații) într-un lot: limitează memoria unui proces la câteva zeci de MB
+CHUNK_CELLS = 2_000_000
+# Sub atât, pornirea proceselor costă mai mult decât simularea
+MIN_PARALLEL_ITERATIONS = 20_000
+TORNADO_SIZE = 10
+
+HISTOGRAM_COLOR = '#3498db'
+PERCENTILE_COLOR = '#e74c3c'
+PLAN_COLOR = '#2c3e50'
+
+
+@dataclass
+class Network:
+    """Datele de intrare ale simulării, în ordine topologică; se transmite proceselor prin pickle"""
+    labels: list            # numele taskurilor, apoi descrierile riscurilor
+    low: np.ndarray
+    mode: np.ndarray
+    high: np.ndarray
+    preds: list             # pentru fiecare task, pozițiile predecesorilor
+    offset: np.ndarray      # începutul planificat, în zile de la începutul proiectului
+    cost_rate: np.ndarray   # costul pe zi de durată
+    base_cost: float        # costul taskurilor fără durată
+    risk_probability: np.ndarray
+    risk_delay: np.ndarray
+    risk_cost: np.ndarray
+
+    @property
+    def task_count(self):
+        return len(self.mode)
+
+
+@dataclass
+class Samples:
+    """Rezultatul unui lot: termenele și costurile, plus sumele pentru corelații"""
+    finish: np.ndarray
+    cost: np.ndarray
+    sum_x: np.ndarray
+    sum_x2: np.ndarray
+    sum_xy: np.ndarray      # intrări x (termen, cost)
+
+
+@dataclass
+class SimulationResult:
+    project_id: int
+    start: datetime.date
+    planned_end: datetime.date      # data de sfârșit a proiectului, dacă există
+    iterations: int
+    distribution: str
+    finish: np.ndarray              # durata proiectului în zile, pe iterație
+    cost: np.ndarray
+    deterministic_finish: float     # termenul (zile de la start) cu duratele cele mai probabile
+    budget: float
+    labels: list
+    finish_correlation: np.ndarray  # corelația fiecărei intrări cu termenul
+    cost_correlation: np.ndarray
+
+    def finish_date(self, days):
+        return self.start + datetime.timedelta(days=math.ceil(days))
+
+    def percentiles(self, levels=PERCENTILES):
+        """{nivel: (data de sfârșit, cost)} pentru P50, P80, P95"""
+        finish = np.percentile(self.finish, levels)
+        cost = np.percentile(self.cost, levels)
+        return {level: (self.finish_date(f), float(c)) for level, f, c in zip(levels, finish, cost)}
+
+    def on_time_probability(self):
+        """Probabilitatea de a termina până la data de sfârșit planificată (None dacă lipsește)"""
+        if self.planned_end is None:
+            return None
+        return float(np.mean(self.finish <= (self.planned_end - self.start).days))
+
+    def tornado(self, target='finish', size=TORNADO_SIZE):
+        """Intrările cu cea mai mare corelație (în valoare absolută) cu termenul sau costul"""
+        correlation = self.finish_correlation if target == 'finish' else self.cost_correlation
+        order = np.argsort(-np.abs(np.nan_to_num(correlation)), kind='stable')[:size]
+        return [(self.labels[i], float(correlation[i])) for i in order if correlation[i] == correlation[i]]
+
+
+def work_packages(tasks):
+    """Frunzele WBS, singurele taskuri cu muncă proprie, cu dependențele taskurilor sumare mutate pe frunze.
+
+    O dependență de un task sumar devine dependență de toate frunzele lui, iar dependențele unui task
+    sumar se aplică fiecărei frunze din subarborele lui.
+    """
+    children = {}
+    for task in tasks:
+        if task.parent_id is not None:
+            children.setdefault(task.parent_id, []).append(task.id)
+    if not children:
+        return tasks
+    by_id = {task.id: task for task in tasks}
+    leaves = {}
+
+    def leaves_of(task_id):
+        if task_id not in leaves:
+            leaves[task_id] = ([i for child in children[task_id] for i in leaves_of(child)]
+                               if task_id in children else [task_id])
+        return leaves[task_id]
+
+    result = []
+    for task in tasks:
+        if task.id in children:
+            continue
+        chain, node = [], task
+        while node is not None:
+            chain.append(node)
+            node = by_id.get(node.parent_id)
+        # O dependență de propriul task sumar nu are sens pentru frunzele lui și ar forma un ciclu
+        ancestors = {node.id for node in chain}
+        ids = [i for node in chain for d in parse_dependencies(node.dependencies) if d not in ancestors
+               for i in (leaves_of(d) if d in by_id else [d])]
+        result.append(replace(task, dependencies=json.dumps(list(dict.fromkeys(ids)))))
+    return result
+
+
+def build_network(tasks, risks, budget, start_day=None):
+    """(rețeaua de simulare, termenul cu duratele cele mai probabile) din taskurile și riscurile unui proiect.
+
+    start_day este începutul proiectului (zile de la EPOCH); un task nu începe înaintea datei lui
+    planificate. Ridică CycleError.
+    """
+    graph = ScheduleGraph(tasks, compute=False)
+    order = graph.order
+    position = {v: i for i, v in enumerate(order)}
+    by_index = [tasks[v] for v in order]
+    mode = np.array([graph.duration[v] for v in order], dtype=float)
+    low = np.array([t.optimistic_duration or 0 for t in by_index], dtype=float)
+    high = np.array([t.pessimistic_duration or 0 for t in by_index], dtype=float)
+    offset = np.array([max(t.start_day - start_day, 0) if start_day is not None and t.start_day is not None
+                       else 0 for t in by_index], dtype=float)
+    low = np.where(low > 0, np.minimum(low, mode), mode)
+    high = np.where(high > 0, np.maximum(high, mode), mode)
+
+    # Bugetul este împărțit după durată (minim o zi); taskurile fără durată au cost fix
+    weight = np.maximum(mode, 1)
+    share = budget * weight / weight.sum() if len(weight) else weight
+    cost_rate = np.divide(share, mode, out=np.zeros_like(share), where=mode > 0)
+    base_cost = float(share[mode <= 0].sum())
+
+    active = [r for r in risks if r.status in OPEN_RISK_STATUSES and ((r.delay_days or 0) > 0 or
+                                                                       (r.cost_impact or 0) > 0)]
+    network = Network(labels=[t.name for t in by_index] + [r.description for r in active],
+                      low=low, mode=mode, high=high,
+                      preds=[np.array([position[p] for p in graph.preds[v]], dtype=np.int64) for v in order],
+                      offset=offset, cost_rate=cost_rate, base_cost=base_cost,
+                      risk_probability=np.array([RISK_PROBABILITY_VALUES.get(r.probability, 0.0) for r in active]),
+                      risk_delay=np.array([float(r.delay_days or 0) for r in active]),
+                      risk_cost=np.array([float(r.cost_impact or 0) for r in active]))
+    deterministic = float(forward_pass(network, mode[:, None]).max()) if len(mode) else 0.0
+    return network, deterministic
+
+
+def sample_durations(rng, network, iterations, distribution='pert'):
+    """Matricea duratelor, taskuri x iterații"""
+    durations = np.repeat(network.mode[:, None], iterations, axis=1)
+    uncertain = np.flatnonzero(network.high > network.low)
+    if len(uncertain):
+        low, mode, high = (values[uncertain, None] for values in (network.low, network.mode, network.high))
+        size = (len(uncertain), iterations)
+        if distribution == 'pert':
+            alpha = 1 + 4 * (mode - low) / (high - low)
+            beta = 1 + 4 * (high - mode) / (high - low)
+            durations[uncertain] = low + (high - low) * rng.beta(alpha, beta, size=size)
+        else:
+            durations[uncertain] = rng.triangular(low, mode, high, size=size)
+    return durations
+
+
+def forward_pass(network, durations):
+    """Termenele taskurilor (taskuri x iterații), toate iterațiile deodată.
+
+    Un task începe la maximul dintre începutul lui planificat și sfârșitul predecesorilor.
+    """
+    finish = np.empty_like(durations)
+    for v, preds in enumerate(network.preds):
+        start = network.offset[v]
+        if len(preds):
+            start = np.maximum(finish[preds].max(axis=0), start)
+        np.add(start, durations[v], out=finish[v])
+    return finish
+
+
+def simulate_chunk(network, seed, iterations, distribution='pert'):
+    """Un lot de iterații (rulează și într-un proces separat)"""
+    rng = np.random.default_rng(seed)
+    durations = sample_durations(rng, network, iterations, distribution)
+    total = forward_pass(network, durations).max(axis=0) if network.task_count else np.zeros(iterations)
+
+    occurs = (rng.random((len(network.risk_probability), iterations)) <
+              network.risk_probability[:, None]).astype(float)
+    total += network.risk_delay @ occurs
+    cost = network.cost_rate @ durations + network.base_cost + network.risk_cost @ occurs
+
+    inputs = np.vstack([durations, occurs])
+    targets = np.vstack([total, cost])
+    return Samples(finish=total, cost=cost, sum_x=inputs.sum(axis=1), sum_x2=np.einsum('ij,ij->i', inputs, inputs),
+                   sum_xy=inputs @ targets.T)
+
+
+def _correlation(n, sum_x, sum_x2, sum_y, sum_y2, sum_xy):
+    """Corelația Pearson din sume; NaN pentru intrările (sau ieșirile) constante"""
+    var_x = n * sum_x2 - sum_x ** 2
+    var_y = n * sum_y2 - sum_y ** 2
+    # Variațiile de ordinul erorilor de rotunjire sunt tratate ca zero
+    valid = (var_x > 1e-12 * n * sum_x2) & (var_y > 1e-12 * n * sum_y2)
+    out = np.full(np.shape(var_x), np.nan)
+    return np.divide(n * sum_xy - sum_x * sum_y, np.sqrt(np.where(valid, var_x * var_y, 1)), out=out, where=valid)
+
+
+def run(network, iterations=10_000, distribution='pert', seed=None, workers=None):
+    """Simularea completă; întoarce (durate proiect, costuri, corelații termen, corelații cost)"""
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Distribuție necunoscută: {distribution}")
+    if iterations < 1:
+        raise ValueError("Numărul de iterații trebuie să fie pozitiv")
+    chunk = max(CHUNK_CELLS // max(network.task_count, 1), 1)
+    sizes = [min(chunk, iterations - start) for start in range(0, iterations, chunk)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    workers = min(workers or os.cpu_count() or 1, len(sizes))
+    if workers > 1 and iterations >= MIN_PARALLEL_ITERATIONS:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+            parts = list(pool.map(simulate_chunk, itertools.repeat(network), seeds, sizes,
+                                  itertools.repeat(distribution)))
+    else:
+        parts = [simulate_chunk(network, s, size, distribution) for s, size in zip(seeds, sizes)]
+
+    finish = np.concatenate([part.finish for part in parts])
+    cost = np.concatenate([part.cost for part in parts])
+    sum_x = sum(part.sum_x for part in parts)
+    sum_x2 = sum(part.sum_x2 for part in parts)
+    sum_xy = sum(part.sum_xy for part in parts)
+    correlations = [_correlation(iterations, sum_x, sum_x2, y.sum(), (y * y).sum(), sum_xy[:, k])
+                    for k, y in enumerate((finish, cost))]
+    return finish, cost, correlations[0], correlations[1]
+
+
+def simulate_project(store, project_id, iterations=10_000, distribution='pert', seed=None, workers=None):
+    """Simularea unui proiect din baza de date; ridică ValueError dacă proiectul nu există"""
+    # Datele sunt citite pe o conexiune din pool, eliberată înainte de simulare
+    with store.snapshot() as view:
+        project = view.get_project(project_id)
+        if project is None:
+            raise ValueError(f"Proiectul {project_id} nu există")
+        tasks = work_packages(view.list_tasks(project_id))
+        risks = view.list_risks(project_id)
+        resources = view.list_resources(project_id)
+    # Fără buget, costul de referință este costul resurselor proiectului
+    budget = project.budget or sum(r.total_cost or 0.0 for r in resources)
+    start_days = [t.start_day for t in tasks if t.start_day is not None]
+    start_day = project.start_day if project.start_day is not None else min(start_days, default=None)
+    network, deterministic = build_network(tasks, risks, budget, start_day)
+
+    start = EPOCH + datetime.timedelta(days=start_day) if start_day is not None else datetime.date.today()
+    planned_end = EPOCH + datetime.timedelta(days=project.end_day) if project.end_day is not None else None
+
+    finish, cost, finish_correlation, cost_correlation = run(network, iterations, distribution, seed, workers)
+    return SimulationResult(project_id=project_id, start=start, planned_end=planned_end, iterations=iterations,
+                            distribution=distribution, finish=finish, cost=cost, deterministic_finish=deterministic,
+                            budget=budget, labels=network.labels, finish_correlation=finish_correlation,
+                            cost_correlation=cost_correlation)
+
+
+def draw_histogram(ax, result, target='finish'):
+    """Histograma termenelor (ca date) sau a costurilor, cu percentilele P50/P80/P95"""
+    from matplotlib import dates
+
+    ax.clear()
+    if target == 'finish':
+        values = dates.date2num(result.start) + result.finish
+        marks = [dates.date2num(finish) for finish, _ in result.percentiles().values()]
+        plan = dates.date2num(result.planned_end) if result.planned_end else None
+        ax.xaxis_date()
+        ax.figure.autofmt_xdate()
+        ax.set_title("Distribuția datei de finalizare")
+    else:
+        values = result.cost
+        marks = [cost for _, cost in result.percentiles().values()]
+        plan = result.budget or None
+        ax.set_title("Distribuția costului (RON)")
+    ax.hist(values, bins=50, color=HISTOGRAM_COLOR)
+    for level, mark in zip(PERCENTILES, marks):
+        ax.axvline(mark, color=PERCENTILE_COLOR, linestyle='--', linewidth=1)
+        ax.annotate(f"P{level}", (mark, 1), xycoords=('data', 'axes fraction'), rotation=90,
+                    va='top', ha='right', fontsize=8, color=PERCENTILE_COLOR)
+    if plan is not None:
+        ax.axvline(plan, color=PLAN_COLOR, linewidth=1.5, label="Plan")
+        ax.legend(loc='upper left', fontsize=8)
+    ax.set_ylabel("Iterații")
+
+
+def draw_tornado(ax, result, target='finish', size=TORNADO_SIZE):
+    """Diagrama tornado: corelația celor mai influente taskuri și riscuri cu termenul sau costul"""
+    items = result.tornado(target, size)[::-1]
+    ax.clear()
+    labels = [label if len(label) <= 30 else label[:29] + "…" for label, _ in items]
+    ax.barh(range(len(items)), [value for _, value in items],
+            color=[PERCENTILE_COLOR if value > 0 else HISTOGRAM_COLOR for _, value in items])
+    ax.set_yticks(range(len(items)), labels, fontsize=8)
+    ax.axvline(0, color=PLAN_COLOR, linewidth=1)
+    ax.set_xlim(-1, 1)
+    ax.set_xlabel("Corelație cu " + ("termenul" if target == 'finish' else "costul"))
+    ax.set_title("Senzitivitate (tornado)")
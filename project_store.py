@@ -0,0 +1,1480 @@
+"""Stratul de acces la date pentru baza de date a managementului de proiecte.
+
+Modulul nu depinde de tkinter sau matplotlib, astfel încât aceeași bază de
+date poate fi folosită din scripturi, job-uri batch și benchmark-uri.
+"""
+import re
+import copy
+import json
+import sqlite3
+import datetime
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+
+from storage import DB_PATH, StorageConfig, StorageEngine
+from scheduling import ScheduleGraph, parse_dependencies
+
+# Valorile folosite în formularele aplicației
+PROJECT_STATUSES = ["Planificare", "In progres", "Blocat", "Finalizat"]
+TASK_STATUSES = ["Neînceput", "În desfășurare", "Blocat", "Finalizat"]
+PRIORITIES = ["Înaltă", "Medie", "Scăzută"]
+METHODOLOGIES = ["Waterfall", "Agile", "Scrum", "Kanban", "PRINCE2", "PMBOK"]
+RESOURCE_TYPES = ["Uman", "Material", "Financiar", "Tehnic", "Informațional"]
+AVAILABILITY_VALUES = ["Disponibil", "Parțial", "Indisponibil"]
+RISK_PROBABILITIES = ["Mică", "Medie", "Mare"]
+RISK_IMPACTS = ["Mic", "Mediu", "Mare"]
+RISK_STATUSES = ["Identificat", "Monitorizat", "Mitigat", "Realizat"]
+STAKEHOLDER_LEVELS = ["Mic", "Mediu", "Mare"]
+
+
+# Tabelele care aparțin unui proiect
+CHILD_TABLES = ['tasks', 'resources', 'risks', 'stakeholders']
+
+
+def _rebuild_with_cascade(conn, table):
+    """Recreează tabelul cu ON DELETE CASCADE pe cheia externă spre projects"""
+    sql = conn.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name=?", (table,)).fetchone()[0]
+    if 'ON DELETE CASCADE' in sql:
+        return
+
+    new_sql = re.sub(r'REFERENCES projects \(id\)', 'REFERENCES projects (id) ON DELETE CASCADE', sql)
+    new_sql = re.sub(rf'CREATE TABLE {table}\b', f'CREATE TABLE {table}_new', new_sql, count=1)
+    seq = conn.execute("SELECT seq FROM sqlite_sequence WHERE name=?", (table,)).fetchone()
+
+    conn.execute(new_sql)
+    conn.execute(f"INSERT INTO {table}_new SELECT * FROM {table}")
+    conn.execute(f"DROP TABLE {table}")
+    conn.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+    if seq:
+        # Păstrăm contorul AUTOINCREMENT ca id-urile șterse să nu fie refolosite
+        conn.execute("UPDATE sqlite_sequence SET seq=max(seq, ?) WHERE name=?", (seq[0], table))
+
+
+def _migration_1(conn):
+    """Chei externe cu ștergere în cascadă și indexuri pe project_id"""
+    for table in CHILD_TABLES:
+        # Rândurile orfane aparțin unor proiecte deja șterse și ar încălca noua cheie externă
+        conn.execute(f"""DELETE FROM {table} WHERE project_id IS NOT NULL
+                         AND project_id NOT IN (SELECT id FROM projects)""")
+        _rebuild_with_cascade(conn, table)
+
+    # Indexul compus servește și filtrarea simplă după project_id (prefixul indexului)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_project_start ON tasks (project_id, start_date)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_resources_project ON resources (project_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_risks_project ON risks (project_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_stakeholders_project ON stakeholders (project_id)")
+
+
+# Operația înregistrată în jurnal pentru fiecare eveniment și rândul din care se citește id-ul
+CHANGE_EVENTS = {'INSERT': ('insert', 'NEW'), 'UPDATE': ('update', 'NEW'), 'DELETE': ('delete', 'OLD')}
+
+
+def _migration_2(conn):
+    """Jurnalul de modificări, completat de triggere la fiecare scriere"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS change_log (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            entity TEXT NOT NULL,
+            entity_id INTEGER NOT NULL,
+            project_id INTEGER,
+            op TEXT NOT NULL,
+            changed_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))
+        )
+    ''')
+    # Triggerele prind și scrierile din alte procese (CLI, API, importuri) și ștergerile în cascadă
+    for entity, entity_cls in ENTITY_CLASSES.items():
+        table = entity_cls.table
+        project_column = 'id' if table == 'projects' else 'project_id'
+        for event, (op, row) in CHANGE_EVENTS.items():
+            conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS log_{table}_{op} AFTER {event} ON {table}
+                BEGIN
+                    INSERT INTO change_log (entity, entity_id, project_id, op)
+                    VALUES ('{entity}', {row}.id, {row}.{project_column}, '{op}');
+                END
+            """)
+
+
+# Câmpurile indexate pentru căutarea globală: titlul și textele asociate
+SEARCH_FIELDS = {
+    'project': ('name', ['description']),
+    'task': ('name', ['description']),
+    'risk': ('description', ['mitigation_strategy']),
+    'stakeholder': ('name', ['role', 'communication_plan']),
+}
+# rowid-ul din indexul de căutare este id * 8 + codul entității, ca triggerele să găsească rândul direct
+SEARCH_CODES = {'project': 1, 'task': 2, 'risk': 3, 'stakeholder': 4}
+SEARCH_COLUMNS = "rowid, entity, entity_id, project_id, title, body"
+# Titlul cântărește mai mult decât restul textului în scorul bm25
+SEARCH_RANK = "bm25(0, 0, 0, 4.0, 1.0)"
+# Cuvintele mai scurte sunt ignorate: un prefix de o literă se potrivește cu aproape tot textul
+SEARCH_MIN_WORD = 2
+# Scorul este calculat doar pentru cele mai noi potriviri, ca latența să nu crească odată cu baza de date
+SEARCH_WINDOW = 5000
+
+
+def _search_values(entity, row):
+    """Expresiile SQL pentru SEARCH_COLUMNS, citite din rândul dat (NEW sau numele tabelului)"""
+    title, body = SEARCH_FIELDS[entity]
+    project_column = 'id' if entity == 'project' else 'project_id'
+    text = " || char(10) || ".join(f"IFNULL({row}.{column}, '')" for column in body)
+    return (f"{row}.id * 8 + {SEARCH_CODES[entity]}, '{entity}', {row}.id, {row}.{project_column}, "
+            f"{row}.{title}, {text}")
+
+
+def _migration_3(conn):
+    """Index FTS5 pentru căutarea globală, populat din tabele și ținut la zi de triggere"""
+    # remove_diacritics: "desfasurare" găsește și "desfășurare"; prefix: căutare rapidă pe primele litere
+    conn.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+            entity UNINDEXED, entity_id UNINDEXED, project_id UNINDEXED, title, body,
+            tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')
+    """)
+    conn.execute(f"INSERT INTO search_index (search_index, rank) VALUES ('rank', '{SEARCH_RANK}')")
+
+    for entity, (title, body) in SEARCH_FIELDS.items():
+        table = ENTITY_CLASSES[entity].table
+        rowid = f"OLD.id * 8 + {SEARCH_CODES[entity]}"
+        watched = [title] + body + ([] if entity == 'project' else ['project_id'])
+        conn.execute(f"INSERT INTO search_index ({SEARCH_COLUMNS}) SELECT {_search_values(entity, table)} "
+                     f"FROM {table}")
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS search_{table}_insert AFTER INSERT ON {table}
+            BEGIN
+                INSERT INTO search_index ({SEARCH_COLUMNS}) VALUES ({_search_values(entity, 'NEW')});
+            END
+        """)
+        # Doar modificările coloanelor indexate reindexează rândul (nu și progresul sau statusul)
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS search_{table}_update AFTER UPDATE OF {', '.join(watched)} ON {table}
+            BEGIN
+                DELETE FROM search_index WHERE rowid = {rowid};
+                INSERT INTO search_index ({SEARCH_COLUMNS}) VALUES ({_search_values(entity, 'NEW')});
+            END
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS search_{table}_delete AFTER DELETE ON {table}
+            BEGIN
+                DELETE FROM search_index WHERE rowid = {rowid};
+            END
+        """)
+    conn.execute("INSERT INTO search_index (search_index) VALUES ('optimize')")
+
+
+def search_query(text):
+    """Interogarea FTS5 pentru textul introdus: toate cuvintele, fiecare ca prefix"""
+    return " ".join(f'"{word}"*' for word in re.findall(r"\w+", text) if len(word) >= SEARCH_MIN_WORD)
+
+
+def bulk_insert(conn, table, columns, rows):
+    """Inserează rândurile printr-un tabel temporar și un singur INSERT ... SELECT
+
+    FTS5 își scrie bufferul pe disc la finalul fiecărei instrucțiuni: cu un
+    INSERT per rând, triggerele de căutare ar face un segment nou pentru
+    fiecare rând (de ~15 ori mai lent la importuri mari)
+    """
+    names = ", ".join(columns)
+    staging = f"temp.staging_{table}"
+    conn.execute(f"CREATE TEMP TABLE IF NOT EXISTS staging_{table} AS SELECT {names} FROM {table} WHERE 0")
+    conn.execute(f"DELETE FROM {staging}")
+    conn.executemany(f"INSERT INTO {staging} VALUES ({', '.join('?' for _ in columns)})", rows)
+    cursor = conn.execute(f"INSERT INTO {table} ({names}) SELECT {names} FROM {staging} ORDER BY rowid")
+    conn.execute(f"DELETE FROM {staging}")
+    return cursor.rowcount
+
+
+# Formatele acceptate la introducere; în baza de date datele sunt păstrate ca AAAA-LL-ZZ
+DATE_FORMATS = ("%Y-%m-%d", "%d.%m.%Y", "%d/%m/%Y", "%Y/%m/%d")
+# Ziua 0 a coloanelor start_day / end_day, aceeași cu epoca implicită din matplotlib (date2num)
+EPOCH = datetime.date(1970, 1, 1)
+DATE_TABLES = ['projects', 'tasks']
+
+
+def normalize_date(value):
+    """Data în format AAAA-LL-ZZ ("" dacă lipsește); ridică ValueError dacă nu poate fi citită"""
+    text = (value or "").strip() if isinstance(value, str) else ("" if value is None else str(value))
+    if not text:
+        return ""
+    # Datele cu oră (2025-01-06T08:00:00) păstrează doar ziua
+    day = text[:10] if len(text) > 10 and text[10] in 'T ' else text
+    try:
+        return datetime.date.fromisoformat(day).isoformat()
+    except ValueError:
+        pass
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(day, fmt).date().isoformat()
+        except ValueError:
+            pass
+    raise ValueError(f"'{text}' nu este o dată validă (AAAA-LL-ZZ)")
+
+
+def day_number(value):
+    """Numărul zilei (zile de la EPOCH) pentru o dată AAAA-LL-ZZ; None dacă lipsește"""
+    if not value:
+        return None
+    return (datetime.date.fromisoformat(value) - EPOCH).days
+
+
+def _migration_4(conn):
+    """Date normalizate la AAAA-LL-ZZ și coloane numerice start_day / end_day, indexate"""
+    for table in DATE_TABLES:
+        updates = []
+        for row_id, start_date, end_date in conn.execute(f"SELECT id, start_date, end_date FROM {table}"):
+            normalized = []
+            for value in (start_date, end_date):
+                try:
+                    normalized.append(normalize_date(value))
+                except ValueError:
+                    # O dată ilizibilă era afișată oricum ca ziua curentă; rămâne necompletată
+                    normalized.append("")
+            if normalized != [start_date, end_date]:
+                updates.append((*normalized, row_id))
+        conn.executemany(f"UPDATE {table} SET start_date=?, end_date=? WHERE id=?", updates)
+
+        # Coloane generate: rămân corecte și pentru scrierile din afara store-ului
+        for column, source in (('start_day', 'start_date'), ('end_day', 'end_date')):
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} INTEGER GENERATED ALWAYS AS "
+                         f"(CAST(julianday({source}) - julianday('{EPOCH.isoformat()}') AS INTEGER)) VIRTUAL")
+
+    # Termene depășite (end_day < azi) și intervale ("active săptămâna aceasta": end_day >= luni,
+    # start_day <= duminică, filtrat din index); un singur index ține ieftină reprogramarea în masă
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_end_day ON tasks (end_day, start_day)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_projects_end_day ON projects (end_day)")
+
+
+def check_estimates(task):
+    """Estimările optimistă și pesimistă trebuie să încadreze durata (0 = nestabilită)"""
+    optimistic, pessimistic = task.optimistic_duration or 0, task.pessimistic_duration or 0
+    if optimistic < 0 or pessimistic < 0:
+        raise ValueError("Estimările de durată nu pot fi negative!")
+    if optimistic and task.duration and optimistic > task.duration:
+        raise ValueError(f"Estimarea optimistă ({optimistic}) depășește durata ({task.duration})!")
+    if pessimistic and pessimistic < max(task.duration or 0, optimistic):
+        raise ValueError(f"Estimarea pesimistă ({pessimistic}) este sub durata sau estimarea optimistă!")
+
+
+def _migration_5(conn):
+    """Estimări în trei puncte pentru taskuri și efectul cuantificat al riscurilor"""
+    conn.execute("ALTER TABLE tasks ADD COLUMN optimistic_duration INTEGER DEFAULT 0")
+    conn.execute("ALTER TABLE tasks ADD COLUMN pessimistic_duration INTEGER DEFAULT 0")
+    conn.execute("ALTER TABLE risks ADD COLUMN delay_days INTEGER DEFAULT 0")
+    conn.execute("ALTER TABLE risks ADD COLUMN cost_impact REAL DEFAULT 0")
+
+
+# Poziția în matricea de risc; valorile necunoscute contează ca cele mai mici
+RISK_PROBABILITY_SCORES = {"Mică": 1, "Medie": 2, "Mare": 3}
+RISK_IMPACT_SCORES = {"Mic": 1, "Mediu": 2, "Mare": 3}
+# Regulile de clasificare: fiecare nivel cu cel mai mare scor (probabilitate x impact) care îi aparține
+RISK_LEVELS = [("Scăzut", 2), ("Moderat", 4), ("Ridicat", 9)]
+
+
+def _score_sql(column, scores):
+    cases = " ".join(f"WHEN '{label}' THEN {score}" for label, score in scores.items())
+    return f"CASE {column} {cases} ELSE 1 END"
+
+
+def _migration_6(conn):
+    """Scorul numeric al riscurilor, coloană generată și indexată"""
+    conn.execute(f"ALTER TABLE risks ADD COLUMN risk_score INTEGER GENERATED ALWAYS AS "
+                 f"(({_score_sql('probability', RISK_PROBABILITY_SCORES)}) * "
+                 f"({_score_sql('impact', RISK_IMPACT_SCORES)})) VIRTUAL")
+    # "Toate riscurile ridicate (deschise)" devine o parcurgere de interval în index
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_risks_score ON risks (risk_score, status)")
+
+
+# Totalurile WBS ale unui subarbore, adunate din frunze (taskurile fără subtaskuri); fiecare frunză contribuie
+# cu expresiile de mai jos, calculate din rândul ei (ponderea progresului este durata, minim o zi, ca în EVM)
+ROLLUP_TERMS = {
+    'leaves': "1",
+    'weight': "MAX(IFNULL({row}.duration, 0), 1)",
+    'work': "IFNULL({row}.duration, 0)",
+    'earned': "MAX(IFNULL({row}.duration, 0), 1) * IFNULL({row}.progress, 0)",
+    'cost': "IFNULL({row}.cost, 0)",
+}
+
+
+def _chain(node, proper=False):
+    """Strămoșii nodului din tabelul de închidere (cu nodul însuși, dacă proper este fals)"""
+    return f"SELECT ancestor FROM task_tree WHERE descendant = {node}" + (" AND depth > 0" if proper else "")
+
+
+def _add_own(sign, row, node, when="1"):
+    """Adaugă (sign = +) sau scade (-) contribuția rândului row la nodul node și la strămoșii lui"""
+    terms = ", ".join(f"{column} = {column} {sign} {term.format(row=row)}" for column, term in ROLLUP_TERMS.items())
+    return f"UPDATE task_rollups SET {terms} WHERE task_id IN ({_chain(node)}) AND {when};"
+
+
+def _add_change(node):
+    """Aplică lanțului de strămoși diferența dintre contribuția nouă (NEW) și cea veche (OLD) a nodului"""
+    terms = ", ".join(f"{column} = {column} - {term.format(row='OLD')} + {term.format(row='NEW')}"
+                      for column, term in ROLLUP_TERMS.items())
+    return f"UPDATE task_rollups SET {terms} WHERE task_id IN ({_chain(node)});"
+
+
+def _add_task_own(sign, task_id, when="1"):
+    """Ca _add_own, pentru un task citit din tabel (nu mai contează dacă a fost deja șters)"""
+    terms = ", ".join(f"{column} = task_rollups.{column} {sign} {term.format(row='p')}"
+                      for column, term in ROLLUP_TERMS.items())
+    return (f"UPDATE task_rollups SET {terms} FROM tasks AS p "
+            f"WHERE p.id = {task_id} AND task_rollups.task_id IN ({_chain(task_id)}) AND {when};")
+
+
+def _add_subtree(sign, node):
+    """Mută totalurile subarborelui nodului la strămoșii lui (fără nodul însuși)"""
+    terms = ", ".join(f"{column} = task_rollups.{column} {sign} t.{column}" for column in ROLLUP_TERMS)
+    return (f"UPDATE task_rollups SET {terms} FROM task_rollups AS t "
+            f"WHERE t.task_id = {node} AND task_rollups.task_id IN ({_chain(node, proper=True)});")
+
+
+def is_leaf(node):
+    """Condiția SQL: taskul node nu are subtaskuri, deci este un pachet de lucru, nu un task sumar din WBS"""
+    return f"NOT EXISTS (SELECT 1 FROM tasks WHERE parent_id = {node})"
+
+
+def _log_tasks(ids):
+    """Taskurile date (care încă există) ajung în jurnal ca modificate: li s-au schimbat totalurile"""
+    return ("INSERT INTO change_log (entity, entity_id, project_id, op) "
+            f"SELECT 'task', id, project_id, 'update' FROM tasks WHERE id IN ({ids});")
+
+
+def _migration_7(conn):
+    """WBS ierarhic: părintele taskului, tabelul de închidere și totalurile pe subarbori, ținute de triggere"""
+    conn.execute("ALTER TABLE tasks ADD COLUMN parent_id INTEGER REFERENCES tasks (id) ON DELETE CASCADE")
+    conn.execute("ALTER TABLE tasks ADD COLUMN cost REAL DEFAULT 0")
+    # Copiii unui task și rădăcinile unui proiect; servește și ștergerea în cascadă a subarborelui
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_parent ON tasks (parent_id, project_id)")
+    # O pereche (strămoș, descendent) pe nivel, inclusiv (task, task) la adâncimea 0
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS task_tree (
+            ancestor INTEGER NOT NULL,
+            descendant INTEGER NOT NULL,
+            depth INTEGER NOT NULL,
+            PRIMARY KEY (descendant, ancestor)
+        ) WITHOUT ROWID
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_task_tree_ancestor ON task_tree (ancestor, depth)")
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS task_rollups (
+            task_id INTEGER PRIMARY KEY,
+            {', '.join(f"{column} {'INTEGER' if column == 'leaves' else 'REAL'} NOT NULL DEFAULT 0"
+                       for column in ROLLUP_TERMS)}
+        )
+    """)
+    # Taskurile existente sunt toate rădăcini și frunze
+    conn.execute("INSERT INTO task_tree (ancestor, descendant, depth) SELECT id, id, 0 FROM tasks")
+    conn.execute(f"INSERT INTO task_rollups (task_id, {', '.join(ROLLUP_TERMS)}) "
+                 f"SELECT t.id, {', '.join(term.format(row='t') for term in ROLLUP_TERMS.values())} FROM tasks t")
+    _create_wbs_triggers(conn)
+
+
+def _create_wbs_triggers(conn):
+    """Triggerele care țin tabelul de închidere și totalurile WBS.
+
+    Strămoșii ale căror totaluri se schimbă sunt trecuți în jurnal ca 'update', ca să ajungă în
+    interfață; taskul scris apare în jurnal doar prin propriile triggere (insert, update, delete).
+    """
+    # Fiecare modificare actualizează doar lanțul de strămoși al taskului, O(adâncime)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS wbs_tasks_check BEFORE UPDATE OF parent_id ON tasks
+        WHEN NEW.parent_id IS NOT NULL
+        BEGIN
+            SELECT RAISE(ABORT, 'Părintele nu poate fi taskul însuși sau un subtask al lui')
+            WHERE EXISTS (SELECT 1 FROM task_tree WHERE ancestor = NEW.id AND descendant = NEW.parent_id);
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS wbs_tasks_insert AFTER INSERT ON tasks
+        BEGIN
+            INSERT INTO task_tree (ancestor, descendant, depth)
+                SELECT ancestor, NEW.id, depth + 1 FROM task_tree WHERE descendant = NEW.parent_id
+                UNION ALL SELECT NEW.id, NEW.id, 0;
+            INSERT INTO task_rollups (task_id) VALUES (NEW.id);
+            {_add_task_own('-', 'NEW.parent_id',
+                           'NOT EXISTS (SELECT 1 FROM tasks WHERE parent_id = NEW.parent_id AND id != NEW.id)')}
+            {_add_own('+', 'NEW', 'NEW.id')}
+            {_log_tasks(_chain('NEW.id', proper=True))}
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS wbs_tasks_values AFTER UPDATE OF duration, progress, cost ON tasks
+        WHEN (OLD.duration IS NOT NEW.duration OR OLD.progress IS NOT NEW.progress OR OLD.cost IS NOT NEW.cost)
+             AND {is_leaf('NEW.id')}
+        BEGIN
+            {_add_change('NEW.id')}
+            {_log_tasks(_chain('NEW.id', proper=True))}
+        END
+    """)
+    # La mutare se schimbă doar strămoșii care nu sunt comuni vechiului și noului loc
+    old_chain, new_chain = _chain('NEW.id', proper=True), _chain('NEW.parent_id')
+    moved = (f"SELECT * FROM ({old_chain} EXCEPT {new_chain}) "
+             f"UNION ALL SELECT * FROM ({new_chain} EXCEPT {old_chain})")
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS wbs_tasks_move AFTER UPDATE OF parent_id ON tasks
+        WHEN NEW.parent_id IS NOT OLD.parent_id
+        BEGIN
+            {_log_tasks(moved)}
+            {_add_subtree('-', 'NEW.id')}
+            {_add_task_own('+', 'OLD.parent_id', is_leaf('OLD.parent_id'))}
+            DELETE FROM task_tree
+            WHERE descendant IN (SELECT descendant FROM task_tree WHERE ancestor = NEW.id)
+              AND ancestor IN ({_chain('NEW.id', proper=True)});
+            INSERT INTO task_tree (ancestor, descendant, depth)
+                SELECT a.ancestor, d.descendant, a.depth + d.depth + 1
+                FROM task_tree a JOIN task_tree d ON d.ancestor = NEW.id
+                WHERE a.descendant = NEW.parent_id;
+            {_add_task_own('-', 'NEW.parent_id',
+                           'NOT EXISTS (SELECT 1 FROM tasks WHERE parent_id = NEW.parent_id AND id != NEW.id)')}
+            {_add_subtree('+', 'NEW.id')}
+        END
+    """)
+    # Subtaskurile șterse în cascadă își scad singure contribuția. Ștergerile în cascadă rulează înaintea
+    # triggerului părintelui: un părinte rămas fără copii a fost frunză doar dacă încă are o frunză numărată
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS wbs_tasks_delete AFTER DELETE ON tasks
+        BEGIN
+            {_add_own('-', 'OLD', 'OLD.id', is_leaf('OLD.id') +
+                      ' AND (SELECT leaves FROM task_rollups WHERE task_id = OLD.id) > 0')}
+            {_add_task_own('+', 'OLD.parent_id', is_leaf('OLD.parent_id'))}
+            {_log_tasks(_chain('OLD.id', proper=True))}
+            DELETE FROM task_tree WHERE descendant = OLD.id;
+            DELETE FROM task_rollups WHERE task_id = OLD.id;
+        END
+    """)
+
+
+def _migration_8(conn):
+    """Intervalul taskurilor fiecărui proiect, pentru timeline-ul portofoliului"""
+    # Agregarea pe proiect parcurge indexul în ordinea proiectelor, fără sortare; taskurile proiectelor
+    # de pe ecran dintr-o fereastră de timp sunt o căutare pe interval (project_id = ?, start_day <= ?)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_project_span ON tasks (project_id, start_day, end_day)")
+
+
+WBS_TRIGGERS = ['wbs_tasks_check', 'wbs_tasks_insert', 'wbs_tasks_values', 'wbs_tasks_move', 'wbs_tasks_delete']
+
+
+def _migration_9(conn):
+    """Doar strămoșii reali ai taskului scris ajung în jurnal, nu și taskul însuși la inserare sau ștergere"""
+    conn.execute("DROP TRIGGER IF EXISTS log_task_rollups_update")
+    for trigger in WBS_TRIGGERS:
+        conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    _create_wbs_triggers(conn)
+
+
+def _migration_10(conn):
+    """Setările portofoliului (de exemplu pragurile nivelurilor de risc), ca perechi cheie - JSON"""
+    conn.execute("CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+
+def _dependency_edges(row, tables=""):
+    """SELECT cu perechile (task, predecesor) din coloana dependencies, citită ca parse_dependencies"""
+    # JSON invalid sau altceva decât o listă înseamnă fără dependențe; CASE nu evaluează ramurile neatinse
+    source = (f"CASE WHEN json_valid({row}.dependencies) THEN CASE json_type({row}.dependencies) "
+              f"WHEN 'array' THEN {row}.dependencies END END")
+    return (f"SELECT {row}.id, CAST(j.value AS INTEGER) FROM {tables}json_each(IFNULL({source}, '[]')) j "
+            f"WHERE j.type = 'integer' AND j.value >= 0 "
+            f"OR j.type = 'text' AND j.value != '' AND j.value NOT GLOB '*[^0-9]*'")
+
+
+def _migration_11(conn):
+    """Dependențele ca muchii indexate după predecesor, ca reprogramarea să citească doar taskurile din aval"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS task_dependencies (
+            task_id INTEGER NOT NULL REFERENCES tasks (id) ON DELETE CASCADE,
+            depends_on INTEGER NOT NULL,
+            PRIMARY KEY (task_id, depends_on)
+        ) WITHOUT ROWID
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_task_dependencies_on ON task_dependencies (depends_on)")
+    conn.execute(f"INSERT OR IGNORE INTO task_dependencies (task_id, depends_on) "
+                 f"{_dependency_edges('t', 'tasks t, ')}")
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS dependencies_tasks_insert AFTER INSERT ON tasks
+        BEGIN
+            INSERT OR IGNORE INTO task_dependencies (task_id, depends_on) {_dependency_edges('NEW')};
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS dependencies_tasks_update AFTER UPDATE OF dependencies ON tasks
+        WHEN NEW.dependencies IS NOT OLD.dependencies
+        BEGIN
+            DELETE FROM task_dependencies WHERE task_id = NEW.id;
+            INSERT OR IGNORE INTO task_dependencies (task_id, depends_on) {_dependency_edges('NEW')};
+        END
+    """)
+
+
+# MIGRATIONS[i] aduce schema de la versiunea i la versiunea i + 1
+MIGRATIONS = [_migration_1, _migration_2, _migration_3, _migration_4, _migration_5, _migration_6, _migration_7,
+              _migration_8, _migration_9, _migration_10, _migration_11]
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def risk_score(probability, impact):
+    """Scorul riscului, ca în coloana generată risks.risk_score"""
+    return RISK_PROBABILITY_SCORES.get(probability, 1) * RISK_IMPACT_SCORES.get(impact, 1)
+
+
+def compute_risk_level(probability, impact, levels=None):
+    """Calculează nivelul riscului din matricea probabilitate x impact"""
+    score = risk_score(probability, impact)
+    levels = levels or RISK_LEVELS
+    return next((level for level, highest in levels if score <= highest), levels[-1][0])
+
+
+def load_risk_levels(conn):
+    """Pragurile nivelurilor de risc salvate la ultima reclasificare; altfel RISK_LEVELS"""
+    row = conn.execute("SELECT value FROM settings WHERE key = 'risk_levels'").fetchone()
+    return [tuple(level) for level in json.loads(row[0])] if row else list(RISK_LEVELS)
+
+
+def high_risk_score(levels=None):
+    """Scorul minim al unui risc de nivelul cel mai ridicat"""
+    levels = levels or RISK_LEVELS
+    return levels[-2][1] + 1
+
+
+def risk_level_sql(levels=None):
+    """Expresia SQL a nivelului, din risk_score, pentru reclasificarea în masă"""
+    levels = levels or RISK_LEVELS
+    cases = " ".join(f"WHEN risk_score <= {int(highest)} THEN '{level}'" for level, highest in levels[:-1])
+    return f"CASE {cases} ELSE '{levels[-1][0]}' END"
+
+
+class Entity:
+    """Bază comună pentru entitățile persistate"""
+    table = None
+    # Coloanele generate de SQLite: citite împreună cu rândul, dar niciodată scrise
+    generated = ()
+
+    @classmethod
+    def columns(cls):
+        """Coloanele tabelului, în ordinea câmpurilor, fără id și fără coloanele generate"""
+        return [f.name for f in fields(cls) if f.name != 'id' and f.name not in cls.generated]
+
+    @classmethod
+    def from_row(cls, row):
+        """Construiește entitatea dintr-un sqlite3.Row"""
+        return cls(**{key: row[key] for key in row.keys()})
+
+    def values(self):
+        """Valorile coloanelor, în ordinea din columns()"""
+        return tuple(getattr(self, name) for name in self.columns())
+
+
+@dataclass
+class Project(Entity):
+    name: str
+    description: str = ""
+    start_date: str = ""
+    end_date: str = ""
+    budget: float = 0.0
+    status: str = "Planificare"
+    priority: str = "Medie"
+    project_manager: str = ""
+    methodology: str = ""
+    created_date: str = ""
+    id: int = None
+    start_day: int = None   # zile de la EPOCH, calculate de SQLite din start_date
+    end_day: int = None
+
+    table = 'projects'
+    generated = ('start_day', 'end_day')
+
+
+@dataclass
+class Task(Entity):
+    project_id: int
+    name: str
+    description: str = ""
+    start_date: str = ""
+    end_date: str = ""
+    duration: int = 0
+    # Estimările optimistă și pesimistă, în zile (0 = nestabilită); cea mai probabilă este duration
+    optimistic_duration: int = 0
+    pessimistic_duration: int = 0
+    dependencies: str = "[]"
+    assigned_to: str = ""
+    status: str = "Neînceput"
+    progress: int = 0
+    priority: str = "Medie"
+    parent_id: int = None   # taskul părinte din WBS; None pentru nivelul de sus
+    cost: float = 0.0       # costul planificat al pachetului de lucru
+    id: int = None
+    start_day: int = None   # zile de la EPOCH, calculate de SQLite din start_date
+    end_day: int = None
+
+    table = 'tasks'
+    generated = ('start_day', 'end_day')
+
+
+@dataclass
+class Resource(Entity):
+    project_id: int
+    name: str
+    type: str = "Uman"
+    cost_per_unit: float = 0.0
+    quantity: int = 1
+    total_cost: float = 0.0
+    availability: str = "Disponibil"
+    id: int = None
+
+    table = 'resources'
+
+
+@dataclass
+class Risk(Entity):
+    project_id: int
+    description: str
+    probability: str = "Medie"
+    impact: str = "Mediu"
+    delay_days: int = 0         # întârzierea și costul suplimentar dacă riscul se produce
+    cost_impact: float = 0.0
+    risk_level: str = ""
+    mitigation_strategy: str = ""
+    status: str = "Identificat"
+    id: int = None
+    risk_score: int = None  # probabilitate x impact, calculat de SQLite
+
+    table = 'risks'
+    generated = ('risk_score',)
+
+
+@dataclass
+class Stakeholder(Entity):
+    project_id: int
+    name: str
+    role: str = ""
+    influence: str = "Mediu"
+    interest: str = "Mediu"
+    communication_plan: str = ""
+    id: int = None
+
+    table = 'stakeholders'
+
+
+# Numele entităților, ca în jurnalul de modificări, în API și în linia de comandă
+ENTITY_CLASSES = {'project': Project, 'task': Task, 'resource': Resource, 'risk': Risk,
+                  'stakeholder': Stakeholder}
+
+
+@dataclass
+class SearchResult:
+    """Un rezultat al căutării globale"""
+    entity: str
+    entity_id: int
+    project_id: int
+    title: str
+    snippet: str
+    rank: float
+
+
+@dataclass
+class WbsNode:
+    """Un task din WBS cu totalurile subarborelui său (pentru o frunză, valorile proprii)
+
+    Câmpurile taskului sunt accesibile direct (node.name); progress, work și cost sunt cele totalizate.
+    """
+    task: Task
+    leaves: int
+    weight: float
+    work: float
+    earned: float
+    cost: float
+    has_children: bool = False
+
+    @property
+    def id(self):
+        return self.task.id
+
+    @property
+    def progress(self):
+        """Progresul subarborelui, ponderat cu durata frunzelor"""
+        return self.earned / self.weight if self.weight else 0.0
+
+    def __getattr__(self, name):
+        if name == 'task':
+            # Obiect încă neinițializat (copy, pickle)
+            raise AttributeError(name)
+        return getattr(self.task, name)
+
+
+# Sortarea WBS după valorile totalizate, ca în WbsNode; restul coloanelor sunt ale taskului
+WBS_SORT_KEYS = {'work': "r.work", 'progress': "r.earned / r.weight", 'cost': "r.cost"}
+WBS_SELECT = """
+    SELECT t.*, r.leaves, r.weight, r.work, r.earned, r.cost AS rolled_cost,
+           EXISTS (SELECT 1 FROM tasks c WHERE c.parent_id = t.id) AS has_children
+    FROM tasks t JOIN task_rollups r ON r.task_id = t.id
+"""
+
+
+@dataclass
+class Change:
+    """O intrare din jurnalul de modificări"""
+    seq: int
+    entity: str
+    entity_id: int
+    project_id: int
+    op: str
+    changed_at: str
+
+
+class ProjectStore:
+    """Repository pentru proiecte, taskuri, resurse, riscuri și stakeholderi"""
+
+    def __init__(self, path=DB_PATH, config=None):
+        self.engine = StorageEngine(config or StorageConfig(path=path))
+        self.path = self.engine.config.path
+        # Conexiunea de scriere; citirile din alte thread-uri folosesc reader()
+        self.conn = self.engine.writer
+        self.init_schema()
+        self.migrate()
+
+    def close(self):
+        """Închide conexiunile cu baza de date"""
+        self.engine.close()
+
+    def reader(self):
+        """Conexiune de citire din pool, pentru lucru în fundal"""
+        return self.engine.reader()
+
+    @contextmanager
+    def snapshot(self):
+        """Vedere read-only a store-ului pe o conexiune din pool, utilizabilă din alt thread"""
+        with self.engine.reader() as conn:
+            view = copy.copy(self)
+            view.conn = conn
+            yield view
+
+    def init_schema(self):
+        """Creează tabelele dacă nu există"""
+        with self.engine.write():
+            # Tabel proiecte
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS projects (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL,
+                    description TEXT,
+                    start_date TEXT,
+                    end_date TEXT,
+                    budget REAL,
+                    status TEXT,
+                    priority TEXT,
+                    project_manager TEXT,
+                    methodology TEXT,
+                    created_date TEXT
+                )
+            ''')
+
+            # Tabel taskuri/activități
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS tasks (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    project_id INTEGER,
+                    name TEXT NOT NULL,
+                    description TEXT,
+                    start_date TEXT,
+                    end_date TEXT,
+                    duration INTEGER,
+                    dependencies TEXT,
+                    assigned_to TEXT,
+                    status TEXT,
+                    progress INTEGER,
+                    priority TEXT,
+                    FOREIGN KEY (project_id) REFERENCES projects (id)
+                )
+            ''')
+
+            # Tabel resurse
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS resources (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    project_id INTEGER,
+                    name TEXT NOT NULL,
+                    type TEXT,
+                    cost_per_unit REAL,
+                    quantity INTEGER,
+                    total_cost REAL,
+                    availability TEXT,
+                    FOREIGN KEY (project_id) REFERENCES projects (id)
+                )
+            ''')
+
+            # Tabel riscuri
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS risks (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    project_id INTEGER,
+                    description TEXT NOT NULL,
+                    probability TEXT,
+                    impact TEXT,
+                    risk_level TEXT,
+                    mitigation_strategy TEXT,
+                    status TEXT,
+                    FOREIGN KEY (project_id) REFERENCES projects (id)
+                )
+            ''')
+
+            # Tabel stakeholderi
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS stakeholders (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    project_id INTEGER,
+                    name TEXT NOT NULL,
+                    role TEXT,
+                    influence TEXT,
+                    interest TEXT,
+                    communication_plan TEXT,
+                    FOREIGN KEY (project_id) REFERENCES projects (id)
+                )
+            ''')
+
+    def schema_version(self):
+        """Versiunea schemei, păstrată în PRAGMA user_version"""
+        return self.conn.execute("PRAGMA user_version").fetchone()[0]
+
+    def migrate(self):
+        """Aduce o bază de date existentă la ultima versiune a schemei"""
+        version = self.schema_version()
+        if version >= SCHEMA_VERSION:
+            return
+
+        # Reconstruirea tabelelor cere cheile externe dezactivate, iar pragma nu are efect în tranzacție
+        self.conn.execute("PRAGMA foreign_keys = OFF")
+        try:
+            for target, migration in enumerate(MIGRATIONS[version:], start=version + 1):
+                self.conn.execute("BEGIN")
+                try:
+                    migration(self.conn)
+                    if self.conn.execute("PRAGMA foreign_key_check").fetchone():
+                        raise sqlite3.IntegrityError(f"Chei externe invalide după migrarea {target}")
+                    self.conn.execute(f"PRAGMA user_version = {target}")
+                    self.conn.commit()
+                except Exception:
+                    self.conn.rollback()
+                    raise
+        finally:
+            self.conn.execute("PRAGMA foreign_keys = ON")
+
+    # ------------------------------------------------------------------
+    # Operații generice
+    # ------------------------------------------------------------------
+
+    def _get(self, entity_cls, entity_id):
+        """Returnează entitatea cu id-ul dat sau None"""
+        row = self.conn.execute(f"SELECT * FROM {entity_cls.table} WHERE id=?",
+                                (entity_id,)).fetchone()
+        return entity_cls.from_row(row) if row else None
+
+    def _list(self, entity_cls, where="", params=(), order_by="id"):
+        """Returnează entitățile care respectă filtrul"""
+        sql = f"SELECT * FROM {entity_cls.table}"
+        if where:
+            sql += f" WHERE {where}"
+        sql += f" ORDER BY {order_by}"
+        return [entity_cls.from_row(row) for row in self.conn.execute(sql, params)]
+
+    @staticmethod
+    def _keyset(key, id_column, descending, after, clauses, params):
+        """Adaugă condiția paginii următoare și întoarce ORDER BY pentru cheia (key, id)
+
+        key este None pentru sortarea după id.
+        """
+        op, order = ('<', 'DESC') if descending else ('>', 'ASC')
+        if after is not None:
+            if key is None:
+                clauses.append(f"{id_column} {op} ?")
+                params.append(after[1])
+            else:
+                clauses.append(f"({key}, {id_column}) {op} (IFNULL(?, ''), ?)")
+                params.extend(after)
+        return f"{id_column} {order}" if key is None else f"{key} {order}, {id_column} {order}"
+
+    def page(self, entity_cls, project_id=None, sort_column="id", descending=False, after=None, limit=200):
+        """O pagină de entități, cu paginare keyset pe (sort_column, id)
+
+        after este cheia (valoare sortare, id) a ultimului rând din pagina precedentă.
+        """
+        if sort_column != 'id' and sort_column not in entity_cls.columns() + list(entity_cls.generated):
+            raise ValueError(f"Coloană de sortare necunoscută: {sort_column}")
+
+        # IFNULL pe ambele părți ține valorile NULL într-o poziție stabilă la comparare
+        key = None if sort_column == 'id' else f"IFNULL({sort_column}, '')"
+        clauses, params = [], []
+        if project_id is not None:
+            clauses.append("project_id=?")
+            params.append(project_id)
+        order = self._keyset(key, "id", descending, after, clauses, params)
+
+        sql = f"SELECT * FROM {entity_cls.table}"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY {order} LIMIT ?"
+        params.append(limit)
+        return [entity_cls.from_row(row) for row in self.conn.execute(sql, params)]
+
+    def _insert_sql(self, entity_cls):
+        columns = entity_cls.columns()
+        placeholders = ", ".join("?" for _ in columns)
+        return f"INSERT INTO {entity_cls.table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+    def _insert(self, entity):
+        """Inserează entitatea și îi completează id-ul"""
+        with self.engine.write():
+            cursor = self.conn.execute(self._insert_sql(type(entity)), entity.values())
+        entity.id = cursor.lastrowid
+        return entity.id
+
+    def _insert_many(self, entities):
+        """Inserează un lot de entități de același tip într-o singură tranzacție"""
+        entities = list(entities)
+        if not entities:
+            return 0
+        entity_cls = type(entities[0])
+        with self.engine.write():
+            bulk_insert(self.conn, entity_cls.table, entity_cls.columns(), (e.values() for e in entities))
+        return len(entities)
+
+    def _update(self, entity):
+        """Actualizează toate coloanele entității"""
+        columns = entity.columns()
+        assignments = ", ".join(f"{name}=?" for name in columns)
+        with self.engine.write():
+            self.conn.execute(f"UPDATE {entity.table} SET {assignments} WHERE id=?",
+                              entity.values() + (entity.id,))
+
+    @staticmethod
+    def _check_dates(entity):
+        """Normalizează datele la AAAA-LL-ZZ și actualizează start_day / end_day ale obiectului"""
+        try:
+            entity.start_date = normalize_date(entity.start_date)
+            entity.end_date = normalize_date(entity.end_date)
+        except ValueError as e:
+            raise ValueError(f"Dată invalidă: {e}")
+        if entity.start_date and entity.end_date and entity.end_date < entity.start_date:
+            raise ValueError(f"Data de sfârșit ({entity.end_date}) este înaintea datei de început "
+                             f"({entity.start_date})!")
+        entity.start_day = day_number(entity.start_date)
+        entity.end_day = day_number(entity.end_date)
+
+    def _delete(self, entity_cls, entity_id):
+        with self.engine.write():
+            self.conn.execute(f"DELETE FROM {entity_cls.table} WHERE id=?", (entity_id,))
+
+    # ------------------------------------------------------------------
+    # Proiecte
+    # ------------------------------------------------------------------
+
+    def list_projects(self, order_by="id"):
+        """Returnează toate proiectele"""
+        return self._list(Project, order_by=order_by)
+
+    def project_choices(self):
+        """Perechi (id, nume) pentru combobox-uri, ordonate după nume"""
+        return [tuple(row) for row in self.conn.execute("SELECT id, name FROM projects ORDER BY name")]
+
+    def recent_projects(self, limit=3):
+        """Numele ultimelor proiecte create"""
+        rows = self.conn.execute("SELECT name FROM projects ORDER BY created_date DESC LIMIT ?", (limit,))
+        return [row[0] for row in rows]
+
+    def get_project(self, project_id):
+        return self._get(Project, project_id)
+
+    def add_project(self, project):
+        """Salvează un proiect nou și returnează id-ul"""
+        if not project.name:
+            raise ValueError("Numele proiectului este obligatoriu!")
+        self._check_dates(project)
+        if not project.created_date:
+            project.created_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return self._insert(project)
+
+    def add_projects(self, projects):
+        """Încărcare în masă a proiectelor"""
+        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        projects = list(projects)
+        for project in projects:
+            self._check_dates(project)
+            project.created_date = project.created_date or now
+        return self._insert_many(projects)
+
+    def update_project(self, project):
+        if not project.name:
+            raise ValueError("Numele proiectului este obligatoriu!")
+        self._check_dates(project)
+        self._update(project)
+
+    def set_methodology(self, project_id, methodology):
+        with self.engine.write():
+            self.conn.execute("UPDATE projects SET methodology=? WHERE id=?", (methodology, project_id))
+
+    def delete_project(self, project_id):
+        """Șterge proiectul; datele asociate sunt șterse prin ON DELETE CASCADE"""
+        self._delete(Project, project_id)
+
+    def status_summary(self):
+        """Numărul de proiecte și bugetul total pe fiecare status, într-o singură agregare"""
+        rows = self.conn.execute("SELECT status, COUNT(*), TOTAL(budget) FROM projects GROUP BY status")
+        return [tuple(row) for row in rows]
+
+    # ------------------------------------------------------------------
+    # Taskuri
+    # ------------------------------------------------------------------
+
+    def list_tasks(self, project_id, order_by="id"):
+        return self._list(Task, "project_id=?", (project_id,), order_by)
+
+    def gantt_tasks(self, project_id):
+        """Taskurile proiectului ordonate după data de început"""
+        return self.list_tasks(project_id, order_by="start_date")
+
+    def active_tasks(self, start, end, project_id=None):
+        """Taskurile care se desfășoară în cel puțin o zi din intervalul [start, end] (AAAA-LL-ZZ)"""
+        where = "end_day >= ? AND start_day <= ?"
+        params = [day_number(normalize_date(start)), day_number(normalize_date(end))]
+        if project_id is not None:
+            where += " AND project_id = ?"
+            params.append(project_id)
+        return self._list(Task, where, params, order_by="start_day, id")
+
+    def overdue_tasks(self, today=None, project_id=None):
+        """Taskurile nefinalizate al căror termen a trecut, cele mai vechi întâi"""
+        today = normalize_date(today) or datetime.date.today().isoformat()
+        where = "end_day < ? AND IFNULL(status, '') != 'Finalizat'"
+        params = [day_number(today)]
+        if project_id is not None:
+            where += " AND project_id = ?"
+            params.append(project_id)
+        return self._list(Task, where, params, order_by="end_day, id")
+
+    def get_task(self, task_id):
+        return self._get(Task, task_id)
+
+    def schedule(self, project_id):
+        """Graful de dependențe al proiectului, cu drumul critic calculat"""
+        return ScheduleGraph(self.list_tasks(project_id))
+
+    def _check_dependencies(self, task, known):
+        """Dependențele trebuie să fie alte taskuri ale aceluiași proiect (id-urile din known)"""
+        invalid = [d for d in parse_dependencies(task.dependencies) if d not in known or d == task.id]
+        if invalid:
+            raise ValueError(f"Dependențe invalide: {', '.join(map(str, invalid))} "
+                             f"nu sunt alte taskuri ale acestui proiect!")
+
+    def _schedule_tasks(self, task):
+        """Taskurile care depind, direct sau indirect, de task și predecesorii direcți ai tuturor.
+
+        Pentru task sunt folosite dependențele primite, nu cele salvate; task-ul însuși nu este citit.
+        """
+        rows = self.conn.execute("""
+            WITH RECURSIVE downstream (id) AS (
+                SELECT ?
+                UNION SELECT t.id FROM downstream
+                JOIN task_dependencies d ON d.depends_on = downstream.id
+                JOIN tasks t ON t.id = d.task_id AND t.project_id = ?)
+            SELECT * FROM tasks
+            WHERE project_id = ? AND id IS NOT ?
+              AND (id IN downstream
+                   OR id IN (SELECT depends_on FROM task_dependencies
+                             WHERE task_id IN downstream AND task_id IS NOT ?)
+                   OR id IN (SELECT value FROM json_each(?)))
+            ORDER BY id
+        """, (task.id, task.project_id, task.project_id, task.id, task.id,
+              json.dumps(parse_dependencies(task.dependencies))))
+        return [Task.from_row(row) for row in rows]
+
+    def _propagate(self, task):
+        """Validează dependențele taskului și îl reprogramează, împreună cu taskurile din aval.
+
+        Sunt citite doar taskurile din aval și predecesorii lor direcți: numai primele se pot muta,
+        iar un ciclu nou trece obligatoriu prin ele. Datele taskurilor mutate (inclusiv task, dacă
+        începe înaintea sfârșitului unui predecesor) sunt actualizate pe obiecte, dar nu și în baza
+        de date. Întoarce taskurile mutate.
+        """
+        tasks = [task] + self._schedule_tasks(task)
+        self._check_dependencies(task, {t.id for t in tasks})
+        if len(tasks) == 1:
+            return []
+
+        graph = ScheduleGraph(tasks, compute=False)
+        by_id = {t.id: t for t in tasks}
+        moved = [by_id[task_id] for task_id in graph.propagate(task.id)]
+        for moved_task in moved:
+            moved_task.start_date, moved_task.end_date = graph.dates(moved_task.id)
+            self._check_dates(moved_task)
+        return moved
+
+    def add_task(self, task):
+        """Adaugă task-ul; dacă începe înaintea sfârșitului unei dependențe, este mutat după ea.
+
+        Un task nou nu are încă succesori, așa că nu se mută alte taskuri.
+        """
+        if not task.name:
+            raise ValueError("Numele task-ului este obligatoriu!")
+        self._check_dates(task)
+        check_estimates(task)
+        self._check_parent(task)
+        with self.engine.write():
+            self._propagate(task)
+            return self._insert(task)
+
+    def add_tasks(self, tasks):
+        """Încărcare în masă a taskurilor, cu datele primite (fără reprogramarea dependențelor)"""
+        tasks = list(tasks)
+        for task in tasks:
+            self._check_dates(task)
+            check_estimates(task)
+        return self._insert_many(tasks)
+
+    def update_task(self, task):
+        """Salvează task-ul și reprogramează taskurile dependente, într-o singură tranzacție.
+
+        Întoarce taskurile ale căror date au fost mutate (inclusiv task-ul primit,
+        dacă începea înaintea sfârșitului unui predecesor).
+        """
+        if not task.name:
+            raise ValueError("Numele task-ului este obligatoriu!")
+        self._check_dates(task)
+        check_estimates(task)
+        self._check_parent(task)
+
+        with self.engine.write():
+            old = self.get_task(task.id)
+            unchanged = old is None or ((old.start_date, old.end_date, old.dependencies) ==
+                                        (task.start_date, task.end_date, task.dependencies))
+            if unchanged:
+                # Datele și dependențele nu s-au schimbat: nimic de reprogramat
+                self._update(task)
+                return []
+
+            moved = self._propagate(task)
+            self._update(task)
+            self.conn.executemany("UPDATE tasks SET start_date=?, end_date=? WHERE id=?",
+                                  [(t.start_date, t.end_date, t.id) for t in moved if t is not task])
+        return moved
+
+    def delete_task(self, task_id):
+        """Șterge task-ul; subtaskurile lui din WBS sunt șterse prin ON DELETE CASCADE"""
+        self._delete(Task, task_id)
+
+    def _check_parent(self, task):
+        """Părintele din WBS trebuie să fie un task al aceluiași proiect, în afara subarborelui taskului"""
+        if task.parent_id is None:
+            return
+        row = self.conn.execute("SELECT project_id FROM tasks WHERE id=?", (task.parent_id,)).fetchone()
+        if row is None or row[0] != task.project_id:
+            raise ValueError(f"Task-ul părinte {task.parent_id} nu există în acest proiect!")
+        if task.id is not None and self.conn.execute(
+                "SELECT 1 FROM task_tree WHERE ancestor=? AND descendant=?", (task.id, task.parent_id)).fetchone():
+            raise ValueError("Task-ul părinte nu poate fi task-ul însuși sau unul dintre subtaskurile lui!")
+
+    # ------------------------------------------------------------------
+    # WBS
+    # ------------------------------------------------------------------
+
+    def _wbs_nodes(self, where, params, order="t.id", limit=None):
+        sql = f"{WBS_SELECT} WHERE {where} ORDER BY {order}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params = list(params) + [limit]
+        nodes = []
+        for row in self.conn.execute(sql, params):
+            values = dict(zip(row.keys(), row))
+            extra = [values.pop(name) for name in ('leaves', 'weight', 'work', 'earned', 'rolled_cost',
+                                                   'has_children')]
+            nodes.append(WbsNode(Task(**values), *extra[:-1], has_children=bool(extra[-1])))
+        return nodes
+
+    def _wbs_order(self, sort_column, descending, after, clauses, params):
+        if sort_column in WBS_SORT_KEYS:
+            key = WBS_SORT_KEYS[sort_column]
+        elif sort_column == 'id':
+            key = None
+        elif sort_column in Task.columns() + list(Task.generated):
+            key = f"IFNULL(t.{sort_column}, '')"
+        else:
+            raise ValueError(f"Coloană de sortare necunoscută: {sort_column}")
+        return self._keyset(key, "t.id", descending, after, clauses, params)
+
+    def wbs_page(self, project_id, sort_column="id", descending=False, after=None, limit=200):
+        """O pagină din nivelul de sus al WBS-ului, cu paginare keyset ca page()"""
+        clauses, params = ["t.parent_id IS NULL", "t.project_id = ?"], [project_id]
+        order = self._wbs_order(sort_column, descending, after, clauses, params)
+        return self._wbs_nodes(" AND ".join(clauses), params, order, limit)
+
+    def wbs_children(self, parent_id, sort_column="id", descending=False):
+        """Subtaskurile directe ale unui task, cu totalurile lor"""
+        clauses, params = ["t.parent_id = ?"], [parent_id]
+        order = self._wbs_order(sort_column, descending, None, clauses, params)
+        return self._wbs_nodes(" AND ".join(clauses), params, order)
+
+    def wbs_nodes(self, task_ids, ancestors=False):
+        """Nodurile cu id-urile date (și, cu ancestors=True, toți strămoșii lor), cu totalurile la zi"""
+        task_ids = list(task_ids)
+        nodes = []
+        # Loturi sub limita de parametri SQLite
+        for i in range(0, len(task_ids), 500):
+            chunk = task_ids[i:i + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            where = (f"t.id IN (SELECT ancestor FROM task_tree WHERE descendant IN ({placeholders}))" if ancestors
+                     else f"t.id IN ({placeholders})")
+            nodes.extend(self._wbs_nodes(where, chunk))
+        return nodes
+
+    def wbs_path(self, task_id):
+        """Id-urile de la rădăcina WBS până la task (inclusiv)"""
+        rows = self.conn.execute("SELECT ancestor FROM task_tree WHERE descendant=? ORDER BY depth DESC",
+                                 (task_id,))
+        return [row[0] for row in rows]
+
+    # ------------------------------------------------------------------
+    # Timeline portofoliu
+    # ------------------------------------------------------------------
+
+    def project_spans(self):
+        """Câte un rând pe proiect, agregat în SQL, ordonat după început (proiectele fără date la sfârșit)
+
+        Întoarce rânduri (id, nume, status, start_day, end_day, taskuri, progres 0-100). Intervalul
+        este primul început și ultimul sfârșit al taskurilor, altfel datele proiectului; progresul
+        este cel totalizat din WBS.
+        """
+        rows = self.conn.execute("""
+            WITH spans AS (
+                SELECT project_id, MIN(start_day) AS start_day, MAX(end_day) AS end_day, COUNT(*) AS tasks
+                FROM tasks GROUP BY project_id
+            ), progress AS (
+                SELECT t.project_id, TOTAL(r.earned) / TOTAL(r.weight) AS progress
+                FROM tasks t JOIN task_rollups r ON r.task_id = t.id
+                WHERE t.parent_id IS NULL GROUP BY t.project_id
+            )
+            SELECT p.id, p.name, p.status, IFNULL(s.start_day, p.start_day) AS first_day,
+                   IFNULL(s.end_day, p.end_day), IFNULL(s.tasks, 0), IFNULL(g.progress, 0)
+            FROM projects p
+            LEFT JOIN spans s ON s.project_id = p.id
+            LEFT JOIN progress g ON g.project_id = p.id
+            ORDER BY first_day IS NULL, first_day, p.id
+        """)
+        return [tuple(row) for row in rows]
+
+    def timeline_tasks(self, project_ids, first_day, last_day, limit=-1):
+        """Frunzele WBS ale proiectelor date care se suprapun cu zilele [first_day, last_day] (de la EPOCH)
+
+        Întoarce rânduri (id, project_id, nume, status, progres, start_day, end_day), pe proiect
+        și după început; cel mult limit rânduri.
+        """
+        project_ids = list(project_ids)
+        if not project_ids:
+            return []
+        rows = self.conn.execute(f"""
+            SELECT id, project_id, name, status, progress, start_day, end_day FROM tasks t
+            WHERE project_id IN ({', '.join('?' for _ in project_ids)}) AND start_day <= ? AND end_day >= ?
+              AND {is_leaf('t.id')}
+            ORDER BY project_id, start_day, id LIMIT ?
+        """, [*project_ids, last_day, first_day, limit])
+        return [tuple(row) for row in rows]
+
+    # ------------------------------------------------------------------
+    # Resurse
+    # ------------------------------------------------------------------
+
+    def list_resources(self, project_id):
+        return self._list(Resource, "project_id=?", (project_id,))
+
+    def get_resource(self, resource_id):
+        return self._get(Resource, resource_id)
+
+    def add_resource(self, resource):
+        if not resource.name:
+            raise ValueError("Numele resursei este obligatoriu!")
+        resource.total_cost = resource.cost_per_unit * resource.quantity
+        return self._insert(resource)
+
+    def update_resource(self, resource):
+        if not resource.name:
+            raise ValueError("Numele resursei este obligatoriu!")
+        resource.total_cost = resource.cost_per_unit * resource.quantity
+        self._update(resource)
+
+    def delete_resource(self, resource_id):
+        self._delete(Resource, resource_id)
+
+    # ------------------------------------------------------------------
+    # Riscuri
+    # ------------------------------------------------------------------
+
+    def list_risks(self, project_id):
+        return self._list(Risk, "project_id=?", (project_id,))
+
+    def get_risk(self, risk_id):
+        return self._get(Risk, risk_id)
+
+    def add_risk(self, risk):
+        if not risk.description:
+            raise ValueError("Descrierea riscului este obligatorie!")
+        risk.risk_level = compute_risk_level(risk.probability, risk.impact, self.risk_levels())
+        risk.risk_score = risk_score(risk.probability, risk.impact)
+        return self._insert(risk)
+
+    def update_risk(self, risk):
+        if not risk.description:
+            raise ValueError("Descrierea riscului este obligatorie!")
+        risk.risk_level = compute_risk_level(risk.probability, risk.impact, self.risk_levels())
+        risk.risk_score = risk_score(risk.probability, risk.impact)
+        self._update(risk)
+
+    def delete_risk(self, risk_id):
+        self._delete(Risk, risk_id)
+
+    def high_risks(self, min_score=None, open_statuses=None, project_id=None):
+        """Riscurile cu scorul cel puțin min_score (implicit: nivelul cel mai ridicat), cele mai grave întâi
+
+        Filtrul este o căutare de interval în indexul pe (risk_score, status).
+        """
+        if min_score is None:
+            min_score = high_risk_score(self.risk_levels())
+        where, params = "risk_score >= ?", [min_score]
+        if open_statuses:
+            where += f" AND status IN ({', '.join('?' for _ in open_statuses)})"
+            params.extend(open_statuses)
+        if project_id is not None:
+            where += " AND project_id = ?"
+            params.append(project_id)
+        return self._list(Risk, where, params, order_by="risk_score DESC, id")
+
+    def risk_matrix(self, open_statuses=None):
+        """Riscurile din tot portofoliul pe (probabilitate, impact, proiect), într-o singură agregare
+
+        Întoarce rânduri (project_id, probabilitate, impact, riscuri, scor total, cost total).
+        """
+        where, params = "", []
+        if open_statuses:
+            where = f"WHERE status IN ({', '.join('?' for _ in open_statuses)})"
+            params = list(open_statuses)
+        rows = self.conn.execute(f"""
+            SELECT project_id, probability, impact, COUNT(*), TOTAL(risk_score), TOTAL(cost_impact)
+            FROM risks {where} GROUP BY project_id, probability, impact
+        """, params)
+        return [tuple(row) for row in rows]
+
+    def risk_levels(self):
+        """Pragurile curente ale nivelurilor de risc: [(nivel, scorul maxim), ...]"""
+        return load_risk_levels(self.conn)
+
+    def rescore_risks(self, levels=None):
+        """Recalculează nivelul tuturor riscurilor, într-o singură tranzacție.
+
+        Pragurile date sunt salvate și folosite apoi pentru riscurile noi sau modificate, pentru
+        riscurile ridicate și pentru rapoarte; fără ele se aplică pragurile salvate. Întoarce
+        numărul riscurilor al căror nivel s-a schimbat.
+        """
+        with self.engine.write():
+            if levels is None:
+                levels = self.risk_levels()
+            else:
+                levels = [(level, int(highest)) for level, highest in levels]
+                self.conn.execute("INSERT OR REPLACE INTO settings (key, value) VALUES ('risk_levels', ?)",
+                                  (json.dumps(levels, ensure_ascii=False),))
+            level = risk_level_sql(levels)
+            cursor = self.conn.execute(f"UPDATE risks SET risk_level = {level} WHERE risk_level IS NOT {level}")
+        return cursor.rowcount
+
+    # ------------------------------------------------------------------
+    # Căutare
+    # ------------------------------------------------------------------
+
+    def search(self, text, limit=20, entity=None):
+        """Căutare full-text în proiecte, taskuri, riscuri și stakeholderi, ordonată după relevanță.
+
+        Când textul se potrivește cu mai mult de SEARCH_WINDOW rânduri (prefixe scurte,
+        în timpul tastării), sunt ordonate doar cele mai noi SEARCH_WINDOW potriviri.
+        """
+        query = search_query(text)
+        if not query:
+            return []
+        where = "search_index MATCH ?"
+        params = [query]
+        if entity is not None:
+            where += " AND entity = ?"
+            params.append(entity)
+
+        # Găsirea pragului parcurge doar rowid-urile, fără calculul scorului
+        threshold = self.conn.execute(f"SELECT rowid FROM search_index WHERE {where} ORDER BY rowid DESC "
+                                      f"LIMIT 1 OFFSET ?", params + [SEARCH_WINDOW - 1]).fetchone()
+        if threshold is not None:
+            where += " AND rowid >= ?"
+            params.append(threshold[0])
+        sql = f"""SELECT entity, entity_id, project_id, title,
+                         snippet(search_index, 4, '[', ']', '…', 8) AS snippet, rank
+                  FROM search_index WHERE {where} ORDER BY rank LIMIT ?"""
+        return [SearchResult(**dict(row)) for row in self.conn.execute(sql, params + [limit])]
+
+    # ------------------------------------------------------------------
+    # Jurnalul de modificări
+    # ------------------------------------------------------------------
+
+    def last_change(self):
+        """Numărul de secvență al ultimei modificări (0 dacă jurnalul este gol)"""
+        return self.conn.execute("SELECT IFNULL(MAX(seq), 0) FROM change_log").fetchone()[0]
+
+    def first_change(self):
+        """Cea mai veche modificare păstrată; cele dinainte au fost eliminate cu prune_changes()"""
+        row = self.conn.execute("SELECT MIN(seq) FROM change_log").fetchone()
+        return row[0] if row[0] is not None else self.last_change() + 1
+
+    def changes_since(self, seq, limit=None):
+        """Modificările cu număr de secvență mai mare decât seq, în ordine"""
+        sql = "SELECT * FROM change_log WHERE seq > ? ORDER BY seq"
+        params = [seq]
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [Change(**dict(row)) for row in self.conn.execute(sql, params)]
+
+    def changed_entities(self, changes):
+        """Starea curentă a entităților modificate: {(entitate, id): obiect, sau None dacă a fost șters}"""
+        ids = {}
+        for change in changes:
+            ids.setdefault(change.entity, set()).add(change.entity_id)
+
+        result = {}
+        for entity, entity_ids in ids.items():
+            entity_cls = ENTITY_CLASSES[entity]
+            result.update(((entity, entity_id), None) for entity_id in entity_ids)
+            entity_ids = list(entity_ids)
+            # Loturi sub limita de parametri SQLite
+            for i in range(0, len(entity_ids), 500):
+                chunk = entity_ids[i:i + 500]
+                placeholders = ", ".join("?" for _ in chunk)
+                for row in self.conn.execute(f"SELECT * FROM {entity_cls.table} WHERE id IN ({placeholders})",
+                                             chunk):
+                    result[(entity, row['id'])] = entity_cls.from_row(row)
+        return result
+
+    def prune_changes(self, before_seq):
+        """Elimină din jurnal modificările mai vechi decât before_seq; întoarce câte au fost eliminate"""
+        with self.engine.write():
+            return self.conn.execute("DELETE FROM change_log WHERE seq < ?", (before_seq,)).rowcount
+
+    # ------------------------------------------------------------------
+    # Stakeholderi
+    # ------------------------------------------------------------------
+
+    def list_stakeholders(self, project_id):
+        return self._list(Stakeholder, "project_id=?", (project_id,))
+
+    def get_stakeholder(self, stakeholder_id):
+        return self._get(Stakeholder, stakeholder_id)
+
+    def add_stakeholder(self, stakeholder):
+        if not stakeholder.name:
+            raise ValueError("Numele stakeholderului este obligatoriu!")
+        return self._insert(stakeholder)
+
+    def update_stakeholder(self, stakeholder):
+        if not stakeholder.name:
+            raise ValueError("Numele stakeholderului este obligatoriu!")
+        self._update(stakeholder)
+
+    def delete_stakeholder(self, stakeholder_id):
+        self._delete(Stakeholder, stakeholder_id)
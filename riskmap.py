@@ -0,0 +1,90 @@
+"""Harta riscurilor din tot portofoliul: matricea probabilitate x impact și expunerea pe proiecte.
+
+Matricea și expunerea vin din aceeași agregare SQL, grupată pe (proiect,
+probabilitate, impact), deci cel mult nouă rânduri pe proiect, indiferent
+de numărul riscurilor. Scorul unui risc este coloana generată risk_score
+(probabilitate x impact, 1-9); nivelurile (Scăzut, Moderat, Ridicat) folosesc
+pragurile salvate de store la ultima reclasificare (implicit RISK_LEVELS).
+"""
+from dataclasses import dataclass
+
+from project_store import RISK_PROBABILITIES, RISK_IMPACTS, RISK_LEVELS, compute_risk_level, risk_score
+
+LEVEL_COLORS = {"Scăzut": '#27ae60', "Moderat": '#f39c12', "Ridicat": '#e74c3c'}
+
+
+@dataclass
+class ProjectExposure:
+    project_id: int
+    name: str
+    risks: int = 0
+    high: int = 0           # riscuri cu nivelul cel mai ridicat
+    score: float = 0.0      # suma scorurilor
+    cost: float = 0.0       # suma costurilor suplimentare dacă riscurile se produc
+
+
+@dataclass
+class RiskMap:
+    counts: list            # probabilități (de la mică la mare) x impacturi
+    exposure: list          # ProjectExposure, cea mai mare expunere întâi
+    other: int = 0          # riscuri cu probabilitate sau impact în afara valorilor din formular
+    levels: list = None     # pragurile nivelurilor; None = RISK_LEVELS
+
+    @property
+    def total(self):
+        return sum(map(sum, self.counts)) + self.other
+
+
+def build_map(rows, names, levels=None):
+    """Harta din rândurile store.risk_matrix(), numele proiectelor (id -> nume) și pragurile nivelurilor"""
+    levels = levels or RISK_LEVELS
+    counts = [[0] * len(RISK_IMPACTS) for _ in RISK_PROBABILITIES]
+    other = 0
+    exposure = {}
+    high = levels[-1][0]
+    for project_id, probability, impact, count, score, cost in rows:
+        if probability in RISK_PROBABILITIES and impact in RISK_IMPACTS:
+            counts[RISK_PROBABILITIES.index(probability)][RISK_IMPACTS.index(impact)] += count
+        else:
+            other += count
+        item = exposure.get(project_id)
+        if item is None:
+            item = exposure[project_id] = ProjectExposure(project_id, names.get(project_id, f"#{project_id}"))
+        item.risks += count
+        item.score += score
+        item.cost += cost
+        if compute_risk_level(probability, impact, levels) == high:
+            item.high += count
+    ordered = sorted(exposure.values(), key=lambda e: (-e.high, -e.score, e.project_id))
+    return RiskMap(counts=counts, exposure=ordered, other=other, levels=levels)
+
+
+def risk_map(store, open_statuses=None):
+    """Harta riscurilor din tot portofoliul; doar riscurile cu aceste statusuri, dacă sunt date"""
+    with store.snapshot() as view:
+        names = dict(view.project_choices())
+        rows = view.risk_matrix(open_statuses)
+        levels = view.risk_levels()
+    return build_map(rows, names, levels)
+
+
+def draw_heat_map(ax, result):
+    """Matricea probabilitate x impact: culoarea celulei este nivelul, textul numărul de riscuri"""
+    from matplotlib.colors import ListedColormap
+
+    thresholds = result.levels or RISK_LEVELS
+    levels = [level for level, _ in thresholds]
+    cells = [[levels.index(compute_risk_level(probability, impact, thresholds)) for impact in RISK_IMPACTS]
+             for probability in RISK_PROBABILITIES]
+    ax.clear()
+    ax.imshow(cells, cmap=ListedColormap([LEVEL_COLORS.get(level, '#95a5a6') for level in levels]),
+              vmin=0, vmax=len(levels) - 1, origin='lower', alpha=0.8)
+    for i, probability in enumerate(RISK_PROBABILITIES):
+        for j, impact in enumerate(RISK_IMPACTS):
+            ax.text(j, i, f"{result.counts[i][j]}\n(scor {risk_score(probability, impact)})",
+                    ha='center', va='center', fontsize=10, fontweight='bold', color='white')
+    ax.set_xticks(range(len(RISK_IMPACTS)), RISK_IMPACTS)
+    ax.set_yticks(range(len(RISK_PROBABILITIES)), RISK_PROBABILITIES)
+    ax.set_xlabel("Impact")
+    ax.set_ylabel("Probabilitate")
+    ax.set_title(f"Matricea riscurilor ({result.total} riscuri)")
@@ -0,0 +1,338 @@
+"""Graful de dependențe dintre taskuri și metoda drumului critic (CPM).
+
+Dependențele unui task sunt păstrate în coloana tasks.dependencies, ca listă
+JSON cu id-urile predecesorilor din același proiect. Graful este construit în
+memorie, sortat topologic (algoritmul lui Kahn) și parcurs o dată înainte și o
+dată înapoi, în timp liniar în numărul de taskuri și dependențe. Când datele
+unui task se schimbă, sunt reprogramate doar taskurile din aval care chiar se
+mută. Modulul nu depinde de tkinter, matplotlib sau NumPy.
+"""
+import json
+import heapq
+import datetime
+from dataclasses import dataclass
+
+# Rezervele (slack) mai mici decât această toleranță sunt considerate zero
+EPSILON = 1e-9
+# Ordinalul zilei 0 din coloanele start_day / end_day (1970-01-01)
+EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+
+class CycleError(ValueError):
+    """Dependențele formează un ciclu; `cycle` conține id-urile taskurilor din ciclu"""
+
+    def __init__(self, cycle):
+        self.cycle = cycle
+        super().__init__("Dependențele formează un ciclu: " + " → ".join(str(i) for i in cycle + cycle[:1]))
+
+
+@dataclass
+class TaskTiming:
+    early_start: float
+    early_finish: float
+    late_start: float
+    late_finish: float
+
+    @property
+    def slack(self):
+        return self.late_start - self.early_start
+
+    @property
+    def critical(self):
+        return self.slack <= EPSILON
+
+
+def parse_dependencies(value):
+    """Id-urile din coloana dependencies; valorile invalide sunt ignorate"""
+    if not value:
+        return []
+    try:
+        ids = json.loads(value)
+    except (TypeError, ValueError):
+        return []
+    if not isinstance(ids, list):
+        return []
+    return [int(i) for i in ids if str(i).isdigit()]
+
+
+def parse_dependency_input(text):
+    """Convertește textul din formular ("3, 7 12") în lista JSON pentru coloana dependencies"""
+    ids = []
+    for part in (text or "").replace(',', ' ').split():
+        if not part.isdigit():
+            raise ValueError(f"Dependența '{part}' nu este un ID de task valid!")
+        ids.append(int(part))
+    return json.dumps(list(dict.fromkeys(ids)))
+
+
+def format_dependencies(value):
+    """Textul afișat în formular pentru coloana dependencies"""
+    return ", ".join(str(i) for i in parse_dependencies(value))
+
+
+def date_span(task):
+    """Datele taskului ca ordinale (start, end); (None, None) dacă lipsesc sau sunt invalide"""
+    start_day, end_day = getattr(task, 'start_day', None), getattr(task, 'end_day', None)
+    if start_day is not None and end_day is not None:
+        # Coloanele numerice citite din baza de date: fără parsarea șirurilor
+        return start_day + EPOCH_ORDINAL, end_day + EPOCH_ORDINAL
+    try:
+        return (datetime.date.fromisoformat(task.start_date).toordinal(),
+                datetime.date.fromisoformat(task.end_date).toordinal())
+    except (TypeError, ValueError):
+        return None, None
+
+
+def task_duration(task):
+    """Durata în zile folosită de CPM: coloana duration sau, dacă lipsește, intervalul dintre date"""
+    if task.duration:
+        return max(float(task.duration), 0.0)
+    start, end = date_span(task)
+    if start is None:
+        return 0.0
+    return float(max(end - start, 0))
+
+
+def topological_order(preds, succs):
+    """Ordinea topologică a nodurilor 0..n-1 (Kahn); ridică CycleError cu indicii unui ciclu"""
+    indegree = [len(p) for p in preds]
+    order = [i for i, degree in enumerate(indegree) if degree == 0]
+    for v in order:
+        for w in succs[v]:
+            indegree[w] -= 1
+            if indegree[w] == 0:
+                order.append(w)
+
+    if len(order) < len(preds):
+        # Orice nod rămas are un predecesor rămas: mergând înapoi pe ele ajungem într-un ciclu
+        v = next(i for i, degree in enumerate(indegree) if degree > 0)
+        seen = {}
+        while v not in seen:
+            seen[v] = len(seen)
+            v = next(p for p in preds[v] if indegree[p] > 0)
+        cycle = list(seen)[seen[v]:]
+        raise CycleError(cycle[::-1])
+    return order
+
+
+class ScheduleGraph:
+    """DAG-ul taskurilor unui proiect, cu timpii CPM calculați în zile de la începutul proiectului.
+
+    Cu compute=False graful este doar sortat, pentru propagarea datelor pe o parte a proiectului.
+    """
+
+    def __init__(self, tasks, compute=True):
+        self.ids = [t.id for t in tasks]
+        self.index = {task_id: i for i, task_id in enumerate(self.ids)}
+        self.duration = [task_duration(t) for t in tasks]
+        spans = [date_span(t) for t in tasks]
+        self.start = [span[0] for span in spans]
+        self.end = [span[1] for span in spans]
+        self.preds = [[] for _ in self.ids]
+        self.succs = [[] for _ in self.ids]
+        for i, task in enumerate(tasks):
+            self._link(i, parse_dependencies(task.dependencies))
+        self._sort()
+        if compute:
+            self.compute()
+
+    def _link(self, i, dependency_ids):
+        # Dependențele spre taskuri din afara proiectului sau șterse sunt ignorate
+        for j in dict.fromkeys(self.index[d] for d in dependency_ids if d in self.index):
+            if j != i:
+                self.preds[i].append(j)
+                self.succs[j].append(i)
+
+    def _sort(self):
+        try:
+            self.order = topological_order(self.preds, self.succs)
+        except CycleError as e:
+            raise CycleError([self.ids[i] for i in e.cycle]) from None
+        self.position = [0] * len(self.order)
+        for pos, i in enumerate(self.order):
+            self.position[i] = pos
+
+    def compute(self):
+        """Parcurgerea completă înainte (ES/EF) și înapoi (LS/LF)"""
+        n = len(self.ids)
+        self.es = [0.0] * n
+        self.ef = [0.0] * n
+        for v in self.order:
+            start = max((self.ef[p] for p in self.preds[v]), default=0.0)
+            self.es[v] = start
+            self.ef[v] = start + self.duration[v]
+        self.finish = max(self.ef, default=0.0)
+        self._backward_all()
+
+    def _backward_all(self):
+        n = len(self.ids)
+        self.ls = [0.0] * n
+        self.lf = [0.0] * n
+        for v in reversed(self.order):
+            finish = min((self.ls[s] for s in self.succs[v]), default=self.finish)
+            self.lf[v] = finish
+            self.ls[v] = finish - self.duration[v]
+
+    def _forward_from(self, seed):
+        """Recalculează ES/EF doar pentru seed și succesorii ale căror valori se schimbă"""
+        heap = [self.position[seed]]
+        queued = {seed}
+        while heap:
+            v = self.order[heapq.heappop(heap)]
+            queued.discard(v)
+            start = max((self.ef[p] for p in self.preds[v]), default=0.0)
+            finish = start + self.duration[v]
+            if start == self.es[v] and finish == self.ef[v]:
+                continue
+            self.es[v] = start
+            self.ef[v] = finish
+            for w in self.succs[v]:
+                if w not in queued:
+                    queued.add(w)
+                    heapq.heappush(heap, self.position[w])
+
+    def _backward_from(self, seed):
+        """Recalculează LS/LF doar pentru seed și predecesorii ale căror valori se schimbă"""
+        heap = [-self.position[seed]]
+        queued = {seed}
+        while heap:
+            v = self.order[-heapq.heappop(heap)]
+            queued.discard(v)
+            finish = min((self.ls[s] for s in self.succs[v]), default=self.finish)
+            start = finish - self.duration[v]
+            if start == self.ls[v] and finish == self.lf[v]:
+                continue
+            self.ls[v] = start
+            self.lf[v] = finish
+            for p in self.preds[v]:
+                if p not in queued:
+                    queued.add(p)
+                    heapq.heappush(heap, -self.position[p])
+
+    def set_duration(self, task_id, duration):
+        """Actualizare incrementală după modificarea duratei unui singur task"""
+        v = self.index[task_id]
+        duration = max(float(duration), 0.0)
+        if duration == self.duration[v]:
+            return
+        self.duration[v] = duration
+        self._forward_from(v)
+
+        finish = max(self.ef, default=0.0)
+        if finish != self.finish:
+            # S-a mutat sfârșitul proiectului: se schimbă LF pentru toate taskurile finale
+            self.finish = finish
+            self._backward_all()
+        else:
+            self._backward_from(v)
+
+    def set_dependencies(self, task_id, dependency_ids):
+        """Înlocuiește predecesorii unui task; graful este resortat și recalculat"""
+        v = self.index[task_id]
+        old_preds = self.preds[v]
+        for p in old_preds:
+            self.succs[p].remove(v)
+        self.preds[v] = []
+        self._link(v, dependency_ids)
+        try:
+            self._sort()
+        except CycleError:
+            # Graful rămâne cum era înainte de modificare
+            for p in self.preds[v]:
+                self.succs[p].remove(v)
+            self.preds[v] = old_preds
+            for p in old_preds:
+                self.succs[p].append(v)
+            raise
+        self.compute()
+
+    def update_task(self, task):
+        """Aplică modificarea unui task existent; întoarce False dacă task-ul nu e în graf"""
+        v = self.index.get(task.id)
+        if v is None:
+            return False
+        self.start[v], self.end[v] = date_span(task)
+        dependency_ids = parse_dependencies(task.dependencies)
+        if {self.index[d] for d in dependency_ids if d in self.index} - {v} != set(self.preds[v]):
+            self.duration[v] = task_duration(task)
+            self.set_dependencies(task.id, dependency_ids)
+        else:
+            self.set_duration(task.id, task_duration(task))
+        return True
+
+    def _shift(self, v):
+        """Mută taskul v după cel mai târziu predecesor, dacă începe prea devreme"""
+        if self.start[v] is None:
+            return False
+        latest = max((self.end[p] for p in self.preds[v] if self.end[p] is not None), default=None)
+        if latest is None or latest <= self.start[v]:
+            return False
+        shift = latest - self.start[v]
+        self.start[v] += shift
+        self.end[v] += shift
+        return True
+
+    def propagate(self, task_id):
+        """Reprogramează taskul modificat și taskurile din aval, dependență finish-to-start.
+
+        Sunt vizitați, în ordine topologică, doar succesorii taskurilor care se
+        mută; fiecare task mutat își păstrează intervalul. Taskurile nu sunt trase
+        mai devreme, astfel încât pauzele planificate manual rămân. Întoarce
+        id-urile taskurilor mutate.
+        """
+        return self.propagate_many([task_id])
+
+    def propagate_many(self, task_ids):
+        """Ca propagate, pentru mai multe taskuri modificate deodată (de exemplu cele importate)"""
+        seeds = {self.index[task_id] for task_id in task_ids}
+        heap = [self.position[v] for v in seeds]
+        heapq.heapify(heap)
+        queued = set(seeds)
+        moved = []
+        while heap:
+            v = self.order[heapq.heappop(heap)]
+            if self._shift(v):
+                moved.append(self.ids[v])
+            elif v not in seeds:
+                continue
+            # Succesorii unui task modificat sunt verificați chiar dacă el nu s-a mutat
+            for w in self.succs[v]:
+                if w not in queued:
+                    queued.add(w)
+                    heapq.heappush(heap, self.position[w])
+        return moved
+
+    def dates(self, task_id):
+        """Datele curente ale taskului, ca șiruri YYYY-MM-DD"""
+        v = self.index[task_id]
+        if self.start[v] is None:
+            return None, None
+        return (datetime.date.fromordinal(self.start[v]).isoformat(),
+                datetime.date.fromordinal(self.end[v]).isoformat())
+
+    def timing(self, task_id):
+        v = self.index[task_id]
+        return TaskTiming(self.es[v], self.ef[v], self.ls[v], self.lf[v])
+
+    def is_critical(self, task_id):
+        v = self.index[task_id]
+        return self.ls[v] - self.es[v] <= EPSILON
+
+    def critical_ids(self):
+        """Toate taskurile cu rezervă zero, în ordine topologică"""
+        return [self.ids[v] for v in self.order if self.ls[v] - self.es[v] <= EPSILON]
+
+    def critical_path(self):
+        """Un lanț de taskuri critice, de la începutul până la sfârșitul proiectului"""
+        if not self.ids:
+            return []
+        v = max(self.order, key=lambda i: (self.ef[i], -self.position[i]))
+        path = [v]
+        while True:
+            previous = [p for p in self.preds[v]
+                        if self.ls[p] - self.es[p] <= EPSILON and self.ef[p] == self.es[v]]
+            if not previous:
+                break
+            v = previous[0]
+            path.append(v)
+        return [self.ids[i] for i in reversed(path)]
@@ -0,0 +1,125 @@
+"""Motorul de stocare SQLite: o conexiune de scriere și un pool de conexiuni de citire.
+
+În modul WAL cititorii nu blochează scriitorul și nici invers, așa că
+aplicația, scripturile de raportare și thread-urile de fundal pot lucra
+simultan pe același fișier fără erori "database is locked".
+"""
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+DB_PATH = 'project_management.db'
+
+
+@dataclass
+class StorageConfig:
+    path: str = DB_PATH
+    journal_mode: str = 'WAL'
+    # NORMAL în WAL: commit-ul nu mai face fsync, doar checkpoint-ul
+    synchronous: str = 'NORMAL'
+    cache_size_kib: int = 64 * 1024
+    mmap_size: int = 256 * 1024 * 1024
+    busy_timeout_ms: int = 5000
+    read_pool_size: int = 4
+
+    @classmethod
+    def legacy(cls, path=DB_PATH):
+        """Setările implicite SQLite, folosite înainte de motorul de stocare"""
+        return cls(path=path, journal_mode='DELETE', synchronous='FULL', cache_size_kib=2000,
+                   mmap_size=0)
+
+
+class StorageEngine:
+    """Deține conexiunea unică de scriere și pool-ul de conexiuni de citire"""
+
+    def __init__(self, config=None):
+        self.config = config or StorageConfig()
+        self._write_lock = threading.RLock()
+        self._write_depth = 0
+        self._readers = queue.Queue()
+        self._reader_count = 0
+        self._reader_lock = threading.Lock()
+        self._closed = False
+        self.writer = self._connect()
+        self.writer.execute(f"PRAGMA journal_mode = {self.config.journal_mode}")
+
+    def _connect(self, readonly=False):
+        """Deschide o conexiune cu pragma-urile din configurație"""
+        conn = sqlite3.connect(self.config.path, timeout=self.config.busy_timeout_ms / 1000,
+                               check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA busy_timeout = {int(self.config.busy_timeout_ms)}")
+        conn.execute(f"PRAGMA synchronous = {self.config.synchronous}")
+        conn.execute(f"PRAGMA cache_size = -{int(self.config.cache_size_kib)}")
+        conn.execute(f"PRAGMA mmap_size = {int(self.config.mmap_size)}")
+        conn.execute("PRAGMA foreign_keys = ON")
+        if readonly:
+            conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    @contextmanager
+    def write(self):
+        """Tranzacție pe conexiunea de scriere; scrierile sunt serializate între thread-uri.
+
+        Un write() imbricat în același thread face parte din tranzacția exterioară.
+        """
+        with self._write_lock:
+            if self._write_depth:
+                self._write_depth += 1
+                try:
+                    yield self.writer
+                finally:
+                    self._write_depth -= 1
+                return
+
+            self._write_depth = 1
+            try:
+                with self.writer:
+                    yield self.writer
+            finally:
+                self._write_depth = 0
+
+    @contextmanager
+    def reader(self):
+        """Împrumută o conexiune de citire din pool"""
+        conn = self._acquire_reader()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            if self._closed:
+                conn.close()
+            else:
+                self._readers.put(conn)
+
+    def _acquire_reader(self):
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._reader_lock:
+            if self._reader_count < self.config.read_pool_size:
+                self._reader_count += 1
+                return self._connect(readonly=True)
+        return self._readers.get(timeout=self.config.busy_timeout_ms / 1000)
+
+    def checkpoint(self):
+        """Mută paginile din fișierul WAL în baza de date principală"""
+        if self.config.journal_mode.upper() == 'WAL':
+            with self._write_lock:
+                self.writer.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close(self):
+        """Închide toate conexiunile"""
+        self._closed = True
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._write_lock:
+            self.writer.close()
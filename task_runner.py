@@ -0,0 +1,127 @@
+"""Execuția în fundal a interogărilor și a pregătirii graficelor.
+
+Tk nu este thread-safe: thread-urile de lucru nu ating widget-urile, ci pun
+rezultatele într-o coadă pe care thread-ul principal o golește periodic prin
+root.after. Fiecare cerere are o cheie; o cerere nouă cu aceeași cheie o face
+învechită pe cea precedentă, iar rezultatul acesteia este ignorat.
+Rezultatele mari pot fi livrate progresiv, element cu element, prin stream().
+"""
+import time
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+# ~un cadru la 60 Hz
+POLL_INTERVAL_MS = 16
+# Cât timp poate consuma o golire a cozii, ca interfața să rămână receptivă
+POLL_BUDGET_S = 0.008
+
+
+class TaskRunner:
+    """Rulează funcții în fundal și livrează rezultatele în thread-ul Tk"""
+
+    def __init__(self, root, max_workers=2, on_busy_change=None):
+        self.root = root
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='pm-worker')
+        self.on_busy_change = on_busy_change
+        self._results = queue.Queue()
+        self._generations = {}
+        self._futures = {}
+        self._pending = 0
+        self._polling = False
+
+    @property
+    def busy(self):
+        return self._pending > 0
+
+    def submit(self, key, work, on_done=None, on_error=None):
+        """Rulează work() în fundal; on_done(rezultat) este apelat în thread-ul Tk"""
+        return self._submit(key, lambda generation: work(), on_done, on_error)
+
+    def _submit(self, key, work, on_done, on_error):
+        self.cancel(key)
+        generation = self._generations.get(key, 0) + 1
+        self._generations[key] = generation
+
+        future = self.executor.submit(work, generation)
+        self._futures[key] = future
+        self._set_pending(self._pending + 1)
+        future.add_done_callback(
+            lambda f: self._results.put(('done', key, generation, f, on_done, on_error)))
+
+        if not self._polling:
+            self._polling = True
+            self.root.after(POLL_INTERVAL_MS, self._poll)
+        return future
+
+    def stream(self, key, items, on_item, on_done=None, on_error=None):
+        """Parcurge în fundal iterabilul întors de items(); on_item(element) este apelat
+        în thread-ul Tk pentru fiecare element, în ordine, iar on_done(număr) la final"""
+        def work(generation):
+            iterator = iter(items())
+            count = 0
+            try:
+                for item in iterator:
+                    # O cerere nouă sau cancel() opresc producerea elementelor
+                    if self._generations.get(key) != generation:
+                        break
+                    self._results.put(('item', key, generation, item, on_item))
+                    count += 1
+            finally:
+                close = getattr(iterator, 'close', None)
+                if close:
+                    close()
+            return count
+
+        return self._submit(key, work, on_done, on_error)
+
+    def cancel(self, key):
+        """Renunță la cererea în curs pentru cheia dată"""
+        future = self._futures.pop(key, None)
+        if future is not None:
+            # Dacă a pornit deja, rezultatul va fi ignorat la livrare
+            future.cancel()
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def _poll(self):
+        deadline = time.perf_counter() + POLL_BUDGET_S
+        while time.perf_counter() < deadline:
+            try:
+                message = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            if message[0] == 'item':
+                _, key, generation, item, on_item = message
+                if generation == self._generations.get(key):
+                    on_item(item)
+                continue
+
+            _, key, generation, future, on_done, on_error = message
+            self._set_pending(self._pending - 1)
+            if generation != self._generations.get(key) or future.cancelled():
+                continue
+            self._futures.pop(key, None)
+
+            error = future.exception()
+            if error is None:
+                if on_done:
+                    on_done(future.result())
+            elif on_error:
+                on_error(error)
+            else:
+                self.root.report_callback_exception(type(error), error, error.__traceback__)
+
+        if self._pending > 0 or not self._results.empty():
+            self.root.after(POLL_INTERVAL_MS, self._poll)
+        else:
+            self._polling = False
+
+    def _set_pending(self, value):
+        was_busy = self.busy
+        self._pending = value
+        if self.on_busy_change and was_busy != self.busy:
+            self.on_busy_change(self.busy)
+
+    def shutdown(self):
+        """Oprește thread-urile de lucru fără a aștepta cererile în curs"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
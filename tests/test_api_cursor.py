@@ -0,0 +1,58 @@
+"""Cursorul de paginare al API-ului: formele invalide sunt refuzate cu 400, nu ajung în SQL.
+
+    python -m unittest discover tests
+"""
+import os
+import sys
+import json
+import base64
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api_server import Api, encode_cursor  # noqa: E402
+from project_store import ProjectStore, Project  # noqa: E402
+
+
+def raw_cursor(text):
+    return base64.urlsafe_b64encode(text.encode()).decode().rstrip('=')
+
+
+class CursorTest(unittest.TestCase):
+    def setUp(self):
+        self.workdir = tempfile.TemporaryDirectory()
+        self.store = ProjectStore(os.path.join(self.workdir.name, "api.db"))
+        self.store.add_projects(Project(name=f"Proiect {i}") for i in range(5))
+        self.api = Api(self.store)
+
+    def tearDown(self):
+        self.store.close()
+        self.workdir.cleanup()
+
+    def get(self, target):
+        status, body, _ = self.api.handle('GET', target, {}, b'')
+        return status, json.loads(body) if body else None
+
+    def test_next_cursor_returns_following_page(self):
+        status, first = self.get('/projects?limit=2&sort=name')
+        self.assertEqual(status, 200)
+        status, second = self.get(f"/projects?limit=2&sort=name&after={first['next']}")
+        self.assertEqual(status, 200)
+        self.assertEqual([p['name'] for p in second['items']], ["Proiect 2", "Proiect 3"])
+
+    def test_malformed_cursors_are_rejected(self):
+        cursors = ['%%%', 'not-base64!', raw_cursor('{"a": 1, "b": 2}'), raw_cursor('"ab"'),
+                   raw_cursor('[1, 2, 3]'), raw_cursor('[[1], 2]'), raw_cursor('[{"x": 1}, 2]'),
+                   raw_cursor('["a", "2"]'), raw_cursor('["a", true]'), raw_cursor('["a", 1.5]'),
+                   raw_cursor(f'["a", {2 ** 70}]'), raw_cursor(f'[{2 ** 70}, 1]'),
+                   encode_cursor(["listă"], 1)]
+        for cursor in cursors:
+            with self.subTest(cursor=cursor):
+                status, body = self.get(f'/projects?sort=name&after={cursor}')
+                self.assertEqual(status, 400)
+                self.assertIn('error', body)
+
+
+if __name__ == "__main__":
+    unittest.main()
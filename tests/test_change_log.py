@@ -0,0 +1,91 @@
+"""Jurnalul de modificări pentru taskurile din WBS: ordinea și strămoșii trecuți ca 'update'.
+
+    python -m unittest discover tests
+"""
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_store import ProjectStore, Project, Task  # noqa: E402
+
+
+class NestedTaskChangeLogTest(unittest.TestCase):
+    def setUp(self):
+        self.workdir = tempfile.TemporaryDirectory()
+        self.store = ProjectStore(os.path.join(self.workdir.name, "changes.db"))
+        self.project_id = self.store.add_project(Project(name="WBS"))
+        self.root = self.add("Rădăcină")
+        self.parent = self.add("Părinte", self.root)
+        self.other = self.add("Alt părinte", self.root)
+
+    def tearDown(self):
+        self.store.close()
+        self.workdir.cleanup()
+
+    def add(self, name, parent_id=None, duration=5):
+        return self.store.add_task(Task(project_id=self.project_id, name=name, parent_id=parent_id,
+                                        duration=duration))
+
+    def changes_after(self, func):
+        seq = self.store.last_change()
+        func()
+        return [(change.entity_id, change.op) for change in self.store.changes_since(seq)
+                if change.entity == 'task']
+
+    def ops(self, changes, task_id):
+        return [op for entity_id, op in changes if entity_id == task_id]
+
+    def test_nested_task_lifecycle_in_order(self):
+        seq = self.store.last_change()
+        child = self.add("Subtask", self.parent)
+        task = self.store.get_task(child)
+        task.progress = 60
+        self.store.update_task(task)
+        self.store.delete_task(child)
+        changes = [(c.entity_id, c.op) for c in self.store.changes_since(seq) if c.entity == 'task']
+        self.assertEqual(self.ops(changes, child), ['insert', 'update', 'delete'])
+        # Strămoșii: câte o modificare la inserare, la actualizare și la ștergere
+        self.assertEqual(self.ops(changes, self.parent), ['update'] * 3)
+        self.assertEqual(self.ops(changes, self.root), ['update'] * 3)
+
+    def test_insert_logs_task_and_only_ancestors(self):
+        changes = self.changes_after(lambda: setattr(self, 'child', self.add("Subtask", self.parent)))
+        self.assertCountEqual(changes, [(self.child, 'insert'), (self.parent, 'update'), (self.root, 'update')])
+
+    def test_leaf_update_logs_each_ancestor_once(self):
+        child = self.add("Subtask", self.parent)
+
+        def update():
+            task = self.store.get_task(child)
+            task.progress = 40
+            self.store.update_task(task)
+
+        changes = self.changes_after(update)
+        self.assertCountEqual(changes, [(child, 'update'), (self.parent, 'update'), (self.root, 'update')])
+
+    def test_move_logs_only_ancestors_that_change(self):
+        child = self.add("Subtask", self.parent)
+
+        def move():
+            task = self.store.get_task(child)
+            task.parent_id = self.other
+            self.store.update_task(task)
+
+        changes = self.changes_after(move)
+        # Rădăcina este comună ambelor locuri: totalurile ei nu se schimbă
+        self.assertCountEqual(changes, [(child, 'update'), (self.parent, 'update'), (self.other, 'update')])
+
+    def test_cascade_delete_logs_no_updates_for_deleted_tasks(self):
+        child = self.add("Subtask", self.parent)
+        changes = self.changes_after(lambda: self.store.delete_task(self.parent))
+        deleted = {child, self.parent}
+        self.assertTrue(all(c == (self.root, 'update') for c in changes if c[0] not in deleted))
+        for task_id in deleted:
+            self.assertEqual(self.ops(changes, task_id), ['delete'])
+
+
+if __name__ == "__main__":
+    unittest.main()
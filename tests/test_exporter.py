@@ -0,0 +1,64 @@
+"""Exportul Parquet: schema vine din tipurile declarate ale coloanelor, nu din primul lot.
+
+    python -m unittest discover tests
+"""
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_store import ProjectStore, Project, Task  # noqa: E402
+from exporter import export, has_pyarrow  # noqa: E402
+
+
+@unittest.skipUnless(has_pyarrow(), "exportul Parquet necesită pyarrow")
+class ParquetSchemaTest(unittest.TestCase):
+    def setUp(self):
+        self.workdir = tempfile.TemporaryDirectory()
+        self.store = ProjectStore(os.path.join(self.workdir.name, "export.db"))
+        self.project_id = self.store.add_project(Project(name="Export"))
+
+    def tearDown(self):
+        self.store.close()
+        self.workdir.cleanup()
+
+    def export(self, source, batch_size=2):
+        path = os.path.join(self.workdir.name, f"{source}.parquet")
+        result = export(self.store, source, path, batch_size=batch_size)
+        import pyarrow.parquet as parquet
+        return result, parquet.read_table(path)
+
+    def test_column_null_in_first_batch(self):
+        # Primele taskuri sunt de nivel sus: parent_id este NULL în tot primul lot
+        roots = [self.store.add_task(Task(project_id=self.project_id, name=f"Rădăcină {i}")) for i in range(2)]
+        child = self.store.add_task(Task(project_id=self.project_id, name="Subtask", parent_id=roots[0]))
+        result, table = self.export('tasks')
+        self.assertEqual(result.rows, 3)
+        self.assertEqual(str(table.schema.field('parent_id').type), 'int64')
+        self.assertEqual(str(table.schema.field('cost').type), 'double')
+        self.assertEqual(table.column('parent_id').to_pylist(), [None, None, roots[0]])
+        self.assertEqual(table.column('id').to_pylist()[-1], child)
+
+    def test_view_uses_declared_types(self):
+        self.store.add_task(Task(project_id=self.project_id, name="Task", duration=3))
+        _, table = self.export('portfolio')
+        self.assertEqual(str(table.schema.field('project_budget').type), 'double')
+        self.assertEqual(str(table.schema.field('project_resources').type), 'int64')
+
+    def test_empty_source_keeps_schema(self):
+        result, table = self.export('risks')
+        self.assertEqual(result.rows, 0)
+        self.assertEqual(str(table.schema.field('risk_score').type), 'int64')
+
+    def test_value_of_another_type_is_a_value_error(self):
+        self.store.add_task(Task(project_id=self.project_id, name="Task"))
+        with self.store.engine.write():
+            self.store.conn.execute("UPDATE tasks SET progress = 'jumătate'")
+        with self.assertRaisesRegex(ValueError, "progress"):
+            self.export('tasks')
+
+
+if __name__ == "__main__":
+    unittest.main()
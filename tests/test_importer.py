@@ -0,0 +1,110 @@
+"""Importul în masă: rânduri respinse, dependențe spre taskuri de mai jos și reprogramarea lor.
+
+    python -m unittest discover tests
+"""
+import io
+import os
+import sys
+import json
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_store import ProjectStore, Project  # noqa: E402
+from importer import import_file, iter_json_array  # noqa: E402
+
+CSV_HEADER = "type,id,project,name,start_date,end_date,duration,progress,status,dependencies\n"
+
+
+class ImporterTest(unittest.TestCase):
+    def setUp(self):
+        self.workdir = tempfile.TemporaryDirectory()
+        self.store = ProjectStore(os.path.join(self.workdir.name, "import.db"))
+
+    def tearDown(self):
+        self.store.close()
+        self.workdir.cleanup()
+
+    def import_text(self, name, text, **kwargs):
+        path = os.path.join(self.workdir.name, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return import_file(self.store, path, **kwargs)
+
+    def tasks(self):
+        return {task.name: task for project in self.store.list_projects()
+                for task in self.store.list_tasks(project.id)}
+
+    def test_rejected_rows_are_reported_and_the_rest_imported(self):
+        result = self.import_text("plan.csv", CSV_HEADER + "\n".join([
+            "project,P,,Plan,2025-01-01,2025-03-01,,,,",
+            "task,1,P,,2025-01-01,2025-01-05,4,,,",              # fără nume
+            "task,2,P,Cifre,2025-01-01,2025-01-05,patru,,,",     # durată invalidă
+            "task,3,P,Procent,2025-01-01,2025-01-05,4,150,,",    # progres peste 100
+            "task,4,P,Status,2025-01-01,2025-01-05,4,,Gata,",    # status necunoscut
+            "task,5,P,Invers,2025-01-05,2025-01-01,4,,,",        # sfârșit înaintea începutului
+            "task,6,Q,Orfan,2025-01-01,2025-01-05,4,,,",         # proiect inexistent
+            "task,7,P,Bun,2025-01-01,2025-01-05,4,,,",
+            "task,7,P,Dublură,2025-01-01,2025-01-05,4,,,",       # cheie repetată
+        ]) + "\n")
+        self.assertEqual((result.projects, result.tasks), (1, 1))
+        self.assertEqual([issue.key for issue in result.errors], ["1", "2", "3", "4", "5", "6", "7"])
+        self.assertEqual([issue.row for issue in result.errors], [3, 4, 5, 6, 7, 8, 10])
+        self.assertEqual(list(self.tasks()), ["Bun"])
+
+    def test_forward_dependency_is_resolved_and_rescheduled(self):
+        result = self.import_text("plan.csv", CSV_HEADER + "\n".join([
+            "project,P,,Plan,2025-01-01,2025-03-01,,,,",
+            "task,T1,P,Integrare,2025-01-01,2025-01-04,3,,,T2",
+            "task,T2,P,Dezvoltare,2025-01-01,2025-01-08,7,,,",
+            "task,T3,P,Livrare,2025-01-05,2025-01-06,1,,,T1",
+        ]) + "\n")
+        self.assertEqual(result.errors, [])
+        tasks = self.tasks()
+        self.assertEqual(json.loads(tasks["Integrare"].dependencies), [tasks["Dezvoltare"].id])
+        self.assertEqual((tasks["Integrare"].start_date, tasks["Integrare"].end_date), ("2025-01-08", "2025-01-11"))
+        self.assertEqual((tasks["Livrare"].start_date, tasks["Livrare"].end_date), ("2025-01-11", "2025-01-12"))
+        self.assertEqual(sorted(issue.key for issue in result.warnings), ["T1", "T3"])
+
+    def test_dependencies_to_other_projects_and_unknown_keys_are_ignored(self):
+        result = self.import_text("plan.jsonl", "\n".join(json.dumps(record) for record in [
+            {"type": "project", "id": "A", "name": "A"},
+            {"type": "project", "id": "B", "name": "B"},
+            {"type": "task", "id": "a1", "project": "A", "name": "a1", "dependencies": ["b1", "lipsă"]},
+            {"type": "task", "id": "b1", "project": "B", "name": "b1"},
+        ]) + "\n")
+        self.assertEqual(result.tasks, 2)
+        self.assertEqual(len(result.warnings), 2)
+        self.assertEqual(self.tasks()["a1"].dependencies, "[]")
+
+    def test_dependency_cycle_is_imported_with_a_warning(self):
+        result = self.import_text("plan.json", json.dumps([
+            {"type": "project", "id": "P", "name": "Plan", "tasks": [
+                {"id": "x", "name": "x", "start_date": "2025-01-01", "end_date": "2025-01-02", "dependencies": "y"},
+                {"id": "y", "name": "y", "start_date": "2025-01-01", "end_date": "2025-01-02", "dependencies": "x"},
+            ]},
+        ]))
+        self.assertEqual(result.tasks, 2)
+        self.assertEqual(len(result.warnings), 1)
+        self.assertIn("ciclu", result.warnings[0].message)
+
+    def test_tasks_for_existing_project(self):
+        project_id = self.store.add_project(Project(name="Existent"))
+        result = self.import_text("taskuri.csv", "name,duration\nUnu,2\nDoi,3\n", project_id=project_id)
+        self.assertEqual(result.tasks, 2)
+        self.assertEqual(len(self.store.list_tasks(project_id)), 2)
+
+    def test_json_array_is_read_across_chunk_boundaries(self):
+        items = [{"name": f"Task {i}", "value": 1.5e10, "list": [i, {"nested": "]"}]} for i in range(50)]
+        text = "  \n" + json.dumps(items, indent=1)
+        self.assertEqual(list(iter_json_array(io.StringIO(text), chunk_size=7)), items)
+        self.assertEqual(list(iter_json_array(io.StringIO("[]"), chunk_size=1)), [])
+        with self.assertRaises(ValueError):
+            list(iter_json_array(io.StringIO('[{"a": 1}, {"b": '), chunk_size=4))
+        with self.assertRaises(ValueError):
+            list(iter_json_array(io.StringIO('{"a": 1}')))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""Simularea Monte Carlo: taskurile încep la data planificată, nu la începutul proiectului.
+
+    python -m unittest discover tests
+"""
+import os
+import sys
+import json
+import datetime
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_store import ProjectStore, Project, Task  # noqa: E402
+from montecarlo import simulate_project  # noqa: E402
+
+
+class PlannedStartTest(unittest.TestCase):
+    def setUp(self):
+        self.workdir = tempfile.TemporaryDirectory()
+        self.store = ProjectStore(os.path.join(self.workdir.name, "simulation.db"))
+        self.project_id = self.store.add_project(Project(name="Târziu", start_date="2025-01-01",
+                                                         end_date="2025-06-05"))
+
+    def tearDown(self):
+        self.store.close()
+        self.workdir.cleanup()
+
+    def add(self, start, end, duration, optimistic=0, pessimistic=0, dependencies=()):
+        return self.store.add_task(Task(project_id=self.project_id, name=f"Task {start}", start_date=start,
+                                        end_date=end, duration=duration, optimistic_duration=optimistic,
+                                        pessimistic_duration=pessimistic,
+                                        dependencies=json.dumps(list(dependencies))))
+
+    def simulate(self):
+        return simulate_project(self.store, self.project_id, iterations=500, seed=1, workers=1)
+
+    def test_late_root_task_starts_at_its_planned_date(self):
+        self.add("2025-06-01", "2025-06-11", 10, 8, 15)
+        result = self.simulate()
+        self.assertEqual(result.finish_date(result.deterministic_finish), datetime.date(2025, 6, 11))
+        p50, _ = result.percentiles()[50]
+        self.assertGreaterEqual(p50, datetime.date(2025, 6, 9))
+        self.assertLessEqual(p50, datetime.date(2025, 6, 16))
+        self.assertEqual(result.on_time_probability(), 0.0)
+
+    def test_task_starts_after_planned_date_and_predecessors(self):
+        first = self.add("2025-01-01", "2025-01-11", 10)
+        # Planificat după predecesor, cu o pauză: pauza rămâne
+        self.add("2025-02-01", "2025-02-06", 5, dependencies=[first])
+        result = self.simulate()
+        self.assertEqual(result.finish_date(result.deterministic_finish), datetime.date(2025, 2, 6))
+        self.assertTrue((result.finish == result.deterministic_finish).all())
+
+    def test_predecessor_finishing_late_delays_successor(self):
+        first = self.add("2025-01-01", "2025-01-11", 10, 10, 20)
+        self.add("2025-01-11", "2025-01-16", 5, dependencies=[first])
+        result = self.simulate()
+        self.assertEqual(result.finish_date(result.deterministic_finish), datetime.date(2025, 1, 16))
+        self.assertGreater(result.finish.mean(), result.deterministic_finish)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+"""Pragurile nivelurilor de risc salvate la reclasificare și folosite apoi peste tot.
+
+    python -m unittest discover tests
+"""
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_store import ProjectStore, Project, Risk, RISK_LEVELS  # noqa: E402
+from riskmap import risk_map  # noqa: E402
+
+
+class RiskLevelsTest(unittest.TestCase):
+    def setUp(self):
+        self.workdir = tempfile.TemporaryDirectory()
+        self.store = ProjectStore(os.path.join(self.workdir.name, "risks.db"))
+        self.project_id = self.store.add_project(Project(name="Riscuri"))
+
+    def tearDown(self):
+        self.store.close()
+        self.workdir.cleanup()
+
+    def add(self, description):
+        return self.store.add_risk(Risk(project_id=self.project_id, description=description,
+                                        probability="Medie", impact="Mediu", status="Identificat"))
+
+    def test_rescore_thresholds_apply_to_later_risks(self):
+        before = self.add("înainte")
+        self.store.rescore_risks([("Scăzut", 1), ("Moderat", 3), RISK_LEVELS[-1]])
+        after = self.add("după")
+        self.assertEqual(self.store.get_risk(before).risk_level, "Ridicat")
+        self.assertEqual(self.store.get_risk(after).risk_level, "Ridicat")
+        self.assertCountEqual([risk.id for risk in self.store.high_risks()], [before, after])
+        self.assertEqual(risk_map(self.store).exposure[0].high, 2)
+
+    def test_rescore_without_levels_keeps_saved_thresholds(self):
+        self.store.rescore_risks([("Scăzut", 1), ("Moderat", 3), RISK_LEVELS[-1]])
+        risk_id = self.add("risc")
+        self.assertEqual(self.store.rescore_risks(), 0)
+        self.assertEqual(self.store.get_risk(risk_id).risk_level, "Ridicat")
+        self.store.rescore_risks(RISK_LEVELS)
+        self.assertEqual(self.store.get_risk(risk_id).risk_level, "Moderat")
+        self.assertEqual(self.store.high_risks(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
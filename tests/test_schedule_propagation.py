@@ -0,0 +1,98 @@
+"""Reprogramarea taskurilor dependente citind doar taskurile din aval.
+
+    python -m unittest discover tests
+"""
+import os
+import sys
+import json
+import random
+import datetime
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_store import ProjectStore, Project, Task  # noqa: E402
+from scheduling import ScheduleGraph, CycleError  # noqa: E402
+
+BASE = datetime.date(2025, 1, 1)
+
+
+def day(offset):
+    return (BASE + datetime.timedelta(days=offset)).isoformat()
+
+
+class PropagationTest(unittest.TestCase):
+    def setUp(self):
+        self.workdir = tempfile.TemporaryDirectory()
+        self.store = ProjectStore(os.path.join(self.workdir.name, "schedule.db"))
+        self.project_id = self.store.add_project(Project(name="Program"))
+
+    def tearDown(self):
+        self.store.close()
+        self.workdir.cleanup()
+
+    def add(self, start, length, dependencies=(), project_id=None):
+        return self.store.add_task(Task(project_id=project_id or self.project_id, name="Task",
+                                        start_date=day(start), end_date=day(start + length), duration=length,
+                                        dependencies=json.dumps(list(dependencies))))
+
+    def test_matches_propagation_on_whole_project(self):
+        rng = random.Random(3)
+        ids = []
+        for i in range(120):
+            deps = sorted({rng.choice(ids) for _ in range(rng.randrange(3))}) if ids else []
+            ids.append(self.add(rng.randrange(60), rng.randrange(1, 8), deps))
+        for _ in range(30):
+            task = self.store.get_task(rng.choice(ids))
+            task.end_date = day(rng.randrange(40, 120))
+            task.start_date = min(task.start_date, task.end_date)
+            task.start_day = task.end_day = None  # graful de referință citește datele din șiruri
+            tasks = self.store.list_tasks(self.project_id)
+            graph = ScheduleGraph([task if t.id == task.id else t for t in tasks])
+            expected = {task_id: graph.dates(task_id) for task_id in graph.propagate(task.id)}
+
+            moved = self.store.update_task(task)
+            self.assertEqual({t.id: (t.start_date, t.end_date) for t in moved}, expected)
+            for task_id, dates in expected.items():
+                saved = self.store.get_task(task_id)
+                self.assertEqual((saved.start_date, saved.end_date), dates)
+
+    def test_new_dependency_closing_a_cycle_is_rejected(self):
+        first = self.add(0, 2)
+        second = self.add(2, 2, [first])
+        third = self.add(4, 2, [second])
+        task = self.store.get_task(first)
+        task.dependencies = json.dumps([third])
+        with self.assertRaises(CycleError):
+            self.store.update_task(task)
+        self.assertEqual(self.store.get_task(first).dependencies, "[]")
+
+    def test_dependency_from_another_project_is_rejected(self):
+        other = self.add(0, 2, project_id=self.store.add_project(Project(name="Alt proiect")))
+        task = self.store.get_task(self.add(0, 2))
+        task.dependencies = json.dumps([other])
+        with self.assertRaises(ValueError):
+            self.store.update_task(task)
+
+    def test_new_task_starts_after_its_dependencies(self):
+        first = self.add(0, 5)
+        second = self.add(3, 4)
+        task_id = self.add(1, 2, [first, second])
+        task = self.store.get_task(task_id)
+        self.assertEqual((task.start_date, task.end_date), (day(7), day(9)))
+
+    def test_changed_dependencies_are_followed(self):
+        first = self.add(0, 2)
+        second = self.add(2, 2)
+        task = self.store.get_task(second)
+        task.dependencies = json.dumps([first])
+        self.store.update_task(task)
+        task = self.store.get_task(first)
+        task.end_date = day(5)
+        moved = self.store.update_task(task)
+        self.assertEqual([(t.id, t.start_date, t.end_date) for t in moved], [(second, day(5), day(7))])
+
+
+if __name__ == "__main__":
+    unittest.main()
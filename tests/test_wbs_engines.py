@@ -0,0 +1,76 @@
+"""Taskurile sumare din WBS nu sunt numărate a doua oară în EVM, rapoarte, capacitate și simulare.
+
+    python -m unittest discover tests
+"""
+import os
+import sys
+import json
+import datetime
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_store import ProjectStore, Project, Resource, Task  # noqa: E402
+from analytics import progress_report  # noqa: E402
+from capacity import capacity_plan  # noqa: E402
+from evm import earned_value  # noqa: E402
+from montecarlo import simulate_project, work_packages  # noqa: E402
+
+
+class SummaryTaskTest(unittest.TestCase):
+    def setUp(self):
+        self.workdir = tempfile.TemporaryDirectory()
+        self.store = ProjectStore(os.path.join(self.workdir.name, "wbs.db"))
+        self.project_id = self.store.add_project(Project(name="WBS", budget=1000, start_date="2025-01-01",
+                                                         end_date="2025-01-11"))
+        self.store.add_resource(Resource(project_id=self.project_id, name="Ana", quantity=1))
+        self.parent = self.add("Sumar", "2025-01-01", "2025-01-11", 10, 0)
+        self.children = [self.add("Faza 1", "2025-01-01", "2025-01-06", 5, 100, self.parent),
+                         self.add("Faza 2", "2025-01-06", "2025-01-11", 5, 100, self.parent)]
+
+    def tearDown(self):
+        self.store.close()
+        self.workdir.cleanup()
+
+    def add(self, name, start, end, duration, progress, parent_id=None):
+        return self.store.add_task(Task(project_id=self.project_id, name=name, start_date=start, end_date=end,
+                                        duration=duration, progress=progress, assigned_to="Ana",
+                                        parent_id=parent_id))
+
+    def test_earned_value_counts_only_work_packages(self):
+        result = earned_value(self.store, "2025-01-11")
+        metrics = result.project(self.project_id)
+        self.assertAlmostEqual(float(metrics.ev), 1000)
+        self.assertAlmostEqual(float(metrics.spi), 1.0)
+        self.assertCountEqual(result.project_tasks(self.project_id)[0].tolist(), self.children)
+
+    def test_progress_report_counts_only_work_packages(self):
+        with self.store.reader() as conn:
+            text = "".join(progress_report(conn, "2025-01-11"))
+        weighted = next(line for line in text.splitlines() if line.startswith("Progres ponderat"))
+        self.assertTrue(weighted.rstrip().endswith("100.00"), weighted)
+
+    def test_capacity_load_counts_only_work_packages(self):
+        plan = capacity_plan(self.store, "2025-01-01", "2025-01-10", bucket='day')
+        self.assertEqual(plan.load.max(), 1.0)
+
+    def test_simulation_uses_work_packages(self):
+        result = simulate_project(self.store, self.project_id, iterations=50, seed=1, workers=1)
+        self.assertEqual(sorted(result.labels), ["Faza 1", "Faza 2"])
+
+    def test_summary_dependencies_move_to_leaves(self):
+        after = self.store.add_task(Task(project_id=self.project_id, name="După", duration=3,
+                                         dependencies=json.dumps([self.parent])))
+        tasks = {t.id: t for t in work_packages(self.store.list_tasks(self.project_id))}
+        self.assertNotIn(self.parent, tasks)
+        self.assertCountEqual(json.loads(tasks[after].dependencies), self.children)
+
+    def test_status_date_before_children_end(self):
+        status = datetime.date(2025, 1, 6).isoformat()
+        metrics = earned_value(self.store, status).project(self.project_id)
+        self.assertAlmostEqual(float(metrics.pv), 500)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,330 @@
+"""Timeline-ul portofoliului: toate proiectele pe aceeași axă a timpului, cu detalierea pe taskuri la zoom.
+
+Intervalul fiecărui proiect (primul început și ultimul sfârșit al taskurilor)
+și progresul totalizat din WBS vin dintr-o singură agregare SQL, deci
+diagrama încarcă un rând pe proiect, nu taskurile. Nivelul de detaliu
+urmează zoom-ul: cât timp fereastra de timp depășește DETAIL_DAYS sunt
+desenate doar barele proiectelor; sub acest prag, taskurile sunt citite în
+fundal doar pentru proiectele de pe ecran și doar cele din fereastra de timp,
+apoi așezate pe benzi în rândul proiectului. Ca în diagrama Gantt, pe ecran
+ajung doar rândurile din fereastra vizibilă.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+from matplotlib import dates
+from matplotlib.collections import PolyCollection
+
+from gantt import STATUS_COLORS, DEFAULT_COLOR, BAR_HEIGHT, SCROLL_STEP, ZOOM_FACTOR, bar_vertices, day_spans
+from project_store import EPOCH
+
+PROJECT_COLORS = {
+    "Finalizat": '#2ecc71',       # Verde
+    "In progres": '#3498db',      # Albastru
+    "Blocat": '#e74c3c',          # Roșu
+}
+
+VISIBLE_ROWS = 30
+# Sub câte zile vizibile pe axa timpului sunt afișate taskurile proiectelor
+DETAIL_DAYS = 120
+# Câte taskuri sunt citite cel mult pentru un ecran; peste limită rămân barele proiectelor
+MAX_DETAIL_TASKS = 5000
+# Benzile din rândul unui proiect pe care sunt așezate taskurile care se suprapun
+DETAIL_LANES = 4
+DETAIL_BAND = 0.8
+# Cât din fereastra de timp se deplasează la o treaptă a rotiței (Shift + rotiță)
+PAN_FRACTION = 0.2
+
+
+@dataclass
+class PortfolioData:
+    ids: np.ndarray
+    names: np.ndarray
+    start: np.ndarray       # zile matplotlib (date2num)
+    duration: np.ndarray    # zile
+    progress: np.ndarray    # 0..100, totalizat din WBS
+    colors: np.ndarray
+    tasks: np.ndarray       # numărul taskurilor proiectului
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def end(self):
+        return self.start + self.duration
+
+
+@dataclass
+class TaskDetail:
+    project_ids: np.ndarray
+    names: np.ndarray
+    start: np.ndarray       # zile matplotlib (date2num)
+    duration: np.ndarray
+    progress: np.ndarray
+    colors: np.ndarray
+    lanes: np.ndarray       # banda din rândul proiectului
+    truncated: bool = False  # peste MAX_DETAIL_TASKS: taskurile nu au fost citite
+
+    def __len__(self):
+        return len(self.project_ids)
+
+
+def build_portfolio_data(rows):
+    """Tablourile diagramei din rândurile store.project_spans()"""
+    start, duration = day_spans([row[3] for row in rows], [row[4] for row in rows])
+    return PortfolioData(
+        ids=np.array([row[0] for row in rows], dtype=np.int64),
+        names=np.array([row[1] for row in rows], dtype=object),
+        start=start,
+        duration=duration,
+        progress=np.array([row[6] for row in rows], dtype=float),
+        colors=np.array([PROJECT_COLORS.get(row[2], DEFAULT_COLOR) for row in rows], dtype=object),
+        tasks=np.array([row[5] for row in rows], dtype=np.int64),
+    )
+
+
+def portfolio_timeline(store):
+    """Câte o bară pe proiect, din agregarea SQL (rulează în thread-ul de lucru)"""
+    with store.snapshot() as view:
+        rows = view.project_spans()
+    return build_portfolio_data(rows)
+
+
+def pack_lanes(groups, start, end, lanes=DETAIL_LANES):
+    """Banda fiecărui interval din grupul lui: prima liberă, altfel cea care se eliberează cel mai devreme
+
+    Intervalele sunt ordonate după grup și început, ca în store.timeline_tasks().
+    """
+    result = np.zeros(len(groups), dtype=np.int64)
+    current, free = None, None
+    for i, (group, begin, finish) in enumerate(zip(groups.tolist(), start.tolist(), end.tolist())):
+        if group != current:
+            current, free = group, [float('-inf')] * lanes
+        lane = next((k for k, busy_until in enumerate(free) if busy_until <= begin), None)
+        if lane is None:
+            lane = min(range(lanes), key=free.__getitem__)
+        free[lane] = max(free[lane], finish)
+        result[i] = lane
+    return result
+
+
+def build_task_detail(rows, truncated=False):
+    """Tablourile taskurilor din rândurile store.timeline_tasks()"""
+    start, duration = day_spans([row[5] for row in rows], [row[6] for row in rows])
+    project_ids = np.array([row[1] for row in rows], dtype=np.int64)
+    return TaskDetail(
+        project_ids=project_ids,
+        names=np.array([row[2] for row in rows], dtype=object),
+        start=start,
+        duration=duration,
+        progress=np.array([row[4] or 0 for row in rows], dtype=float),
+        colors=np.array([STATUS_COLORS.get(row[3], DEFAULT_COLOR) for row in rows], dtype=object),
+        lanes=pack_lanes(project_ids, start, start + duration),
+        truncated=truncated,
+    )
+
+
+def load_details(store, project_ids, first_day, last_day, limit=MAX_DETAIL_TASKS):
+    """Taskurile proiectelor de pe ecran din zilele [first_day, last_day] (rulează în thread-ul de lucru)"""
+    with store.snapshot() as view:
+        rows = view.timeline_tasks(project_ids, first_day, last_day, limit + 1)
+    if len(rows) > limit:
+        return build_task_detail([], truncated=True)
+    return build_task_detail(rows)
+
+
+class PortfolioTimeline:
+    """Timeline cu un rând pe proiect, derulare pe rânduri și zoom pe axa timpului.
+
+    La o fereastră de timp sub DETAIL_DAYS zile, rândurile de pe ecran își afișează
+    taskurile. Ele sunt cerute prin request_details(cerere, project_ids, first_day,
+    last_day), care le citește în fundal și le predă prin set_details(cerere, detalii);
+    răspunsul pentru un ecran părăsit între timp este ignorat. Dublu-click pe un rând
+    apelează on_open(project_id).
+    """
+
+    def __init__(self, fig, ax, canvas, request_details, on_open=None, visible_rows=VISIBLE_ROWS):
+        self.fig = fig
+        self.ax = ax
+        self.canvas = canvas
+        self.request_details = request_details
+        self.on_open = on_open
+        self.visible_rows = visible_rows
+        self.data = None
+        self.rows = {}          # project_id -> rândul din diagramă
+        self.first_row = 0
+        self.xlim = None
+        self.details = None
+        self._request = None
+
+        self.bars = PolyCollection([], edgecolors='none')
+        self.done_bars = PolyCollection([], facecolors='black', alpha=0.25, edgecolors='none')
+        self.task_bars = PolyCollection([], edgecolors='white', linewidths=0.5)
+        self.task_done_bars = PolyCollection([], facecolors='black', alpha=0.25, edgecolors='none')
+        for collection in (self.bars, self.done_bars, self.task_bars, self.task_done_bars):
+            ax.add_collection(collection)
+        ax.set_xlabel("Timeline")
+        ax.grid(True)
+        ax.xaxis_date()
+
+        canvas.mpl_connect('scroll_event', self.on_scroll)
+        canvas.mpl_connect('button_press_event', self.on_click)
+
+    def set_data(self, data):
+        """Înlocuiește proiectele și afișează tot intervalul portofoliului"""
+        self.data = data
+        self.rows = {int(project_id): row for row, project_id in enumerate(data.ids)}
+        self.first_row = 0
+        self.xlim = None
+        self.details = None
+        self._request = None
+        if len(data):
+            self.xlim = (float(data.start.min()) - 1, float(data.end.max()) + 1)
+        self.render()
+
+    @property
+    def detailed(self):
+        """Fereastra de timp este destul de îngustă pentru afișarea taskurilor"""
+        return self.xlim is not None and self.xlim[1] - self.xlim[0] <= DETAIL_DAYS
+
+    def visible_slice(self):
+        n = len(self.data)
+        first = max(0, min(self.first_row, n - self.visible_rows))
+        return first, min(n, first + self.visible_rows)
+
+    def render(self):
+        """Reașază axele pentru fereastra vizibilă, cere taskurile la nevoie și redesenează"""
+        data = self.data
+        if data is None or not len(data):
+            for collection in (self.bars, self.done_bars, self.task_bars, self.task_done_bars):
+                collection.set_verts([])
+            self.canvas.draw_idle()
+            return
+
+        lo, hi = self.visible_slice()
+        ax = self.ax
+        ax.set_xlim(*self.xlim)
+        ax.set_ylim(hi - 0.5, lo - 0.5)
+        ax.set_yticks(np.arange(lo, hi))
+        ax.set_yticklabels(data.names[lo:hi])
+        if self.detailed:
+            self._request_details(lo, hi)
+        else:
+            self.details = None
+            self._request = None
+        self.fig.autofmt_xdate()
+        self._update_artists()
+        self.canvas.draw_idle()
+
+    def _request_details(self, lo, hi):
+        offset = dates.date2num(EPOCH)
+        x0, x1 = self.xlim
+        request = (lo, hi, int(np.floor(x0 - offset)), int(np.ceil(x1 - offset)))
+        if request != self._request:
+            # Taskurile ecranului anterior rămân afișate până sosesc cele noi
+            self._request = request
+            self.request_details(request, self.data.ids[lo:hi].tolist(), request[2], request[3])
+
+    def set_details(self, request, details):
+        """Taskurile citite în fundal pentru cererea dată; ignorate dacă ecranul s-a schimbat între timp"""
+        if request != self._request:
+            return
+        self.details = details
+        self._update_artists()
+        self.canvas.draw_idle()
+
+    def _update_artists(self):
+        """Recalculează barele proiectelor și, la zoom, ale taskurilor din rândurile vizibile"""
+        data = self.data
+        lo, hi = self.visible_slice()
+        rows = np.arange(lo, hi, dtype=float)
+        left = data.start[lo:hi]
+        width = data.duration[lo:hi]
+        details = self.details if self.details is not None and not self.details.truncated else None
+
+        self.bars.set_facecolor(list(data.colors[lo:hi]))
+        if details is None:
+            self.bars.set_verts(bar_vertices(left, width, rows))
+            self.bars.set_alpha(1.0)
+            self.done_bars.set_verts(bar_vertices(left, width * data.progress[lo:hi] / 100, rows, BAR_HEIGHT / 3))
+            self.task_bars.set_verts([])
+            self.task_done_bars.set_verts([])
+        else:
+            # Bara proiectului devine fundalul rândului, iar taskurile sunt așezate pe benzi în interior
+            self.bars.set_verts(bar_vertices(left, width, rows, DETAIL_BAND))
+            self.bars.set_alpha(0.2)
+            self.done_bars.set_verts([])
+            task_rows = np.array([self.rows.get(int(project_id), -1) for project_id in details.project_ids],
+                                 dtype=float)
+            shown = (task_rows >= lo) & (task_rows < hi)
+            lane_height = DETAIL_BAND / DETAIL_LANES
+            y = task_rows[shown] - DETAIL_BAND / 2 + (details.lanes[shown] + 0.5) * lane_height
+            start, duration = details.start[shown], details.duration[shown]
+            self.task_bars.set_verts(bar_vertices(start, duration, y, lane_height * 0.8))
+            self.task_bars.set_facecolor(list(details.colors[shown]))
+            self.task_done_bars.set_verts(bar_vertices(start, duration * details.progress[shown] / 100, y,
+                                                       lane_height * 0.3))
+
+        title = f"Portofoliu - proiecte {lo + 1}-{hi} din {len(data)}"
+        if not self.detailed:
+            title += f"  |  zoom sub {DETAIL_DAYS} zile pentru taskuri"
+        elif self.details is None:
+            title += "  |  se încarcă taskurile..."
+        elif self.details.truncated:
+            title += f"  |  peste {MAX_DETAIL_TASKS:,} taskuri pe ecran: apropiați mai mult"
+        else:
+            title += f"  |  {len(self.details):,} taskuri"
+        self.ax.set_title(title)
+
+    def project_at(self, y):
+        """Proiectul din rândul de la coordonata y; None în afara rândurilor vizibile"""
+        if self.data is None or y is None:
+            return None
+        row = int(round(y))
+        lo, hi = self.visible_slice()
+        return int(self.data.ids[row]) if lo <= row < hi else None
+
+    def scroll(self, rows):
+        """Derulează fereastra de proiecte cu numărul dat de rânduri"""
+        if self.data is None:
+            return
+        first = max(0, min(self.first_row + rows, len(self.data) - self.visible_rows))
+        if first != self.first_row:
+            self.first_row = first
+            self.render()
+
+    def zoom(self, factor, center=None):
+        """Zoom pe axa timpului în jurul punctului dat (factor > 1 = apropiere)"""
+        if self.xlim is None:
+            return
+        x0, x1 = self.xlim
+        center = (x0 + x1) / 2 if center is None else center
+        self.xlim = (center - (center - x0) / factor, center + (x1 - center) / factor)
+        self.render()
+
+    def pan(self, fraction):
+        """Deplasează fereastra de timp cu o fracțiune din lățimea ei (pozitiv = spre viitor)"""
+        if self.xlim is None:
+            return
+        x0, x1 = self.xlim
+        step = (x1 - x0) * fraction
+        self.xlim = (x0 + step, x1 + step)
+        self.render()
+
+    def on_scroll(self, event):
+        """Rotița: derulare proiecte; Ctrl + rotiță: zoom; Shift + rotiță: deplasare în timp"""
+        direction = 1 if event.button == 'up' else -1
+        if event.key == 'control':
+            self.zoom(ZOOM_FACTOR ** direction, event.xdata)
+        elif event.key == 'shift':
+            self.pan(-direction * PAN_FRACTION)
+        else:
+            self.scroll(-direction * SCROLL_STEP)
+
+    def on_click(self, event):
+        """Dublu-click pe un rând: detalierea proiectului"""
+        if not event.dblclick or event.inaxes is not self.ax or self.on_open is None:
+            return
+        project_id = self.project_at(event.ydata)
+        if project_id is not None:
+            self.on_open(project_id)
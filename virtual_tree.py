@@ -0,0 +1,393 @@
+"""Listă virtuală pentru ttk.Treeview, cu paginare keyset și sortare în SQL.
+
+În loc să insereze toate rândurile unui tabel, Treeview-ul primește câte o
+pagină; următoarea pagină se încarcă doar când utilizatorul ajunge aproape de
+capătul listei. Sortarea prin click pe antetul coloanei se face în baza de date.
+Modificările din jurnal se aplică rând cu rând prin upsert() și remove(), fără
+a reîncărca paginile deja afișate. VirtualTree face același lucru pentru un
+arbore: doar nivelul de sus este paginat, copiii unui nod sunt ceruți la
+prima lui expandare.
+"""
+
+PAGE_SIZE = 200
+# Fracțiunea din listă derulată după care se cere pagina următoare
+LOAD_MORE_THRESHOLD = 0.9
+
+
+class VirtualTreeview:
+    """Încarcă pagini într-un Treeview pe măsură ce utilizatorul derulează"""
+
+    def __init__(self, tree, scrollbar, fields, fetch_page, page_size=PAGE_SIZE, runner=None, formats=None):
+        # fetch_page(sort_column, descending, after, limit) -> listă de entități;
+        # cu un TaskRunner, fetch_page rulează în fundal și trebuie să fie thread-safe
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.fields = list(fields)
+        # Funcții de afișare pe câmp (valoare -> text); sortarea folosește valorile brute
+        self.formats = formats or {}
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.runner = runner
+        self.sort_column = 'id'
+        self.descending = False
+        self.after = None
+        self.exhausted = True
+        self._pending = False
+        self._headings = {}
+        self._labels = {}
+        # Cheia de sortare a rândurilor afișate, după iid (id-ul entității)
+        self._keys = {}
+        # Rândul care trebuie selectat când ajunge în listă (vezi reveal)
+        self._reveal = None
+
+        for column, field in zip(tree['columns'], self.fields):
+            self._headings[field] = column
+            tree.heading(column, command=lambda f=field: self.sort_by(f))
+        tree.configure(yscrollcommand=self._on_scroll)
+
+    def clear(self):
+        """Golește lista fără a mai cere date"""
+        if self.runner is not None:
+            self.runner.cancel(self)
+        self.tree.delete(*self.tree.get_children())
+        self._keys.clear()
+        self._reveal = None
+        self.after = None
+        self.exhausted = True
+        self._pending = False
+
+    def reset(self):
+        """Reîncarcă lista de la prima pagină"""
+        self.clear()
+        self.exhausted = False
+        self.load_more()
+
+    def load_more(self):
+        """Aduce și inserează pagina următoare"""
+        if self.exhausted:
+            self._pending = False
+            return
+
+        sort_column, descending, after, limit = self.sort_column, self.descending, self.after, self.page_size
+        if self.runner is None:
+            self._append(self.fetch_page(sort_column, descending, after, limit))
+        else:
+            # Pagina vine din fundal; alte cereri sunt blocate până la sosirea ei
+            self._pending = True
+            self.runner.submit(self, lambda: self.fetch_page(sort_column, descending, after, limit),
+                               on_done=self._append)
+
+    def _append(self, rows):
+        """Inserează o pagină adusă din baza de date"""
+        self._pending = False
+        for entity in rows:
+            iid = str(entity.id)
+            if self._shown(iid):
+                # Rândul a fost deja adăugat de upsert() înainte să sosească pagina
+                continue
+            self._keys[iid] = self._sort_key(entity)
+            self._insert('', 'end', entity)
+
+        if rows:
+            last = rows[-1]
+            self.after = (getattr(last, self.sort_column), last.id)
+        self.exhausted = len(rows) < self.page_size
+        self._try_reveal()
+
+    def _values(self, entity):
+        values = []
+        for f in self.fields:
+            value = getattr(entity, f)
+            values.append(self.formats[f](value) if f in self.formats and value is not None else value)
+        return tuple(values)
+
+    def _shown(self, iid):
+        return iid in self._keys
+
+    def _insert(self, parent, index, entity):
+        self.tree.insert(parent, index, iid=str(entity.id), values=self._values(entity))
+
+    def _update(self, entity):
+        self.tree.item(str(entity.id), values=self._values(entity))
+
+    def _delete(self, iid):
+        self.tree.delete(iid)
+
+    @staticmethod
+    def _key(value, entity_id):
+        """Cheia după care SQL ordonează un rând: IFNULL(valoare, ''), apoi id; numerele înaintea textului"""
+        if value is None:
+            value = ''
+        return isinstance(value, str), value, entity_id
+
+    def _sort_key(self, entity):
+        return self._key(getattr(entity, self.sort_column), entity.id)
+
+    def _loaded(self, key):
+        """Cheia cade în intervalul paginilor deja încărcate"""
+        if self.exhausted:
+            return True
+        if self.after is None:
+            return False
+        last = self._key(*self.after)
+        return key >= last if self.descending else key <= last
+
+    def upsert(self, entity):
+        """Adaugă sau actualizează rândul unei entități, la poziția dată de sortare"""
+        iid = str(entity.id)
+        key = self._sort_key(entity)
+        present = self._keys.pop(iid, None) is not None
+        if not self._loaded(key):
+            # Rândul a ajuns dincolo de paginile încărcate; va veni la derulare
+            if present:
+                self._delete(iid)
+            return
+
+        if self.descending:
+            index = sum(1 for other in self._keys.values() if other > key)
+        else:
+            index = sum(1 for other in self._keys.values() if other < key)
+        self._keys[iid] = key
+        if present:
+            self._update(entity)
+            self.tree.move(iid, '', index)
+        else:
+            self._insert('', index, entity)
+
+    def remove(self, entity_id):
+        """Scoate rândul unei entități, dacă este afișat"""
+        iid = str(entity_id)
+        if self._keys.pop(iid, None) is not None:
+            self._delete(iid)
+
+    def reveal(self, entity_id):
+        """Selectează rândul entității, încărcând paginile următoare până când apare"""
+        self._reveal = str(entity_id)
+        self._try_reveal()
+
+    def _try_reveal(self):
+        iid = self._reveal
+        if iid is None:
+            return
+        if iid in self._keys:
+            self._reveal = None
+            self.tree.selection_set(iid)
+            self.tree.focus(iid)
+            self.tree.see(iid)
+        elif self.exhausted:
+            self._reveal = None
+        elif not self._pending:
+            self.load_more()
+
+    def sort_by(self, field):
+        """Sortare după coloană; al doilea click inversează ordinea"""
+        if field == self.sort_column:
+            self.descending = not self.descending
+        else:
+            self.sort_column = field
+            self.descending = False
+
+        for f, column in self._headings.items():
+            arrow = (" ▼" if self.descending else " ▲") if f == field else ""
+            self.tree.heading(column, text=f"{self._labels.get(column, column)}{arrow}")
+        self.reset()
+
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        if not self.exhausted and not self._pending and float(last) >= LOAD_MORE_THRESHOLD:
+            self._pending = True
+            self.tree.after_idle(self.load_more)
+
+
+class VirtualTree(VirtualTreeview):
+    """VirtualTreeview ierarhic: nivelul de sus este paginat, copiii se încarcă la prima expandare.
+
+    Entitățile au parent_id și has_children. Coloana arborelui (#0) afișează
+    text_field; un nod cu copii neîncărcați primește un rând substituent, ca
+    Treeview-ul să-l arate expandabil. upsert() mută un nod sub noul părinte
+    doar dacă acesta are copiii deja încărcați; altfel nodul va veni la expandare.
+    """
+
+    def __init__(self, tree, scrollbar, text_field, text_label, fields, fetch_page, fetch_children,
+                 page_size=PAGE_SIZE, runner=None, formats=None):
+        # fetch_children(parent_id, sort_column, descending) -> copiii direcți, sortați
+        super().__init__(tree, scrollbar, fields, fetch_page, page_size, runner, formats)
+        self.text_field = text_field
+        self.fetch_children = fetch_children
+        # Cheile de sortare ale copiilor, pentru fiecare părinte cu copiii încărcați
+        self._children = {}
+        # Părintele fiecărui nod afișat sub nivelul de sus
+        self._parent = {}
+        self._loading = set()
+        self._reveal_path = None
+
+        self._headings[text_field] = '#0'
+        self._labels['#0'] = text_label
+        tree.heading('#0', text=text_label, command=lambda: self.sort_by(text_field))
+        tree.bind('<<TreeviewOpen>>', self._on_open)
+
+    def clear(self):
+        for iid in self._loading:
+            self.runner.cancel((self, iid))
+        self._loading.clear()
+        self._children.clear()
+        self._parent.clear()
+        self._reveal_path = None
+        super().clear()
+
+    def _location(self, iid):
+        """'' pentru nivelul de sus, id-ul părintelui pentru un copil, None dacă nodul nu este afișat"""
+        return '' if iid in self._keys else self._parent.get(iid)
+
+    def _siblings(self, parent):
+        """Cheile copiilor părintelui; None dacă nu sunt încărcați"""
+        return self._keys if parent == '' else self._children.get(parent)
+
+    def _shown(self, iid):
+        return self._location(iid) is not None
+
+    def _insert(self, parent, index, entity):
+        iid = str(entity.id)
+        self.tree.insert(parent, index, iid=iid, text=getattr(entity, self.text_field), values=self._values(entity))
+        if entity.has_children:
+            self.tree.insert(iid, 'end', text="...")
+
+    def _update(self, entity):
+        iid = str(entity.id)
+        self.tree.item(iid, text=getattr(entity, self.text_field), values=self._values(entity))
+        if iid not in self._children and iid not in self._loading:
+            # Substituentul urmează starea nodului: apare la primul copil, dispare după ultimul
+            placeholders = self.tree.get_children(iid)
+            if entity.has_children and not placeholders:
+                self.tree.insert(iid, 'end', text="...")
+            elif not entity.has_children and placeholders:
+                self.tree.delete(*placeholders)
+
+    def _delete(self, iid):
+        self.tree.delete(iid)
+        self._forget(iid)
+
+    def _forget(self, iid):
+        """Uită nodul și subarborele lui încărcat (deja șterse din Treeview)"""
+        self._parent.pop(iid, None)
+        if iid in self._loading:
+            self._loading.discard(iid)
+            self.runner.cancel((self, iid))
+        for child in self._children.pop(iid, {}):
+            self._forget(child)
+
+    def _on_open(self, event):
+        iid = self.tree.focus()
+        if iid:
+            self._expand(iid)
+
+    def _expand(self, iid):
+        """Încarcă copiii nodului, o singură dată"""
+        if iid in self._children or iid in self._loading:
+            return
+        self._loading.add(iid)
+        sort_column, descending = self.sort_column, self.descending
+
+        def fetch():
+            return self.fetch_children(int(iid), sort_column, descending)
+
+        if self.runner is None:
+            self._set_children(iid, fetch())
+        else:
+            self.runner.submit((self, iid), fetch, on_done=lambda rows: self._set_children(iid, rows))
+
+    def _set_children(self, iid, rows):
+        if iid not in self._loading:
+            return
+        self._loading.discard(iid)
+        self.tree.delete(*self.tree.get_children(iid))
+        children = self._children[iid] = {}
+        for entity in rows:
+            child = str(entity.id)
+            if self._shown(child):
+                # Mutat aici de upsert() înaintea sosirii copiilor
+                self._siblings(self._location(child)).pop(child, None)
+                self._delete(child)
+            children[child] = self._sort_key(entity)
+            self._parent[child] = iid
+            self._insert(iid, 'end', entity)
+        self._try_reveal()
+
+    def upsert(self, entity):
+        """Adaugă, actualizează sau mută nodul unei entități sub părintele ei, la poziția dată de sortare"""
+        iid = str(entity.id)
+        parent = '' if entity.parent_id is None else str(entity.parent_id)
+        old = self._location(iid)
+        if old is not None:
+            self._siblings(old).pop(iid, None)
+        key = self._sort_key(entity)
+        siblings = self._siblings(parent)
+        if siblings is None or (parent == '' and not self._loaded(key)):
+            # Părintele nu are copiii încărcați sau rândul este dincolo de paginile încărcate
+            if old is not None:
+                self._delete(iid)
+            return
+
+        if self.descending:
+            index = sum(1 for other in siblings.values() if other > key)
+        else:
+            index = sum(1 for other in siblings.values() if other < key)
+        siblings[iid] = key
+        if parent:
+            self._parent[iid] = parent
+        else:
+            self._parent.pop(iid, None)
+        if old is not None:
+            self._update(entity)
+            self.tree.move(iid, parent, index)
+        else:
+            self._insert(parent, index, entity)
+
+    def remove(self, entity_id):
+        iid = str(entity_id)
+        location = self._location(iid)
+        if location is not None:
+            self._siblings(location).pop(iid, None)
+            self._delete(iid)
+
+    def ancestors(self, entity_id):
+        """Id-urile strămoșilor afișați ai nodului, de la părinte spre rădăcină"""
+        result = []
+        iid = self._location(str(entity_id))
+        while iid:
+            result.append(int(iid))
+            iid = self._location(iid)
+        return result
+
+    def reveal(self, entity_id, path=None):
+        """Selectează nodul, expandând pe rând strămoșii din path (de la rădăcină până la nod)"""
+        self._reveal_path = [str(i) for i in (path or [entity_id])]
+        self._try_reveal()
+
+    def _try_reveal(self):
+        path = self._reveal_path
+        if path is None:
+            return
+        for depth, iid in enumerate(path):
+            if self._shown(iid):
+                continue
+            if depth == 0:
+                # Rădăcina vine cu paginile următoare
+                if self.exhausted:
+                    self._reveal_path = None
+                elif not self._pending:
+                    self.load_more()
+            elif path[depth - 1] in self._children:
+                # Copiii părintelui sunt încărcați, dar nodul nu mai este printre ei
+                self._reveal_path = None
+            else:
+                self.tree.item(path[depth - 1], open=True)
+                self._expand(path[depth - 1])
+            return
+
+        self._reveal_path = None
+        for iid in path[:-1]:
+            self.tree.item(iid, open=True)
+        self.tree.selection_set(path[-1])
+        self.tree.focus(path[-1])
+        self.tree.see(path[-1])